@@ -1,8 +1,7 @@
 import pandas as pd
 import threading
 from os.path import join
-from typing import List
-from hummingbot.model.trade_fill import TradeFill
+from hummingbot.model.trade_fill_archive import TradeFillArchive
 from hummingbot.client.config.global_config_map import global_config_map
 from hummingbot.client.settings import DEFAULT_LOG_FILE_PATH
 from typing import TYPE_CHECKING
@@ -25,11 +24,12 @@ class ExportTradesCommand:
                 path = DEFAULT_LOG_FILE_PATH
             path = join(path, fname)
 
-        trades: List[TradeFill] = self._get_trades_from_session(self.init_time)
+        trade_fill_archive: TradeFillArchive = self._update_trade_fill_archive()
+        trades: pd.DataFrame = trade_fill_archive.read(start_timestamp=self.init_time, include_flat_fees=True)
 
         if len(trades) > 0:
             try:
-                df: pd.DataFrame = TradeFill.to_pandas(trades)
+                df: pd.DataFrame = TradeFillArchive.to_pandas(trades)
                 df.to_csv(path, header=True)
                 self._notify(f"Successfully saved trades to {path}")
             except Exception as e:
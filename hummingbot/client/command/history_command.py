@@ -10,7 +10,6 @@ from typing import (
     Optional,
     TYPE_CHECKING,
 )
-from hummingbot.client.performance_analysis import PerformanceAnalysis
 from hummingbot.core.utils.exchange_rate_conversion import ExchangeRateConversion
 from hummingbot.market.market_base import MarketBase
 from hummingbot.strategy.market_trading_pair_tuple import MarketTradingPairTuple
@@ -79,15 +78,17 @@ class HistoryCommand:
 
     def _calculate_trade_performance(self,  # type: HummingbotApplication
                                      ) -> Tuple[Dict, Dict]:
-        raw_queried_trades = self._get_trades_from_session(self.init_time)
+        """
+        Calculates the trade performance from the performance tracker, which has the trade fills recorded since the
+        application started - without querying the trade fills.
+        """
         current_strategy_name: str = self.markets_recorder.strategy_name
-        performance_analysis: PerformanceAnalysis = PerformanceAnalysis()
-        trade_performance_stats, market_trading_pair_stats = performance_analysis.calculate_trade_performance(
-            current_strategy_name,
-            self.market_trading_pair_tuples,
-            raw_queried_trades,
-            self.starting_balances
-        )
+        trade_performance_stats, market_trading_pair_stats = \
+            self.performance_tracker.calculate_trade_performance(
+                current_strategy_name,
+                self.market_trading_pair_tuples,
+                self.starting_balances
+            )
         return trade_performance_stats, market_trading_pair_stats
 
     def calculate_profitability(self,  # type: HummingbotApplication
@@ -27,6 +27,7 @@ from hummingbot.client.settings import (
     MAXIMUM_TRADE_FILLS_DISPLAY_OUTPUT
 )
 from hummingbot.model.trade_fill import TradeFill
+from hummingbot.model.trade_fill_archive import TradeFillArchive
 
 from typing import TYPE_CHECKING
 if TYPE_CHECKING:
@@ -92,6 +93,16 @@ class ListCommand:
         result.reverse()
         return result
 
+    def _update_trade_fill_archive(self,  # type: HummingbotApplication
+                                   ) -> TradeFillArchive:
+        """
+        Brings the trade fill archive up to date with the trade fills database, and returns it.
+        """
+        if self.markets_recorder is not None:
+            self.markets_recorder.flush()
+        self.trade_fill_archive.update(self.trade_fill_db)
+        return self.trade_fill_archive
+
     def list_trades(self,  # type: HummingbotApplication
                     ):
         if threading.current_thread() != threading.main_thread():
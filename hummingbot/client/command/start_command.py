@@ -14,6 +14,7 @@ from hummingbot.core.clock import (
     ClockMode
 )
 from hummingbot import init_logging
+from hummingbot.client.config.global_config_map import global_config_map
 from hummingbot.client.config.in_memory_config_map import in_memory_config_map
 from hummingbot.client.config.config_helpers import (
     get_strategy_starter_file,
@@ -88,7 +89,14 @@ class StartCommand:
         try:
             config_path: str = in_memory_config_map.get("strategy_file_path").value
             self.start_time = time.time() * 1e3  # Time in milliseconds
-            self.clock = Clock(ClockMode.REALTIME)
+            tick_size: float = global_config_map.get("clock_tick_size").value or 1.0
+            event_driven: bool = global_config_map.get("event_driven_clock_enabled").value or False
+            min_event_tick_interval: float = global_config_map.get("event_driven_min_tick_interval").value or 0.1
+            self.clock = Clock(ClockMode.REALTIME,
+                               tick_size=tick_size,
+                               event_driven=event_driven,
+                               min_event_tick_interval=min_event_tick_interval,
+                               stagger_iterators=global_config_map.get("clock_stagger_iterators").value or False)
             if self.wallet is not None:
                 self.clock.add_iterator(self.wallet)
             for market in self.markets.values():
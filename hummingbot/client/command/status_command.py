@@ -127,6 +127,11 @@ class StatusCommand:
             self._notify("   x initializing strategy.")
         else:
             self._notify(self.strategy.format_status() + "\n")
+            if self.markets_recorder is not None and len(self.starting_balances) > 0:
+                try:
+                    self._notify(f"  Profitability: {self.calculate_profitability():.4f} %\n")
+                except Exception:
+                    self.logger().debug("Error calculating profitability for the status.", exc_info=True)
 
         # Application warnings.
         self._expire_old_application_warnings()
@@ -282,6 +282,43 @@ global_config_map = {
                   prompt="What is your default exchange rate data feed name? >>> ",
                   required_if=lambda: False,
                   default="coin_gecko_api"),
+    "db_write_behind_enabled":
+        ConfigVar(key="db_write_behind_enabled",
+                  prompt="Would you like to write trades to the database in batches from a background thread? "
+                         "(Yes/No) >>> ",
+                  type_str="bool",
+                  default=False,
+                  required_if=lambda: False),
+    "market_data_recording_enabled":
+        ConfigVar(key="market_data_recording_enabled",
+                  prompt="Would you like to record the order book and trade data of your markets? (Yes/No) >>> ",
+                  type_str="bool",
+                  default=False,
+                  required_if=lambda: False),
+    "clock_tick_size":
+        ConfigVar(key="clock_tick_size",
+                  prompt=None,
+                  type_str="float",
+                  default=1.0,
+                  required_if=lambda: False),
+    "clock_stagger_iterators":
+        ConfigVar(key="clock_stagger_iterators",
+                  prompt=None,
+                  type_str="bool",
+                  default=False,
+                  required_if=lambda: False),
+    "event_driven_clock_enabled":
+        ConfigVar(key="event_driven_clock_enabled",
+                  prompt="Would you like strategies to react to order book changes between clock ticks? (Yes/No) >>> ",
+                  type_str="bool",
+                  default=False,
+                  required_if=lambda: False),
+    "event_driven_min_tick_interval":
+        ConfigVar(key="event_driven_min_tick_interval",
+                  prompt=None,
+                  type_str="float",
+                  default=0.1,
+                  required_if=lambda: False),
     "send_error_logs":
         ConfigVar(key="send_error_logs",
                   prompt="Would you like to send error logs to hummingbot? (Yes/No) >>> ",
@@ -25,7 +25,9 @@ from hummingbot.market.radar_relay.radar_relay_market import RadarRelayMarket
 from hummingbot.market.bamboo_relay.bamboo_relay_market import BambooRelayMarket
 from hummingbot.market.dolomite.dolomite_market import DolomiteMarket
 from hummingbot.market.bitcoin_com.bitcoin_com_market import BitcoinComMarket
+from hummingbot.core.data_type.market_data_recorder import MarketDataRecorder
 from hummingbot.model.sql_connection_manager import SQLConnectionManager
+from hummingbot.model.trade_fill_archive import TradeFillArchive
 
 from hummingbot.wallet.ethereum.ethereum_chain import EthereumChain
 from hummingbot.wallet.ethereum.web3_wallet import Web3Wallet
@@ -37,6 +39,7 @@ from hummingbot.client.errors import InvalidCommandError, ArgumentParserError
 from hummingbot.client.config.in_memory_config_map import in_memory_config_map
 from hummingbot.client.config.global_config_map import global_config_map
 from hummingbot.client.config.config_helpers import get_erc20_token_addresses
+from hummingbot.client.performance_tracker import PerformanceTracker
 from hummingbot.strategy.strategy_base import StrategyBase
 from hummingbot.strategy.cross_exchange_market_making import CrossExchangeMarketPair
 
@@ -113,7 +116,9 @@ class HummingbotApplication(*commands):
         self._trading_required: bool = True
 
         self.trade_fill_db: SQLConnectionManager = SQLConnectionManager.get_trade_fills_instance()
+        self.trade_fill_archive: TradeFillArchive = TradeFillArchive.get_instance()
         self.markets_recorder: Optional[MarketsRecorder] = None
+        self.performance_tracker: PerformanceTracker = PerformanceTracker()
 
     def _notify(self, msg: str):
         self.app.log(msg)
@@ -331,6 +336,12 @@ class HummingbotApplication(*commands):
             else:
                 raise ValueError(f"Market name {market_name} is invalid.")
 
+            if market.order_book_tracker is not None:
+                # The order books the strategy trades on are initialized before any others the market tracks.
+                market.order_book_tracker.priority_trading_pairs = trading_pairs
+            if global_config_map.get("market_data_recording_enabled").value and market.order_book_tracker is not None:
+                market.order_book_tracker.market_data_recorder = MarketDataRecorder(market_name)
+
             self.markets[market_name]: MarketBase = market
 
         self.markets_recorder = MarketsRecorder(
@@ -338,6 +349,9 @@ class HummingbotApplication(*commands):
             list(self.markets.values()),
             in_memory_config_map.get("strategy_file_path").value,
             in_memory_config_map.get("strategy").value,
+            write_behind=global_config_map.get("db_write_behind_enabled").value or False,
+            trade_fill_archive=self.trade_fill_archive,
+            performance_tracker=self.performance_tracker,
         )
         self.markets_recorder.start()
 
@@ -1,7 +1,10 @@
 import logging
 from collections import defaultdict
 from decimal import Decimal
+import numpy as np
+import pandas as pd
 from typing import (
+    Optional,
     Tuple,
     Dict,
     List)
@@ -11,6 +14,7 @@ from hummingbot.core.utils.exchange_rate_conversion import ExchangeRateConversio
 from hummingbot.logger import HummingbotLogger
 from hummingbot.model.sql_connection_manager import SQLConnectionManager
 from hummingbot.model.trade_fill import TradeFill
+from hummingbot.model.trade_fill_archive import TradeFillArchive
 from hummingbot.strategy.market_trading_pair_tuple import MarketTradingPairTuple
 s_float_nan = float("nan")
 s_float_0 = float(0)
@@ -107,28 +111,57 @@ class PerformanceAnalysis:
     @staticmethod
     def calculate_trade_asset_delta_with_fees(trade: TradeFill) -> Tuple[Decimal, Decimal]:
         trade_fee: Dict[str, any] = trade.trade_fee
+        flat_fees: List[Tuple[str, Decimal]] = []
+        for flat_fee in trade_fee["flat_fees"]:
+            if isinstance(flat_fee, dict):
+                flat_fees.append((flat_fee["asset"], Decimal(flat_fee["amount"])))
+            else:
+                flat_fees.append((flat_fee[0], Decimal(flat_fee[1])))
+        return PerformanceAnalysis.calculate_asset_delta_with_fees(trade.trade_type,
+                                                                   trade.quote_asset,
+                                                                   Decimal(trade.price),
+                                                                   Decimal(trade.amount),
+                                                                   Decimal(trade_fee["percent"]),
+                                                                   flat_fees)
+
+    @staticmethod
+    def calculate_asset_delta_with_fees(trade_type: str,
+                                        quote_asset: str,
+                                        price: Decimal,
+                                        amount: Decimal,
+                                        fee_percent: Decimal,
+                                        flat_fees: List[Tuple[str, Decimal]]) -> Tuple[Decimal, Decimal]:
+        """
+        Calculates the base and quote asset amounts of a trade, net of its fees.
+
+        :param trade_type: Name of the trade type, i.e. "BUY" or "SELL"
+        :param quote_asset: Quote asset of the trading pair, that flat fees are converted to
+        :param price: Trade price
+        :param amount: Trade amount, in base asset
+        :param fee_percent: Percentage fee, e.g. Decimal("0.001") for 0.1%
+        :param flat_fees: Flat fees, as (asset, amount)
+        :return: Base asset delta and quote asset delta
+        """
         total_flat_fees: Decimal = s_decimal_0
-        amount: Decimal = Decimal(trade.amount)
-        price: Decimal = Decimal(trade.price)
-        for flat_fee_currency, flat_fee_amount in trade_fee["flat_fees"]:
-            if flat_fee_currency == trade.quote_asset:
-                total_flat_fees += Decimal(flat_fee_amount)
+        for flat_fee_currency, flat_fee_amount in flat_fees:
+            if flat_fee_currency == quote_asset:
+                total_flat_fees += flat_fee_amount
             else:
                 # if the flat fee asset does not match quote asset, convert to quote asset value
                 total_flat_fees += ExchangeRateConversion.get_instance().convert_token_value_decimal(
-                    amount=Decimal(flat_fee_amount),
+                    amount=flat_fee_amount,
                     from_currency=flat_fee_currency,
-                    to_currency=trade.quote_asset,
+                    to_currency=quote_asset,
                     source="default"
                 )
-        if trade.trade_type == TradeType.SELL.name:
+        if trade_type == TradeType.SELL.name:
             net_base_delta: Decimal = amount
-            net_quote_delta: Decimal = amount * price * (Decimal("1") - Decimal(trade_fee["percent"])) - total_flat_fees
-        elif trade.trade_type == TradeType.BUY.name:
-            net_base_delta: Decimal = amount * (Decimal("1") - Decimal(trade_fee["percent"])) - total_flat_fees
+            net_quote_delta: Decimal = amount * price * (Decimal("1") - fee_percent) - total_flat_fees
+        elif trade_type == TradeType.BUY.name:
+            net_base_delta: Decimal = amount * (Decimal("1") - fee_percent) - total_flat_fees
             net_quote_delta: Decimal = amount * price
         else:
-            raise Exception(f"Unsupported trade type {trade.trade_type}")
+            raise Exception(f"Unsupported trade type {trade_type}")
         return net_base_delta, net_quote_delta
 
     def calculate_asset_delta_from_trades(self,
@@ -190,6 +223,89 @@ class PerformanceAnalysis:
 
         return market_trading_pair_stats
 
+    @staticmethod
+    def _flat_fees_in_quote(flat_fees: pd.DataFrame) -> pd.Series:
+        """
+        Converts flat fees to their trade's quote asset, and returns their sum by trade fill id.
+        """
+        if flat_fees.empty:
+            return pd.Series(dtype=float)
+        ERC = ExchangeRateConversion.get_instance()
+        rates: Dict[Tuple[str, str], float] = {
+            (asset, quote_asset): (1.0 if asset == quote_asset else
+                                   float(ERC.convert_token_value_decimal(Decimal("1"), asset, quote_asset,
+                                                                         source="default")))
+            for asset, quote_asset in set(zip(flat_fees["asset"], flat_fees["quote_asset"]))
+        }
+        fee_rates: np.ndarray = np.array([rates[key] for key in zip(flat_fees["asset"], flat_fees["quote_asset"])],
+                                         dtype=float)
+        return (flat_fees["amount"].astype(float) * fee_rates).groupby(flat_fees["id"]).sum()
+
+    def calculate_asset_delta_from_archive(self,
+                                           current_strategy_name: str,
+                                           market_trading_pair_tuples: List[MarketTradingPairTuple],
+                                           trade_fill_archive: TradeFillArchive,
+                                           start_timestamp: Optional[int] = None,
+                                           ) -> Dict[MarketTradingPairTuple, Dict[str, Decimal]]:
+        """
+        Same as `calculate_asset_delta_from_trades()`, but sums the trades from a trade fill archive with vectorized
+        operations, instead of going through TradeFill records one by one. The sums are done in floating point.
+
+        :param current_strategy_name: Name of the currently configured strategy
+        :param market_trading_pair_tuples: Current MarketTradingPairTuple
+        :param trade_fill_archive: Archive holding the trade fills
+        :param start_timestamp: Only trade fills at or after this timestamp (in milliseconds) are counted
+        :return: Dictionary consisting of spent and acquired amount for each assets
+        """
+        market_trading_pair_stats: Dict[MarketTradingPairTuple, Dict[str, Decimal]] = {}
+        for market_trading_pair_tuple in market_trading_pair_tuples:
+            asset_stats: Dict[str, Dict[str, Decimal]] = defaultdict(
+                lambda: {"spent": s_decimal_0, "acquired": s_decimal_0}
+            )
+            asset_stats[market_trading_pair_tuple.base_asset.upper()] = {"spent": s_decimal_0, "acquired": s_decimal_0}
+            asset_stats[market_trading_pair_tuple.quote_asset.upper()] = {"spent": s_decimal_0, "acquired": s_decimal_0}
+
+            query_kwargs = dict(market=market_trading_pair_tuple.market.display_name,
+                                strategy=current_strategy_name,
+                                symbol=market_trading_pair_tuple.trading_pair,
+                                start_timestamp=start_timestamp)
+            trades: pd.DataFrame = trade_fill_archive.read(**query_kwargs)
+            if trades.empty:
+                market_trading_pair_stats[market_trading_pair_tuple] = {
+                    "starting_quote_rate": market_trading_pair_tuple.get_mid_price(),
+                    "asset": asset_stats
+                }
+                continue
+
+            flat_fees: np.ndarray = (trades["id"]
+                                     .map(self._flat_fees_in_quote(trade_fill_archive.read_flat_fees(**query_kwargs)))
+                                     .fillna(0.0)
+                                     .to_numpy(dtype=float))
+            amount: np.ndarray = trades["amount"].to_numpy(dtype=float)
+            quote_amount: np.ndarray = amount * trades["price"].to_numpy(dtype=float)
+            fee_factor: np.ndarray = 1.0 - trades["fee_percent"].to_numpy(dtype=float)
+            is_sell: np.ndarray = (trades["trade_type"] == TradeType.SELL.name).to_numpy()
+            is_buy: np.ndarray = (trades["trade_type"] == TradeType.BUY.name).to_numpy()
+            if not (is_sell | is_buy).all():
+                raise Exception(f"Unsupported trade type in {set(trades['trade_type'])}")
+
+            # Same deltas as calculate_trade_asset_delta_with_fees(), for all the trades at once.
+            base_delta: np.ndarray = np.where(is_sell, amount, amount * fee_factor - flat_fees)
+            quote_delta: np.ndarray = np.where(is_sell, quote_amount * fee_factor - flat_fees, quote_amount)
+            for (base_asset, quote_asset), indices in trades.groupby(["base_asset", "quote_asset"]).indices.items():
+                base_asset, quote_asset = base_asset.upper(), quote_asset.upper()
+                asset_stats[base_asset]["spent"] += Decimal(repr(float(base_delta[indices][is_sell[indices]].sum())))
+                asset_stats[quote_asset]["acquired"] += Decimal(repr(float(quote_delta[indices][is_sell[indices]].sum())))
+                asset_stats[base_asset]["acquired"] += Decimal(repr(float(base_delta[indices][is_buy[indices]].sum())))
+                asset_stats[quote_asset]["spent"] += Decimal(repr(float(quote_delta[indices][is_buy[indices]].sum())))
+
+            market_trading_pair_stats[market_trading_pair_tuple] = {
+                "starting_quote_rate": Decimal(repr(float(trades["price"].iloc[0]))),
+                "asset": asset_stats
+            }
+
+        return market_trading_pair_stats
+
     def calculate_trade_performance(self,
                                     current_strategy_name: str,
                                     market_trading_pair_tuples: List[MarketTradingPairTuple],
@@ -207,14 +323,28 @@ class PerformanceAnalysis:
         :return: Dictionary consisting of total spent and acquired across whole portfolio in quote value,
                  as well as individual assets
         """
-        ERC = ExchangeRateConversion.get_instance()
-        trade_performance_stats: Dict[str, Decimal] = {}
-        # The final stats will be in primary quote unit
-        primary_quote_asset: str = market_trading_pair_tuples[0].quote_asset
         market_trading_pair_stats: Dict[str, Dict[str, Decimal]] = self.calculate_asset_delta_from_trades(
             current_strategy_name,
             market_trading_pair_tuples,
             raw_queried_trades)
+        return self.calculate_portfolio_performance(market_trading_pair_tuples, market_trading_pair_stats,
+                                                    starting_balances)
+
+    @staticmethod
+    def calculate_portfolio_performance(market_trading_pair_tuples: List[MarketTradingPairTuple],
+                                        market_trading_pair_stats: Dict[str, Dict[str, Decimal]],
+                                        starting_balances: Dict[str, Dict[str, Decimal]]) -> Tuple[Dict, Dict]:
+        """
+        Calculates the performance of each trading pair and of the whole portfolio in quote value, from the spent and
+        acquired amount of each asset, at the current mid prices. Adds the trading pair stats to
+        `market_trading_pair_stats`.
+
+        :return: Dictionary of the portfolio stats, and the updated `market_trading_pair_stats`
+        """
+        ERC = ExchangeRateConversion.get_instance()
+        trade_performance_stats: Dict[str, Decimal] = {}
+        # The final stats will be in primary quote unit
+        primary_quote_asset: str = market_trading_pair_tuples[0].quote_asset
 
         # Calculate total spent and acquired amount for each trading pair in primary quote value
         for market_trading_pair_tuple, trading_pair_stats in market_trading_pair_stats.items():
@@ -0,0 +1,200 @@
+import copy
+from collections import defaultdict
+from decimal import Decimal
+from typing import (
+    Any,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+)
+
+from hummingbot.client.performance_analysis import PerformanceAnalysis
+from hummingbot.core.event.event_forwarder import SourceInfoEventForwarder
+from hummingbot.core.event.events import (
+    MarketEvent,
+    OrderFilledEvent,
+    TradeType,
+)
+from hummingbot.market.market_base import MarketBase
+from hummingbot.model.trade_fill import TradeFill
+from hummingbot.strategy.market_trading_pair_tuple import MarketTradingPairTuple
+
+s_decimal_0 = Decimal(0)
+
+
+class PerformanceTracker:
+    """
+    Keeps the spent and acquired amount of each asset, and the fees paid, of each market trading pair, updated with
+    every trade fill. So the trade performance can be calculated without querying all the trade fills again, which gets
+    slower as they accumulate.
+
+    The trade fills are added by `MarketsRecorder` as it records them, or from the order filled events of the markets
+    the tracker is started with. The amounts are the same as `PerformanceAnalysis.calculate_asset_delta_from_trades()`
+    over the same trade fills, and the performance is marked to the current mid prices in the same way.
+    """
+
+    def __init__(self, strategy_name: Optional[str] = None):
+        """
+        :param strategy_name: Name of the strategy that the order filled events of `start()` are counted for
+        """
+        self._strategy_name: Optional[str] = strategy_name
+        self._trading_pair_stats: Dict[Tuple[str, str, str], Dict[str, Any]] = {}
+        self._trade_fill_count: int = 0
+        self._markets: List[MarketBase] = []
+        self._fill_order_forwarder: SourceInfoEventForwarder = SourceInfoEventForwarder(self._did_fill_order)
+
+    @property
+    def trade_fill_count(self) -> int:
+        return self._trade_fill_count
+
+    def start(self, markets: List[MarketBase]):
+        self.stop()
+        self._markets = list(markets)
+        for market in self._markets:
+            market.add_listener(MarketEvent.OrderFilled, self._fill_order_forwarder)
+
+    def stop(self):
+        for market in self._markets:
+            market.remove_listener(MarketEvent.OrderFilled, self._fill_order_forwarder)
+        self._markets = []
+
+    def reset(self):
+        self._trading_pair_stats.clear()
+        self._trade_fill_count = 0
+
+    def _did_fill_order(self, event_tag: int, market: MarketBase, evt: OrderFilledEvent):
+        base_asset, quote_asset = market.split_trading_pair(evt.trading_pair)
+        self.add_trade(self._strategy_name,
+                       market.display_name,
+                       evt.trading_pair,
+                       base_asset,
+                       quote_asset,
+                       evt.trade_type.name,
+                       Decimal(evt.price),
+                       Decimal(evt.amount),
+                       Decimal(evt.trade_fee.percent),
+                       [(asset, Decimal(amount)) for asset, amount in evt.trade_fee.flat_fees])
+
+    def add_trade_fill(self, trade_fill: TradeFill):
+        base_delta, quote_delta = PerformanceAnalysis.calculate_trade_asset_delta_with_fees(trade_fill)
+        self._add_asset_deltas(trade_fill.strategy,
+                               trade_fill.market,
+                               trade_fill.symbol,
+                               trade_fill.base_asset,
+                               trade_fill.quote_asset,
+                               trade_fill.trade_type,
+                               Decimal(trade_fill.price),
+                               Decimal(trade_fill.amount),
+                               Decimal(trade_fill.trade_fee["percent"]),
+                               base_delta,
+                               quote_delta)
+
+    def add_trade(self,
+                  strategy_name: Optional[str],
+                  market_name: str,
+                  trading_pair: str,
+                  base_asset: str,
+                  quote_asset: str,
+                  trade_type: str,
+                  price: Decimal,
+                  amount: Decimal,
+                  fee_percent: Decimal,
+                  flat_fees: List[Tuple[str, Decimal]]):
+        """
+        :param market_name: Display name of the market
+        :param trade_type: Name of the trade type, i.e. "BUY" or "SELL"
+        """
+        base_delta, quote_delta = PerformanceAnalysis.calculate_asset_delta_with_fees(trade_type, quote_asset, price,
+                                                                                      amount, fee_percent, flat_fees)
+        self._add_asset_deltas(strategy_name, market_name, trading_pair, base_asset, quote_asset, trade_type,
+                               price, amount, fee_percent, base_delta, quote_delta)
+
+    def _add_asset_deltas(self,
+                          strategy_name: Optional[str],
+                          market_name: str,
+                          trading_pair: str,
+                          base_asset: str,
+                          quote_asset: str,
+                          trade_type: str,
+                          price: Decimal,
+                          amount: Decimal,
+                          fee_percent: Decimal,
+                          base_delta: Decimal,
+                          quote_delta: Decimal):
+        key: Tuple[str, str, str] = (strategy_name, market_name, trading_pair)
+        trading_pair_stats: Optional[Dict[str, Any]] = self._trading_pair_stats.get(key)
+        if trading_pair_stats is None:
+            trading_pair_stats = {
+                "starting_quote_rate": Decimal(repr(float(price))),
+                "asset": defaultdict(lambda: {"spent": s_decimal_0, "acquired": s_decimal_0}),
+                "fees": defaultdict(lambda: s_decimal_0),
+                "trade_count": 0
+            }
+            self._trading_pair_stats[key] = trading_pair_stats
+
+        base_asset, quote_asset = base_asset.upper(), quote_asset.upper()
+        asset_stats: Dict[str, Dict[str, Decimal]] = trading_pair_stats["asset"]
+        # The percentage fee is taken from the acquired asset, and the flat fees are in quote asset value.
+        if trade_type == TradeType.SELL.name:
+            asset_stats[base_asset]["spent"] += base_delta
+            asset_stats[quote_asset]["acquired"] += quote_delta
+            trading_pair_stats["fees"][quote_asset] += amount * price - quote_delta
+        elif trade_type == TradeType.BUY.name:
+            asset_stats[base_asset]["acquired"] += base_delta
+            asset_stats[quote_asset]["spent"] += quote_delta
+            trading_pair_stats["fees"][base_asset] += amount * fee_percent
+            trading_pair_stats["fees"][quote_asset] += amount * (Decimal("1") - fee_percent) - base_delta
+        trading_pair_stats["trade_count"] += 1
+        self._trade_fill_count += 1
+
+    def get_market_trading_pair_stats(self,
+                                      strategy_name: Optional[str],
+                                      market_trading_pair_tuples: List[MarketTradingPairTuple]
+                                      ) -> Dict[MarketTradingPairTuple, Dict[str, Any]]:
+        """
+        Same as `PerformanceAnalysis.calculate_asset_delta_from_trades()`, from the trade fills added so far.
+        Also has the fees paid in each asset, and the number of trade fills, of each market trading pair.
+        """
+        market_trading_pair_stats: Dict[MarketTradingPairTuple, Dict[str, Any]] = {}
+        for market_trading_pair_tuple in market_trading_pair_tuples:
+            asset_stats: Dict[str, Dict[str, Decimal]] = defaultdict(
+                lambda: {"spent": s_decimal_0, "acquired": s_decimal_0}
+            )
+            asset_stats[market_trading_pair_tuple.base_asset.upper()] = {"spent": s_decimal_0, "acquired": s_decimal_0}
+            asset_stats[market_trading_pair_tuple.quote_asset.upper()] = {"spent": s_decimal_0, "acquired": s_decimal_0}
+
+            trading_pair_stats: Optional[Dict[str, Any]] = self._trading_pair_stats.get(
+                (strategy_name, market_trading_pair_tuple.market.display_name, market_trading_pair_tuple.trading_pair)
+            )
+            if trading_pair_stats is None:
+                market_trading_pair_stats[market_trading_pair_tuple] = {
+                    "starting_quote_rate": market_trading_pair_tuple.get_mid_price(),
+                    "asset": asset_stats,
+                    "fees": {},
+                    "trade_count": 0
+                }
+                continue
+
+            asset_stats.update(copy.deepcopy(dict(trading_pair_stats["asset"])))
+            market_trading_pair_stats[market_trading_pair_tuple] = {
+                "starting_quote_rate": trading_pair_stats["starting_quote_rate"],
+                "asset": asset_stats,
+                "fees": dict(trading_pair_stats["fees"]),
+                "trade_count": trading_pair_stats["trade_count"]
+            }
+        return market_trading_pair_stats
+
+    def calculate_trade_performance(self,
+                                    strategy_name: Optional[str],
+                                    market_trading_pair_tuples: List[MarketTradingPairTuple],
+                                    starting_balances: Dict[str, Dict[str, Decimal]]) -> Tuple[Dict, Dict]:
+        """
+        Same as `PerformanceAnalysis.calculate_trade_performance()`, from the trade fills added so far. Takes time in
+        proportion to the number of market trading pairs, not of trade fills.
+        """
+        return PerformanceAnalysis.calculate_portfolio_performance(
+            market_trading_pair_tuples,
+            self.get_market_trading_pair_stats(strategy_name, market_trading_pair_tuples),
+            starting_balances
+        )
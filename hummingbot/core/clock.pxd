@@ -1,5 +1,22 @@
 # distutils: language=c++
 
+from libc.stdint cimport int64_t
+from libcpp.vector cimport vector
+
+
+cdef class TickTimingStats:
+    cdef:
+        double _tick_size
+        tuple _bucket_bounds
+        vector[int64_t] _bucket_counts
+        int64_t _count
+        int64_t _overrun_count
+        double _total_duration
+        double _max_duration
+        double _last_duration
+
+    cdef c_record(self, double duration)
+
 cdef class Clock:
     cdef:
         object _clock_mode
@@ -10,3 +27,23 @@ cdef class Clock:
         list _current_context
         double _current_tick
         bint _started
+        bint _event_driven
+        double _min_event_tick_interval
+        object _wakeup_event
+        dict _pending_wakeups
+        list _wakeup_subscriptions
+        int64_t _event_tick_count
+        bint _stagger_iterators
+        int64_t _tick_index
+        double _time_offset
+        dict _tick_stats
+        int64_t _tick_overrun_count
+        int64_t _skipped_tick_count
+        double _last_overrun_log_timestamp
+
+    cdef c_request_tick(self, object iterator)
+    cdef double c_next_wakeup_time(self)
+    cdef bint c_tick_iterators(self, list iterators, double timestamp)
+    cdef bint c_tick_woken_iterators(self, double now)
+    cdef double c_time(self)
+    cdef c_log_skipped_ticks(self, double now, int64_t skipped_ticks)
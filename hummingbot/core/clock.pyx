@@ -1,10 +1,20 @@
 # distutils: language=c++
 
 import asyncio
+from enum import Enum
 import logging
 import time
-from typing import List
+from typing import (
+    Dict,
+    List,
+    Tuple,
+)
 
+from libc.stdint cimport int64_t
+
+from hummingbot.core.event.event_listener cimport EventListener
+from hummingbot.core.pubsub import PubSub
+from hummingbot.core.pubsub cimport PubSub
 from hummingbot.core.time_iterator import TimeIterator
 from hummingbot.core.time_iterator cimport TimeIterator
 from hummingbot.core.clock_mode import ClockMode
@@ -13,7 +23,117 @@ from hummingbot.logger import HummingbotLogger
 s_logger = None
 
 
+cdef class ClockWakeupListener(EventListener):
+    """
+    Requests an early tick of a time iterator from its clock whenever the event it listens to is triggered.
+    """
+    cdef:
+        Clock _clock
+        TimeIterator _iterator
+
+    def __init__(self, Clock clock, TimeIterator iterator):
+        super().__init__()
+        self._clock = clock
+        self._iterator = iterator
+
+    def __call__(self, arg: any):
+        self._clock.c_request_tick(self._iterator)
+
+    cdef c_call(self, object arg):
+        self._clock.c_request_tick(self._iterator)
+
+
+cdef class TickTimingStats:
+    """
+    Histogram of the time taken by the ticks of one time iterator.
+    """
+    BUCKET_BOUNDS = (0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5)
+
+    def __init__(self, tick_size: float):
+        self._tick_size = tick_size
+        self._bucket_bounds = self.BUCKET_BOUNDS
+        # The last bucket counts the ticks longer than the largest bound.
+        self._bucket_counts.assign(len(self.BUCKET_BOUNDS) + 1, 0)
+        self._count = 0
+        self._overrun_count = 0
+        self._total_duration = 0
+        self._max_duration = 0
+        self._last_duration = 0
+
+    cdef c_record(self, double duration):
+        cdef:
+            size_t bucket = 0
+        for bucket_bound in self._bucket_bounds:
+            if duration <= <double>bucket_bound:
+                break
+            bucket += 1
+        self._bucket_counts[bucket] += 1
+        self._count += 1
+        self._total_duration += duration
+        self._last_duration = duration
+        if duration > self._max_duration:
+            self._max_duration = duration
+        if duration > self._tick_size:
+            self._overrun_count += 1
+
+    def record(self, duration: float):
+        self.c_record(duration)
+
+    @property
+    def count(self) -> int:
+        return self._count
+
+    @property
+    def overrun_count(self) -> int:
+        """
+        Number of ticks that took longer than the tick size on their own.
+        """
+        return self._overrun_count
+
+    @property
+    def mean_duration(self) -> float:
+        return self._total_duration / self._count if self._count > 0 else float("nan")
+
+    @property
+    def max_duration(self) -> float:
+        return self._max_duration
+
+    @property
+    def last_duration(self) -> float:
+        return self._last_duration
+
+    @property
+    def histogram(self) -> List[Tuple[float, int]]:
+        """
+        (upper bound in seconds, count) of every bucket. The last bucket's upper bound is infinity.
+        """
+        return list(zip(self._bucket_bounds + (float("inf"),), self._bucket_counts))
+
+    def percentile(self, q: float) -> float:
+        """
+        Upper bound of the bucket holding the q-th percentile tick duration, or the max duration for the last bucket.
+        """
+        cdef:
+            int64_t cumulative_count = 0
+            size_t bucket
+        if self._count == 0:
+            return float("nan")
+        for bucket in range(self._bucket_counts.size()):
+            cumulative_count += self._bucket_counts[bucket]
+            if cumulative_count >= q / 100.0 * self._count:
+                if bucket < len(self._bucket_bounds):
+                    return min(self._bucket_bounds[bucket], self._max_duration)
+                break
+        return self._max_duration
+
+    def __repr__(self) -> str:
+        return (f"TickTimingStats(count={self._count}, mean={self.mean_duration:.6f}, "
+                f"p99={self.percentile(99):.6f}, max={self._max_duration:.6f}, overruns={self._overrun_count})")
+
+
 cdef class Clock:
+    OVERRUN_LOG_INTERVAL = 60.0
+
     @classmethod
     def logger(cls) -> HummingbotLogger:
         global s_logger
@@ -21,12 +141,18 @@ cdef class Clock:
             s_logger = logging.getLogger(__name__)
         return s_logger
 
-    def __init__(self, clock_mode: ClockMode, tick_size: float = 1.0, start_time: float = 0.0, end_time: float = 0.0):
+    def __init__(self, clock_mode: ClockMode, tick_size: float = 1.0, start_time: float = 0.0, end_time: float = 0.0,
+                 event_driven: bool = False, min_event_tick_interval: float = 0.1, stagger_iterators: bool = False):
         """
         :param clock_mode: either real time mode or back testing mode
         :param tick_size: time interval of each tick
         :param start_time: (back testing mode only) start of simulation in UNIX timestamp
         :param end_time: (back testing mode only) end of simulation in UNIX timestamp. NaN to simulate to end of data.
+        :param event_driven: (real time mode only) also tick iterators as soon as the events they subscribed to with
+                             subscribe_wakeup() are triggered, between the regular ticks
+        :param min_event_tick_interval: minimum time between two ticks of an iterator woken up by events
+        :param stagger_iterators: (real time mode only) spread the child iterators of each tick over the tick interval,
+                                  instead of running them all at once
         """
         self._clock_mode = clock_mode
         self._tick_size = tick_size
@@ -36,6 +162,19 @@ cdef class Clock:
         self._child_iterators = []
         self._current_context = None
         self._started = False
+        self._event_driven = event_driven and clock_mode is ClockMode.REALTIME
+        self._min_event_tick_interval = min_event_tick_interval
+        self._wakeup_event = None
+        self._pending_wakeups = {}
+        self._wakeup_subscriptions = []
+        self._event_tick_count = 0
+        self._stagger_iterators = stagger_iterators
+        self._tick_index = 0
+        self._time_offset = 0
+        self._tick_stats = {}
+        self._tick_overrun_count = 0
+        self._skipped_tick_count = 0
+        self._last_overrun_log_timestamp = 0
 
     @property
     def clock_mode(self) -> ClockMode:
@@ -57,6 +196,47 @@ cdef class Clock:
     def current_timestamp(self) -> float:
         return self._current_tick
 
+    @property
+    def event_driven(self) -> bool:
+        return self._event_driven
+
+    @property
+    def min_event_tick_interval(self) -> float:
+        return self._min_event_tick_interval
+
+    @property
+    def event_tick_count(self) -> int:
+        """
+        Number of iterator ticks caused by events, rather than by the regular ticks.
+        """
+        return self._event_tick_count
+
+    @property
+    def tick_stats(self) -> Dict[TimeIterator, "TickTimingStats"]:
+        """
+        Timing of the ticks of every child iterator, in real time mode.
+        """
+        return self._tick_stats
+
+    @property
+    def tick_overrun_count(self) -> int:
+        """
+        Number of ticks that started late, because the ones before them took longer than the tick size.
+        """
+        return self._tick_overrun_count
+
+    @property
+    def skipped_tick_count(self) -> int:
+        """
+        Number of ticks that were skipped, because the ones before them took longer than the tick size.
+        """
+        return self._skipped_tick_count
+
+    def reset_tick_stats(self):
+        self._tick_stats = {}
+        self._tick_overrun_count = 0
+        self._skipped_tick_count = 0
+
     def __enter__(self) -> Clock:
         if self._current_context is not None:
             raise EnvironmentError("Clock context is not re-entrant.")
@@ -68,6 +248,8 @@ cdef class Clock:
             for iterator in self._current_context:
                 (<TimeIterator>iterator).c_stop(self)
         self._current_context = None
+        for iterator, _, _, _ in list(self._wakeup_subscriptions):
+            self.unsubscribe_wakeups(iterator)
 
     def add_iterator(self, iterator: TimeIterator):
         if self._current_context is not None:
@@ -81,6 +263,113 @@ cdef class Clock:
             (<TimeIterator>iterator).c_stop(self)
             self._current_context.remove(iterator)
         self._child_iterators.remove(iterator)
+        self.unsubscribe_wakeups(iterator)
+
+    def subscribe_wakeup(self, iterator: TimeIterator, pubsub: PubSub, event_tag: Enum):
+        """
+        Wakes up the iterator for an early tick whenever the event is triggered on pubsub, e.g. an order book update
+        or an order fill, in event driven mode. Ticks caused by events are debounced to min_event_tick_interval per
+        iterator. Does nothing outside event driven mode.
+        """
+        cdef:
+            ClockWakeupListener listener
+
+        if not self._event_driven:
+            return
+        listener = ClockWakeupListener(self, iterator)
+        pubsub.add_listener(event_tag, listener)
+        # PubSub only keeps weak references to its listeners.
+        self._wakeup_subscriptions.append((iterator, pubsub, event_tag, listener))
+
+    def unsubscribe_wakeups(self, iterator: TimeIterator):
+        remaining_subscriptions = []
+        for subscription in self._wakeup_subscriptions:
+            subscribed_iterator, pubsub, event_tag, listener = subscription
+            if subscribed_iterator is iterator:
+                pubsub.remove_listener(event_tag, listener)
+            else:
+                remaining_subscriptions.append(subscription)
+        self._wakeup_subscriptions = remaining_subscriptions
+        self._pending_wakeups.pop(iterator, None)
+
+    def request_tick(self, iterator: TimeIterator):
+        self.c_request_tick(iterator)
+
+    cdef c_request_tick(self, object iterator):
+        if not self._event_driven or self._current_context is None:
+            return
+        self._pending_wakeups[iterator] = None
+        if self._wakeup_event is not None:
+            self._wakeup_event.set()
+
+    cdef double c_next_wakeup_time(self):
+        """
+        Earliest time a pending wakeup can be run without breaking the minimum interval between event ticks.
+        """
+        cdef:
+            TimeIterator iterator
+            double retval = float("inf")
+            double wakeup_time
+        for pi in self._pending_wakeups:
+            iterator = pi
+            wakeup_time = iterator._current_timestamp + self._min_event_tick_interval
+            if wakeup_time != wakeup_time:
+                # Not ticked yet.
+                wakeup_time = 0
+            if not (wakeup_time >= retval):
+                retval = wakeup_time
+        return retval
+
+    cdef bint c_tick_iterators(self, list iterators, double timestamp):
+        cdef:
+            TimeIterator child_iterator
+            TickTimingStats tick_stats
+            double tick_start
+        for ci in iterators:
+            child_iterator = ci
+            tick_stats = self._tick_stats.get(child_iterator)
+            if tick_stats is None:
+                tick_stats = TickTimingStats(self._tick_size)
+                self._tick_stats[child_iterator] = tick_stats
+            tick_start = time.perf_counter()
+            try:
+                child_iterator.c_tick(timestamp)
+            except StopIteration:
+                self.logger().error("Stop iteration triggered in real time mode. This is not expected.")
+                return False
+            except Exception:
+                self.logger().error("Unexpected error running clock tick.", exc_info=True)
+            finally:
+                tick_stats.c_record(time.perf_counter() - tick_start)
+        return True
+
+    cdef bint c_tick_woken_iterators(self, double now):
+        """
+        Ticks the iterators with pending wakeups whose minimum event tick interval has passed, in context order.
+        """
+        cdef:
+            TimeIterator child_iterator
+            list woken_iterators = []
+            double timestamp = max(now, self._current_tick)
+
+        for ci in self._current_context:
+            child_iterator = ci
+            if child_iterator not in self._pending_wakeups:
+                continue
+            if now - child_iterator._current_timestamp < self._min_event_tick_interval:
+                continue
+            del self._pending_wakeups[child_iterator]
+            woken_iterators.append(child_iterator)
+        # Drop the wakeups of iterators that are no longer in the context.
+        for pi in list(self._pending_wakeups):
+            if pi not in self._current_context:
+                del self._pending_wakeups[pi]
+
+        if len(woken_iterators) == 0:
+            return True
+        self._current_tick = timestamp
+        self._event_tick_count += len(woken_iterators)
+        return self.c_tick_iterators(woken_iterators, timestamp)
 
     async def run(self):
         await self.run_til(float("nan"))
@@ -88,45 +377,132 @@ cdef class Clock:
     async def run_til(self, timestamp: float):
         cdef:
             TimeIterator child_iterator
-            double now = time.time()
+            double now
             double next_tick_time
+            double wakeup_time
+            int64_t next_tick_index
+            int64_t skipped_ticks
+            bint is_regular_tick
 
         if self._current_context is None:
             raise EnvironmentError("run() and run_til() can only be used within the context of a `with...` statement.")
 
-        self._current_tick = (now // self._tick_size) * self._tick_size
+        # Ticks are scheduled on the monotonic clock, so they don't drift with changes to the system time. The
+        # timestamps given to the iterators are still UNIX timestamps, on a fixed grid of tick_size intervals.
+        self._time_offset = time.time() - time.monotonic()
+        now = self.c_time()
+        self._tick_index = <int64_t>(now // self._tick_size)
+        self._current_tick = self._tick_index * self._tick_size
         if not self._started:
             for ci in self._current_context:
                 child_iterator = ci
                 child_iterator.c_start(self, self._current_tick)
             self._started = True
+        if self._event_driven and self._wakeup_event is None:
+            self._wakeup_event = asyncio.Event()
 
         try:
             while True:
-                now = time.time()
+                now = self.c_time()
                 if now >= timestamp:
                     return
 
-                # Sleep until the next tick
-                next_tick_time = ((now // self._tick_size) + 1) * self._tick_size
-                await asyncio.sleep(next_tick_time - now)
+                next_tick_index = self._tick_index + 1
+                next_tick_time = next_tick_index * self._tick_size
+                if next_tick_time <= now:
+                    # The last tick took too long. Run the latest tick that's due right away, skipping any before it.
+                    self._tick_overrun_count += 1
+                    skipped_ticks = <int64_t>(now // self._tick_size) - next_tick_index
+                    if skipped_ticks > 0:
+                        self._skipped_tick_count += skipped_ticks
+                        next_tick_index += skipped_ticks
+                        next_tick_time = next_tick_index * self._tick_size
+                        self.c_log_skipped_ticks(now, skipped_ticks)
+                    # Still yield to the event loop, or ticks that keep overrunning would starve every other task.
+                    await asyncio.sleep(0)
+                elif self._event_driven:
+                    # Sleep until the next tick or the next wakeup, whichever comes first.
+                    is_regular_tick = True
+                    wakeup_time = next_tick_time
+                    if len(self._pending_wakeups) > 0:
+                        wakeup_time = min(next_tick_time, self.c_next_wakeup_time())
+                        is_regular_tick = wakeup_time >= next_tick_time
+                    if wakeup_time > now:
+                        self._wakeup_event.clear()
+                        try:
+                            await asyncio.wait_for(self._wakeup_event.wait(), wakeup_time - now)
+                            is_regular_tick = False
+                        except asyncio.TimeoutError:
+                            pass
+                    now = self.c_time()
+                    if not (is_regular_tick or now >= next_tick_time):
+                        if not self.c_tick_woken_iterators(now):
+                            return
+                        continue
+                else:
+                    # Sleep until the next tick
+                    await asyncio.sleep(next_tick_time - now)
+
+                # The regular tick wakes up everything.
+                self._pending_wakeups.clear()
+                self._tick_index = next_tick_index
                 self._current_tick = next_tick_time
 
                 # Run through all the child iterators.
-                for ci in self._current_context:
-                    child_iterator = ci
-                    try:
-                        child_iterator.c_tick(self._current_tick)
-                    except StopIteration:
-                        self.logger().error("Stop iteration triggered in real time mode. This is not expected.")
+                if self._stagger_iterators and len(self._current_context) > 1:
+                    if not await self._run_staggered_tick():
                         return
-                    except Exception:
-                        self.logger().error("Unexpected error running clock tick.", exc_info=True)
+                elif not self.c_tick_iterators(self._current_context, self._current_tick):
+                    return
         finally:
             for ci in self._current_context:
                 child_iterator = ci
                 child_iterator._clock = None
 
+    async def _run_staggered_tick(self) -> bool:
+        """
+        Spreads the child iterators of a tick evenly over the tick interval, in order, so the event loop gets to run
+        between them. Every iterator still gets the same tick timestamp.
+        """
+        cdef:
+            list iterators = list(self._current_context)
+            double stagger_interval = self._tick_size / len(iterators)
+            double delay
+            size_t i
+
+        for i in range(len(iterators)):
+            if i > 0:
+                delay = self._current_tick + i * stagger_interval - self.c_time()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+            if not self.c_tick_iterators(iterators[i:i + 1], self._current_tick):
+                return False
+        return True
+
+    cdef double c_time(self):
+        """
+        Current UNIX timestamp, moving with the monotonic clock.
+        """
+        return time.monotonic() + self._time_offset
+
+    cdef c_log_skipped_ticks(self, double now, int64_t skipped_ticks):
+        cdef:
+            TickTimingStats tick_stats
+            double slowest_duration = 0
+
+        if now - self._last_overrun_log_timestamp < self.OVERRUN_LOG_INTERVAL:
+            return
+        self._last_overrun_log_timestamp = now
+        slowest_iterator = None
+        for iterator, ts in self._tick_stats.items():
+            tick_stats = ts
+            if tick_stats._last_duration > slowest_duration:
+                slowest_iterator = iterator
+                slowest_duration = tick_stats._last_duration
+        self.logger().warning(f"Clock ticks are taking longer than the tick size of {self._tick_size} seconds. "
+                              f"{skipped_ticks} ticks were skipped, {self._skipped_tick_count} in total. "
+                              f"Slowest iterator in the last tick: {slowest_iterator}.")
+
     def backtest_til(self, timestamp: float):
         cdef TimeIterator child_iterator
 
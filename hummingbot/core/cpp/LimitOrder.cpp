@@ -8,6 +8,9 @@ LimitOrder::LimitOrder() {
     this->quoteCurrency = "";
     this->price = NULL;
     this->quantity = NULL;
+    this->priceValue = 0;
+    this->filledQuantity = NULL;
+    this->queueAhead = 0;
 }
 
 LimitOrder::LimitOrder(std::string clientOrderID,
@@ -24,6 +27,13 @@ LimitOrder::LimitOrder(std::string clientOrderID,
     this->quoteCurrency = quoteCurrency;
     this->price = price;
     this->quantity = quantity;
+    this->priceValue = price != NULL ? PyFloat_AsDouble(price) : 0;
+    if (this->priceValue == -1.0 && PyErr_Occurred()) {
+        PyErr_Clear();
+        this->priceValue = Py_NAN;
+    }
+    this->filledQuantity = NULL;
+    this->queueAhead = 0;
     Py_XINCREF(price);
     Py_XINCREF(quantity);
 }
@@ -36,18 +46,30 @@ LimitOrder::LimitOrder(const LimitOrder &other) {
     this->quoteCurrency = other.quoteCurrency;
     this->price = other.price;
     this->quantity = other.quantity;
+    this->priceValue = other.priceValue;
+    this->filledQuantity = other.filledQuantity;
+    this->queueAhead = other.queueAhead;
     Py_XINCREF(this->price);
     Py_XINCREF(this->quantity);
+    Py_XINCREF(this->filledQuantity);
 }
 
 LimitOrder::~LimitOrder() {
     Py_XDECREF(this->price);
     Py_XDECREF(this->quantity);
+    Py_XDECREF(this->filledQuantity);
     this->price = NULL;
     this->quantity = NULL;
+    this->filledQuantity = NULL;
 }
 
 LimitOrder &LimitOrder::operator=(const LimitOrder &other) {
+    Py_XINCREF(other.price);
+    Py_XINCREF(other.quantity);
+    Py_XINCREF(other.filledQuantity);
+    Py_XDECREF(this->price);
+    Py_XDECREF(this->quantity);
+    Py_XDECREF(this->filledQuantity);
     this->clientOrderID = other.clientOrderID;
     this->tradingPair = other.tradingPair;
     this->isBuy = other.isBuy;
@@ -55,14 +77,22 @@ LimitOrder &LimitOrder::operator=(const LimitOrder &other) {
     this->quoteCurrency = other.quoteCurrency;
     this->price = other.price;
     this->quantity = other.quantity;
-    Py_XINCREF(this->price);
-    Py_XINCREF(this->quantity);
+    this->priceValue = other.priceValue;
+    this->filledQuantity = other.filledQuantity;
+    this->queueAhead = other.queueAhead;
 
     return *this;
 }
 
 bool operator<(LimitOrder const &a, LimitOrder const &b) {
-    return (bool)(PyObject_RichCompareBool(a.price, b.price, Py_LT));
+    if (PyObject_RichCompareBool(a.price, b.price, Py_LT)) {
+        return true;
+    }
+    if (PyObject_RichCompareBool(b.price, a.price, Py_LT)) {
+        return false;
+    }
+    // Orders at the same price are kept apart, instead of being treated as duplicates.
+    return a.clientOrderID < b.clientOrderID;
 }
 
 std::string LimitOrder::getClientOrderID() const {
@@ -92,3 +122,44 @@ PyObject *LimitOrder::getPrice() const {
 PyObject *LimitOrder::getQuantity() const {
     return this->quantity;
 }
+
+double LimitOrder::getPriceValue() const {
+    return this->priceValue;
+}
+
+PyObject *LimitOrder::getFilledQuantity() const {
+    return this->filledQuantity;
+}
+
+void LimitOrder::setFilledQuantity(PyObject *filledQuantity) const {
+    Py_XINCREF(filledQuantity);
+    Py_XDECREF(this->filledQuantity);
+    this->filledQuantity = filledQuantity;
+}
+
+double LimitOrder::getQueueAhead() const {
+    return this->queueAhead;
+}
+
+void LimitOrder::setQueueAhead(double queueAhead) const {
+    this->queueAhead = queueAhead > 0 ? queueAhead : 0;
+}
+
+void LimitOrder::updateQueueAhead(double levelVolume) const {
+    // Volume added to the price level queues up behind the order, while volume taken off the level is assumed to
+    // be from ahead of it.
+    if (levelVolume < this->queueAhead) {
+        this->queueAhead = levelVolume > 0 ? levelVolume : 0;
+    }
+}
+
+double LimitOrder::consumeTradedVolume(double tradedVolume) const {
+    // Trades fill the volume queued ahead of the order first. Returns the traded volume left for the order itself.
+    if (tradedVolume <= this->queueAhead) {
+        this->queueAhead -= tradedVolume;
+        return 0;
+    }
+    tradedVolume -= this->queueAhead;
+    this->queueAhead = 0;
+    return tradedVolume;
+}
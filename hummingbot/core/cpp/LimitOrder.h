@@ -12,6 +12,12 @@ class LimitOrder {
     std::string quoteCurrency;
     PyObject *price;
     PyObject *quantity;
+    double priceValue;
+
+    // Matching state of simulated orders. It doesn't take part in the ordering, so it can be updated in place while
+    // the order sits in a std::set.
+    mutable PyObject *filledQuantity;
+    mutable double queueAhead;
 
     public:
         LimitOrder();
@@ -34,6 +40,14 @@ class LimitOrder {
         std::string getQuoteCurrency() const;
         PyObject *getPrice() const;
         PyObject *getQuantity() const;
+        double getPriceValue() const;
+
+        PyObject *getFilledQuantity() const;
+        void setFilledQuantity(PyObject *filledQuantity) const;
+        double getQueueAhead() const;
+        void setQueueAhead(double queueAhead) const;
+        void updateQueueAhead(double levelVolume) const;
+        double consumeTradedVolume(double tradedVolume) const;
 };
 
 #endif
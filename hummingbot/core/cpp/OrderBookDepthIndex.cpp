@@ -0,0 +1,311 @@
+#include "OrderBookDepthIndex.h"
+#include <algorithm>
+#include <cmath>
+#include <functional>
+
+// Point updates accumulate floating point drift in the Fenwick sums, and insertions use up the empty slots, so the
+// index is rebuilt from the order book after this many updates.
+static const size_t MAX_PENDING_UPDATES = 4096;
+
+// Number of empty slots left before the best and after the worst price level by a rebuild.
+static const size_t EDGE_EMPTY_SLOTS = 16;
+
+// A rebuild leaves one empty slot after every this many price levels.
+static const size_t LEVELS_PER_EMPTY_SLOT = 8;
+
+// Maximum number of price levels shifted to make room for a new price level, before giving up and rebuilding.
+static const size_t MAX_SHIFTED_LEVELS = 64;
+
+OrderBookDepthIndex::OrderBookDepthIndex() {
+    this->ascending = true;
+    this->stale = true;
+    this->pendingUpdates = 0;
+    this->rebuildCount = 0;
+}
+
+void OrderBookDepthIndex::invalidate() {
+    this->stale = true;
+}
+
+bool OrderBookDepthIndex::isStale() const {
+    return this->stale;
+}
+
+size_t OrderBookDepthIndex::getRebuildCount() const {
+    return this->rebuildCount;
+}
+
+void OrderBookDepthIndex::rebuild(const std::set<OrderBookEntry> &book, bool ascending) {
+    size_t numLevels = book.size();
+    size_t numSlots = numLevels + numLevels / LEVELS_PER_EMPTY_SLOT + 2 * EDGE_EMPTY_SLOTS;
+    size_t slot = EDGE_EMPTY_SLOTS;
+    size_t level = 0;
+    this->ascending = ascending;
+    this->prices.assign(numSlots, 0);
+    this->amounts.assign(numSlots, 0);
+    this->occupied.assign(numSlots, false);
+    if (ascending) {
+        for (std::set<OrderBookEntry>::const_iterator it = book.begin(); it != book.end(); ++it, ++level, ++slot) {
+            if (level > 0 && level % LEVELS_PER_EMPTY_SLOT == 0) {
+                ++slot;
+            }
+            this->prices[slot] = it->getPrice();
+            this->amounts[slot] = it->getAmount();
+            this->occupied[slot] = true;
+        }
+    } else {
+        for (std::set<OrderBookEntry>::const_reverse_iterator it = book.rbegin(); it != book.rend();
+             ++it, ++level, ++slot) {
+            if (level > 0 && level % LEVELS_PER_EMPTY_SLOT == 0) {
+                ++slot;
+            }
+            this->prices[slot] = it->getPrice();
+            this->amounts[slot] = it->getAmount();
+            this->occupied[slot] = true;
+        }
+    }
+
+    // Empty slots take the price of the next price level, or infinity past the worst price level.
+    double nextPrice = ascending ? INFINITY : -INFINITY;
+    for (size_t i = numSlots; i > 0; --i) {
+        if (this->occupied[i - 1]) {
+            nextPrice = this->prices[i - 1];
+        } else {
+            this->prices[i - 1] = nextPrice;
+        }
+    }
+
+    // Build the Fenwick trees in linear time.
+    this->baseTree.assign(numSlots + 1, 0);
+    this->quoteTree.assign(numSlots + 1, 0);
+    this->levelTree.assign(numSlots + 1, 0);
+    for (size_t i = 1; i <= numSlots; ++i) {
+        double amount = this->amounts[i - 1];
+        this->baseTree[i] += amount;
+        // Empty slots past the worst price level have infinite prices.
+        this->quoteTree[i] += amount > 0 ? amount * this->prices[i - 1] : 0;
+        this->levelTree[i] += amount > 0 ? 1 : 0;
+        size_t parent = i + (i & (~i + 1));
+        if (parent <= numSlots) {
+            this->baseTree[parent] += this->baseTree[i];
+            this->quoteTree[parent] += this->quoteTree[i];
+            this->levelTree[parent] += this->levelTree[i];
+        }
+    }
+
+    this->pendingUpdates = 0;
+    this->rebuildCount += 1;
+    this->stale = false;
+}
+
+size_t OrderBookDepthIndex::findSlotAfter(double price) const {
+    // Index of the first slot whose price comes after the given price.
+    if (this->ascending) {
+        return std::upper_bound(this->prices.begin(), this->prices.end(), price) - this->prices.begin();
+    }
+    return std::upper_bound(this->prices.begin(), this->prices.end(), price, std::greater<double>()) -
+           this->prices.begin();
+}
+
+size_t OrderBookDepthIndex::findLevel(double price) const {
+    // Empty slots share the price of the level behind them, so the level is the last slot with the price.
+    size_t index = this->findSlotAfter(price);
+    if (index > 0 && this->occupied[index - 1] && this->prices[index - 1] == price) {
+        return index - 1;
+    }
+    return this->prices.size();
+}
+
+size_t OrderBookDepthIndex::insertLevel(double price) {
+    // Returns the slot of the new, empty price level, or the number of slots if there's no room for it.
+    size_t numSlots = this->prices.size();
+    size_t index = this->findSlotAfter(price);
+    size_t slot;
+
+    if (index < numSlots && !this->occupied[index]) {
+        // There's a run of empty slots at the position of the new level. Take the one in the middle of the run, so
+        // there's room for more levels on both sides. Runs at the ends of the index fill up from the inside.
+        size_t runEnd = index;
+        while (runEnd < numSlots && !this->occupied[runEnd]) {
+            ++runEnd;
+        }
+        if (index == 0) {
+            slot = runEnd - 1;
+        } else if (runEnd == numSlots) {
+            slot = index;
+        } else {
+            slot = index + (runEnd - index) / 2;
+        }
+        for (size_t i = index; i < slot; ++i) {
+            this->prices[i] = price;
+        }
+        this->prices[slot] = price;
+        this->occupied[slot] = true;
+        return slot;
+    }
+
+    // Otherwise, shift the levels between the position of the new level and the nearest empty slot by one.
+    for (size_t distance = 0; distance < MAX_SHIFTED_LEVELS; ++distance) {
+        if (index + distance < numSlots && !this->occupied[index + distance]) {
+            for (size_t i = index + distance; i > index; --i) {
+                this->setSlot(i, this->prices[i - 1], this->amounts[i - 1]);
+            }
+            this->setSlot(index, price, 0);
+            this->pendingUpdates += distance;
+            return index;
+        }
+        if (index > distance && !this->occupied[index - distance - 1]) {
+            for (size_t i = index - distance - 1; i + 1 < index; ++i) {
+                this->setSlot(i, this->prices[i + 1], this->amounts[i + 1]);
+            }
+            this->setSlot(index - 1, price, 0);
+            this->pendingUpdates += distance;
+            return index - 1;
+        }
+    }
+    return numSlots;
+}
+
+void OrderBookDepthIndex::setSlot(size_t index, double price, double amount) {
+    // Moves a price level into a slot.
+    double oldAmount = this->amounts[index];
+    double oldQuote = oldAmount > 0 ? oldAmount * this->prices[index] : 0;
+    int64_t levelDelta = (amount > 0 ? 1 : 0) - (oldAmount > 0 ? 1 : 0);
+    this->addToTrees(index, amount - oldAmount, (amount > 0 ? amount * price : 0) - oldQuote, levelDelta);
+    this->prices[index] = price;
+    this->amounts[index] = amount;
+    this->occupied[index] = true;
+}
+
+void OrderBookDepthIndex::addToTrees(size_t index, double baseDelta, double quoteDelta, int64_t levelDelta) {
+    size_t numSlots = this->prices.size();
+    for (size_t i = index + 1; i <= numSlots; i += (i & (~i + 1))) {
+        this->baseTree[i] += baseDelta;
+        this->quoteTree[i] += quoteDelta;
+        this->levelTree[i] += levelDelta;
+    }
+}
+
+void OrderBookDepthIndex::applyUpdate(double price, double amount) {
+    if (this->stale) {
+        return;
+    }
+    size_t index = this->findLevel(price);
+    if (index >= this->prices.size()) {
+        // Removing a price level the index does not know about is a no-op.
+        if (amount <= 0) {
+            return;
+        }
+        index = this->insertLevel(price);
+        if (index >= this->prices.size()) {
+            this->stale = true;
+            return;
+        }
+    }
+
+    // Removed price levels are kept as empty levels until the next rebuild.
+    double oldAmount = this->amounts[index];
+    double newAmount = amount > 0 ? amount : 0;
+    int64_t levelDelta = (newAmount > 0 ? 1 : 0) - (oldAmount > 0 ? 1 : 0);
+    this->amounts[index] = newAmount;
+    this->addToTrees(index, newAmount - oldAmount, (newAmount - oldAmount) * price, levelDelta);
+
+    if (++this->pendingUpdates >= MAX_PENDING_UPDATES) {
+        this->stale = true;
+    }
+}
+
+size_t OrderBookDepthIndex::size() const {
+    return this->prices.size();
+}
+
+double OrderBookDepthIndex::getPrice(size_t index) const {
+    return this->prices[index];
+}
+
+double OrderBookDepthIndex::getAmount(size_t index) const {
+    return this->amounts[index];
+}
+
+double OrderBookDepthIndex::getCumulativeBase(size_t index) const {
+    double retval = 0;
+    for (size_t i = index + 1; i > 0; i -= (i & (~i + 1))) {
+        retval += this->baseTree[i];
+    }
+    return retval;
+}
+
+double OrderBookDepthIndex::getCumulativeQuote(size_t index) const {
+    double retval = 0;
+    for (size_t i = index + 1; i > 0; i -= (i & (~i + 1))) {
+        retval += this->quoteTree[i];
+    }
+    return retval;
+}
+
+int64_t OrderBookDepthIndex::getCumulativeLevels(size_t index) const {
+    int64_t retval = 0;
+    for (size_t i = index + 1; i > 0; i -= (i & (~i + 1))) {
+        retval += this->levelTree[i];
+    }
+    return retval;
+}
+
+double OrderBookDepthIndex::getTotalBase() const {
+    return this->prices.empty() ? 0 : this->getCumulativeBase(this->prices.size() - 1);
+}
+
+double OrderBookDepthIndex::getTotalQuote() const {
+    return this->prices.empty() ? 0 : this->getCumulativeQuote(this->prices.size() - 1);
+}
+
+template <typename T>
+static size_t fenwickLowerBound(const std::vector<T> &tree, T target) {
+    // Returns the 0-based index of the first slot whose inclusive prefix sum is >= target, or the number of slots if
+    // there's no such slot.
+    size_t numLevels = tree.size() - 1;
+    size_t position = 0;
+    size_t step = 1;
+    while ((step << 1) <= numLevels) {
+        step <<= 1;
+    }
+    for (; step > 0; step >>= 1) {
+        if (position + step <= numLevels && tree[position + step] < target) {
+            position += step;
+            target -= tree[position];
+        }
+    }
+    return position;
+}
+
+size_t OrderBookDepthIndex::findByBase(double volume) const {
+    if (this->prices.empty()) {
+        return 0;
+    }
+    if (volume <= 0) {
+        // Any level satisfies a non-positive volume, so return the first non-empty one.
+        return this->findByLevels(1);
+    }
+    return fenwickLowerBound(this->baseTree, volume);
+}
+
+size_t OrderBookDepthIndex::findByQuote(double quoteVolume) const {
+    if (this->prices.empty()) {
+        return 0;
+    }
+    if (quoteVolume <= 0) {
+        return this->findByLevels(1);
+    }
+    return fenwickLowerBound(this->quoteTree, quoteVolume);
+}
+
+size_t OrderBookDepthIndex::findByLevels(int64_t levels) const {
+    if (this->prices.empty()) {
+        return 0;
+    }
+    return fenwickLowerBound(this->levelTree, levels);
+}
+
+size_t OrderBookDepthIndex::countWithinPrice(double price) const {
+    return this->findSlotAfter(price);
+}
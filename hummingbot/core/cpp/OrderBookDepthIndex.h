@@ -0,0 +1,62 @@
+#ifndef _ORDER_BOOK_DEPTH_INDEX_H
+#define _ORDER_BOOK_DEPTH_INDEX_H
+
+#include <stdint.h>
+#include <stddef.h>
+#include <set>
+#include <vector>
+#include "OrderBookEntry.h"
+
+// Cumulative depth index over one side of an order book.
+//
+// Price levels are stored in slots from the best price outwards, with Fenwick trees over the base amount, quote amount
+// and number of non-empty levels of each slot. Rebuilding the index leaves empty slots at both ends and between every
+// few levels, so new price levels can be inserted in place. Amount changes are applied in O(log n), and new price
+// levels in O(k log n), for the k neighbouring levels shifted to the nearest empty slot. The index is only marked as
+// stale when there's no empty slot near a new price level, and the owner rebuilds it from the order book set before
+// the next query.
+//
+// Empty slots take the price of the next level behind them, so the slot prices stay sorted for binary searches.
+class OrderBookDepthIndex {
+    bool ascending;
+    bool stale;
+    size_t pendingUpdates;
+    size_t rebuildCount;
+    std::vector<double> prices;
+    std::vector<double> amounts;
+    std::vector<bool> occupied;
+    std::vector<double> baseTree;
+    std::vector<double> quoteTree;
+    std::vector<int64_t> levelTree;
+
+    size_t findSlotAfter(double price) const;
+    size_t findLevel(double price) const;
+    size_t insertLevel(double price);
+    void setSlot(size_t index, double price, double amount);
+    void addToTrees(size_t index, double baseDelta, double quoteDelta, int64_t levelDelta);
+
+    public:
+        OrderBookDepthIndex();
+
+        void invalidate();
+        bool isStale() const;
+        size_t getRebuildCount() const;
+        void rebuild(const std::set<OrderBookEntry> &book, bool ascending);
+        void applyUpdate(double price, double amount);
+
+        size_t size() const;
+        double getPrice(size_t index) const;
+        double getAmount(size_t index) const;
+        double getCumulativeBase(size_t index) const;
+        double getCumulativeQuote(size_t index) const;
+        int64_t getCumulativeLevels(size_t index) const;
+        double getTotalBase() const;
+        double getTotalQuote() const;
+
+        size_t findByBase(double volume) const;
+        size_t findByQuote(double quoteVolume) const;
+        size_t findByLevels(int64_t levels) const;
+        size_t countWithinPrice(double price) const;
+};
+
+#endif
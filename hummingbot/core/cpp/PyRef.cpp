@@ -20,8 +20,10 @@ PyRef::~PyRef() {
 }
 
 PyRef &PyRef::operator=(const PyRef &other) {
+    PyObject *old_obj = this->obj;
     this->obj = other.obj;
     Py_XINCREF(this->obj);
+    Py_XDECREF(old_obj);
     return *this;
 }
 
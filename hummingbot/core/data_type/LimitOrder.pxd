@@ -24,3 +24,10 @@ cdef extern from "../cpp/LimitOrder.h":
         string getQuoteCurrency();
         PyObject *getPrice();
         PyObject *getQuantity();
+        double getPriceValue();
+        PyObject *getFilledQuantity();
+        void setFilledQuantity(PyObject *filledQuantity);
+        double getQueueAhead();
+        void setQueueAhead(double queueAhead);
+        void updateQueueAhead(double levelVolume);
+        double consumeTradedVolume(double tradedVolume);
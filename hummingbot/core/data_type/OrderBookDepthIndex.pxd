@@ -0,0 +1,27 @@
+# distutils: language=c++
+
+from libc.stdint cimport int64_t
+from libcpp cimport bool
+from libcpp.set cimport set
+from hummingbot.core.data_type.OrderBookEntry cimport OrderBookEntry
+
+cdef extern from "../cpp/OrderBookDepthIndex.h" nogil:
+    cdef cppclass OrderBookDepthIndex:
+        OrderBookDepthIndex()
+        void invalidate()
+        bool isStale()
+        size_t getRebuildCount()
+        void rebuild(const set[OrderBookEntry] &book, bool ascending)
+        void applyUpdate(double price, double amount)
+        size_t size()
+        double getPrice(size_t index)
+        double getAmount(size_t index)
+        double getCumulativeBase(size_t index)
+        double getCumulativeQuote(size_t index)
+        int64_t getCumulativeLevels(size_t index)
+        double getTotalBase()
+        double getTotalQuote()
+        size_t findByBase(double volume)
+        size_t findByQuote(double quote_volume)
+        size_t findByLevels(int64_t levels)
+        size_t countWithinPrice(double price)
@@ -1,8 +1,17 @@
 # distutils: language=c++
-from hummingbot.core.data_type.order_book cimport OrderBook
+from libc.stdint cimport int64_t
+from libcpp.vector cimport vector
+from hummingbot.core.data_type.OrderBookEntry cimport OrderBookEntry
+from hummingbot.core.data_type.order_book cimport (
+    DepthWalkResult,
+    OrderBook
+)
 
 cdef class CompositeOrderBook(OrderBook):
     cdef:
         OrderBook _traded_order_book
 
-    cdef double c_get_price(self, bint is_buy) except? -1
\ No newline at end of file
+    cdef c_record_fill(self, bint is_buy, double price, double amount, int64_t update_id)
+    cdef vector[OrderBookEntry] c_get_depth_entries(self, bint is_buy)
+    cdef double c_get_price(self, bint is_buy) except? -1
+    cdef DepthWalkResult c_walk_composite_depth(self, bint is_buy, int target, double limit)
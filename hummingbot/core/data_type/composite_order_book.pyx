@@ -1,18 +1,36 @@
 # distutils: language=c++
-# distutils: sources=hummingbot/core/cpp/OrderBookEntry.cpp
+# distutils: sources=hummingbot/core/cpp/OrderBookEntry.cpp hummingbot/core/cpp/OrderBookDepthIndex.cpp
 
 from typing import Iterator
+from libc.math cimport NAN
+from libc.stdint cimport int64_t
 from libcpp.set cimport set
 from cython.operator cimport (
     postincrement as inc,
-    dereference as deref,
-    address as ref
+    dereference as deref
 )
 from libcpp.vector cimport vector
 
 from hummingbot.core.event.events import TradeType
 from hummingbot.core.data_type.order_book_row import OrderBookRow
 from hummingbot.core.data_type.OrderBookEntry cimport OrderBookEntry
+from hummingbot.core.data_type.order_book cimport DepthWalkResult
+
+# Limits of a composite depth walk
+DEF BASE_VOLUME_TARGET = 0
+DEF QUOTE_VOLUME_TARGET = 1
+DEF PRICE_TARGET = 2
+
+
+cdef inline double c_get_composite_amount(set[OrderBookEntry] &traded_book, OrderBookEntry entry):
+    """
+    :returns: Amount left at the price level of an original order book entry, after the filled orders recorded there
+    """
+    cdef:
+        set[OrderBookEntry].iterator traded_it = traded_book.find(entry)
+    if traded_it == traded_book.end():
+        return entry.getAmount()
+    return entry.getAmount() - deref(traded_it).getAmount()
 
 
 cdef class CompositeOrderBook(OrderBook):
@@ -24,6 +42,8 @@ cdef class CompositeOrderBook(OrderBook):
     def __init__(self, order_book: OrderBook = None):
         super().__init__()
         self._traded_order_book = OrderBook()
+        # Depth queries must go through the composite bid_entries() and ask_entries() below.
+        self._depth_index_enabled = False
 
     @property
     def traded_order_book(self) -> OrderBook:
@@ -32,8 +52,20 @@ cdef class CompositeOrderBook(OrderBook):
     def clear_traded_order_book(self):
         self._traded_order_book._bid_book.clear()
         self._traded_order_book._ask_book.clear()
+        self._traded_order_book._bid_depth_index.invalidate()
+        self._traded_order_book._ask_depth_index.invalidate()
 
     def record_filled_order(self, order_fill_event):
+        if order_fill_event.trade_type is TradeType.BUY:
+            self.c_record_fill(True, order_fill_event.price, order_fill_event.amount, order_fill_event.timestamp)
+        elif order_fill_event.trade_type is TradeType.SELL:
+            self.c_record_fill(False, order_fill_event.price, order_fill_event.amount, order_fill_event.timestamp)
+
+    cdef c_record_fill(self, bint is_buy, double price, double amount, int64_t update_id):
+        """
+        Records an amount filled at a price level of the original order book, which is then netted out of the
+        composite entries. Buys consume the ask side, and sells the bid side.
+        """
         cdef:
             vector[OrderBookEntry] cpp_bids
             vector[OrderBookEntry] cpp_asks
@@ -41,11 +73,7 @@ cdef class CompositeOrderBook(OrderBook):
             set[OrderBookEntry].iterator ask_order_it = self._traded_order_book._ask_book.begin()
             OrderBookEntry entry
 
-        price = order_fill_event.price
-        amount = order_fill_event.amount
-        timestamp = order_fill_event.timestamp
-
-        if order_fill_event.trade_type is TradeType.BUY:
+        if is_buy:
             while ask_order_it != self._traded_order_book._ask_book.end():
                 entry = deref(ask_order_it)
                 # price is in the order book, sum the amount
@@ -58,9 +86,8 @@ cdef class CompositeOrderBook(OrderBook):
                 # price is further up the ask price range, continue searching
                 elif entry.getPrice() < price:
                     inc(ask_order_it)
-            cpp_asks.push_back(OrderBookEntry(price, amount, timestamp))
-
-        elif order_fill_event.trade_type is TradeType.SELL:
+            cpp_asks.push_back(OrderBookEntry(price, amount, update_id))
+        else:
             while bid_order_it != self._traded_order_book._bid_book.rend():
                 entry = deref(bid_order_it)
                 if entry.getPrice() == price:
@@ -72,9 +99,9 @@ cdef class CompositeOrderBook(OrderBook):
                 # price is outside of the bid price range, break and insert the new filled order into the bid book
                 elif entry.getPrice() < price:
                     break
-            cpp_bids.push_back(OrderBookEntry(price, amount, timestamp))
+            cpp_bids.push_back(OrderBookEntry(price, amount, update_id))
 
-        self._traded_order_book.c_apply_diffs(cpp_bids, cpp_asks, timestamp)
+        self._traded_order_book.c_apply_diffs(cpp_bids, cpp_asks, update_id)
 
     def original_bid_entries(self) -> Iterator[OrderBookRow]:
         return super().bid_entries()
@@ -82,118 +109,173 @@ cdef class CompositeOrderBook(OrderBook):
     def original_ask_entries(self) -> Iterator[OrderBookRow]:
         return super().ask_entries()
 
-    def bid_entries(self) -> Iterator[OrderBookRow]:
+    cdef vector[OrderBookEntry] c_get_depth_entries(self, bint is_buy):
+        """
+        Returns the composite ask entries if is_buy, or the composite bid entries otherwise, ordered from the best
+        price outwards. Recorded filled orders that no longer match the original order book are cleaned up as a side
+        effect.
+        """
         cdef:
-            set[OrderBookEntry].reverse_iterator order_it = self._bid_book.rbegin()
-            set[OrderBookEntry].reverse_iterator traded_order_it = self._traded_order_book._bid_book.rbegin()
-            OrderBookEntry traded_order_entry
-            OrderBookEntry original_order_entry
-            vector[OrderBookEntry] cpp_asks_changes
+            vector[OrderBookEntry] entries
             vector[OrderBookEntry] cpp_bids_changes
+            vector[OrderBookEntry] cpp_asks_changes
+            set[OrderBookEntry].reverse_iterator bid_order_it = self._bid_book.rbegin()
+            set[OrderBookEntry].reverse_iterator traded_bid_order_it = self._traded_order_book._bid_book.rbegin()
+            set[OrderBookEntry].iterator ask_order_it = self._ask_book.begin()
+            set[OrderBookEntry].iterator traded_ask_order_it = self._traded_order_book._ask_book.begin()
+            OrderBookEntry original_order_entry
+            OrderBookEntry traded_order_entry
+            double composite_amount
+
+        if not is_buy:
+            while bid_order_it != self._bid_book.rend():
+                original_order_entry = deref(bid_order_it)
+                while traded_bid_order_it != self._traded_order_book._bid_book.rend():
+                    traded_order_entry = deref(traded_bid_order_it)
 
-        while order_it != self._bid_book.rend():
-            original_order_entry = deref(order_it)
-            original_order_price = original_order_entry.getPrice()
-            original_order_amount = original_order_entry.getAmount()
-            original_order_update_id = original_order_entry.getUpdateId()
-
-            while traded_order_it != self._traded_order_book._bid_book.rend():
-                traded_order_entry = deref(traded_order_it)
-                traded_order_price = traded_order_entry.getPrice()
-                traded_order_amount = traded_order_entry.getAmount()
-                traded_order_update_id = traded_order_entry.getUpdateId()
-
-                # Found matching price for the recorded filled order, return composite order book row
-                if traded_order_price == original_order_price:
-                    composite_amount = original_order_amount - traded_order_amount
-                    if composite_amount > 0:
-                        yield OrderBookRow(original_order_price, composite_amount, original_order_update_id)
+                    # Found matching price for the recorded filled order, return composite order book row
+                    if traded_order_entry.getPrice() == original_order_entry.getPrice():
+                        composite_amount = original_order_entry.getAmount() - traded_order_entry.getAmount()
+                        if composite_amount > 0:
+                            entries.push_back(OrderBookEntry(original_order_entry.getPrice(),
+                                                             composite_amount,
+                                                             original_order_entry.getUpdateId()))
+                        else:
+                            cpp_bids_changes.push_back(OrderBookEntry(original_order_entry.getPrice(),
+                                                                      min(original_order_entry.getAmount(),
+                                                                          traded_order_entry.getAmount()),
+                                                                      traded_order_entry.getUpdateId()))
+                        inc(traded_bid_order_it)
+                        # continue to next original order book row
+                        break
+                    # Recorded filled order price is outside of the bid price range
+                    elif traded_order_entry.getPrice() > original_order_entry.getPrice():
+                        # Remove the recorded entry and increment the pointer
+                        cpp_bids_changes.push_back(OrderBookEntry(traded_order_entry.getPrice(),
+                                                                  0,
+                                                                  traded_order_entry.getUpdateId()))
+                        inc(traded_bid_order_it)
+                    # Recorded filled order price is within lower end of the bid price range, return original bid entry
                     else:
-                        cpp_bids_changes.push_back(OrderBookEntry(original_order_price,
-                                                                  min(original_order_amount, traded_order_amount),
-                                                                  traded_order_update_id))
-                    inc(traded_order_it)
-                    # continue to next original order book row
-                    break
-                # Recorded filled order price is outside of the bid price range
-                elif traded_order_price > original_order_price:
-                    # Remove the recorded entry and increment the pointer
-                    cpp_bids_changes.push_back(OrderBookEntry(traded_order_price, 0, traded_order_update_id))
-                    inc(traded_order_it)
-                # Recorded filled order price is within lower end of the bid price range, yield original bid entry
-                elif traded_order_price < original_order_price:
-                    yield OrderBookRow(original_order_price, original_order_amount, original_order_update_id)
-                    break
-            else:
-                yield OrderBookRow(original_order_price, original_order_amount, original_order_update_id)
+                        entries.push_back(original_order_entry)
+                        break
+                else:
+                    entries.push_back(original_order_entry)
+                inc(bid_order_it)
+        else:
+            while ask_order_it != self._ask_book.end():
+                original_order_entry = deref(ask_order_it)
+                while traded_ask_order_it != self._traded_order_book._ask_book.end():
+                    traded_order_entry = deref(traded_ask_order_it)
 
-            inc(order_it)
+                    if traded_order_entry.getPrice() == original_order_entry.getPrice():
+                        composite_amount = original_order_entry.getAmount() - traded_order_entry.getAmount()
+                        if composite_amount > 0:
+                            entries.push_back(OrderBookEntry(original_order_entry.getPrice(),
+                                                             composite_amount,
+                                                             original_order_entry.getUpdateId()))
+                        else:
+                            cpp_asks_changes.push_back(OrderBookEntry(original_order_entry.getPrice(),
+                                                                      min(original_order_entry.getAmount(),
+                                                                          traded_order_entry.getAmount()),
+                                                                      traded_order_entry.getUpdateId()))
+                        inc(traded_ask_order_it)
+                        # continue to next original order book row
+                        break
+                    # Recorded filled order price is within upper end of the ask price range, return original ask entry
+                    elif traded_order_entry.getPrice() > original_order_entry.getPrice():
+                        entries.push_back(original_order_entry)
+                        break
+                    # Recorded filled order price is outside of the ask price range, remove the recorded ask order
+                    else:
+                        cpp_asks_changes.push_back(OrderBookEntry(traded_order_entry.getPrice(),
+                                                                  0,
+                                                                  traded_order_entry.getUpdateId()))
+                        inc(traded_ask_order_it)
+                else:
+                    entries.push_back(original_order_entry)
+                inc(ask_order_it)
 
-        self._traded_order_book.c_apply_diffs(cpp_bids_changes, cpp_asks_changes, self._last_diff_uid)
+        if cpp_bids_changes.size() > 0 or cpp_asks_changes.size() > 0:
+            self._traded_order_book.c_apply_diffs(cpp_bids_changes, cpp_asks_changes, self._last_diff_uid)
+        return entries
 
+    def bid_entries(self) -> Iterator[OrderBookRow]:
+        cdef:
+            vector[OrderBookEntry] entries = self.c_get_depth_entries(False)
+        for entry in entries:
+            yield OrderBookRow(entry.getPrice(), entry.getAmount(), entry.getUpdateId())
 
     def ask_entries(self) -> Iterator[OrderBookRow]:
         cdef:
-            set[OrderBookEntry].iterator order_it = self._ask_book.begin()
-            set[OrderBookEntry].iterator traded_order_it = self._traded_order_book._ask_book.begin()
-            OrderBookEntry original_order_entry
-            OrderBookEntry traded_order_entry
-            vector[OrderBookEntry] cpp_asks_changes
-            vector[OrderBookEntry] cpp_bids_changes
-
-        while order_it != self._ask_book.end():
-            original_order_entry = deref(order_it)
-            original_order_price = original_order_entry.getPrice()
-            original_order_amount = original_order_entry.getAmount()
-            original_order_update_id = original_order_entry.getUpdateId()
-
-            while traded_order_it != self._traded_order_book._ask_book.end():
-                traded_order_entry = deref(traded_order_it)
-                traded_order_price = traded_order_entry.getPrice()
-                traded_order_amount = traded_order_entry.getAmount()
-                traded_order_update_id = traded_order_entry.getUpdateId()
-
-                if traded_order_price == original_order_price:
-                    composite_amount = original_order_amount - traded_order_amount
-                    if composite_amount > 0:
-                        yield OrderBookRow(original_order_price, composite_amount, original_order_update_id)
-                    else:
-                        cpp_asks_changes.push_back(OrderBookEntry(original_order_price,
-                                                                  min(original_order_amount, traded_order_amount),
-                                                                  traded_order_update_id))
-                    inc(traded_order_it)
-                    # continue to next original order book row
-                    break
-                # Recorded filled order price is within upper end of the ask price range, yield original ask entry
-                elif traded_order_price > original_order_price:
-                    yield OrderBookRow(original_order_price, original_order_amount, original_order_update_id)
-                    break
-                # Recorded filled order price is outside of the ask price range, remove the recorded ask order
-                elif traded_order_price < original_order_price:
-                    cpp_asks_changes.push_back(OrderBookEntry(traded_order_price, 0, traded_order_update_id))
-                    inc(traded_order_it)
-
-            else:
-                yield OrderBookRow(original_order_price, original_order_amount, original_order_update_id)
+            vector[OrderBookEntry] entries = self.c_get_depth_entries(True)
+        for entry in entries:
+            yield OrderBookRow(entry.getPrice(), entry.getAmount(), entry.getUpdateId())
 
-            inc(order_it)
+    cdef double c_get_price(self, bint is_buy) except? -1:
+        cdef:
+            set[OrderBookEntry].iterator ask_it = self._ask_book.begin()
+            set[OrderBookEntry].reverse_iterator bid_it = self._bid_book.rbegin()
 
-        self._traded_order_book.c_apply_diffs(cpp_bids_changes, cpp_asks_changes, self._last_diff_uid)
+        # Only the best price level is looked at, unless the recorded filled orders used it up.
+        if is_buy:
+            while ask_it != self._ask_book.end():
+                if c_get_composite_amount(self._traded_order_book._ask_book, deref(ask_it)) > 0:
+                    return deref(ask_it).getPrice()
+                inc(ask_it)
+        else:
+            while bid_it != self._bid_book.rend():
+                if c_get_composite_amount(self._traded_order_book._bid_book, deref(bid_it)) > 0:
+                    return deref(bid_it).getPrice()
+                inc(bid_it)
+        raise EnvironmentError("Order book is empty - no price quote is possible.")
 
-    cdef double c_get_price(self, bint is_buy) except? -1:
+    cdef DepthWalkResult c_walk_composite_depth(self, bint is_buy, int target, double limit):
+        """
+        Walks the composite ask entries if is_buy, or the composite bid entries otherwise, from the best price outwards
+        until the base volume, quote volume or price limit given by target. The results are the same as walking
+        c_get_depth_entries(), but the walk stops as soon as the limit is reached instead of copying the whole book.
+        """
         cdef:
-            set[OrderBookEntry] *book = ref(self._ask_book) if is_buy else ref(self._bid_book)
-        if deref(book).size() < 1:
-            raise EnvironmentError("Order book is empty - no price quote is possible.")
+            DepthWalkResult result
+            set[OrderBookEntry].iterator ask_it = self._ask_book.begin()
+            set[OrderBookEntry].reverse_iterator bid_it = self._bid_book.rbegin()
+            OrderBookEntry entry
+            double amount
 
-        ask_it = self.ask_entries()
-        bid_it = self.bid_entries()
-        try:
+        result.reached = False
+        result.price = NAN
+        result.base_volume = result.quote_volume = 0
+        while (ask_it != self._ask_book.end()) if is_buy else (bid_it != self._bid_book.rend()):
             if is_buy:
-                best_ask = next(ask_it)
-                return best_ask.price
+                entry = deref(ask_it)
+                inc(ask_it)
+                amount = c_get_composite_amount(self._traded_order_book._ask_book, entry)
             else:
-                best_bid = next(bid_it)
-                return best_bid.price
-        except Exception:
-            raise
+                entry = deref(bid_it)
+                inc(bid_it)
+                amount = c_get_composite_amount(self._traded_order_book._bid_book, entry)
+            if amount <= 0:
+                continue
+            if target == PRICE_TARGET:
+                if (is_buy and entry.getPrice() > limit) or (not is_buy and entry.getPrice() < limit):
+                    break
+                result.reached = True
+                result.price = entry.getPrice()
+            result.base_volume += amount
+            result.quote_volume += amount * entry.getPrice()
+            if ((target == BASE_VOLUME_TARGET and result.base_volume >= limit) or
+                    (target == QUOTE_VOLUME_TARGET and result.quote_volume >= limit)):
+                result.reached = True
+                result.price = entry.getPrice()
+                break
+        return result
+
+    cdef DepthWalkResult c_walk_base_volume(self, bint is_buy, double volume):
+        return self.c_walk_composite_depth(is_buy, BASE_VOLUME_TARGET, volume)
+
+    cdef DepthWalkResult c_walk_quote_volume(self, bint is_buy, double quote_volume):
+        return self.c_walk_composite_depth(is_buy, QUOTE_VOLUME_TARGET, quote_volume)
+
+    cdef DepthWalkResult c_walk_price(self, bint is_buy, double price):
+        return self.c_walk_composite_depth(is_buy, PRICE_TARGET, price)
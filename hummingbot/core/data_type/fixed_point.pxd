@@ -0,0 +1,24 @@
+# distutils: language=c++
+
+from libc.stdint cimport int64_t
+
+
+cdef class FixedPoint:
+    cdef:
+        readonly int64_t value
+        readonly int scale
+
+    cdef FixedPoint c_rescale(self, int scale)
+    cdef FixedPoint c_add(self, FixedPoint other)
+    cdef FixedPoint c_sub(self, FixedPoint other)
+    cdef FixedPoint c_mul(self, FixedPoint other, int scale)
+    cdef FixedPoint c_quantize(self, int64_t quantum, bint truncate)
+    cdef int c_compare(self, FixedPoint other)
+    cdef double c_to_double(self)
+    cdef object c_to_decimal(self)
+
+
+cdef FixedPoint c_fixed_point_from_double(double value, int scale)
+cdef FixedPoint c_fixed_point_from_decimal(object value, int scale)
+cdef int c_get_scale_for_quantum(object quantum)
+cdef int64_t c_get_quantum_value(object quantum, int scale)
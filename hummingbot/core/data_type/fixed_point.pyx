@@ -0,0 +1,291 @@
+# distutils: language=c++
+
+from decimal import (
+    Decimal,
+    ROUND_HALF_EVEN
+)
+from libc.math cimport (
+    fabs,
+    isfinite,
+    rint
+)
+from libc.stdint cimport (
+    INT64_MAX,
+    INT64_MIN
+)
+
+# Scales are kept small enough for 10^scale to fit in an int64.
+DEF MAX_SCALE = 18
+
+# Scale used when a quantum is too fine (or missing) to give a sensible scale, e.g. the TradingRule defaults of 1e-56.
+# This leaves room for values up to ~9.2e8 at the finest precision.
+DEF MAX_QUANTUM_SCALE = 10
+
+cdef int64_t[MAX_SCALE + 1] s_powers_of_ten = [
+    1LL, 10LL, 100LL, 1000LL, 10000LL, 100000LL, 1000000LL, 10000000LL, 100000000LL, 1000000000LL,
+    10000000000LL, 100000000000LL, 1000000000000LL, 10000000000000LL, 100000000000000LL, 1000000000000000LL,
+    10000000000000000LL, 100000000000000000LL, 1000000000000000000LL
+]
+
+
+cdef inline FixedPoint c_new_fixed_point(int64_t value, int scale):
+    cdef FixedPoint retval = FixedPoint.__new__(FixedPoint)
+    retval.value = value
+    retval.scale = scale
+    return retval
+
+
+cdef inline int64_t c_div_round_half_even(int64_t numerator, int64_t denominator):
+    # Floor division, since Python semantics are used for C integers in this module.
+    cdef:
+        int64_t quotient = numerator // denominator
+        int64_t remainder = numerator % denominator
+    if 2 * remainder > denominator or (2 * remainder == denominator and quotient % 2 != 0):
+        quotient += 1
+    return quotient
+
+
+cdef inline int64_t c_div_truncate(int64_t numerator, int64_t denominator):
+    if numerator >= 0:
+        return numerator // denominator
+    return -((-numerator) // denominator)
+
+
+cdef inline void c_check_scale(int scale) except *:
+    if scale < 0 or scale > MAX_SCALE:
+        raise ValueError(f"Fixed point scale must be between 0 and {MAX_SCALE}, got {scale}.")
+
+
+cdef FixedPoint c_fixed_point_from_python_int(object value, int scale):
+    if value > INT64_MAX or value < INT64_MIN:
+        raise OverflowError(f"{value}E-{scale} is out of range for a fixed point number.")
+    return c_new_fixed_point(value, scale)
+
+
+cdef class FixedPoint:
+    """
+    Exact decimal number stored as an int64 number of 10^-scale units, e.g. FixedPoint(9801, 2) is 98.01.
+
+    Prices and amounts on hot paths can be kept as FixedPoint instead of Decimal, and converted back with
+    to_decimal() at the API boundary. Operations that would overflow an int64 raise OverflowError.
+    """
+    def __init__(self, int64_t value, int scale):
+        c_check_scale(scale)
+        self.value = value
+        self.scale = scale
+
+    @classmethod
+    def from_decimal(cls, value: Decimal, scale: int) -> "FixedPoint":
+        return c_fixed_point_from_decimal(value, scale)
+
+    @classmethod
+    def from_float(cls, value: float, scale: int) -> "FixedPoint":
+        return c_fixed_point_from_double(value, scale)
+
+    cdef FixedPoint c_rescale(self, int scale):
+        """
+        Changes the scale of the number, rounding half to even if precision is lost.
+        """
+        cdef:
+            int64_t multiplier
+        c_check_scale(scale)
+        if scale == self.scale:
+            return self
+        if scale < self.scale:
+            return c_new_fixed_point(c_div_round_half_even(self.value, s_powers_of_ten[self.scale - scale]), scale)
+        multiplier = s_powers_of_ten[scale - self.scale]
+        if self.value > INT64_MAX // multiplier or self.value < INT64_MIN // multiplier:
+            raise OverflowError(f"{self} is out of range for a fixed point number with scale {scale}.")
+        return c_new_fixed_point(self.value * multiplier, scale)
+
+    cdef FixedPoint c_add(self, FixedPoint other):
+        cdef:
+            int scale = max(self.scale, other.scale)
+            int64_t a = self.c_rescale(scale).value
+            int64_t b = other.c_rescale(scale).value
+        if (b > 0 and a > INT64_MAX - b) or (b < 0 and a < INT64_MIN - b):
+            raise OverflowError(f"{self} + {other} is out of range for a fixed point number.")
+        return c_new_fixed_point(a + b, scale)
+
+    cdef FixedPoint c_sub(self, FixedPoint other):
+        cdef:
+            int scale = max(self.scale, other.scale)
+            int64_t a = self.c_rescale(scale).value
+            int64_t b = other.c_rescale(scale).value
+        if (b < 0 and a > INT64_MAX + b) or (b > 0 and a < INT64_MIN + b):
+            raise OverflowError(f"{self} - {other} is out of range for a fixed point number.")
+        return c_new_fixed_point(a - b, scale)
+
+    cdef FixedPoint c_mul(self, FixedPoint other, int scale):
+        """
+        Multiplies two numbers, and rounds the product half to even at the given scale.
+        """
+        cdef:
+            int product_scale = self.scale + other.scale
+            object exact_product
+            object divisor
+            object remainder
+        c_check_scale(scale)
+        # abs(INT64_MIN) overflows, so INT64_MIN is always multiplied with Python integers.
+        if (product_scale <= MAX_SCALE and
+                (self.value == 0 or
+                 (self.value != INT64_MIN and
+                  other.value <= INT64_MAX // abs(self.value) and other.value >= -(INT64_MAX // abs(self.value))))):
+            return c_new_fixed_point(self.value * other.value, product_scale).c_rescale(scale)
+
+        # The exact product doesn't fit in an int64, so it is computed with Python integers instead.
+        exact_product = <object>self.value * <object>other.value
+        if scale >= product_scale:
+            return c_fixed_point_from_python_int(exact_product * 10 ** (scale - product_scale), scale)
+        divisor = 10 ** (product_scale - scale)
+        exact_product, remainder = divmod(exact_product, divisor)
+        if 2 * remainder > divisor or (2 * remainder == divisor and exact_product % 2 != 0):
+            exact_product += 1
+        return c_fixed_point_from_python_int(exact_product, scale)
+
+    cdef FixedPoint c_quantize(self, int64_t quantum, bint truncate):
+        """
+        Rounds the number to a multiple of quantum, which is in units of 10^-scale.
+
+        :param quantum: Quantum in units of 10^-scale, e.g. 5 for a quantum of 0.05 at scale 2
+        :param truncate: Round towards zero like Decimal floor division, instead of half to even
+        """
+        if quantum <= 1:
+            return self
+        if truncate:
+            return c_new_fixed_point(c_div_truncate(self.value, quantum) * quantum, self.scale)
+        return c_new_fixed_point(c_div_round_half_even(self.value, quantum) * quantum, self.scale)
+
+    cdef int c_compare(self, FixedPoint other):
+        cdef:
+            int scale = max(self.scale, other.scale)
+            int64_t a
+            int64_t b
+        try:
+            a = self.c_rescale(scale).value
+            b = other.c_rescale(scale).value
+        except OverflowError:
+            a = int(self.c_to_decimal().compare(other.c_to_decimal()))
+            b = 0
+        return (a > b) - (a < b)
+
+    cdef double c_to_double(self):
+        return <double>self.value / <double>s_powers_of_ten[self.scale]
+
+    cdef object c_to_decimal(self):
+        return Decimal(self.value).scaleb(-self.scale)
+
+    def rescale(self, scale: int) -> "FixedPoint":
+        return self.c_rescale(scale)
+
+    def quantize(self, quantum: Decimal, truncate: bool = False) -> "FixedPoint":
+        return self.c_quantize(c_get_quantum_value(quantum, self.scale), truncate)
+
+    def to_decimal(self) -> Decimal:
+        return self.c_to_decimal()
+
+    def __float__(self) -> float:
+        return self.c_to_double()
+
+    def __add__(x, y):
+        if not isinstance(x, FixedPoint) or not isinstance(y, FixedPoint):
+            return NotImplemented
+        return (<FixedPoint>x).c_add(<FixedPoint>y)
+
+    def __sub__(x, y):
+        if not isinstance(x, FixedPoint) or not isinstance(y, FixedPoint):
+            return NotImplemented
+        return (<FixedPoint>x).c_sub(<FixedPoint>y)
+
+    def __mul__(x, y):
+        if not isinstance(x, FixedPoint) or not isinstance(y, FixedPoint):
+            return NotImplemented
+        return (<FixedPoint>x).c_mul(<FixedPoint>y, max((<FixedPoint>x).scale, (<FixedPoint>y).scale))
+
+    def __neg__(self) -> "FixedPoint":
+        if self.value == INT64_MIN:
+            raise OverflowError(f"-{self} is out of range for a fixed point number.")
+        return c_new_fixed_point(-self.value, self.scale)
+
+    def __richcmp__(FixedPoint self, other, int op):
+        cdef:
+            int result
+        if not isinstance(other, FixedPoint):
+            return NotImplemented
+        result = self.c_compare(<FixedPoint>other)
+        if op == 0:
+            return result < 0
+        elif op == 1:
+            return result <= 0
+        elif op == 2:
+            return result == 0
+        elif op == 3:
+            return result != 0
+        elif op == 4:
+            return result > 0
+        return result >= 0
+
+    def __hash__(self) -> int:
+        # Equal values with different scales must hash the same.
+        return hash(self.c_to_decimal())
+
+    def __reduce__(self):
+        return FixedPoint, (self.value, self.scale)
+
+    def __repr__(self) -> str:
+        return f"FixedPoint('{self.c_to_decimal()}')"
+
+    def __str__(self) -> str:
+        return str(self.c_to_decimal())
+
+
+cdef FixedPoint c_fixed_point_from_double(double value, int scale):
+    """
+    Converts a double to a fixed point number, rounding half to even at the given scale.
+    """
+    cdef:
+        double scaled_value
+    c_check_scale(scale)
+    if not isfinite(value):
+        raise ValueError(f"Cannot convert {value} to a fixed point number.")
+    scaled_value = rint(value * s_powers_of_ten[scale])
+    # 2^63 is the first double that doesn't fit in an int64.
+    if fabs(scaled_value) >= 9223372036854775808.0:
+        raise OverflowError(f"{value} is out of range for a fixed point number with scale {scale}.")
+    return c_new_fixed_point(<int64_t>scaled_value, scale)
+
+
+cdef FixedPoint c_fixed_point_from_decimal(object value, int scale):
+    """
+    Converts a Decimal to a fixed point number, rounding half to even at the given scale.
+    """
+    c_check_scale(scale)
+    if not value.is_finite():
+        raise ValueError(f"Cannot convert {value} to a fixed point number.")
+    return c_fixed_point_from_python_int(int(value.scaleb(scale).to_integral_value(rounding=ROUND_HALF_EVEN)), scale)
+
+
+cdef int c_get_scale_for_quantum(object quantum):
+    """
+    :returns: The number of decimal places needed to represent multiples of a quantum, e.g. 2 for Decimal("0.05")
+    """
+    if not quantum.is_finite() or quantum <= 0:
+        return MAX_QUANTUM_SCALE
+    return min(max(-quantum.normalize().as_tuple().exponent, 0), MAX_QUANTUM_SCALE)
+
+
+cdef int64_t c_get_quantum_value(object quantum, int scale):
+    """
+    :returns: A quantum in units of 10^-scale, e.g. 5 for Decimal("0.05") at scale 2. Quanta finer than the scale
+              give 1, i.e. no rounding beyond the scale itself.
+    """
+    c_check_scale(scale)
+    if not quantum.is_finite() or quantum <= 0:
+        return 1
+    return c_fixed_point_from_python_int(
+        max(1, int(quantum.scaleb(scale).to_integral_value(rounding=ROUND_HALF_EVEN))), scale
+    ).value
+
+
+def get_scale_for_quantum(quantum: Decimal) -> int:
+    return c_get_scale_for_quantum(quantum)
@@ -8,6 +8,9 @@ from decimal import Decimal
 import pandas as pd
 from typing import List
 
+s_decimal_0 = Decimal(0)
+
+
 cdef class LimitOrder:
     @classmethod
     def to_pandas(cls, limit_orders: List[LimitOrder]) -> pd.DataFrame:
@@ -86,6 +89,22 @@ cdef class LimitOrder:
     def quantity(self) -> Decimal:
         return <object>(self._cpp_limit_order.getQuantity())
 
+    @property
+    def filled_quantity(self) -> Decimal:
+        """
+        Quantity partially filled so far, for simulated orders that are filled in parts.
+        """
+        if self._cpp_limit_order.getFilledQuantity() == NULL:
+            return s_decimal_0
+        return <object>(self._cpp_limit_order.getFilledQuantity())
+
+    @property
+    def queue_ahead(self) -> float:
+        """
+        Estimated volume queued ahead of a simulated order at its price level.
+        """
+        return self._cpp_limit_order.getQueueAhead()
+
     def __repr__(self) -> str:
         return (f"LimitOrder('{self.client_order_id}', '{self.trading_pair}', {self.is_buy}, '{self.base_currency}', "
                 f"'{self.quote_currency}', {self.price}, {self.quantity})")
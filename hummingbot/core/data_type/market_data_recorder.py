@@ -0,0 +1,583 @@
+#!/usr/bin/env python
+
+import asyncio
+from collections import deque
+from datetime import (
+    datetime,
+    timezone,
+)
+import importlib
+import json
+import logging
+import math
+import mmap
+import os
+from os.path import (
+    exists,
+    getsize,
+    isdir,
+    join,
+)
+import struct
+import threading
+import time
+from typing import (
+    Any,
+    Callable,
+    Deque,
+    Dict,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Tuple,
+    Type,
+)
+from urllib.parse import (
+    quote,
+    unquote,
+)
+import ujson
+import zlib
+
+from hummingbot import data_path
+from hummingbot.core.data_type.order_book_message import (
+    OrderBookMessage,
+    OrderBookMessageType,
+)
+from hummingbot.logger import HummingbotLogger
+
+# Log file layout
+#
+# Each exchange and trading pair has its own directory, with one log file and one index file per UTC day. A log file
+# is a sequence of chunks, each holding a zlib compressed batch of messages of the same trading pair:
+#
+#   chunk header: magic, format version, number of messages, first and last receive timestamps, compressed size,
+#                 crc32 of the compressed data
+#   chunk data:   one record header per message, followed by the message content as JSON
+#
+# The index file has one fixed size entry per chunk with its receive timestamp range, offset and number of messages,
+# so a time range can be read without decompressing the chunks outside of it. The index is only written after its
+# chunk, and a log file with a partly written chunk is repaired when it's opened again.
+CHUNK_MAGIC: bytes = b"HBMD"
+FORMAT_VERSION: int = 1
+CHUNK_HEADER = struct.Struct("<4sBIddII")
+RECORD_HEADER = struct.Struct("<ddBBqI")
+INDEX_ENTRY = struct.Struct("<ddQI")
+# Range of the message ids, which are stored as signed 64-bit integers in the record headers.
+MIN_MESSAGE_ID: int = -2 ** 63
+MAX_MESSAGE_ID: int = 2 ** 63 - 1
+LOG_FILE_SUFFIX: str = ".log"
+INDEX_FILE_SUFFIX: str = ".idx"
+
+# Record flag for snapshots that were built from the tracker's order book, instead of received from the exchange. Their
+# content always has the generic trading_pair, update_id, bids and asks fields.
+FLAG_ORDER_BOOK_SNAPSHOT: int = 1
+
+
+class RecordedMarketDataMessage(NamedTuple):
+    receive_timestamp: float
+    flags: int
+    message: OrderBookMessage
+
+
+class MarketDataTapQueue(asyncio.Queue):
+    """
+    Order book message queue that hands every message to a tap function as it's put in the queue.
+    """
+    def __init__(self, tap: Callable[[OrderBookMessage], None], *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._tap: Callable[[OrderBookMessage], None] = tap
+
+    def put_nowait(self, item: OrderBookMessage):
+        super().put_nowait(item)
+        self._tap(item)
+
+
+class MarketDataLogWriter:
+    """
+    Appends chunks to the log and index files of one trading pair and UTC day.
+    """
+    def __init__(self, log_path: str):
+        self._log_path: str = log_path
+        self._index_path: str = log_path[:-len(LOG_FILE_SUFFIX)] + INDEX_FILE_SUFFIX
+        self._repair()
+        self._log_file = open(self._log_path, "ab")
+        self._index_file = open(self._index_path, "ab")
+
+    @property
+    def log_path(self) -> str:
+        return self._log_path
+
+    def _repair(self):
+        """
+        Checks the indexed chunks against the log file, indexes any complete chunk that's missing from the index, and
+        truncates a partly written chunk at the end of the log file.
+        """
+        log_size: int = getsize(self._log_path) if exists(self._log_path) else 0
+        old_entries: List[Tuple[float, float, int, int]] = read_index(self._index_path)
+        entries: List[Tuple[float, float, int, int]] = []
+        offset: int = 0
+        with open(self._log_path, "ab+") as fd:
+            for entry in old_entries:
+                fd.seek(offset)
+                header_bytes: bytes = fd.read(CHUNK_HEADER.size)
+                if entry[2] != offset or len(header_bytes) < CHUNK_HEADER.size:
+                    break
+                magic, _, _, _, _, data_size, _ = CHUNK_HEADER.unpack(header_bytes)
+                if magic != CHUNK_MAGIC or offset + CHUNK_HEADER.size + data_size > log_size:
+                    break
+                entries.append(entry)
+                offset += CHUNK_HEADER.size + data_size
+            while offset + CHUNK_HEADER.size <= log_size:
+                fd.seek(offset)
+                magic, _, count, first_ts, last_ts, data_size, crc = CHUNK_HEADER.unpack(fd.read(CHUNK_HEADER.size))
+                data: bytes = fd.read(data_size)
+                if magic != CHUNK_MAGIC or len(data) < data_size or zlib.crc32(data) != crc:
+                    break
+                entries.append((first_ts, last_ts, offset, count))
+                offset += CHUNK_HEADER.size + data_size
+            if offset < log_size:
+                fd.truncate(offset)
+        if entries != old_entries:
+            with open(self._index_path, "wb") as fd:
+                fd.write(b"".join(INDEX_ENTRY.pack(*entry) for entry in entries))
+
+    def write_chunk(self, records: List[Tuple[float, float, int, int, int, bytes]]):
+        """
+        :param records: (receive timestamp, exchange timestamp, message type, flags, update or trade id, content) of
+                        each message, in receive order
+        """
+        raw: bytes = b"".join(RECORD_HEADER.pack(receive_ts, exchange_ts, message_type, flags, message_id,
+                                                 len(content)) + content
+                              for receive_ts, exchange_ts, message_type, flags, message_id, content in records)
+        data: bytes = zlib.compress(raw)
+        first_ts: float = records[0][0]
+        last_ts: float = records[-1][0]
+        offset: int = self._log_file.tell()
+        self._log_file.write(CHUNK_HEADER.pack(CHUNK_MAGIC, FORMAT_VERSION, len(records), first_ts, last_ts, len(data),
+                                               zlib.crc32(data)))
+        self._log_file.write(data)
+        self._log_file.flush()
+        self._index_file.write(INDEX_ENTRY.pack(first_ts, last_ts, offset, len(records)))
+        self._index_file.flush()
+
+    def close(self):
+        self._log_file.close()
+        self._index_file.close()
+
+
+def read_index(index_path: str) -> List[Tuple[float, float, int, int]]:
+    if not exists(index_path):
+        return []
+    with open(index_path, "rb") as fd:
+        data: bytes = fd.read()
+    usable_size: int = len(data) - len(data) % INDEX_ENTRY.size
+    return list(INDEX_ENTRY.iter_unpack(data[:usable_size]))
+
+
+class MarketDataRecorder:
+    """
+    Records the order book diff, snapshot and trade messages of an order book tracker to append-only, chunk compressed
+    log files, one set per trading pair, with a time index. See `MarketDataReader` for reading them back.
+
+    Messages are tapped from the tracker's message streams and queued in memory. Encoding, compression and file writes
+    all happen on a background thread, which writes a chunk for a trading pair when it has `chunk_size` messages, or
+    when its oldest message has waited for `flush_interval` seconds.
+    """
+    _mdr_logger: Optional[HummingbotLogger] = None
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._mdr_logger is None:
+            cls._mdr_logger = logging.getLogger(__name__)
+        return cls._mdr_logger
+
+    def __init__(self,
+                 exchange_name: str,
+                 root_path: Optional[str] = None,
+                 chunk_size: int = 1000,
+                 flush_interval: float = 5.0):
+        """
+        :param exchange_name: Name of the exchange, used as the directory name of its recordings
+        :param root_path: Directory of the recordings of all exchanges. Defaults to market_data in the data path.
+        :param chunk_size: Max number of messages in a chunk
+        :param flush_interval: Max time a message waits in memory before it's written
+        """
+        if root_path is None:
+            root_path = join(data_path(), "market_data")
+        self._exchange_name: str = exchange_name
+        self._exchange_path: str = join(root_path, quote(exchange_name, safe=""))
+        self._chunk_size: int = chunk_size
+        self._flush_interval: float = flush_interval
+        self._message_queue: Deque[Tuple[float, int, OrderBookMessage]] = deque()
+        self._message_classes: Dict[Tuple[str, int], Type[OrderBookMessage]] = {}
+        self._writer_thread: Optional[threading.Thread] = None
+        self._writer_stopping: bool = False
+        self._wake_event: threading.Event = threading.Event()
+        self._messages_recorded: int = 0
+
+    @property
+    def exchange_name(self) -> str:
+        return self._exchange_name
+
+    @property
+    def exchange_path(self) -> str:
+        return self._exchange_path
+
+    @property
+    def started(self) -> bool:
+        return self._writer_thread is not None
+
+    @property
+    def messages_recorded(self) -> int:
+        """
+        Number of messages written to the log files so far.
+        """
+        return self._messages_recorded
+
+    @property
+    def pending_messages_count(self) -> int:
+        return len(self._message_queue)
+
+    def record(self, message: OrderBookMessage, flags: int = 0, receive_timestamp: Optional[float] = None):
+        """
+        Queues a message for recording. Safe to call from the event loop, since it only appends to an in-memory queue.
+
+        :param receive_timestamp: Time the message was received, e.g. when importing market data recorded elsewhere.
+                                  Defaults to the current time.
+        """
+        if self._writer_thread is None:
+            self.start()
+        self._message_queue.append((time.time() if receive_timestamp is None else receive_timestamp, flags, message))
+        if len(self._message_queue) >= self._chunk_size:
+            self._wake_event.set()
+
+    def record_order_book_snapshot(self, trading_pair: str, update_id: int, bids: List[List[float]],
+                                   asks: List[List[float]], receive_timestamp: Optional[float] = None):
+        """
+        Records the state of the tracker's order book as a snapshot, e.g. the initial snapshot of a trading pair, which
+        doesn't go through the tracker's message streams.
+        """
+        timestamp: float = time.time() if receive_timestamp is None else receive_timestamp
+        self.record(OrderBookMessage(OrderBookMessageType.SNAPSHOT, {
+            "trading_pair": trading_pair,
+            "update_id": update_id,
+            "bids": bids,
+            "asks": asks
+        }, timestamp=timestamp), flags=FLAG_ORDER_BOOK_SNAPSHOT, receive_timestamp=timestamp)
+
+    def tap_queue(self, queue: asyncio.Queue) -> MarketDataTapQueue:
+        """
+        Returns a queue that records the messages put in it, holding the messages already in the given queue.
+        """
+        tap_queue: MarketDataTapQueue = MarketDataTapQueue(self.record)
+        while not queue.empty():
+            asyncio.Queue.put_nowait(tap_queue, queue.get_nowait())
+        return tap_queue
+
+    def start(self):
+        if self._writer_thread is not None:
+            return
+        self._writer_stopping = False
+        self._writer_thread = threading.Thread(target=self._writer_loop,
+                                               name=f"MarketDataRecorder-{self._exchange_name}",
+                                               daemon=True)
+        self._writer_thread.start()
+
+    def stop(self):
+        """
+        Stops the writer thread, after it has written every queued message.
+        """
+        if self._writer_thread is None:
+            return
+        self._writer_stopping = True
+        self._wake_event.set()
+        self._writer_thread.join()
+        self._writer_thread = None
+
+    def _pair_path(self, trading_pair: str) -> str:
+        return join(self._exchange_path, quote(trading_pair, safe=""))
+
+    def _save_message_class(self, trading_pair: str, message: OrderBookMessage):
+        message_type: int = message.type.value
+        message_class: Type[OrderBookMessage] = type(message)
+        if self._message_classes.get((trading_pair, message_type)) is message_class:
+            return
+        self._message_classes[(trading_pair, message_type)] = message_class
+        meta_path: str = join(self._pair_path(trading_pair), "meta.json")
+        meta: Dict[str, Any] = {"message_classes": {}}
+        if exists(meta_path):
+            with open(meta_path, "r") as fd:
+                meta = json.load(fd)
+        class_path: str = f"{message_class.__module__}.{message_class.__qualname__}"
+        if meta["message_classes"].get(str(message_type)) != class_path:
+            meta["message_classes"][str(message_type)] = class_path
+            with open(meta_path + ".tmp", "w") as fd:
+                json.dump(meta, fd)
+            os.replace(meta_path + ".tmp", meta_path)
+
+    @staticmethod
+    def _encode_content(content: Dict[str, Any]) -> bytes:
+        try:
+            return ujson.dumps(content).encode("utf-8")
+        except (TypeError, OverflowError):
+            return json.dumps(content, default=str).encode("utf-8")
+
+    def _write_pair_chunk(self,
+                          writers: Dict[str, MarketDataLogWriter],
+                          trading_pair: str,
+                          messages: List[Tuple[float, int, OrderBookMessage]]):
+        records: List[Tuple[float, float, int, int, int, bytes]] = []
+        for receive_ts, flags, message in messages:
+            message_id: Any = message.trade_id if message.type is OrderBookMessageType.TRADE else message.update_id
+            try:
+                message_id = int(message_id)
+                if not MIN_MESSAGE_ID <= message_id <= MAX_MESSAGE_ID:
+                    raise OverflowError
+            except (TypeError, ValueError, OverflowError):
+                # Only the message with the invalid id is dropped, rather than the whole chunk.
+                self.logger().warning(f"Skipped recording a {message.type.name} message for {trading_pair} with an "
+                                      f"invalid id: {message_id!r}.")
+                continue
+            if flags & FLAG_ORDER_BOOK_SNAPSHOT == 0:
+                self._save_message_class(trading_pair, message)
+            records.append((receive_ts,
+                            message.timestamp if message.timestamp is not None else math.nan,
+                            message.type.value,
+                            flags,
+                            message_id,
+                            self._encode_content(message.content)))
+
+        # Chunks are split by UTC day, so every log file holds one day of messages.
+        day_records: Dict[str, List[Tuple[float, float, int, int, int, bytes]]] = {}
+        for record in records:
+            day: str = datetime.fromtimestamp(record[0], tz=timezone.utc).strftime("%Y%m%d")
+            day_records.setdefault(day, []).append(record)
+        for day, records_of_day in day_records.items():
+            log_path: str = join(self._pair_path(trading_pair), day + LOG_FILE_SUFFIX)
+            writer: Optional[MarketDataLogWriter] = writers.get(trading_pair)
+            if writer is None or writer.log_path != log_path:
+                if writer is not None:
+                    writer.close()
+                writer = writers[trading_pair] = MarketDataLogWriter(log_path)
+            writer.write_chunk(records_of_day)
+        self._messages_recorded += len(records)
+
+    def _writer_loop(self):
+        writers: Dict[str, MarketDataLogWriter] = {}
+        pending: Dict[str, List[Tuple[float, int, OrderBookMessage]]] = {}
+        try:
+            while True:
+                stopping: bool = self._writer_stopping
+                self._wake_event.wait(min(1.0, self._flush_interval))
+                self._wake_event.clear()
+                while len(self._message_queue) > 0:
+                    item: Tuple[float, int, OrderBookMessage] = self._message_queue.popleft()
+                    pending.setdefault(item[2].trading_pair, []).append(item)
+
+                now: float = time.time()
+                for trading_pair, messages in list(pending.items()):
+                    if (not stopping and len(messages) < self._chunk_size and
+                            now - messages[0][0] < self._flush_interval):
+                        continue
+                    del pending[trading_pair]
+                    try:
+                        os.makedirs(self._pair_path(trading_pair), exist_ok=True)
+                        for start in range(0, len(messages), self._chunk_size):
+                            self._write_pair_chunk(writers, trading_pair, messages[start:start + self._chunk_size])
+                    except Exception:
+                        self.logger().error(f"Error recording {len(messages)} market data messages for "
+                                            f"{trading_pair}.", exc_info=True)
+                if stopping and len(self._message_queue) == 0:
+                    break
+        finally:
+            for writer in writers.values():
+                writer.close()
+
+
+class MarketDataReader:
+    """
+    Reads the market data recorded by a `MarketDataRecorder`.
+    """
+    def __init__(self, exchange_name: str, root_path: Optional[str] = None):
+        if root_path is None:
+            root_path = join(data_path(), "market_data")
+        self._exchange_name: str = exchange_name
+        self._exchange_path: str = join(root_path, quote(exchange_name, safe=""))
+
+    @property
+    def exchange_name(self) -> str:
+        return self._exchange_name
+
+    def trading_pairs(self) -> List[str]:
+        if not isdir(self._exchange_path):
+            return []
+        return sorted(unquote(name) for name in os.listdir(self._exchange_path)
+                      if isdir(join(self._exchange_path, name)))
+
+    def message_classes(self, trading_pair: str) -> Dict[OrderBookMessageType, Type[OrderBookMessage]]:
+        """
+        Returns the message classes the recorded messages were created with, by message type.
+        """
+        meta_path: str = join(self._exchange_path, quote(trading_pair, safe=""), "meta.json")
+        retval: Dict[OrderBookMessageType, Type[OrderBookMessage]] = {}
+        if exists(meta_path):
+            with open(meta_path, "r") as fd:
+                meta: Dict[str, Any] = json.load(fd)
+            for message_type, class_path in meta["message_classes"].items():
+                module_name, class_name = class_path.rsplit(".", 1)
+                retval[OrderBookMessageType(int(message_type))] = getattr(importlib.import_module(module_name),
+                                                                          class_name)
+        return retval
+
+    def _log_paths(self, trading_pair: str) -> List[str]:
+        pair_path: str = join(self._exchange_path, quote(trading_pair, safe=""))
+        if not isdir(pair_path):
+            return []
+        return [join(pair_path, name) for name in sorted(os.listdir(pair_path)) if name.endswith(LOG_FILE_SUFFIX)]
+
+    def time_range(self, trading_pair: str) -> Optional[Tuple[float, float]]:
+        """
+        Returns the receive timestamps of the first and last recorded messages of a trading pair.
+        """
+        entries: List[Tuple[float, float, int, int]] = [
+            entry
+            for log_path in self._log_paths(trading_pair)
+            for entry in read_index(log_path[:-len(LOG_FILE_SUFFIX)] + INDEX_FILE_SUFFIX)
+        ]
+        if len(entries) == 0:
+            return None
+        return entries[0][0], entries[-1][1]
+
+    def _read_records(self,
+                      trading_pair: str,
+                      start_time: Optional[float],
+                      end_time: Optional[float]) -> Iterator[Tuple[Tuple, bytes]]:
+        """
+        Iterates over the (record header, content) of the recorded messages of a trading pair in the time range.
+        """
+        for log_path in self._log_paths(trading_pair):
+            entries: List[Tuple[float, float, int, int]] = read_index(log_path[:-len(LOG_FILE_SUFFIX)] +
+                                                                      INDEX_FILE_SUFFIX)
+            if len(entries) == 0:
+                continue
+            with open(log_path, "rb") as fd, mmap.mmap(fd.fileno(), 0, access=mmap.ACCESS_READ) as log_map:
+                for first_ts, last_ts, offset, _ in entries:
+                    if (start_time is not None and last_ts < start_time) or (end_time is not None and
+                                                                             first_ts > end_time):
+                        continue
+                    header: Tuple = CHUNK_HEADER.unpack_from(log_map, offset)
+                    data_offset: int = offset + CHUNK_HEADER.size
+                    raw: bytes = zlib.decompress(log_map[data_offset:data_offset + header[5]])
+                    position: int = 0
+                    while position < len(raw):
+                        record_header: Tuple = RECORD_HEADER.unpack_from(raw, position)
+                        receive_ts: float = record_header[0]
+                        content_size: int = record_header[5]
+                        position += RECORD_HEADER.size
+                        content_bytes: bytes = raw[position:position + content_size]
+                        position += content_size
+                        if start_time is not None and receive_ts < start_time:
+                            continue
+                        if end_time is not None and receive_ts > end_time:
+                            return
+                        yield record_header, content_bytes
+
+    def read(self,
+             trading_pair: str,
+             start_time: Optional[float] = None,
+             end_time: Optional[float] = None,
+             message_classes: Optional[Dict[OrderBookMessageType, Type[OrderBookMessage]]] = None
+             ) -> Iterator[RecordedMarketDataMessage]:
+        """
+        Iterates over the recorded messages of a trading pair in receive order, starting from `start_time` and up to
+        `end_time` inclusive, by receive timestamp. The log files are memory-mapped, only the chunks overlapping the
+        time range are decompressed, and each message is only decoded when the iterator reaches it.
+
+        :param message_classes: Classes to create the messages with, by message type. Defaults to the classes the
+                                messages were recorded with. Recorded order book snapshots always use OrderBookMessage.
+        """
+        if message_classes is None:
+            message_classes = self.message_classes(trading_pair)
+        for record_header, content_bytes in self._read_records(trading_pair, start_time, end_time):
+            yield decode_record(record_header, content_bytes, message_classes)
+
+    def load(self,
+             trading_pair: str,
+             start_time: Optional[float] = None,
+             end_time: Optional[float] = None,
+             message_classes: Optional[Dict[OrderBookMessageType, Type[OrderBookMessage]]] = None
+             ) -> "MarketDataBuffer":
+        """
+        Decompresses the recorded messages of a trading pair in the time range into memory, to be read more than once.
+        See `read()` for the parameters.
+        """
+        if message_classes is None:
+            message_classes = self.message_classes(trading_pair)
+        records: List[bytes] = [RECORD_HEADER.pack(*record_header) + content_bytes
+                                for record_header, content_bytes in self._read_records(trading_pair,
+                                                                                       start_time,
+                                                                                       end_time)]
+        return MarketDataBuffer(records, message_classes)
+
+
+def decode_record(record_header: Tuple,
+                  content_bytes: bytes,
+                  message_classes: Dict[OrderBookMessageType, Type[OrderBookMessage]]) -> RecordedMarketDataMessage:
+    receive_ts, exchange_ts, message_type, flags, _, _ = record_header
+    ob_message_type: OrderBookMessageType = OrderBookMessageType(message_type)
+    message_class: Type[OrderBookMessage] = (
+        OrderBookMessage if flags & FLAG_ORDER_BOOK_SNAPSHOT
+        else message_classes.get(ob_message_type, OrderBookMessage)
+    )
+    return RecordedMarketDataMessage(
+        receive_ts,
+        flags,
+        message_class(ob_message_type,
+                      ujson.loads(content_bytes),
+                      timestamp=None if math.isnan(exchange_ts) else exchange_ts)
+    )
+
+
+class MarketDataBuffer:
+    """
+    Decompressed recorded messages of a trading pair, held in one anonymous memory map. Processes forked after it's
+    loaded share its pages with the parent process, since it holds no Python objects per message that reading it
+    would touch. The messages are only decoded as they're iterated over, in every process on its own.
+    """
+    def __init__(self,
+                 records: List[bytes],
+                 message_classes: Dict[OrderBookMessageType, Type[OrderBookMessage]]):
+        """
+        :param records: Record header and content of each message, in receive order
+        """
+        self._size: int = sum(len(record) for record in records)
+        # Memory maps can't be empty.
+        self._buffer: mmap.mmap = mmap.mmap(-1, max(self._size, 1))
+        for record in records:
+            self._buffer.write(record)
+        self._num_messages: int = len(records)
+        self._message_classes: Dict[OrderBookMessageType, Type[OrderBookMessage]] = message_classes
+
+    def __len__(self) -> int:
+        return self._num_messages
+
+    def __iter__(self) -> Iterator[RecordedMarketDataMessage]:
+        position: int = 0
+        while position < self._size:
+            record_header: Tuple = RECORD_HEADER.unpack_from(self._buffer, position)
+            position += RECORD_HEADER.size
+            content_bytes: bytes = self._buffer[position:position + record_header[5]]
+            position += record_header[5]
+            yield decode_record(record_header, content_bytes, self._message_classes)
+
+    @property
+    def size(self) -> int:
+        """
+        Size of the buffer in bytes.
+        """
+        return self._size
+
+    def close(self):
+        self._buffer.close()
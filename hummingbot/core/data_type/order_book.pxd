@@ -5,10 +5,23 @@ from libcpp.set cimport set
 from libcpp.vector cimport vector
 cimport numpy as np
 from hummingbot.core.data_type.OrderBookEntry cimport OrderBookEntry
+from hummingbot.core.data_type.OrderBookDepthIndex cimport OrderBookDepthIndex
 from hummingbot.core.pubsub cimport PubSub
 
 from .order_book_query_result cimport OrderBookQueryResult
 
+cdef struct DepthWalkResult:
+    bint reached
+    double price
+    double base_volume
+    double quote_volume
+
+
+cdef DepthWalkResult c_walk_to_base_volume(vector[OrderBookEntry] &entries, double volume) nogil
+cdef DepthWalkResult c_walk_to_quote_volume(vector[OrderBookEntry] &entries, double quote_volume) nogil
+cdef DepthWalkResult c_walk_to_price(vector[OrderBookEntry] &entries, bint is_buy, double price) nogil
+
+
 cdef class OrderBook(PubSub):
     cdef set[OrderBookEntry] _bid_book
     cdef set[OrderBookEntry] _ask_book
@@ -17,16 +30,31 @@ cdef class OrderBook(PubSub):
     cdef double _best_bid
     cdef double _best_ask
     cdef bint _dex
+    cdef OrderBookDepthIndex _bid_depth_index
+    cdef OrderBookDepthIndex _ask_depth_index
+    cdef bint _depth_index_enabled
 
     cdef c_apply_diffs(self, vector[OrderBookEntry] bids, vector[OrderBookEntry] asks, int64_t update_id)
     cdef c_apply_snapshot(self, vector[OrderBookEntry] bids, vector[OrderBookEntry] asks, int64_t update_id)
     cdef c_apply_trade(self, object trade_event)
+    cdef object c_make_event_batch(self, int64_t event_tag, list events)
+    cdef double c_get_level_volume(self, bint is_bid, double price)
+    cdef c_apply_diff_rows(self, object bids, object asks, int64_t update_id)
+    cdef c_apply_snapshot_rows(self, object bids, object asks, int64_t update_id)
+    cdef c_apply_diff_message(self, object message)
+    cdef c_apply_snapshot_message(self, object message)
     cdef c_apply_numpy_diffs(self,
                              np.ndarray[np.float64_t, ndim=2] bids_array,
                              np.ndarray[np.float64_t, ndim=2] asks_array)
     cdef c_apply_numpy_snapshot(self,
                                 np.ndarray[np.float64_t, ndim=2] bids_array,
                                 np.ndarray[np.float64_t, ndim=2] asks_array)
+    cdef OrderBookDepthIndex *c_get_depth_index(self, bint is_buy)
+    cdef vector[OrderBookEntry] c_get_depth_entries(self, bint is_buy)
+    cdef DepthWalkResult c_walk_base_volume(self, bint is_buy, double volume)
+    cdef DepthWalkResult c_walk_quote_volume(self, bint is_buy, double quote_volume)
+    cdef DepthWalkResult c_walk_price(self, bint is_buy, double price)
+    cdef tuple c_get_depth_profile(self, bint is_buy, np.ndarray[np.float64_t, ndim=1] volumes)
     cdef double c_get_price(self, bint is_buy) except? -1
     cdef OrderBookQueryResult c_get_price_for_volume(self, bint is_buy, double volume)
     cdef OrderBookQueryResult c_get_price_for_quote_volume(self, bint is_buy, double quote_volume)
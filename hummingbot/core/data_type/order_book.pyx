@@ -1,15 +1,17 @@
 # distutils: language=c++
-# distutils: sources=hummingbot/core/cpp/OrderBookEntry.cpp
+# distutils: sources=hummingbot/core/cpp/OrderBookEntry.cpp hummingbot/core/cpp/OrderBookDepthIndex.cpp
 from cython.operator cimport(
     postincrement as inc,
     dereference as deref,
     address as ref
 )
+from libc.math cimport NAN
 from hummingbot.core.data_type.OrderBookEntry cimport truncateOverlapEntries
 from hummingbot.logger import HummingbotLogger
 from hummingbot.core.event.events import (
     OrderBookEvent,
-    OrderBookTradeEvent
+    OrderBookTradeEvent,
+    OrderBookTradeEventBatch
 )
 from typing import (
     List,
@@ -32,8 +34,89 @@ ob_logger = None
 NaN = float("nan")
 
 
+cdef DepthWalkResult c_walk_to_base_volume(vector[OrderBookEntry] &entries, double volume) nogil:
+    """
+    Walks entries, ordered from the best price outwards, until the cumulative base volume reaches volume.
+    """
+    cdef:
+        DepthWalkResult result
+        size_t i
+    result.reached = False
+    result.price = NAN
+    result.base_volume = result.quote_volume = 0
+    for i in range(entries.size()):
+        result.base_volume += entries[i].getAmount()
+        result.quote_volume += entries[i].getAmount() * entries[i].getPrice()
+        if result.base_volume >= volume:
+            result.reached = True
+            result.price = entries[i].getPrice()
+            break
+    return result
+
+
+cdef DepthWalkResult c_walk_to_quote_volume(vector[OrderBookEntry] &entries, double quote_volume) nogil:
+    """
+    Walks entries, ordered from the best price outwards, until the cumulative quote volume reaches quote_volume.
+    """
+    cdef:
+        DepthWalkResult result
+        size_t i
+    result.reached = False
+    result.price = NAN
+    result.base_volume = result.quote_volume = 0
+    for i in range(entries.size()):
+        result.base_volume += entries[i].getAmount()
+        result.quote_volume += entries[i].getAmount() * entries[i].getPrice()
+        if result.quote_volume >= quote_volume:
+            result.reached = True
+            result.price = entries[i].getPrice()
+            break
+    return result
+
+
+cdef DepthWalkResult c_walk_to_price(vector[OrderBookEntry] &entries, bint is_buy, double price) nogil:
+    """
+    Walks entries, ordered from the best price outwards, while they are priced at or better than price. The result
+    price is the price of the last entry walked.
+    """
+    cdef:
+        DepthWalkResult result
+        size_t i
+    result.reached = False
+    result.price = NAN
+    result.base_volume = result.quote_volume = 0
+    for i in range(entries.size()):
+        if (is_buy and entries[i].getPrice() > price) or (not is_buy and entries[i].getPrice() < price):
+            break
+        result.reached = True
+        result.price = entries[i].getPrice()
+        result.base_volume += entries[i].getAmount()
+        result.quote_volume += entries[i].getAmount() * result.price
+    return result
+
+
+cdef vector[OrderBookEntry] c_entries_from_rows(object rows, int64_t update_id):
+    """
+    Converts rows in the raw exchange format, [price, amount, ...], into order book entries.
+    """
+    cdef:
+        vector[OrderBookEntry] entries
+    entries.reserve(len(rows))
+    for row in rows:
+        entries.push_back(OrderBookEntry(float(row[0]), float(row[1]), update_id))
+    return entries
+
+
+cdef inline double c_vwap_for_volume(DepthWalkResult result, double volume) nogil:
+    # Only take the part of the last price level that is needed to reach the volume.
+    if volume <= 0:
+        return result.price
+    return (result.quote_volume - (result.base_volume - volume) * result.price) / volume
+
+
 cdef class OrderBook(PubSub):
     ORDER_BOOK_TRADE_EVENT_TAG = OrderBookEvent.TradeEvent.value
+    ORDER_BOOK_UPDATE_EVENT_TAG = OrderBookEvent.UpdateEvent.value
 
     @classmethod
     def logger(cls) -> HummingbotLogger:
@@ -48,6 +131,7 @@ cdef class OrderBook(PubSub):
         self._last_diff_uid = 0
         self._best_bid = self._best_ask = float("NaN")
         self._dex = dex
+        self._depth_index_enabled = True
 
     cdef c_apply_diffs(self, vector[OrderBookEntry] bids, vector[OrderBookEntry] asks, int64_t update_id):
         cdef:
@@ -58,6 +142,8 @@ cdef class OrderBook(PubSub):
             set[OrderBookEntry].iterator result
             OrderBookEntry top_bid
             OrderBookEntry top_ask
+            size_t bid_book_size
+            size_t ask_book_size
 
         # Apply the diffs. Diffs with 0 amounts mean deletion.
         for bid in bids:
@@ -66,15 +152,25 @@ cdef class OrderBook(PubSub):
                 self._bid_book.erase(result)
             if bid.getAmount() > 0:
                 self._bid_book.insert(bid)
+            if self._depth_index_enabled:
+                self._bid_depth_index.applyUpdate(bid.getPrice(), bid.getAmount())
         for ask in asks:
             result = self._ask_book.find(ask)
             if result != ask_book_end:
                 self._ask_book.erase(result)
             if ask.getAmount() > 0:
                 self._ask_book.insert(ask)
+            if self._depth_index_enabled:
+                self._ask_depth_index.applyUpdate(ask.getPrice(), ask.getAmount())
 
         # If any overlapping entries between the bid and ask books, centralised: newer entries win, dex: see OrderBookEntry.cpp
+        bid_book_size = self._bid_book.size()
+        ask_book_size = self._ask_book.size()
         truncateOverlapEntries(self._bid_book, self._ask_book, self._dex)
+        if bid_book_size != self._bid_book.size():
+            self._bid_depth_index.invalidate()
+        if ask_book_size != self._ask_book.size():
+            self._ask_depth_index.invalidate()
 
         # Record the current best prices, for faster c_get_price() calls.
         bid_iterator = self._bid_book.rbegin()
@@ -88,6 +184,7 @@ cdef class OrderBook(PubSub):
 
         # Remember the last diff update ID.
         self._last_diff_uid = update_id
+        self.c_trigger_event(self.ORDER_BOOK_UPDATE_EVENT_TAG, update_id)
 
     cdef c_apply_snapshot(self, vector[OrderBookEntry] bids, vector[OrderBookEntry] asks, int64_t update_id):
         cdef:
@@ -101,6 +198,8 @@ cdef class OrderBook(PubSub):
         # Start with an empty order book, and then insert all entries.
         self._bid_book.clear()
         self._ask_book.clear()
+        self._bid_depth_index.invalidate()
+        self._ask_depth_index.invalidate()
         for bid in bids:
             self._bid_book.insert(bid)
             if not (bid.getPrice() <= best_bid_price):
@@ -128,10 +227,33 @@ cdef class OrderBook(PubSub):
 
         # Remember the last snapshot update ID.
         self._snapshot_uid = update_id
+        self.c_trigger_event(self.ORDER_BOOK_UPDATE_EVENT_TAG, update_id)
 
     cdef c_apply_trade(self, object trade_event):
         self.c_trigger_event(self.ORDER_BOOK_TRADE_EVENT_TAG, trade_event)
 
+    cdef object c_make_event_batch(self, int64_t event_tag, list events):
+        """
+        The trade events are batched into an `OrderBookTradeEventBatch`, for vectorized processing.
+        """
+        if event_tag == self.ORDER_BOOK_TRADE_EVENT_TAG:
+            return OrderBookTradeEventBatch.from_events(events[0].trading_pair, events)
+        return PubSub.c_make_event_batch(self, event_tag, events)
+
+    cdef double c_get_level_volume(self, bint is_bid, double price):
+        """
+        Volume resting at exactly the given price on the bid or ask side. 0 if there's no order at that price.
+        """
+        cdef:
+            set[OrderBookEntry] *book = ref(self._bid_book) if is_bid else ref(self._ask_book)
+            set[OrderBookEntry].iterator it = book.find(OrderBookEntry(price, 0, 0))
+        if it == book.end():
+            return 0
+        return deref(it).getAmount()
+
+    def get_level_volume(self, is_bid: bool, price: float) -> float:
+        return self.c_get_level_volume(is_bid, price)
+
     @property
     def snapshot_uid(self) -> int:
         return self._snapshot_uid
@@ -140,6 +262,13 @@ cdef class OrderBook(PubSub):
     def last_diff_uid(self) -> int:
         return self._last_diff_uid
 
+    @property
+    def depth_index_rebuild_count(self) -> int:
+        """
+        Number of times the depth indexes of both sides were rebuilt from the order book.
+        """
+        return self._bid_depth_index.getRebuildCount() + self._ask_depth_index.getRebuildCount()
+
     @property
     def snapshot(self) -> Tuple[pd.DataFrame, pd.DataFrame]:
         bids_rows = list(self.bid_entries())
@@ -197,13 +326,16 @@ cdef class OrderBook(PubSub):
             vector[OrderBookEntry] cpp_bids
             vector[OrderBookEntry] cpp_asks
             int64_t last_update_id = 0
-
-        for row in bids_array:
-            cpp_bids.push_back(OrderBookEntry(row[0], row[1], <int64_t>(row[2])))
-            last_update_id = max(last_update_id, <int64_t>row[2])
-        for row in asks_array:
-            cpp_asks.push_back(OrderBookEntry(row[0], row[1], <int64_t>(row[2])))
-            last_update_id = max(last_update_id, <int64_t>row[2])
+            size_t i
+
+        cpp_bids.reserve(bids_array.shape[0])
+        cpp_asks.reserve(asks_array.shape[0])
+        for i in range(bids_array.shape[0]):
+            cpp_bids.push_back(OrderBookEntry(bids_array[i, 0], bids_array[i, 1], <int64_t>bids_array[i, 2]))
+            last_update_id = max(last_update_id, <int64_t>bids_array[i, 2])
+        for i in range(asks_array.shape[0]):
+            cpp_asks.push_back(OrderBookEntry(asks_array[i, 0], asks_array[i, 1], <int64_t>asks_array[i, 2]))
+            last_update_id = max(last_update_id, <int64_t>asks_array[i, 2])
         self.c_apply_diffs(cpp_bids, cpp_asks, last_update_id)
 
     def apply_numpy_snapshot(self, bids_array: np.ndarray, asks_array: np.ndarray):
@@ -224,15 +356,54 @@ cdef class OrderBook(PubSub):
             vector[OrderBookEntry] cpp_bids
             vector[OrderBookEntry] cpp_asks
             int64_t last_update_id = 0
-
-        for row in bids_array:
-            cpp_bids.push_back(OrderBookEntry(row[0], row[1], <int64_t>(row[2])))
-            last_update_id = max(last_update_id, <int64_t>row[2])
-        for row in asks_array:
-            cpp_asks.push_back(OrderBookEntry(row[0], row[1], <int64_t>(row[2])))
-            last_update_id = max(last_update_id, <int64_t>row[2])
+            size_t i
+
+        cpp_bids.reserve(bids_array.shape[0])
+        cpp_asks.reserve(asks_array.shape[0])
+        for i in range(bids_array.shape[0]):
+            cpp_bids.push_back(OrderBookEntry(bids_array[i, 0], bids_array[i, 1], <int64_t>bids_array[i, 2]))
+            last_update_id = max(last_update_id, <int64_t>bids_array[i, 2])
+        for i in range(asks_array.shape[0]):
+            cpp_asks.push_back(OrderBookEntry(asks_array[i, 0], asks_array[i, 1], <int64_t>asks_array[i, 2]))
+            last_update_id = max(last_update_id, <int64_t>asks_array[i, 2])
         self.c_apply_snapshot(cpp_bids, cpp_asks, last_update_id)
 
+    cdef c_apply_diff_rows(self, object bids, object asks, int64_t update_id):
+        self.c_apply_diffs(c_entries_from_rows(bids, update_id), c_entries_from_rows(asks, update_id), update_id)
+
+    cdef c_apply_snapshot_rows(self, object bids, object asks, int64_t update_id):
+        self.c_apply_snapshot(c_entries_from_rows(bids, update_id), c_entries_from_rows(asks, update_id), update_id)
+
+    def apply_diff_rows(self, bids: List[List[any]], asks: List[List[any]], update_id: int):
+        """
+        Applies diffs in the raw exchange format, where each row starts with [price, amount, ...]. Prices and amounts
+        may be numbers or numeric strings.
+        """
+        self.c_apply_diff_rows(bids, asks, update_id)
+
+    def apply_snapshot_rows(self, bids: List[List[any]], asks: List[List[any]], update_id: int):
+        """
+        Applies a snapshot in the raw exchange format, where each row starts with [price, amount, ...]. Prices and
+        amounts may be numbers or numeric strings.
+        """
+        self.c_apply_snapshot_rows(bids, asks, update_id)
+
+    cdef c_apply_diff_message(self, object message):
+        """
+        Exchange order book classes whose message content is in the [price, amount, ...] row format can override this
+        to call c_apply_diff_rows() on the raw content, skipping the OrderBookRow lists of OrderBookMessage.
+        """
+        self.apply_diffs(message.bids, message.asks, message.update_id)
+
+    cdef c_apply_snapshot_message(self, object message):
+        self.apply_snapshot(message.bids, message.asks, message.update_id)
+
+    def apply_diff_message(self, message: OrderBookMessage):
+        self.c_apply_diff_message(message)
+
+    def apply_snapshot_message(self, message: OrderBookMessage):
+        self.c_apply_snapshot_message(message)
+
     def bid_entries(self) -> Iterator[OrderBookRow]:
         cdef:
             set[OrderBookEntry].reverse_iterator it = self._bid_book.rbegin()
@@ -289,144 +460,210 @@ cdef class OrderBook(PubSub):
     def get_price(self, is_buy: bool) -> float:
         return self.c_get_price(is_buy)
 
-    cdef OrderBookQueryResult c_get_price_for_volume(self, bint is_buy, double volume):
+    cdef OrderBookDepthIndex *c_get_depth_index(self, bint is_buy):
+        """
+        Returns the cumulative depth index for the ask side if is_buy, or the bid side otherwise. Stale indices are
+        rebuilt from the order book before being returned.
+        """
+        if is_buy:
+            if self._ask_depth_index.isStale():
+                self._ask_depth_index.rebuild(self._ask_book, True)
+            return ref(self._ask_depth_index)
+        if self._bid_depth_index.isStale():
+            self._bid_depth_index.rebuild(self._bid_book, False)
+        return ref(self._bid_depth_index)
+
+    cdef vector[OrderBookEntry] c_get_depth_entries(self, bint is_buy):
+        """
+        Returns the ask entries if is_buy, or the bid entries otherwise, ordered from the best price outwards.
+
+        Subclasses that override bid_entries() and ask_entries() should override this as well, and disable the depth
+        index, so that depth queries see the same entries.
+        """
         cdef:
-            double cumulative_volume = 0
-            double result_price = NaN
+            vector[OrderBookEntry] entries
+            set[OrderBookEntry].iterator ask_it
+            set[OrderBookEntry].reverse_iterator bid_it
 
         if is_buy:
-            for order_book_row in self.ask_entries():
-                cumulative_volume += order_book_row.amount
-                if cumulative_volume >= volume:
-                    result_price = order_book_row.price
-                    break
+            entries.reserve(self._ask_book.size())
+            ask_it = self._ask_book.begin()
+            while ask_it != self._ask_book.end():
+                entries.push_back(deref(ask_it))
+                inc(ask_it)
+        else:
+            entries.reserve(self._bid_book.size())
+            bid_it = self._bid_book.rbegin()
+            while bid_it != self._bid_book.rend():
+                entries.push_back(deref(bid_it))
+                inc(bid_it)
+        return entries
+
+    cdef DepthWalkResult c_walk_base_volume(self, bint is_buy, double volume):
+        cdef:
+            DepthWalkResult result
+            OrderBookDepthIndex *depth_index
+            vector[OrderBookEntry] entries
+            size_t index
+
+        if not self._depth_index_enabled:
+            entries = self.c_get_depth_entries(is_buy)
+            return c_walk_to_base_volume(entries, volume)
+
+        depth_index = self.c_get_depth_index(is_buy)
+        index = depth_index.findByBase(volume)
+        result.reached = index < depth_index.size()
+        if result.reached:
+            result.price = depth_index.getPrice(index)
+            result.base_volume = depth_index.getCumulativeBase(index)
+            result.quote_volume = depth_index.getCumulativeQuote(index)
+        else:
+            result.price = NaN
+            result.base_volume = depth_index.getTotalBase()
+            result.quote_volume = depth_index.getTotalQuote()
+        return result
+
+    cdef DepthWalkResult c_walk_quote_volume(self, bint is_buy, double quote_volume):
+        cdef:
+            DepthWalkResult result
+            OrderBookDepthIndex *depth_index
+            vector[OrderBookEntry] entries
+            size_t index
+
+        if not self._depth_index_enabled:
+            entries = self.c_get_depth_entries(is_buy)
+            return c_walk_to_quote_volume(entries, quote_volume)
+
+        depth_index = self.c_get_depth_index(is_buy)
+        index = depth_index.findByQuote(quote_volume)
+        result.reached = index < depth_index.size()
+        if result.reached:
+            result.price = depth_index.getPrice(index)
+            result.base_volume = depth_index.getCumulativeBase(index)
+            result.quote_volume = depth_index.getCumulativeQuote(index)
         else:
-            for order_book_row in self.bid_entries():
-                cumulative_volume += order_book_row.amount
-                if cumulative_volume >= volume:
-                    result_price = order_book_row.price
-                    break
+            result.price = NaN
+            result.base_volume = depth_index.getTotalBase()
+            result.quote_volume = depth_index.getTotalQuote()
+        return result
+
+    cdef DepthWalkResult c_walk_price(self, bint is_buy, double price):
+        cdef:
+            DepthWalkResult result
+            OrderBookDepthIndex *depth_index
+            vector[OrderBookEntry] entries
+            size_t num_levels
+            int64_t non_empty_levels = 0
+
+        if not self._depth_index_enabled:
+            entries = self.c_get_depth_entries(is_buy)
+            return c_walk_to_price(entries, is_buy, price)
+
+        depth_index = self.c_get_depth_index(is_buy)
+        num_levels = depth_index.countWithinPrice(price)
+        result.price = NaN
+        result.base_volume = result.quote_volume = 0
+        if num_levels > 0:
+            result.base_volume = depth_index.getCumulativeBase(num_levels - 1)
+            result.quote_volume = depth_index.getCumulativeQuote(num_levels - 1)
+            non_empty_levels = depth_index.getCumulativeLevels(num_levels - 1)
+            if non_empty_levels > 0:
+                # The price of the last non-empty level within the price limit.
+                result.price = depth_index.getPrice(depth_index.findByLevels(non_empty_levels))
+        result.reached = non_empty_levels > 0
+        return result
 
-        return OrderBookQueryResult(NaN, volume, result_price, min(cumulative_volume, volume))
+    cdef OrderBookQueryResult c_get_price_for_volume(self, bint is_buy, double volume):
+        cdef:
+            DepthWalkResult result = self.c_walk_base_volume(is_buy, volume)
+        return OrderBookQueryResult(NaN, volume, result.price, min(result.base_volume, volume))
 
     cdef OrderBookQueryResult c_get_vwap_for_volume(self, bint is_buy, double volume):
         cdef:
-            double total_cost = 0
-            double total_volume = 0
+            DepthWalkResult result = self.c_walk_base_volume(is_buy, volume)
             double result_vwap = NaN
-        if is_buy:
-            for order_book_row in self.ask_entries():
-                total_cost += order_book_row.amount * order_book_row.price
-                total_volume += order_book_row.amount
-                if total_volume >= volume:
-                    incremental_amount = total_volume - volume
-                    total_cost -= order_book_row.amount * order_book_row.price
-                    total_volume -= order_book_row.amount
-                    total_cost += incremental_amount * order_book_row.price
-                    total_volume += incremental_amount
-                    result_vwap = total_cost / total_volume
-                    break
-        else:
-            for order_book_row in self.bid_entries():
-                total_cost += order_book_row.amount * order_book_row.price
-                total_volume += order_book_row.amount
-                if total_volume >= volume:
-                    incremental_amount = total_volume - volume
-                    total_cost -= order_book_row.amount * order_book_row.price
-                    total_volume -= order_book_row.amount
-                    total_cost += incremental_amount * order_book_row.price
-                    total_volume += incremental_amount
-                    result_vwap = total_cost / total_volume
-                    break
-
-        return OrderBookQueryResult(NaN, volume, result_vwap, min(total_volume, volume))
+        if result.reached:
+            result_vwap = c_vwap_for_volume(result, volume)
+        return OrderBookQueryResult(NaN, volume, result_vwap, min(result.base_volume, volume))
 
     cdef OrderBookQueryResult c_get_price_for_quote_volume(self, bint is_buy, double quote_volume):
         cdef:
-            double cumulative_volume = 0
-            double result_price = NaN
-
-        if is_buy:
-            for order_book_row in self.ask_entries():
-                cumulative_volume += order_book_row.amount * order_book_row.price
-                if cumulative_volume >= quote_volume:
-                    result_price = order_book_row.price
-                    break
-        else:
-            for order_book_row in self.bid_entries():
-                cumulative_volume += order_book_row.amount * order_book_row.price
-                if cumulative_volume >= quote_volume:
-                    result_price = order_book_row.price
-                    break
-
-        return OrderBookQueryResult(NaN, quote_volume, result_price, min(cumulative_volume, quote_volume))
+            DepthWalkResult result = self.c_walk_quote_volume(is_buy, quote_volume)
+        return OrderBookQueryResult(NaN, quote_volume, result.price, min(result.quote_volume, quote_volume))
 
     cdef OrderBookQueryResult c_get_quote_volume_for_base_amount(self, bint is_buy, double base_amount):
         cdef:
-            double cumulative_volume = 0
-            double cumulative_base_amount = 0
-            double row_amount = 0
-
-        if is_buy:
-            for order_book_row in self.ask_entries():
-                row_amount = order_book_row.amount
-                if row_amount + cumulative_base_amount >= base_amount:
-                    row_amount = base_amount - cumulative_base_amount
-                cumulative_base_amount += row_amount
-                cumulative_volume += row_amount * order_book_row.price
-                if cumulative_base_amount >= base_amount:
-                    break
-        else:
-            for order_book_row in self.bid_entries():
-                row_amount = order_book_row.amount
-                if row_amount + cumulative_base_amount >= base_amount:
-                    row_amount = base_amount - cumulative_base_amount
-                cumulative_base_amount += row_amount
-                cumulative_volume += row_amount * order_book_row.price
-                if cumulative_base_amount >= base_amount:
-                    break
-
+            DepthWalkResult result = self.c_walk_base_volume(is_buy, base_amount)
+            double cumulative_volume = result.quote_volume
+        if result.reached:
+            # Only take the part of the last price level that is needed to reach the base amount.
+            cumulative_volume -= (result.base_volume - base_amount) * result.price
         return OrderBookQueryResult(NaN, base_amount, NaN, cumulative_volume)
 
     cdef OrderBookQueryResult c_get_volume_for_price(self, bint is_buy, double price):
         cdef:
-            double cumulative_volume = 0
-            double result_price = NaN
-
-        if is_buy:
-            for order_book_row in self.ask_entries():
-                if order_book_row.price > price:
-                    break
-                cumulative_volume += order_book_row.amount
-                result_price = order_book_row.price
-        else:
-            for order_book_row in self.bid_entries():
-                if order_book_row.price < price:
-                    break
-                cumulative_volume += order_book_row.amount
-                result_price = order_book_row.price
-
-        return OrderBookQueryResult(price, NaN, result_price, cumulative_volume)
+            DepthWalkResult result = self.c_walk_price(is_buy, price)
+        return OrderBookQueryResult(price, NaN, result.price, result.base_volume)
 
     cdef OrderBookQueryResult c_get_quote_volume_for_price(self, bint is_buy, double price):
         cdef:
-            double cumulative_volume = 0
-            double result_price = NaN
+            DepthWalkResult result = self.c_walk_price(is_buy, price)
+        return OrderBookQueryResult(price, NaN, result.price, result.quote_volume)
 
-        if is_buy:
-            for order_book_row in self.ask_entries():
-                if order_book_row.price > price:
-                    break
-                cumulative_volume += order_book_row.amount * order_book_row.price
-                result_price = order_book_row.price
-        else:
-            for order_book_row in self.bid_entries():
-                if order_book_row.price < price:
-                    break
-                cumulative_volume += order_book_row.amount * order_book_row.price
-                result_price = order_book_row.price
+    cdef tuple c_get_depth_profile(self, bint is_buy, np.ndarray[np.float64_t, ndim=1] volumes):
+        cdef:
+            size_t num_volumes = len(volumes)
+            np.ndarray[np.float64_t, ndim=1] prices = np.full(num_volumes, NaN, dtype="float64")
+            np.ndarray[np.float64_t, ndim=1] vwaps = np.full(num_volumes, NaN, dtype="float64")
+            np.ndarray[np.float64_t, ndim=1] result_volumes = np.empty(num_volumes, dtype="float64")
+            np.ndarray[np.int64_t, ndim=1] volume_order
+            vector[OrderBookEntry] entries
+            DepthWalkResult result
+            size_t i
+            size_t volume_index
+            size_t next_level = 0
+            double volume
+
+        if self._depth_index_enabled:
+            for i in range(num_volumes):
+                volume = volumes[i]
+                result = self.c_walk_base_volume(is_buy, volume)
+                if result.reached:
+                    prices[i] = result.price
+                    vwaps[i] = c_vwap_for_volume(result, volume)
+                result_volumes[i] = min(result.base_volume, volume)
+            return prices, vwaps, result_volumes
+
+        # Without the depth index, walk the order book once, answering the volumes in ascending order.
+        entries = self.c_get_depth_entries(is_buy)
+        volume_order = np.argsort(volumes, kind="mergesort").astype("int64")
+        result.reached = False
+        result.price = NaN
+        result.base_volume = result.quote_volume = 0
+        for i in range(num_volumes):
+            volume_index = volume_order[i]
+            volume = volumes[volume_index]
+            while (next_level == 0 or result.base_volume < volume) and next_level < entries.size():
+                result.price = entries[next_level].getPrice()
+                result.base_volume += entries[next_level].getAmount()
+                result.quote_volume += entries[next_level].getAmount() * result.price
+                next_level += 1
+            if next_level > 0 and result.base_volume >= volume:
+                prices[volume_index] = result.price
+                vwaps[volume_index] = c_vwap_for_volume(result, volume)
+            result_volumes[volume_index] = min(result.base_volume, volume)
+        return prices, vwaps, result_volumes
+
+    def get_depth_profile(self, is_buy: bool, volumes: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Answers get_price_for_volume() and get_vwap_for_volume() for many volumes in one call.
 
-        return OrderBookQueryResult(price, NaN, result_price, cumulative_volume)
+        :param is_buy: True to walk the ask side, False to walk the bid side
+        :param volumes: 1-D array of base asset volumes
+        :return: (prices, vwaps, result_volumes) arrays, in the same order as volumes. Prices and VWAPs are NaN for
+                 volumes that exceed the order book depth.
+        """
+        return self.c_get_depth_profile(is_buy, np.asarray(volumes, dtype="float64"))
 
     def get_price_for_volume(self, is_buy: bool, volume: float) -> OrderBookQueryResult:
         return self.c_get_price_for_volume(is_buy, volume)
@@ -469,6 +706,6 @@ cdef class OrderBook(PubSub):
     def restore_from_snapshot_and_diffs(self, snapshot: OrderBookMessage, diffs: List[OrderBookMessage]):
         replay_position = bisect.bisect_right(diffs, snapshot)
         replay_diffs = diffs[replay_position:]
-        self.apply_snapshot(snapshot.bids, snapshot.asks, snapshot.update_id)
+        self.c_apply_snapshot_message(snapshot)
         for diff in replay_diffs:
-            self.apply_diffs(diff.bids, diff.asks, diff.update_id)
+            self.c_apply_diff_message(diff)
@@ -53,15 +53,24 @@ class OrderBookMessage(namedtuple("_OrderBookMessage", "type, content, timestamp
 
     @property
     def asks(self) -> List[OrderBookRow]:
-        return [
-            OrderBookRow(float(price), float(amount), self.update_id) for price, amount, *trash in self.content["asks"]
-        ]
+        # The parsed rows are cached, since the message may be replayed against the order book more than once.
+        retval: Optional[List[OrderBookRow]] = self.__dict__.get("_asks")
+        if retval is None:
+            retval = self.__dict__["_asks"] = [
+                OrderBookRow(float(price), float(amount), self.update_id)
+                for price, amount, *trash in self.content["asks"]
+            ]
+        return retval
 
     @property
     def bids(self) -> List[OrderBookRow]:
-        return [
-            OrderBookRow(float(price), float(amount), self.update_id) for price, amount, *trash in self.content["bids"]
-        ]
+        retval: Optional[List[OrderBookRow]] = self.__dict__.get("_bids")
+        if retval is None:
+            retval = self.__dict__["_bids"] = [
+                OrderBookRow(float(price), float(amount), self.update_id)
+                for price, amount, *trash in self.content["bids"]
+            ]
+        return retval
 
     @property
     def has_update_id(self) -> bool:
@@ -0,0 +1,151 @@
+#!/usr/bin/env python
+
+import aiohttp
+import asyncio
+import logging
+from typing import (
+    Awaitable,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+)
+
+from hummingbot.core.data_type.order_book_tracker_entry import OrderBookTrackerEntry
+from hummingbot.core.utils.asyncio_throttle import Throttler
+from hummingbot.logger import HummingbotLogger
+
+FetchEntryFunction = Callable[[aiohttp.ClientSession, str], Awaitable[OrderBookTrackerEntry]]
+EntryReadyCallback = Callable[[str, OrderBookTrackerEntry], None]
+
+
+class OrderBookSnapshotBootstrapper:
+    """
+    Fetches the initial order book snapshots for a list of trading pairs concurrently, while keeping the total request
+    weight within the exchange's rate limit.
+
+    Priority trading pairs are requested first, and every order book tracker entry is handed to the ready callback as
+    soon as it's fetched, so order books can be tracked before the other snapshots are done. All requests go through
+    one shared aiohttp client session, which is kept open across calls until `close()` is called.
+    """
+    _obsb_logger: Optional[HummingbotLogger] = None
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._obsb_logger is None:
+            cls._obsb_logger = logging.getLogger(__name__)
+        return cls._obsb_logger
+
+    def __init__(self,
+                 throttler: Throttler,
+                 request_weight: int = 1,
+                 max_concurrency: int = 8,
+                 max_retries: int = 3,
+                 retry_interval: float = 5.0):
+        """
+        :param throttler: Throttler configured with the exchange's rate limit for snapshot requests
+        :param request_weight: Rate limit weight of one snapshot request
+        :param max_concurrency: Max number of snapshot requests in flight
+        :param max_retries: Number of attempts for each trading pair before giving up on it
+        :param retry_interval: Time to wait before retrying a failed snapshot request
+        """
+        self._throttler: Throttler = throttler
+        self._request_weight: int = request_weight
+        self._max_concurrency: int = max_concurrency
+        self._max_retries: int = max_retries
+        self._retry_interval: float = retry_interval
+        self._shared_client: Optional[aiohttp.ClientSession] = None
+
+    @property
+    def throttler(self) -> Throttler:
+        return self._throttler
+
+    async def shared_client(self) -> aiohttp.ClientSession:
+        if self._shared_client is None or self._shared_client.closed:
+            self._shared_client = aiohttp.ClientSession()
+        return self._shared_client
+
+    async def close(self):
+        if self._shared_client is not None:
+            await self._shared_client.close()
+            self._shared_client = None
+
+    @staticmethod
+    def prioritized_trading_pairs(trading_pairs: List[str],
+                                  priority_trading_pairs: Optional[Iterable[str]] = None) -> List[str]:
+        """
+        Moves the priority trading pairs to the front of the list. The order within each group is kept.
+        """
+        priority_set = set(priority_trading_pairs or [])
+        return ([trading_pair for trading_pair in trading_pairs if trading_pair in priority_set] +
+                [trading_pair for trading_pair in trading_pairs if trading_pair not in priority_set])
+
+    async def fetch_tracking_entries(self,
+                                     trading_pairs: List[str],
+                                     fetch_entry: FetchEntryFunction,
+                                     priority_trading_pairs: Optional[Iterable[str]] = None,
+                                     entry_ready_callback: Optional[EntryReadyCallback] = None
+                                     ) -> Dict[str, OrderBookTrackerEntry]:
+        """
+        Fetches the order book tracker entries for the given trading pairs.
+
+        :param trading_pairs: Trading pairs to fetch
+        :param fetch_entry: Coroutine function that fetches the snapshot for one trading pair with the given client
+                            session, and returns its order book tracker entry
+        :param priority_trading_pairs: Trading pairs to fetch before the others
+        :param entry_ready_callback: Called with each trading pair and its entry as soon as the entry is fetched
+        :returns: Order book tracker entries of the trading pairs that were fetched successfully
+        """
+        ordered_trading_pairs: List[str] = self.prioritized_trading_pairs(trading_pairs, priority_trading_pairs)
+        number_of_pairs: int = len(ordered_trading_pairs)
+        retval: Dict[str, OrderBookTrackerEntry] = {}
+        if number_of_pairs == 0:
+            return retval
+
+        client: aiohttp.ClientSession = await self.shared_client()
+        pending_pairs: asyncio.Queue = asyncio.Queue()
+        for trading_pair in ordered_trading_pairs:
+            pending_pairs.put_nowait(trading_pair)
+
+        async def fetch_one(trading_pair: str) -> Optional[OrderBookTrackerEntry]:
+            for attempt in range(1, self._max_retries + 1):
+                try:
+                    async with self._throttler.weighted_task(self._request_weight):
+                        return await fetch_entry(client, trading_pair)
+                except asyncio.CancelledError:
+                    raise
+                except Exception:
+                    self.logger().network(
+                        f"Error getting snapshot for {trading_pair}. {attempt}/{self._max_retries} attempts.",
+                        exc_info=True,
+                        app_warning_msg=f"Error getting snapshot for {trading_pair}. Check network connection."
+                    )
+                    if attempt < self._max_retries:
+                        await asyncio.sleep(self._retry_interval)
+            return None
+
+        async def worker():
+            while not pending_pairs.empty():
+                trading_pair: str = pending_pairs.get_nowait()
+                entry: Optional[OrderBookTrackerEntry] = await fetch_one(trading_pair)
+                if entry is None:
+                    continue
+                retval[trading_pair] = entry
+                if entry_ready_callback is not None:
+                    try:
+                        entry_ready_callback(trading_pair, entry)
+                    except Exception:
+                        self.logger().error(f"Error in the ready callback for {trading_pair}.", exc_info=True)
+                self.logger().info(f"Initialized order book for {trading_pair}. "
+                                   f"{len(retval)}/{number_of_pairs} completed.")
+
+        workers: List[asyncio.Task] = [asyncio.ensure_future(worker())
+                                       for _ in range(min(self._max_concurrency, number_of_pairs))]
+        try:
+            await asyncio.gather(*workers)
+        finally:
+            for task in workers:
+                if not task.done():
+                    task.cancel()
+        return retval
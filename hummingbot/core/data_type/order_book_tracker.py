@@ -17,7 +17,9 @@ from typing import (
 
 from hummingbot.core.event.events import OrderBookTradeEvent, TradeType
 from hummingbot.logger import HummingbotLogger
+from hummingbot.core.data_type.market_data_recorder import MarketDataRecorder
 from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_row import OrderBookRow
 from hummingbot.core.data_type.order_book_tracker_entry import OrderBookTrackerEntry
 from hummingbot.core.utils.async_utils import safe_ensure_future
 from .order_book_message import (
@@ -35,6 +37,36 @@ class OrderBookTrackerDataSourceType(Enum):
     EXCHANGE_API = 3
 
 
+class OrderBookDiffQueueStats:
+    """
+    Diff queue metrics for a tracked order book. The lag is the time between the timestamp of the last diff message
+    in a batch and the batch being applied to the order book.
+    """
+    def __init__(self):
+        self.queue_depth: int = 0
+        self.max_queue_depth: int = 0
+        self.lag: float = 0.0
+        self.max_lag: float = 0.0
+        self.diffs_received: int = 0
+        self.diff_batches_applied: int = 0
+
+    def __repr__(self) -> str:
+        return (
+            f"OrderBookDiffQueueStats(queue_depth={self.queue_depth}, max_queue_depth={self.max_queue_depth}, "
+            f"lag={self.lag:.3f}, max_lag={self.max_lag:.3f}, diffs_received={self.diffs_received}, "
+            f"diff_batches_applied={self.diff_batches_applied})"
+        )
+
+    def record_batch(self, queue_depth: int, num_diffs: int, last_timestamp: Optional[float]):
+        self.queue_depth = queue_depth
+        self.max_queue_depth = max(self.max_queue_depth, queue_depth)
+        if last_timestamp is not None:
+            self.lag = max(time.time() - last_timestamp, 0.0)
+            self.max_lag = max(self.max_lag, self.lag)
+        self.diffs_received += num_diffs
+        self.diff_batches_applied += 1
+
+
 class OrderBookTracker(ABC):
     PAST_DIFF_WINDOW_SIZE: int = 32
     _obt_logger: Optional[HummingbotLogger] = None
@@ -46,8 +78,11 @@ class OrderBookTracker(ABC):
         return cls._obt_logger
 
     def __init__(self,
-                 data_source_type: OrderBookTrackerDataSourceType = OrderBookTrackerDataSourceType.EXCHANGE_API):
+                 data_source_type: OrderBookTrackerDataSourceType = OrderBookTrackerDataSourceType.EXCHANGE_API,
+                 coalesce_diffs: bool = False):
         self._data_source_type: OrderBookTrackerDataSourceType = data_source_type
+        self._coalesce_diffs: bool = coalesce_diffs
+        self._diff_queue_stats: Dict[str, OrderBookDiffQueueStats] = {}
         self._tracking_tasks: Dict[str, asyncio.Task] = {}
         self._order_books: Dict[str, OrderBook] = {}
         self._tracking_message_queues: Dict[str, asyncio.Queue] = {}
@@ -56,6 +91,7 @@ class OrderBookTracker(ABC):
         self._order_book_snapshot_stream: asyncio.Queue = asyncio.Queue()
         self._order_book_trade_stream: asyncio.Queue = asyncio.Queue()
         self._ev_loop: asyncio.BaseEventLoop = asyncio.get_event_loop()
+        self._market_data_recorder: Optional[MarketDataRecorder] = None
 
         self._order_book_diff_listener_task: Optional[asyncio.Task] = None
         self._order_book_trade_listener_task: Optional[asyncio.Task] = None
@@ -82,6 +118,56 @@ class OrderBookTracker(ABC):
     def order_books(self) -> Dict[str, OrderBook]:
         return self._order_books
 
+    @property
+    def coalesce_diffs(self) -> bool:
+        """
+        If True, every diff message waiting in a trading pair's queue is merged and applied to the order book at once,
+        instead of one by one.
+        """
+        return self._coalesce_diffs
+
+    @coalesce_diffs.setter
+    def coalesce_diffs(self, value: bool):
+        self._coalesce_diffs = value
+
+    @property
+    def priority_trading_pairs(self) -> List[str]:
+        """
+        Trading pairs whose order books are initialized first, e.g. the ones a strategy trades on. Must be set before
+        the tracker is started.
+        """
+        return self.data_source.priority_trading_pairs
+
+    @priority_trading_pairs.setter
+    def priority_trading_pairs(self, trading_pairs: List[str]):
+        self.data_source.priority_trading_pairs = trading_pairs
+
+    @property
+    def market_data_recorder(self) -> Optional[MarketDataRecorder]:
+        return self._market_data_recorder
+
+    @market_data_recorder.setter
+    def market_data_recorder(self, recorder: MarketDataRecorder):
+        """
+        Records every order book diff, snapshot and trade message the tracker receives, along with the initial order
+        book of every tracked trading pair. Must be set before the tracker is started, since it replaces the message
+        streams the data source listeners write to.
+        """
+        if (self._order_book_diff_listener_task is not None or
+                self._order_book_snapshot_listener_task is not None or
+                self._order_book_trade_listener_task is not None):
+            raise EnvironmentError("The market data recorder must be set before the order book tracker is started.")
+        if self._market_data_recorder is not None:
+            raise EnvironmentError("The order book tracker already has a market data recorder.")
+        self._market_data_recorder = recorder
+        self._order_book_diff_stream = recorder.tap_queue(self._order_book_diff_stream)
+        self._order_book_snapshot_stream = recorder.tap_queue(self._order_book_snapshot_stream)
+        self._order_book_trade_stream = recorder.tap_queue(self._order_book_trade_stream)
+
+    @property
+    def diff_queue_stats(self) -> Dict[str, OrderBookDiffQueueStats]:
+        return self._diff_queue_stats
+
     @property
     def ready(self) -> bool:
         trading_pairs: List[str] = self.data_source._trading_pairs or []
@@ -96,6 +182,8 @@ class OrderBookTracker(ABC):
         }
 
     async def start(self):
+        if self._market_data_recorder is not None:
+            self._market_data_recorder.start()
         self._emit_trade_event_task = safe_ensure_future(
             self._emit_trade_event_loop()
         )
@@ -119,30 +207,67 @@ class OrderBookTracker(ABC):
         if self._order_book_snapshot_router_task is not None:
             self._order_book_snapshot_router_task.cancel()
             self._order_book_snapshot_router_task = None
+        if self._market_data_recorder is not None:
+            self._market_data_recorder.stop()
+        # Client sessions can only be closed asynchronously, so this is left to the event loop if it's running.
+        if self._ev_loop.is_running():
+            safe_ensure_future(self.data_source.close())
+
+    def _record_initial_order_book(self, trading_pair: str, order_book: OrderBook):
+        bids_df, asks_df = order_book.snapshot
+        self._market_data_recorder.record_order_book_snapshot(trading_pair,
+                                                              order_book.snapshot_uid,
+                                                              bids_df[["price", "amount"]].values.tolist(),
+                                                              asks_df[["price", "amount"]].values.tolist())
+
+    def _start_tracking_entry(self, trading_pair: str, entry: OrderBookTrackerEntry):
+        """
+        Starts tracking the order book of a trading pair, from its freshly fetched order book tracker entry.
+        """
+        self._order_books[trading_pair] = entry.order_book
+        if self._market_data_recorder is not None:
+            self._record_initial_order_book(trading_pair, entry.order_book)
+        self._tracking_message_queues[trading_pair] = asyncio.Queue()
+        self._tracking_tasks[trading_pair] = safe_ensure_future(self._track_single_book(trading_pair))
+        self.logger().info("Started order book tracking for %s.", trading_pair)
+
+    def _stop_tracking_pair(self, trading_pair: str):
+        self._tracking_tasks[trading_pair].cancel()
+        del self._tracking_tasks[trading_pair]
+        del self._order_books[trading_pair]
+        del self._tracking_message_queues[trading_pair]
+        self._diff_queue_stats.pop(trading_pair, None)
+        self.logger().info("Stopped order book tracking for %s.", trading_pair)
+
+    def _is_tracking(self, trading_pair: str) -> bool:
+        return trading_pair in self._tracking_tasks and not self._tracking_tasks[trading_pair].done()
+
+    def _on_tracking_entry_ready(self, trading_pair: str, entry: OrderBookTrackerEntry):
+        if not self._is_tracking(trading_pair):
+            self._start_tracking_entry(trading_pair, entry)
 
     async def _refresh_tracking_tasks(self):
         """
         Starts tracking for any new trading pairs, and stop tracking for any inactive trading pairs.
+
+        Data sources that fetch their snapshots concurrently hand over each order book as soon as it's ready, so the
+        tracking of a trading pair doesn't wait for the other snapshots.
         """
         tracking_trading_pairs: Set[str] = set([key for key in self._tracking_tasks.keys()
-                                          if not self._tracking_tasks[key].done()])
-        available_pairs: Dict[str, OrderBookTrackerEntry] = await self.data_source.get_tracking_pairs()
+                                                if self._is_tracking(key)])
+        self.data_source.tracking_entry_ready_callback = self._on_tracking_entry_ready
+        try:
+            available_pairs: Dict[str, OrderBookTrackerEntry] = await self.data_source.get_tracking_pairs()
+        finally:
+            self.data_source.tracking_entry_ready_callback = None
         available_trading_pairs: Set[str] = set(available_pairs.keys())
-        new_trading_pairs: Set[str] = available_trading_pairs - tracking_trading_pairs
         deleted_trading_pairs: Set[str] = tracking_trading_pairs - available_trading_pairs
 
-        for trading_pair in new_trading_pairs:
-            self._order_books[trading_pair] = available_pairs[trading_pair].order_book
-            self._tracking_message_queues[trading_pair] = asyncio.Queue()
-            self._tracking_tasks[trading_pair] = safe_ensure_future(self._track_single_book(trading_pair))
-            self.logger().info("Started order book tracking for %s.", trading_pair)
+        for trading_pair in available_trading_pairs:
+            self._on_tracking_entry_ready(trading_pair, available_pairs[trading_pair])
 
         for trading_pair in deleted_trading_pairs:
-            self._tracking_tasks[trading_pair].cancel()
-            del self._tracking_tasks[trading_pair]
-            del self._order_books[trading_pair]
-            del self._tracking_message_queues[trading_pair]
-            self.logger().info("Stopped order book tracking for %s.", trading_pair)
+            self._stop_tracking_pair(trading_pair)
 
     async def _refresh_tracking_loop(self):
         """
@@ -218,24 +343,113 @@ class OrderBookTracker(ABC):
                 self.logger().error("Unknown error. Retrying after 5 seconds.", exc_info=True)
                 await asyncio.sleep(5.0)
 
+    @staticmethod
+    def _drain_message_queue(message_queue: asyncio.Queue) -> List[OrderBookMessage]:
+        messages: List[OrderBookMessage] = []
+        while not message_queue.empty():
+            messages.append(message_queue.get_nowait())
+        return messages
+
+    def _apply_coalesced_diffs(self,
+                               order_book: OrderBook,
+                               diff_messages: List[OrderBookMessage],
+                               past_diffs_window: Deque[OrderBookMessage]) -> int:
+        """
+        Merges diff messages into one price -> row map per side, where later messages overwrite earlier ones, and
+        applies the result to the order book in a single call.
+
+        :return: number of diff messages merged
+        """
+        bids: Dict[float, OrderBookRow] = {}
+        asks: Dict[float, OrderBookRow] = {}
+        update_id: int = order_book.last_diff_uid
+        merged_messages: List[OrderBookMessage] = []
+
+        for message in diff_messages:
+            # A snapshot may have been applied after the diff message was queued.
+            if order_book.snapshot_uid > message.update_id:
+                continue
+            for row in message.bids:
+                bids[row.price] = row
+            for row in message.asks:
+                asks[row.price] = row
+            update_id = message.update_id
+            merged_messages.append(message)
+
+        if len(merged_messages) > 0:
+            order_book.apply_diffs(list(bids.values()), list(asks.values()), update_id)
+        # Only the applied diffs are replayed on later snapshots.
+        past_diffs_window.extend(merged_messages[-self.PAST_DIFF_WINDOW_SIZE:])
+        while len(past_diffs_window) > self.PAST_DIFF_WINDOW_SIZE:
+            past_diffs_window.popleft()
+        return len(merged_messages)
+
+    def _apply_coalesced_messages(self,
+                                  trading_pair: str,
+                                  messages: List[OrderBookMessage],
+                                  past_diffs_window: Deque[OrderBookMessage]) -> int:
+        """
+        Applies a batch of queued messages in order. Consecutive diff messages are coalesced, and snapshot messages are
+        applied between them as usual.
+
+        :return: number of diff messages applied
+        """
+        order_book: OrderBook = self._order_books[trading_pair]
+        stats: OrderBookDiffQueueStats = self._diff_queue_stats.setdefault(trading_pair, OrderBookDiffQueueStats())
+        pending_diffs: List[OrderBookMessage] = []
+        diffs_applied: int = 0
+
+        for message in messages:
+            if message.type is OrderBookMessageType.DIFF:
+                pending_diffs.append(message)
+                continue
+            if len(pending_diffs) > 0:
+                diffs_applied += self._apply_coalesced_diffs(order_book, pending_diffs, past_diffs_window)
+                pending_diffs = []
+            if message.type is OrderBookMessageType.SNAPSHOT:
+                order_book.restore_from_snapshot_and_diffs(message, list(past_diffs_window))
+                self.logger().debug("Processed order book snapshot for %s.", trading_pair)
+        if len(pending_diffs) > 0:
+            diffs_applied += self._apply_coalesced_diffs(order_book, pending_diffs, past_diffs_window)
+
+        diff_timestamps: List[float] = [message.timestamp for message in messages
+                                        if message.type is OrderBookMessageType.DIFF]
+        stats.record_batch(len(messages), len(diff_timestamps), diff_timestamps[-1] if diff_timestamps else None)
+        return diffs_applied
+
     async def _track_single_book(self, trading_pair: str):
         past_diffs_window: Deque[OrderBookMessage] = deque()
         self._past_diffs_windows[trading_pair] = past_diffs_window
 
         message_queue: asyncio.Queue = self._tracking_message_queues[trading_pair]
         order_book: OrderBook = self._order_books[trading_pair]
+        stats: OrderBookDiffQueueStats = self._diff_queue_stats.setdefault(trading_pair, OrderBookDiffQueueStats())
         last_message_timestamp: float = time.time()
         diff_messages_accepted: int = 0
 
         while True:
             try:
                 message: OrderBookMessage = await message_queue.get()
-                if message.type is OrderBookMessageType.DIFF:
-                    order_book.apply_diffs(message.bids, message.asks, message.update_id)
+                if self._coalesce_diffs:
+                    messages: List[OrderBookMessage] = [message] + self._drain_message_queue(message_queue)
+                    diff_messages_accepted += self._apply_coalesced_messages(trading_pair,
+                                                                             messages,
+                                                                             past_diffs_window)
+
+                    # Output some statistics periodically.
+                    now: float = time.time()
+                    if int(now / 60.0) > int(last_message_timestamp / 60.0):
+                        self.logger().debug("Processed %d order book diffs for %s. %s",
+                                            diff_messages_accepted, trading_pair, stats)
+                        diff_messages_accepted = 0
+                    last_message_timestamp = now
+                elif message.type is OrderBookMessageType.DIFF:
+                    order_book.apply_diff_message(message)
                     past_diffs_window.append(message)
                     while len(past_diffs_window) > self.PAST_DIFF_WINDOW_SIZE:
                         past_diffs_window.popleft()
                     diff_messages_accepted += 1
+                    stats.record_batch(message_queue.qsize() + 1, 1, message.timestamp)
 
                     # Output some statistics periodically.
                     now: float = time.time()
@@ -274,7 +488,7 @@ class OrderBookTracker(ABC):
                     price=float(trade_message.content["price"]),
                     amount=float(trade_message.content["amount"]),
                     type=TradeType.SELL if
-                    trade_message.content["trade_type"] == float(TradeType.SELL.value) else TradeType.SELL
+                    trade_message.content["trade_type"] == float(TradeType.SELL.value) else TradeType.BUY
                 ))
 
                 messages_accepted += 1
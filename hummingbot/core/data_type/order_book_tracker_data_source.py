@@ -10,6 +10,7 @@ from typing import (
     Callable,
     Dict,
     List,
+    Optional,
 )
 
 from hummingbot.core.data_type.order_book import OrderBook
@@ -20,6 +21,8 @@ class OrderBookTrackerDataSource(metaclass=ABCMeta):
 
     def __init__(self):
         self._order_book_create_function = lambda: OrderBook()
+        self._tracking_entry_ready_callback: Optional[Callable[[str, OrderBookTrackerEntry], None]] = None
+        self._priority_trading_pairs: List[str] = []
 
     @property
     def order_book_create_function(self) -> Callable[[], OrderBook]:
@@ -29,6 +32,36 @@ class OrderBookTrackerDataSource(metaclass=ABCMeta):
     def order_book_create_function(self, func: Callable[[], OrderBook]):
         self._order_book_create_function = func
 
+    @property
+    def tracking_entry_ready_callback(self) -> Optional[Callable[[str, OrderBookTrackerEntry], None]]:
+        """
+        Called by `get_tracking_pairs()` with each trading pair and its order book tracker entry as soon as the
+        entry is ready, before the other trading pairs are done.
+        """
+        return self._tracking_entry_ready_callback
+
+    @tracking_entry_ready_callback.setter
+    def tracking_entry_ready_callback(self, func: Optional[Callable[[str, OrderBookTrackerEntry], None]]):
+        self._tracking_entry_ready_callback = func
+
+    @property
+    def priority_trading_pairs(self) -> List[str]:
+        """
+        Trading pairs whose order books are initialized first by `get_tracking_pairs()`.
+        """
+        return self._priority_trading_pairs
+
+    @priority_trading_pairs.setter
+    def priority_trading_pairs(self, trading_pairs: List[str]):
+        self._priority_trading_pairs = list(trading_pairs)
+
+    async def close(self):
+        """
+        Releases the network resources held by the data source, e.g. shared client sessions. Called when the order
+        book tracker is stopped.
+        """
+        pass
+
     @classmethod
     async def get_active_exchange_markets(cls) -> pd.DataFrame:
         raise NotImplementedError
@@ -0,0 +1,139 @@
+#!/usr/bin/env python
+
+import asyncio
+import logging
+from typing import (
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+)
+
+from hummingbot.core.data_type.market_data_recorder import (
+    MarketDataBuffer,
+    MarketDataReader,
+    RecordedMarketDataMessage,
+)
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_message import OrderBookMessageType
+from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
+from hummingbot.core.data_type.order_book_tracker_entry import OrderBookTrackerEntry
+from hummingbot.logger import HummingbotLogger
+
+ReplayStream = Iterator[RecordedMarketDataMessage]
+
+
+class ReplayOrderBookDataSource(OrderBookTrackerDataSource):
+    """
+    Order book data source over the market data recorded by a `MarketDataRecorder`.
+
+    The recorded messages aren't streamed through the listener queues. Instead, `open_replay()` returns the initial
+    order book of a trading pair along with an iterator over its later messages, which `ReplayOrderBookTracker`
+    applies in step with the clock.
+    """
+    _robds_logger: Optional[HummingbotLogger] = None
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._robds_logger is None:
+            cls._robds_logger = logging.getLogger(__name__)
+        return cls._robds_logger
+
+    def __init__(self,
+                 exchange_name: str,
+                 trading_pairs: Optional[List[str]] = None,
+                 start_time: Optional[float] = None,
+                 end_time: Optional[float] = None,
+                 root_path: Optional[str] = None,
+                 preloaded_messages: Optional[Dict[str, Iterable[RecordedMarketDataMessage]]] = None):
+        """
+        :param exchange_name: Exchange the market data was recorded from
+        :param trading_pairs: Trading pairs to replay. Defaults to every recorded trading pair.
+        :param start_time: Receive timestamp to start the replay from. Defaults to the start of the recording.
+        :param end_time: Receive timestamp to end the replay at. Defaults to the end of the recording.
+        :param root_path: Root directory of the recorded market data. Defaults to the recorder's default.
+        :param preloaded_messages: Messages already loaded with `load_messages()` for the same time range, by trading
+                                   pair, to replay instead of reading the recording again
+        """
+        super().__init__()
+        self._reader: MarketDataReader = MarketDataReader(exchange_name, root_path=root_path)
+        self._trading_pairs: Optional[List[str]] = trading_pairs
+        self._start_time: Optional[float] = start_time
+        self._end_time: Optional[float] = end_time
+        self._preloaded_messages: Dict[str, Iterable[RecordedMarketDataMessage]] = preloaded_messages or {}
+
+    @property
+    def reader(self) -> MarketDataReader:
+        return self._reader
+
+    @property
+    def exchange_name(self) -> str:
+        return self._reader.exchange_name
+
+    @property
+    def start_time(self) -> Optional[float]:
+        return self._start_time
+
+    @property
+    def end_time(self) -> Optional[float]:
+        return self._end_time
+
+    async def get_trading_pairs(self) -> List[str]:
+        return self.replay_trading_pairs()
+
+    def replay_trading_pairs(self) -> List[str]:
+        if self._trading_pairs is not None:
+            return list(self._trading_pairs)
+        return self._reader.trading_pairs()
+
+    def load_messages(self, trading_pair: str) -> MarketDataBuffer:
+        """
+        Loads every message of a trading pair in the replay time range into memory, to be replayed more than once.
+        """
+        return self._reader.load(trading_pair, start_time=self._start_time, end_time=self._end_time)
+
+    def _message_stream(self, trading_pair: str) -> ReplayStream:
+        if trading_pair in self._preloaded_messages:
+            return iter(self._preloaded_messages[trading_pair])
+        return self._reader.read(trading_pair, start_time=self._start_time, end_time=self._end_time)
+
+    def open_replay(self, trading_pair: str) -> Optional[Tuple[OrderBookTrackerEntry, ReplayStream]]:
+        """
+        Starts the replay of a trading pair from its first recorded order book snapshot at or after the start time.
+        Messages before that snapshot are skipped, since there's no order book to apply them to.
+
+        :returns: Order book tracker entry with the order book restored from the snapshot, and an iterator over the
+                  messages after it. None if there's no snapshot in the time range.
+        """
+        stream: ReplayStream = self._message_stream(trading_pair)
+        for recorded_message in stream:
+            message = recorded_message.message
+            if message.type is not OrderBookMessageType.SNAPSHOT:
+                continue
+            order_book: OrderBook = self.order_book_create_function()
+            order_book.apply_snapshot(message.bids, message.asks, message.update_id)
+            return OrderBookTrackerEntry(trading_pair, recorded_message.receive_timestamp, order_book), stream
+        self.logger().warning(f"No recorded order book snapshot found for {trading_pair} on "
+                              f"{self.exchange_name} in the replay time range.")
+        return None
+
+    async def get_tracking_pairs(self) -> Dict[str, OrderBookTrackerEntry]:
+        retval: Dict[str, OrderBookTrackerEntry] = {}
+        for trading_pair in self.replay_trading_pairs():
+            replay: Optional[Tuple[OrderBookTrackerEntry, ReplayStream]] = self.open_replay(trading_pair)
+            if replay is not None:
+                entry, stream = replay
+                stream.close()
+                retval[trading_pair] = entry
+        return retval
+
+    async def listen_for_order_book_diffs(self, ev_loop: asyncio.BaseEventLoop, output: asyncio.Queue):
+        """Does nothing. Recorded diff messages are replayed through ReplayOrderBookTracker."""
+
+    async def listen_for_order_book_snapshots(self, ev_loop: asyncio.BaseEventLoop, output: asyncio.Queue):
+        """Does nothing. Recorded snapshot messages are replayed through ReplayOrderBookTracker."""
+
+    async def listen_for_trades(self, ev_loop: asyncio.BaseEventLoop, output: asyncio.Queue):
+        """Does nothing. Recorded trade messages are replayed through ReplayOrderBookTracker."""
@@ -0,0 +1,183 @@
+#!/usr/bin/env python
+
+from collections import deque
+import logging
+from typing import (
+    Deque,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+)
+
+from hummingbot.core.data_type.market_data_recorder import RecordedMarketDataMessage
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_message import (
+    OrderBookMessage,
+    OrderBookMessageType,
+)
+from hummingbot.core.data_type.order_book_tracker import OrderBookTracker
+from hummingbot.core.data_type.order_book_tracker_entry import OrderBookTrackerEntry
+from hummingbot.core.data_type.replay_order_book_data_source import (
+    ReplayOrderBookDataSource,
+    ReplayStream,
+)
+from hummingbot.core.event.events import (
+    OrderBookTradeEvent,
+    TradeType,
+)
+from hummingbot.logger import HummingbotLogger
+
+
+class ReplayOrderBookTracker(OrderBookTracker):
+    """
+    Order book tracker that replays recorded market data in step with a clock, instead of listening to an exchange.
+
+    `replay_til()` applies every recorded message received up to the given timestamp. The diff messages received
+    between two calls are coalesced and applied to the order book at once, and the recorded trades are emitted as
+    order book trade events. `PaperTradeMarket` calls it on every tick, so a backtest clock can run over recorded data
+    as fast as the strategies allow.
+    """
+    _robt_logger: Optional[HummingbotLogger] = None
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._robt_logger is None:
+            cls._robt_logger = logging.getLogger(__name__)
+        return cls._robt_logger
+
+    def __init__(self,
+                 exchange_name: str,
+                 trading_pairs: Optional[List[str]] = None,
+                 start_time: Optional[float] = None,
+                 end_time: Optional[float] = None,
+                 root_path: Optional[str] = None,
+                 preloaded_messages: Optional[Dict[str, Iterable[RecordedMarketDataMessage]]] = None):
+        super().__init__()
+        self._data_source: ReplayOrderBookDataSource = ReplayOrderBookDataSource(
+            exchange_name,
+            trading_pairs=trading_pairs,
+            start_time=start_time,
+            end_time=end_time,
+            root_path=root_path,
+            preloaded_messages=preloaded_messages
+        )
+        self._replay_streams: Dict[str, ReplayStream] = {}
+        self._next_messages: Dict[str, RecordedMarketDataMessage] = {}
+        self._replay_started: bool = False
+        self._replay_timestamp: float = float("nan")
+        self._messages_replayed: int = 0
+
+    @property
+    def data_source(self) -> ReplayOrderBookDataSource:
+        return self._data_source
+
+    @property
+    def exchange_name(self) -> str:
+        return self._data_source.exchange_name
+
+    @property
+    def replay_started(self) -> bool:
+        return self._replay_started
+
+    @property
+    def replay_timestamp(self) -> float:
+        """
+        Timestamp the order books were last replayed to.
+        """
+        return self._replay_timestamp
+
+    @property
+    def messages_replayed(self) -> int:
+        return self._messages_replayed
+
+    @property
+    def replay_done(self) -> bool:
+        return self._replay_started and len(self._next_messages) == 0
+
+    async def start(self):
+        self.start_replay()
+
+    def stop(self):
+        for stream in self._replay_streams.values():
+            stream.close()
+        self._replay_streams.clear()
+        self._next_messages.clear()
+
+    def start_replay(self):
+        """
+        Restores the order book of every trading pair from its first recorded snapshot. Does nothing if the replay is
+        already started.
+        """
+        if self._replay_started:
+            return
+        for trading_pair in self._data_source.replay_trading_pairs():
+            replay: Optional[Tuple[OrderBookTrackerEntry, ReplayStream]] = self._data_source.open_replay(trading_pair)
+            if replay is None:
+                continue
+            entry, stream = replay
+            self._order_books[trading_pair] = entry.order_book
+            self._past_diffs_windows[trading_pair] = deque()
+            self._replay_streams[trading_pair] = stream
+            self._advance_stream(trading_pair)
+            self.logger().info(f"Started order book replay for {trading_pair} from {entry.timestamp}.")
+        self._replay_started = True
+
+    def _advance_stream(self, trading_pair: str):
+        next_message: Optional[RecordedMarketDataMessage] = next(self._replay_streams[trading_pair], None)
+        if next_message is None:
+            del self._replay_streams[trading_pair]
+            self._next_messages.pop(trading_pair, None)
+        else:
+            self._next_messages[trading_pair] = next_message
+
+    def replay_til(self, timestamp: float):
+        """
+        Applies the recorded messages of every trading pair, up to the given receive timestamp inclusive.
+        """
+        if not self._replay_started:
+            self.start_replay()
+        for trading_pair in list(self._next_messages.keys()):
+            messages: List[OrderBookMessage] = []
+            next_message: Optional[RecordedMarketDataMessage] = self._next_messages[trading_pair]
+            while next_message is not None and next_message.receive_timestamp <= timestamp:
+                messages.append(next_message.message)
+                self._advance_stream(trading_pair)
+                next_message = self._next_messages.get(trading_pair)
+            if len(messages) > 0:
+                self._replay_messages(trading_pair, messages)
+                self._messages_replayed += len(messages)
+                # There's no event loop iteration between the replayed messages, so the event batches are flushed here.
+                self._order_books[trading_pair].flush_event_batches()
+        self._replay_timestamp = timestamp
+
+    def _replay_messages(self, trading_pair: str, messages: List[OrderBookMessage]):
+        """
+        Applies a batch of messages in order. Consecutive diff messages are coalesced, and the trades are emitted
+        after the order book updates received before them.
+        """
+        order_book: OrderBook = self._order_books[trading_pair]
+        past_diffs_window: Deque[OrderBookMessage] = self._past_diffs_windows[trading_pair]
+        pending_diffs: List[OrderBookMessage] = []
+
+        for message in messages:
+            if message.type is OrderBookMessageType.DIFF:
+                pending_diffs.append(message)
+                continue
+            if len(pending_diffs) > 0:
+                self._apply_coalesced_diffs(order_book, pending_diffs, past_diffs_window)
+                pending_diffs = []
+            if message.type is OrderBookMessageType.SNAPSHOT:
+                order_book.restore_from_snapshot_and_diffs(message, list(past_diffs_window))
+            elif message.type is OrderBookMessageType.TRADE:
+                order_book.apply_trade(OrderBookTradeEvent(
+                    trading_pair=trading_pair,
+                    timestamp=message.timestamp,
+                    price=float(message.content["price"]),
+                    amount=float(message.content["amount"]),
+                    type=(TradeType.SELL if message.content["trade_type"] == float(TradeType.SELL.value)
+                          else TradeType.BUY)
+                ))
+        if len(pending_diffs) > 0:
+            self._apply_coalesced_diffs(order_book, pending_diffs, past_diffs_window)
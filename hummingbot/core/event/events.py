@@ -1,6 +1,7 @@
 #!/usr/bin/env python
 from decimal import Decimal
 from enum import Enum
+import numpy as np
 from typing import (
     Tuple,
     List,
@@ -51,6 +52,7 @@ class ERC20WatcherEvent(Enum):
 
 class OrderBookEvent(Enum):
     TradeEvent = 901
+    UpdateEvent = 902
 
 
 class ZeroExEvent(Enum):
@@ -224,6 +226,38 @@ class OrderBookTradeEvent(NamedTuple):
     amount: Decimal
 
 
+class OrderBookTradeEventBatch(NamedTuple):
+    """
+    Order book trade events of a trading pair, as a struct of arrays. `type` holds the `TradeType` values.
+    """
+    trading_pair: str
+    timestamp: np.ndarray
+    type: np.ndarray
+    price: np.ndarray
+    amount: np.ndarray
+
+    @classmethod
+    def from_events(cls, trading_pair: str, events: List[OrderBookTradeEvent]) -> "OrderBookTradeEventBatch":
+        return OrderBookTradeEventBatch(
+            trading_pair,
+            np.array([e.timestamp for e in events], dtype=np.float64),
+            np.array([e.type.value for e in events], dtype=np.int8),
+            np.array([e.price for e in events], dtype=np.float64),
+            np.array([e.amount for e in events], dtype=np.float64)
+        )
+
+    @property
+    def size(self) -> int:
+        return len(self.timestamp)
+
+    def to_events(self) -> List[OrderBookTradeEvent]:
+        return [OrderBookTradeEvent(self.trading_pair, timestamp, TradeType(trade_type), price, amount)
+                for timestamp, trade_type, price, amount in zip(self.timestamp.tolist(),
+                                                                self.type.tolist(),
+                                                                self.price.tolist(),
+                                                                self.amount.tolist())]
+
+
 class OrderFilledEvent(NamedTuple):
     timestamp: float
     order_id: str
@@ -2,26 +2,34 @@
 
 from libc.stdint cimport int64_t
 from libcpp.unordered_map cimport unordered_map
-from libcpp.unordered_set cimport unordered_set
 from libcpp.utility cimport pair
 from hummingbot.core.PyRef cimport PyRef
 from hummingbot.core.event.event_listener cimport EventListener
 
-ctypedef unordered_set[PyRef] EventListenersCollection
-ctypedef unordered_set[PyRef].iterator EventListenersIterator
-ctypedef unordered_map[int64_t, EventListenersCollection] Events
-ctypedef unordered_map[int64_t, EventListenersCollection].iterator EventsIterator
-ctypedef pair[int64_t, EventListenersCollection] EventsPair
+ctypedef unordered_map[int64_t, PyRef] Events
+ctypedef unordered_map[int64_t, PyRef].iterator EventsIterator
+ctypedef pair[int64_t, PyRef] EventsPair
 
 
 cdef class PubSub:
     cdef:
         Events _events
+        Events _batch_events
+        dict _pending_event_batches
+        bint _event_batch_flush_scheduled
         object __weakref__
 
     cdef c_log_exception(self, int64_t event_tag, object arg)
     cdef c_add_listener(self, int64_t event_tag, EventListener listener)
     cdef c_remove_listener(self, int64_t event_tag, EventListener listener)
+    cdef c_add_batch_listener(self, int64_t event_tag, EventListener listener)
+    cdef c_remove_batch_listener(self, int64_t event_tag, EventListener listener)
+    cdef c_remove_listener_ref(self, int64_t event_tag, object listener_weakref, bint batched=*)
     cdef c_remove_dead_listeners(self, int64_t event_tag)
+    cdef tuple c_get_listener_refs(self, int64_t event_tag, bint batched=*)
+    cdef c_set_listener_refs(self, int64_t event_tag, tuple listener_refs, bint batched=*)
     cdef c_get_listeners(self, int64_t event_tag)
     cdef c_trigger_event(self, int64_t event_tag, object arg)
+    cdef c_queue_batched_event(self, int64_t event_tag, object arg)
+    cdef object c_make_event_batch(self, int64_t event_tag, list events)
+    cdef c_flush_event_batches(self)
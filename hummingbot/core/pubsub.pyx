@@ -1,21 +1,20 @@
 # distutils: language=c++
 # distutils: sources=hummingbot/core/cpp/PyRef.cpp
 
+import asyncio
 from cpython cimport (
     PyObject,
     PyWeakref_NewRef,
     PyWeakref_GetObject
 )
 from cython.operator cimport (
-    postincrement as inc,
     dereference as deref,
-    address
 )
-from libcpp.vector cimport vector
 from enum import Enum
+from functools import partial
 import logging
-import random
 from typing import List
+import weakref
 
 from hummingbot.logger import HummingbotLogger
 from hummingbot.core.event.event_listener import EventListener
@@ -24,27 +23,31 @@ from hummingbot.core.event.event_listener cimport EventListener
 class_logger = None
 
 
+def _on_listener_collected(object pubsub_ref, int64_t event_tag, bint batched, object listener_weakref):
+    cdef:
+        PubSub pubsub = pubsub_ref()
+    if pubsub is not None:
+        pubsub.c_remove_listener_ref(event_tag, listener_weakref, batched)
+
+
 cdef class PubSub:
     """
-    PubSub with weak references. This avoids the lapsed listener problem by periodically performing GC on dead
-    event listener.
+    PubSub with weak references. This avoids the lapsed listener problem, by removing the dead event listeners as
+    they're garbage collected.
 
-    Dead listener is done by calling c_remove_dead_listeners(), which checks whether the listener weak references are
-    alive or not, and removes the dead ones. Each call to c_remove_dead_listeners() takes O(n).
+    The listeners of each event tag are kept in a tuple of weak references, which is never modified - adding or
+    removing a listener replaces the tuple with a new one. So triggering an event iterates the current tuple directly,
+    without copying it, and listeners can still add or remove listeners while the event is being dispatched.
 
-    Here's how the dead listener GC is performed:
+    Each weak reference has a callback that removes it from its tuple once its listener is garbage collected, so dead
+    listeners are removed without scanning the listeners.
 
-    1. c_add_listener():
-       Randomly with ADD_LISTENER_GC_PROBABILITY. This assumes c_add_listener() is called frequently and so it doesn't
-       make sense to do the GC every time.
-    2. c_remove_listener():
-       Every time. This assumes c_remove_listener() is called infrequently.
-    3. c_get_listeners() and c_trigger_event():
-       Every time. Both functions take O(n) already.
+    Batch listeners, added with add_batch_listener(), receive the events triggered since the last event loop iteration
+    in one call, as a batch built by c_make_event_batch() - by default a list of the events. The batches are flushed
+    on the next event loop iteration, or by flush_event_batches() when the event loop isn't running, e.g. in
+    backtests.
     """
 
-    ADD_LISTENER_GC_PROBABILITY = 0.005
-
     @classmethod
     def logger(cls) -> HummingbotLogger:
         global class_logger
@@ -54,6 +57,9 @@ cdef class PubSub:
 
     def __init__(self):
         self._events = Events()
+        self._batch_events = Events()
+        self._pending_event_batches = {}
+        self._event_batch_flush_scheduled = False
 
     def add_listener(self, event_tag: Enum, listener: EventListener):
         self.c_add_listener(event_tag.value, listener)
@@ -61,105 +67,131 @@ cdef class PubSub:
     def remove_listener(self, event_tag: Enum, listener: EventListener):
         self.c_remove_listener(event_tag.value, listener)
 
+    def add_batch_listener(self, event_tag: Enum, listener: EventListener):
+        self.c_add_batch_listener(event_tag.value, listener)
+
+    def remove_batch_listener(self, event_tag: Enum, listener: EventListener):
+        self.c_remove_batch_listener(event_tag.value, listener)
+
     def get_listeners(self, event_tag: Enum) -> List[EventListener]:
         return self.c_get_listeners(event_tag.value)
 
     def trigger_event(self, event_tag: Enum, message: any):
         self.c_trigger_event(event_tag.value, message)
 
+    def flush_event_batches(self):
+        self.c_flush_event_batches()
+
     cdef c_log_exception(self, int64_t event_tag, object arg):
         self.logger().error(f"Unexpected error while processing event {event_tag}.", exc_info=True)
 
-    cdef c_add_listener(self, int64_t event_tag, EventListener listener):
+    cdef tuple c_get_listener_refs(self, int64_t event_tag, bint batched=False):
         cdef:
-            EventsIterator it = self._events.find(event_tag)
-            EventListenersCollection new_listeners
-            EventListenersCollection *listeners_ptr
-            object listener_weakref = PyWeakref_NewRef(listener, None)
-            PyRef listener_wrapper = PyRef(<PyObject *>listener_weakref)
-        if it != self._events.end():
-            listeners_ptr = address(deref(it).second)
-            deref(listeners_ptr).insert(listener_wrapper)
+            Events *events = &self._batch_events if batched else &self._events
+            EventsIterator it = events.find(event_tag)
+        if it == events.end():
+            return ()
+        return <tuple>(<object>deref(it).second.get())
+
+    cdef c_set_listener_refs(self, int64_t event_tag, tuple listener_refs, bint batched=False):
+        cdef:
+            Events *events = &self._batch_events if batched else &self._events
+        if len(listener_refs) < 1:
+            events.erase(event_tag)
         else:
-            new_listeners.insert(listener_wrapper)
-            self._events.insert(EventsPair(event_tag, new_listeners))
+            deref(events)[event_tag] = PyRef(<PyObject *>listener_refs)
 
-        if random.random() < PubSub.ADD_LISTENER_GC_PROBABILITY:
-            self.c_remove_dead_listeners(event_tag)
+    cdef c_add_listener(self, int64_t event_tag, EventListener listener):
+        cdef:
+            tuple listener_refs = self.c_get_listener_refs(event_tag)
+            object listener_weakref
+        for listener_weakref in listener_refs:
+            if <object>PyWeakref_GetObject(listener_weakref) is listener:
+                return
+        listener_weakref = PyWeakref_NewRef(listener,
+                                            partial(_on_listener_collected, weakref.ref(self), event_tag, False))
+        self.c_set_listener_refs(event_tag, listener_refs + (listener_weakref,))
 
     cdef c_remove_listener(self, int64_t event_tag, EventListener listener):
         cdef:
-            EventsIterator it = self._events.find(event_tag)
-            EventListenersCollection *listeners_ptr
-            object listener_weakref = PyWeakref_NewRef(listener, None)
-            PyRef listener_wrapper = PyRef(<PyObject *>listener_weakref)
-            EventListenersIterator lit
-        if it == self._events.end():
-            return
-        listeners_ptr = address(deref(it).second)
-        lit = deref(listeners_ptr).find(listener_wrapper)
-        if lit != deref(listeners_ptr).end():
-            deref(listeners_ptr).erase(lit)
-        self.c_remove_dead_listeners(event_tag)
+            tuple listener_refs = self.c_get_listener_refs(event_tag)
+        self.c_set_listener_refs(event_tag, tuple(listener_weakref
+                                                  for listener_weakref in listener_refs
+                                                  if <object>PyWeakref_GetObject(listener_weakref) is not listener))
 
-    cdef c_remove_dead_listeners(self, int64_t event_tag):
+    cdef c_add_batch_listener(self, int64_t event_tag, EventListener listener):
         cdef:
-            EventsIterator it = self._events.find(event_tag)
-            EventListenersCollection *listeners_ptr
+            tuple listener_refs = self.c_get_listener_refs(event_tag, True)
             object listener_weakref
-            EventListenersIterator lit
-            vector[EventListenersIterator] lit_to_remove
-        if it == self._events.end():
-            return
-        listeners_ptr = address(deref(it).second)
-        lit = deref(listeners_ptr).begin()
-        while lit != deref(listeners_ptr).end():
-            listener_weakref = <object>(deref(lit).get())
-            if <object>(PyWeakref_GetObject(listener_weakref)) is None:
-                lit_to_remove.push_back(lit)
-            inc(lit)
-        for lit in lit_to_remove:
-            deref(listeners_ptr).erase(lit)
-        if deref(listeners_ptr).size() < 1:
-            self._events.erase(it)
-
-    cdef c_get_listeners(self, int64_t event_tag):
-        self.c_remove_dead_listeners(event_tag)
+        for listener_weakref in listener_refs:
+            if <object>PyWeakref_GetObject(listener_weakref) is listener:
+                return
+        listener_weakref = PyWeakref_NewRef(listener,
+                                            partial(_on_listener_collected, weakref.ref(self), event_tag, True))
+        self.c_set_listener_refs(event_tag, listener_refs + (listener_weakref,), True)
+
+    cdef c_remove_batch_listener(self, int64_t event_tag, EventListener listener):
+        cdef:
+            tuple listener_refs = self.c_get_listener_refs(event_tag, True)
+        self.c_set_listener_refs(event_tag,
+                                 tuple(listener_weakref
+                                       for listener_weakref in listener_refs
+                                       if <object>PyWeakref_GetObject(listener_weakref) is not listener),
+                                 True)
+
+    cdef c_remove_listener_ref(self, int64_t event_tag, object listener_weakref, bint batched=False):
+        cdef:
+            tuple listener_refs = self.c_get_listener_refs(event_tag, batched)
+        self.c_set_listener_refs(event_tag, tuple(ref for ref in listener_refs if ref is not listener_weakref), batched)
 
+    cdef c_remove_dead_listeners(self, int64_t event_tag):
+        """
+        Removes the weak references to dead listeners whose callbacks haven't been called yet. Not needed in general,
+        since the callbacks remove them.
+        """
         cdef:
-            EventsIterator it = self._events.find(event_tag)
-            EventListenersCollection *listeners_ptr
-            object listener_weafref
-            EventListener typed_listener
+            bint batched
+            tuple listener_refs
+        for batched in (False, True):
+            listener_refs = self.c_get_listener_refs(event_tag, batched)
+            self.c_set_listener_refs(event_tag,
+                                     tuple(listener_weakref
+                                           for listener_weakref in listener_refs
+                                           if <object>PyWeakref_GetObject(listener_weakref) is not None),
+                                     batched)
 
-        if it == self._events.end():
-            return []
-
-        retval = []
-        listeners_ptr = address(deref(it).second)
-        for pyref in deref(listeners_ptr):
-            listener_weafref = <object>pyref.get()
-            typed_listener = <object>PyWeakref_GetObject(listener_weafref)
-            retval.append(typed_listener)
+    cdef c_get_listeners(self, int64_t event_tag):
+        cdef:
+            object listener
+            list retval = []
+        for listener_weakref in self.c_get_listener_refs(event_tag):
+            listener = <object>PyWeakref_GetObject(listener_weakref)
+            if listener is not None:
+                retval.append(listener)
         return retval
 
     cdef c_trigger_event(self, int64_t event_tag, object arg):
-        self.c_remove_dead_listeners(event_tag)
-
         cdef:
-            EventsIterator it = self._events.find(event_tag)
-            EventListenersCollection listeners
-            object listener_weafref
+            EventsIterator it
+            tuple listener_refs
+            object listener
             EventListener typed_listener
+
+        if not self._batch_events.empty() and self._batch_events.find(event_tag) != self._batch_events.end():
+            self.c_queue_batched_event(event_tag, arg)
+
+        it = self._events.find(event_tag)
         if it == self._events.end():
             return
 
-        # It is extremely important that this set of listeners is a C++ copy - because listeners are allowed to call
-        # c_remove_listener(), which breaks the iterator if we're using the underlying set.
-        listeners = deref(it).second
-        for pyref in listeners:
-            listener_weafref = <object>pyref.get()
-            typed_listener = <object>PyWeakref_GetObject(listener_weafref)
+        # Holding on to the tuple keeps it alive even if a listener adds or removes listeners, which replaces it.
+        listener_refs = <tuple>(<object>deref(it).second.get())
+        for listener_weakref in listener_refs:
+            listener = <object>PyWeakref_GetObject(listener_weakref)
+            if listener is None:
+                # The listener is being garbage collected, and its weak reference callback hasn't been called yet.
+                continue
+            typed_listener = listener
             try:
                 typed_listener.c_set_event_info(event_tag, self)
                 typed_listener.c_call(arg)
@@ -167,3 +199,56 @@ cdef class PubSub:
                 self.c_log_exception(event_tag, arg)
             finally:
                 typed_listener.c_set_event_info(0, None)
+
+    cdef c_queue_batched_event(self, int64_t event_tag, object arg):
+        if self._pending_event_batches is None:
+            self._pending_event_batches = {}
+        if event_tag not in self._pending_event_batches:
+            self._pending_event_batches[event_tag] = [arg]
+        else:
+            self._pending_event_batches[event_tag].append(arg)
+
+        if not self._event_batch_flush_scheduled:
+            try:
+                ev_loop = asyncio.get_event_loop()
+            except RuntimeError:
+                return
+            if ev_loop.is_running():
+                ev_loop.call_soon(self.flush_event_batches)
+                self._event_batch_flush_scheduled = True
+
+    cdef object c_make_event_batch(self, int64_t event_tag, list events):
+        """
+        Builds the batch of the events triggered since the last flush, for the batch listeners of the event tag.
+        """
+        return events
+
+    cdef c_flush_event_batches(self):
+        cdef:
+            dict pending_event_batches = self._pending_event_batches
+            object listener
+            EventListener typed_listener
+
+        self._event_batch_flush_scheduled = False
+        if pending_event_batches is None or len(pending_event_batches) < 1:
+            return
+        self._pending_event_batches = {}
+
+        for event_tag, events in pending_event_batches.items():
+            try:
+                batch = self.c_make_event_batch(event_tag, events)
+            except Exception:
+                self.c_log_exception(event_tag, events)
+                continue
+            for listener_weakref in self.c_get_listener_refs(event_tag, True):
+                listener = <object>PyWeakref_GetObject(listener_weakref)
+                if listener is None:
+                    continue
+                typed_listener = listener
+                try:
+                    typed_listener.c_set_event_info(event_tag, self)
+                    typed_listener.c_call(batch)
+                except Exception:
+                    self.c_log_exception(event_tag, batch)
+                finally:
+                    typed_listener.c_set_event_info(0, None)
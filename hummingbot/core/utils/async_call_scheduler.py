@@ -2,12 +2,20 @@
 
 import asyncio
 from async_timeout import timeout
+from bisect import bisect_left
+from enum import IntEnum
+import itertools
 import logging
+import time
 from typing import (
+    Dict,
+    Iterator,
+    List,
     Optional,
     Coroutine,
     NamedTuple,
-    Callable
+    Callable,
+    Tuple
 )
 
 import hummingbot
@@ -15,14 +23,103 @@ from hummingbot.logger import HummingbotLogger
 from hummingbot.core.utils.async_utils import safe_ensure_future
 
 
+class AsyncCallPriority(IntEnum):
+    """
+    Scheduling priority of an async call. Calls with a lower value are started first.
+    """
+    HIGH = 0    # order placement and cancellation
+    NORMAL = 1
+    LOW = 2     # balance and order status polling
+
+
 class AsyncCallSchedulerItem(NamedTuple):
     future: asyncio.Future
     coroutine: Coroutine
     timeout_seconds: float
     app_warning_msg: str = "API call error."
+    priority: int = AsyncCallPriority.NORMAL
+    enqueue_timestamp: float = 0.0
+
+
+class LatencyHistogram:
+    """
+    Fixed bucket histogram of durations in seconds. Each bucket counts the samples less than or equal to its upper
+    bound, and samples above the last bound are counted in the overflow bucket.
+    """
+    DEFAULT_BUCKET_BOUNDS: Tuple[float, ...] = (0.001, 0.005, 0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+    def __init__(self, bucket_bounds: Tuple[float, ...] = DEFAULT_BUCKET_BOUNDS):
+        self._bucket_bounds: Tuple[float, ...] = tuple(sorted(bucket_bounds))
+        self._counts: List[int] = [0] * (len(self._bucket_bounds) + 1)
+        self._total: float = 0.0
+        self._max: float = 0.0
+        self._num_samples: int = 0
+
+    def __repr__(self) -> str:
+        return f"LatencyHistogram(num_samples={self._num_samples}, mean={self.mean:.6f}, max={self._max:.6f})"
+
+    def __iter__(self) -> Iterator[Tuple[float, int]]:
+        """
+        Iterates over (upper bound, count) pairs. The upper bound of the overflow bucket is infinity.
+        """
+        return zip(self._bucket_bounds + (float("inf"),), self._counts)
+
+    @property
+    def bucket_bounds(self) -> Tuple[float, ...]:
+        return self._bucket_bounds
+
+    @property
+    def counts(self) -> List[int]:
+        return list(self._counts)
+
+    @property
+    def num_samples(self) -> int:
+        return self._num_samples
+
+    @property
+    def mean(self) -> float:
+        return self._total / self._num_samples if self._num_samples > 0 else 0.0
+
+    @property
+    def max(self) -> float:
+        return self._max
+
+    def add(self, seconds: float):
+        self._counts[bisect_left(self._bucket_bounds, seconds)] += 1
+        self._total += seconds
+        self._max = max(self._max, seconds)
+        self._num_samples += 1
+
+    def percentile(self, percent: float) -> float:
+        """
+        Returns the upper bound of the bucket containing the given percentile, or the max sample if that's in the
+        overflow bucket.
+        """
+        if self._num_samples == 0:
+            return 0.0
+        threshold: float = self._num_samples * percent / 100.0
+        cumulative: int = 0
+        for bound, count in zip(self._bucket_bounds, self._counts):
+            cumulative += count
+            if cumulative >= threshold:
+                return min(bound, self._max)
+        return self._max
+
+    def reset(self):
+        self._counts = [0] * (len(self._bucket_bounds) + 1)
+        self._total = 0.0
+        self._max = 0.0
+        self._num_samples = 0
 
 
 class AsyncCallScheduler:
+    """
+    Runs async calls through a queue.
+
+    With the default `max_concurrency` of 1, calls are awaited one at a time with `call_interval` between them. With a
+    larger `max_concurrency`, that many workers run calls concurrently, each waiting `call_interval` after its calls.
+    Pending calls are always started in priority order, and in the order they were scheduled within a priority.
+    """
     _acs_shared_instance: Optional["AsyncCallScheduler"] = None
     _acs_logger: Optional[HummingbotLogger] = None
 
@@ -38,14 +135,20 @@ class AsyncCallScheduler:
             cls._acs_logger = logging.getLogger(__name__)
         return cls._acs_logger
 
-    def __init__(self, call_interval: float = 0.01):
-        self._coro_queue: asyncio.Queue = asyncio.Queue()
+    def __init__(self, call_interval: float = 0.01, max_concurrency: int = 1):
+        if max_concurrency < 1:
+            raise ValueError(f"max_concurrency must be at least 1. Got {max_concurrency}.")
+        self._coro_queue: asyncio.PriorityQueue = asyncio.PriorityQueue()
         self._coro_scheduler_task: Optional[asyncio.Task] = None
         self._call_interval: float = call_interval
+        self._max_concurrency: int = max_concurrency
+        self._sequence: Iterator[int] = itertools.count()
+        self._queue_wait_histogram: LatencyHistogram = LatencyHistogram()
+        self._latency_histogram: LatencyHistogram = LatencyHistogram()
         self._ev_loop: asyncio.AbstractEventLoop = asyncio.get_event_loop()
 
     @property
-    def coro_queue(self) -> asyncio.Queue:
+    def coro_queue(self) -> asyncio.PriorityQueue:
         return self._coro_queue
 
     @property
@@ -56,28 +159,73 @@ class AsyncCallScheduler:
     def started(self) -> bool:
         return self._coro_scheduler_task is not None
 
+    @property
+    def max_concurrency(self) -> int:
+        return self._max_concurrency
+
+    @property
+    def queue_wait_histogram(self) -> LatencyHistogram:
+        """
+        Time between scheduling a call and starting it.
+        """
+        return self._queue_wait_histogram
+
+    @property
+    def latency_histogram(self) -> LatencyHistogram:
+        """
+        Time between starting a call and its result or error.
+        """
+        return self._latency_histogram
+
+    @property
+    def metrics(self) -> Dict[str, any]:
+        return {
+            "queue_size": self._coro_queue.qsize(),
+            "queue_wait_mean": self._queue_wait_histogram.mean,
+            "queue_wait_p99": self._queue_wait_histogram.percentile(99),
+            "latency_mean": self._latency_histogram.mean,
+            "latency_p99": self._latency_histogram.percentile(99),
+        }
+
     def start(self):
         if self._coro_scheduler_task is not None:
             self.stop()
-        self._coro_scheduler_task = safe_ensure_future(
-            self._coro_scheduler(
-                self._coro_queue,
-                self._call_interval
+        if self._max_concurrency == 1:
+            self._coro_scheduler_task = safe_ensure_future(
+                self._coro_scheduler(
+                    self._coro_queue,
+                    self._call_interval
+                )
+            )
+        else:
+            self._coro_scheduler_task = safe_ensure_future(
+                asyncio.gather(*[self._coro_scheduler(self._coro_queue, self._call_interval)
+                                 for _ in range(self._max_concurrency)])
             )
-        )
 
     def stop(self):
         if self._coro_scheduler_task is not None:
             self._coro_scheduler_task.cancel()
             self._coro_scheduler_task = None
 
-    async def _coro_scheduler(self, coro_queue: asyncio.Queue, interval: float = 0.01):
+    async def _coro_scheduler(self, coro_queue: asyncio.PriorityQueue, interval: float = 0.01):
         while True:
             app_warning_msg = "API call error."
+            fut = None
             try:
-                fut, coro, timeout_seconds, app_warning_msg = await coro_queue.get()
-                async with timeout(timeout_seconds):
-                    fut.set_result(await coro)
+                _, _, item = await coro_queue.get()
+                fut, coro, timeout_seconds, app_warning_msg, _, enqueue_timestamp = item
+                if fut.done() and asyncio.iscoroutine(coro):
+                    # The caller has given up on the call before it's started.
+                    coro.close()
+                    continue
+                start_timestamp: float = time.time()
+                self._queue_wait_histogram.add(start_timestamp - enqueue_timestamp)
+                try:
+                    async with timeout(timeout_seconds):
+                        fut.set_result(await coro)
+                finally:
+                    self._latency_histogram.add(time.time() - start_timestamp)
             except asyncio.CancelledError:
                 try:
                     fut.cancel()
@@ -108,21 +256,35 @@ class AsyncCallScheduler:
     async def schedule_async_call(self,
                                   coro: Coroutine,
                                   timeout_seconds: float,
-                                  app_warning_msg: str = "API call error.") -> any:
+                                  app_warning_msg: str = "API call error.",
+                                  priority: int = AsyncCallPriority.NORMAL) -> any:
         fut: asyncio.Future = self._ev_loop.create_future()
-        self._coro_queue.put_nowait(AsyncCallSchedulerItem(fut, coro, timeout_seconds,
-                                                           app_warning_msg=app_warning_msg))
+        item: AsyncCallSchedulerItem = AsyncCallSchedulerItem(fut, coro, timeout_seconds,
+                                                              app_warning_msg=app_warning_msg,
+                                                              priority=priority,
+                                                              enqueue_timestamp=time.time())
+        self._coro_queue.put_nowait((int(priority), next(self._sequence), item))
         if self._coro_scheduler_task is None:
             self.start()
         return await fut
 
+    async def _run_in_executor(self, func: Callable, *args) -> any:
+        return await self._ev_loop.run_in_executor(hummingbot.get_executor(), func, *args)
+
     async def call_async(self,
                          func: Callable, *args,
                          timeout_seconds: float = 5.0,
-                         app_warning_msg: str = "API call error.") -> any:
-        coro: Coroutine = self._ev_loop.run_in_executor(
-            hummingbot.get_executor(),
-            func,
-            *args,
-        )
-        return await self.schedule_async_call(coro, timeout_seconds, app_warning_msg=app_warning_msg)
+                         app_warning_msg: str = "API call error.",
+                         priority: int = AsyncCallPriority.NORMAL) -> any:
+        if self._max_concurrency == 1:
+            coro: Coroutine = self._ev_loop.run_in_executor(
+                hummingbot.get_executor(),
+                func,
+                *args,
+            )
+        else:
+            # The function is only submitted to the executor when a worker starts the call, so the priorities and the
+            # timeout apply to the function call itself.
+            coro: Coroutine = self._run_in_executor(func, *args)
+        return await self.schedule_async_call(coro, timeout_seconds, app_warning_msg=app_warning_msg,
+                                              priority=priority)
@@ -2,40 +2,243 @@ import logging
 import time
 import asyncio
 from collections import deque
+import heapq
+import itertools
 from typing import (
+    Dict,
+    List,
+    NamedTuple,
     Optional,
     Tuple,
-    Deque
+    Deque,
+    Iterator,
+    Union
 )
 
+from hummingbot.core.utils.async_call_scheduler import AsyncCallPriority
+
 RequestWeight = int
 Seconds = float
 Timestamp_s = float
 TaskLog = Tuple[Timestamp_s, RequestWeight]
 
 
+class RateLimit(NamedTuple):
+    """
+    Max total weight of the requests in any period of the given length.
+
+    :param limit: Max weight allowed in the period
+    :param period: Length of the period
+    :param name: Name used to give requests a specific weight for this limit, and to report its remaining budget
+    :param default_weight: Weight of requests that don't give one for this limit. None means the request weight, and
+                           0 makes the limit only apply to requests that name it, e.g. an order count limit.
+    """
+    limit: RequestWeight
+    period: Seconds
+    name: str = "default"
+    default_weight: Optional[RequestWeight] = None
+
+
+class RateLimitWindow:
+    """
+    Sliding window log of the requests counted by one rate limit, with a running sum of their weights.
+    """
+    def __init__(self, rate_limit: RateLimit, period_safety_margin: Seconds):
+        self.rate_limit: RateLimit = rate_limit
+        self._expiry: Seconds = rate_limit.period + period_safety_margin
+        self._task_logs: Deque[TaskLog] = deque()
+        self._used_weight: RequestWeight = 0
+
+    @property
+    def used_weight(self) -> RequestWeight:
+        return self._used_weight
+
+    def flush(self, now: Timestamp_s):
+        """
+        Removes task logs that have passed the rate limit period.
+        """
+        while self._task_logs and now - self._task_logs[0][0] >= self._expiry:
+            self._used_weight -= self._task_logs.popleft()[1]
+
+    def remaining(self, now: Timestamp_s) -> RequestWeight:
+        self.flush(now)
+        return self.rate_limit.limit - self._used_weight
+
+    def time_until_capacity(self, weight: RequestWeight, now: Timestamp_s) -> Seconds:
+        """
+        Returns how long until the given weight fits in the window, or 0 if it already does.
+        """
+        self.flush(now)
+        excess: RequestWeight = self._used_weight + weight - self.rate_limit.limit
+        if excess <= 0:
+            return 0.0
+        freed: RequestWeight = 0
+        for task_ts, task_weight in self._task_logs:
+            freed += task_weight
+            if freed >= excess:
+                return max(task_ts + self._expiry - now, 0.0)
+        return self._expiry
+
+    def add(self, weight: RequestWeight, now: Timestamp_s):
+        if weight > 0:
+            self._task_logs.append((now, weight))
+            self._used_weight += weight
+
+
+class ThrottlerMetrics:
+    def __init__(self):
+        self.tasks_acquired: int = 0
+        self.tasks_delayed: int = 0
+        self.total_wait_time: Seconds = 0.0
+        self.max_wait_time: Seconds = 0.0
+
+    def __repr__(self) -> str:
+        return (f"ThrottlerMetrics(tasks_acquired={self.tasks_acquired}, tasks_delayed={self.tasks_delayed}, "
+                f"total_wait_time={self.total_wait_time:.3f}, max_wait_time={self.max_wait_time:.3f})")
+
+    def record(self, wait_time: Seconds):
+        self.tasks_acquired += 1
+        if wait_time > 0:
+            self.tasks_delayed += 1
+            self.total_wait_time += wait_time
+            self.max_wait_time = max(self.max_wait_time, wait_time)
+
+
 class Throttler:
+    """
+    Delays tasks so the total weight of the started tasks stays within one or more rate limits.
+
+    Waiting tasks are started in priority order, and in the order they arrive within a priority. The first waiting
+    task waits exactly until every rate limit has enough capacity for it, and gives way to any task with a higher
+    priority that arrives in the meantime.
+    """
     def __init__(self,
-                 rate_limit: Tuple[RequestWeight, Seconds],
-                 period_safety_margin: Seconds = 0.1,
-                 retry_interval: Seconds = 0.1):
+                 rate_limit: Union[Tuple[RequestWeight, Seconds], List[RateLimit]],
+                 period_safety_margin: Seconds = 0.1):
         """
-        :param rate_limit: Max weight allowed in the given period
-        :param retry_interval: Time between each limit check
+        :param rate_limit: Max weight allowed in the given period, or a list of rate limits that all apply
+        :param period_safety_margin: estimate for the network latency, added to the rate limit periods
         """
-        self._rate_limit_weight: int = rate_limit[0]
-        self._period: float = rate_limit[1]
-        self._retry_interval: float = retry_interval
-        self._period_safety_margin = period_safety_margin
-        self._task_logs: Deque[TaskLog] = deque()
+        rate_limits: List[RateLimit] = ([RateLimit(*rate_limit)] if isinstance(rate_limit, tuple)
+                                        else list(rate_limit))
+        if len(rate_limits) == 0:
+            raise ValueError("At least one rate limit is required.")
+        self._period_safety_margin: Seconds = period_safety_margin
+        self._windows: List[RateLimitWindow] = [RateLimitWindow(r, period_safety_margin) for r in rate_limits]
+        self._paused_until: Timestamp_s = 0.0
+        self._waiters: List[Tuple[int, int, asyncio.Event]] = []
+        self._sequence: Iterator[int] = itertools.count()
+        self._metrics: ThrottlerMetrics = ThrottlerMetrics()
+
+    @property
+    def rate_limits(self) -> List[RateLimit]:
+        return [window.rate_limit for window in self._windows]
+
+    @property
+    def metrics(self) -> ThrottlerMetrics:
+        return self._metrics
+
+    @property
+    def paused_until(self) -> Timestamp_s:
+        return self._paused_until
 
     def weighted_task(self,
-                      request_weight):
-        return ThrottlerContextManager(
-            rate_limit=self._rate_limit_weight,
-            period=self._period,
-            request_weight=request_weight,
-            task_logs=self._task_logs)
+                      request_weight: RequestWeight,
+                      limit_weights: Optional[Dict[str, RequestWeight]] = None,
+                      priority: int = AsyncCallPriority.NORMAL):
+        """
+        :param request_weight: Weight of the request, for the rate limits without a specific weight
+        :param limit_weights: Weights of the request for specific rate limits, by rate limit name
+        :param priority: Tasks with a lower value are started first
+        """
+        return ThrottlerContextManager(self, request_weight, limit_weights, priority)
+
+    def _window_weights(self,
+                        request_weight: RequestWeight,
+                        limit_weights: Optional[Dict[str, RequestWeight]]) -> List[RequestWeight]:
+        retval: List[RequestWeight] = []
+        for window in self._windows:
+            rate_limit: RateLimit = window.rate_limit
+            if limit_weights is not None and rate_limit.name in limit_weights:
+                weight = limit_weights[rate_limit.name]
+            elif rate_limit.default_weight is not None:
+                weight = rate_limit.default_weight
+            else:
+                weight = request_weight
+            if weight > rate_limit.limit:
+                raise ValueError(f"Request weight {weight} is larger than the '{rate_limit.name}' rate limit of "
+                                 f"{rate_limit.limit} per {rate_limit.period} seconds.")
+            retval.append(weight)
+        return retval
+
+    def remaining_budget(self) -> Dict[str, RequestWeight]:
+        """
+        Returns the weight that can be started right away under each rate limit, by rate limit name.
+        """
+        now: Timestamp_s = time.monotonic()
+        return {window.rate_limit.name: window.remaining(now) for window in self._windows}
+
+    def time_until_capacity(self,
+                            request_weight: RequestWeight = 1,
+                            limit_weights: Optional[Dict[str, RequestWeight]] = None) -> Seconds:
+        """
+        Returns how long a request with the given weights would wait if no other tasks are started before it.
+        """
+        weights: List[RequestWeight] = self._window_weights(request_weight, limit_weights)
+        now: Timestamp_s = time.monotonic()
+        wait_time: Seconds = max(self._paused_until - now, 0.0)
+        for window, weight in zip(self._windows, weights):
+            wait_time = max(wait_time, window.time_until_capacity(weight, now))
+        return wait_time
+
+    def pause(self, duration: Seconds):
+        """
+        Holds back all tasks for the given duration, e.g. after the exchange has returned a rate limit error.
+        """
+        self._paused_until = max(self._paused_until, time.monotonic() + duration)
+
+    async def acquire(self,
+                      request_weight: RequestWeight,
+                      limit_weights: Optional[Dict[str, RequestWeight]] = None,
+                      priority: int = AsyncCallPriority.NORMAL):
+        weights: List[RequestWeight] = self._window_weights(request_weight, limit_weights)
+        start_ts: Timestamp_s = time.monotonic()
+        delayed: bool = len(self._waiters) > 0
+        # The event is set whenever the waiter may have become the first one.
+        waiter: Tuple[int, int, asyncio.Event] = (int(priority), next(self._sequence), asyncio.Event())
+        heapq.heappush(self._waiters, waiter)
+        try:
+            while True:
+                waiter[2].clear()
+                if self._waiters[0] is not waiter:
+                    await waiter[2].wait()
+                    continue
+                now: Timestamp_s = time.monotonic()
+                wait_time: Seconds = max(self._paused_until - now, 0.0)
+                for window, weight in zip(self._windows, weights):
+                    wait_time = max(wait_time, window.time_until_capacity(weight, now))
+                if wait_time <= 0:
+                    break
+                delayed = True
+                try:
+                    await asyncio.wait_for(waiter[2].wait(), wait_time)
+                except asyncio.TimeoutError:
+                    pass
+            for window, weight in zip(self._windows, weights):
+                window.add(weight, now)
+        finally:
+            self._remove_waiter(waiter)
+        self._metrics.record(now - start_ts if delayed else 0.0)
+
+    def _remove_waiter(self, waiter: Tuple[int, int, asyncio.Event]):
+        if len(self._waiters) > 0 and self._waiters[0] is waiter:
+            heapq.heappop(self._waiters)
+        else:
+            # Cancelled while waiting behind other tasks.
+            self._waiters.remove(waiter)
+            heapq.heapify(self._waiters)
+        if len(self._waiters) > 0:
+            self._waiters[0][2].set()
 
 
 class ThrottlerContextManager:
@@ -48,54 +251,26 @@ class ThrottlerContextManager:
         return cls.throttler_logger
 
     def __init__(self,
-                 task_logs: Deque[TaskLog],
-                 rate_limit: RequestWeight,
+                 throttler: Throttler,
                  request_weight: RequestWeight = 1,
-                 period_safety_margin: Seconds = 0.1,
-                 period: Seconds = 1.0,
-                 retry_interval: Seconds = 0.1):
+                 limit_weights: Optional[Dict[str, RequestWeight]] = None,
+                 priority: int = AsyncCallPriority.NORMAL):
         """
-        :param task_logs: Shared task logs
-        :param rate_limit: Max weight allowed in the given period
+        :param throttler: Throttler holding the shared rate limit windows
         :param request_weight: Weight of the request of the added task
-        :param period_safety_margin: estimate for the network latency
-        :param period: Time interval of the rate limit
-        :param retry_interval: Time between each limit check
+        :param limit_weights: Weights of the request for specific rate limits, by rate limit name
+        :param priority: Tasks with a lower value are started first
         """
-        self._period_safety_margin = period_safety_margin
-        self._lock = asyncio.Lock()
+        self._throttler: Throttler = throttler
         self._request_weight: RequestWeight = request_weight
-        self._rate_limit: int = rate_limit
-        self._period: float = period
-        self._retry_interval: float = retry_interval
-        self._task_logs: Deque[TaskLog] = task_logs
-
-    def flush(self):
-        """
-        Remove task logs that have passed rate limit periods
-        :return:
-        """
-        now: float = time.time()
-        while self._task_logs:
-            task_ts, _ = self._task_logs[0]
-            elapsed: float = now - task_ts
-            if elapsed > self._period - self._period_safety_margin:
-                self._task_logs.popleft()
-            else:
-                break
+        self._limit_weights: Optional[Dict[str, RequestWeight]] = limit_weights
+        self._priority: int = priority
 
     async def acquire(self):
-        while True:
-            self.flush()
-            current_capacity: int = self._rate_limit - sum(weight for (ts, weight) in self._task_logs)
-            if current_capacity - self._request_weight > 0:
-                break
-            await asyncio.sleep(self._retry_interval)
-        self._task_logs.append((time.time(), self._request_weight))
+        await self._throttler.acquire(self._request_weight, self._limit_weights, self._priority)
 
     async def __aenter__(self):
-        async with self._lock:
-            await self.acquire()
+        await self.acquire()
 
     async def __aexit__(self, exc_type, exc, tb):
         pass
@@ -104,17 +279,18 @@ class ThrottlerContextManager:
 # Dev only
 if __name__ == "__main__":
 
-    throttler = Throttler(rate_limit=(20, 1.0))
+    throttler = Throttler(rate_limit=[RateLimit(20, 1.0), RateLimit(3, 1.0, name="orders", default_weight=0)])
 
-    async def task(task_id, weight):
-        async with throttler.weighted_task(weight):
-            print(int(time.time()), f"Cat {task_id}: Meow {weight}")
+    async def task(task_id, weight, orders=0):
+        async with throttler.weighted_task(weight, limit_weights={"orders": orders}):
+            print(int(time.time()), f"Cat {task_id}: Meow {weight} {orders}", throttler.remaining_budget())
 
     async def test_main():
         tasks = [
-            task(1, 5), task(2, 15), task(3, 1), task(4, 10), task(5, 5), task(6, 5)
+            task(1, 5), task(2, 15, 1), task(3, 1, 1), task(4, 10, 1), task(5, 5, 1), task(6, 5)
         ]
         await asyncio.gather(*tasks)
+        print(throttler.metrics)
 
     loop = asyncio.get_event_loop()
     loop.run_until_complete(test_main())
@@ -5,7 +5,8 @@ from decimal import Decimal
 from typing import (
     Dict,
     List,
-    Optional
+    Optional,
+    Set,
 )
 
 from hummingbot.client.config.global_config_map import global_config_map
@@ -124,6 +125,10 @@ class ExchangeRateConversion:
     def exchange_rate(self) -> Dict[str, float]:
         return self._exchange_rate.copy()
 
+    @property
+    def conversion_required_assets(self) -> Set[str]:
+        return set(self._exchange_rate_config["conversion_required"].keys())
+
     def get_exchange_rate(self, source: str = None) -> Dict[str, float]:
         if source == "default":
             if self._default_data_feed not in self.all_exchange_rate:
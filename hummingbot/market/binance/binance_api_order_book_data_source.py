@@ -19,6 +19,8 @@ from websockets.exceptions import ConnectionClosed
 
 from hummingbot.core.utils import async_ttl_cache
 from hummingbot.core.utils.async_utils import safe_gather
+from hummingbot.core.utils.asyncio_throttle import Throttler
+from hummingbot.core.data_type.order_book_snapshot_bootstrapper import OrderBookSnapshotBootstrapper
 from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
 from hummingbot.core.data_type.order_book_tracker_entry import OrderBookTrackerEntry
 from hummingbot.core.data_type.order_book_message import OrderBookMessage
@@ -38,6 +40,8 @@ class BinanceAPIOrderBookDataSource(OrderBookTrackerDataSource):
 
     MESSAGE_TIMEOUT = 30.0
     PING_TIMEOUT = 10.0
+    SNAPSHOT_RATE_LIMIT = (1200, 60.0)
+    SNAPSHOT_REQUEST_WEIGHT = 10
 
     _baobds_logger: Optional[HummingbotLogger] = None
 
@@ -47,10 +51,19 @@ class BinanceAPIOrderBookDataSource(OrderBookTrackerDataSource):
             cls._baobds_logger = logging.getLogger(__name__)
         return cls._baobds_logger
 
-    def __init__(self, trading_pairs: Optional[List[str]] = None):
+    def __init__(self, trading_pairs: Optional[List[str]] = None, throttler: Optional[Throttler] = None):
+        """
+        :param throttler: Throttler shared with the market's other REST requests, since they count towards the same
+                          rate limits. Defaults to one for the snapshot requests only.
+        """
         super().__init__()
         self._trading_pairs: Optional[List[str]] = trading_pairs
         self._order_book_create_function = lambda: OrderBook()
+        # Each 1000 limit snapshot costs 10 weight, and Binance's REST rate limit is 1200 weight per minute.
+        self._snapshot_bootstrapper: OrderBookSnapshotBootstrapper = OrderBookSnapshotBootstrapper(
+            throttler or Throttler(self.SNAPSHOT_RATE_LIMIT),
+            request_weight=self.SNAPSHOT_REQUEST_WEIGHT
+        )
 
     @classmethod
     @async_ttl_cache(ttl=60 * 30, maxsize=1)
@@ -132,33 +145,30 @@ class BinanceAPIOrderBookDataSource(OrderBookTrackerDataSource):
 
             return data
 
+    async def get_tracking_entry(self, client: aiohttp.ClientSession, trading_pair: str) -> OrderBookTrackerEntry:
+        snapshot: Dict[str, Any] = await self.get_snapshot(client, trading_pair, 1000)
+        snapshot_timestamp: float = time.time()
+        snapshot_msg: OrderBookMessage = BinanceOrderBook.snapshot_message_from_exchange(
+            snapshot,
+            snapshot_timestamp,
+            metadata={"trading_pair": trading_pair}
+        )
+        order_book: OrderBook = self.order_book_create_function()
+        order_book.apply_snapshot(snapshot_msg.bids, snapshot_msg.asks, snapshot_msg.update_id)
+        return OrderBookTrackerEntry(trading_pair, snapshot_timestamp, order_book)
+
     async def get_tracking_pairs(self) -> Dict[str, OrderBookTrackerEntry]:
         # Get the currently active markets
-        async with aiohttp.ClientSession() as client:
-            trading_pairs: List[str] = await self.get_trading_pairs()
-            retval: Dict[str, OrderBookTrackerEntry] = {}
+        trading_pairs: List[str] = await self.get_trading_pairs()
+        return await self._snapshot_bootstrapper.fetch_tracking_entries(
+            trading_pairs,
+            self.get_tracking_entry,
+            priority_trading_pairs=self.priority_trading_pairs,
+            entry_ready_callback=self.tracking_entry_ready_callback
+        )
 
-            number_of_pairs: int = len(trading_pairs)
-            for index, trading_pair in enumerate(trading_pairs):
-                try:
-                    snapshot: Dict[str, Any] = await self.get_snapshot(client, trading_pair, 1000)
-                    snapshot_timestamp: float = time.time()
-                    snapshot_msg: OrderBookMessage = BinanceOrderBook.snapshot_message_from_exchange(
-                        snapshot,
-                        snapshot_timestamp,
-                        metadata={"trading_pair": trading_pair}
-                    )
-                    order_book: OrderBook = self.order_book_create_function()
-                    order_book.apply_snapshot(snapshot_msg.bids, snapshot_msg.asks, snapshot_msg.update_id)
-                    retval[trading_pair] = OrderBookTrackerEntry(trading_pair, snapshot_timestamp, order_book)
-                    self.logger().info(f"Initialized order book for {trading_pair}. "
-                                       f"{index+1}/{number_of_pairs} completed.")
-                    # Each 1000 limit snapshot costs 10 requests and Binance rate limit is 20 requests per second.
-                    await asyncio.sleep(1.0)
-                except Exception:
-                    self.logger().error(f"Error getting snapshot for {trading_pair}. ", exc_info=True)
-                    await asyncio.sleep(5)
-            return retval
+    async def close(self):
+        await self._snapshot_bootstrapper.close()
 
     async def _inner_messages(self,
                               ws: websockets.WebSocketClientProtocol) -> AsyncIterable[str]:
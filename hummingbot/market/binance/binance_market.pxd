@@ -13,6 +13,7 @@ cdef class BinanceMarket(MarketBase):
         dict _in_flight_deposits
         dict _in_flight_orders
         dict _order_not_found_records
+        dict _last_trade_ids
         TransactionTracker _tx_tracker
         dict _withdraw_rules
         dict _trading_rules
@@ -27,8 +27,14 @@ from typing import (
 )
 
 import conf
-from hummingbot.core.utils.asyncio_throttle import Throttler
-from hummingbot.core.utils.async_call_scheduler import AsyncCallScheduler
+from hummingbot.core.utils.asyncio_throttle import (
+    RateLimit,
+    Throttler
+)
+from hummingbot.core.utils.async_call_scheduler import (
+    AsyncCallPriority,
+    AsyncCallScheduler
+)
 from hummingbot.core.clock cimport Clock
 from hummingbot.core.data_type.limit_order import LimitOrder
 from hummingbot.core.utils.async_utils import (
@@ -54,6 +60,7 @@ from hummingbot.core.event.events import (
 )
 from hummingbot.market.market_base import (
     MarketBase,
+    OrderReconciliationResult,
     s_decimal_NaN,
 )
 from hummingbot.core.network_iterator import NetworkStatus
@@ -141,6 +148,35 @@ cdef class BinanceMarket(MarketBase):
 
     DEPOSIT_TIMEOUT = 1800.0
     API_CALL_TIMEOUT = 10.0
+    API_CALL_CONCURRENCY = 8
+    # Scheduling priorities of Binance client calls by function name. Other calls have normal priority.
+    API_CALL_PRIORITIES = {
+        "order_limit_buy": AsyncCallPriority.HIGH,
+        "order_limit_sell": AsyncCallPriority.HIGH,
+        "order_market_buy": AsyncCallPriority.HIGH,
+        "order_market_sell": AsyncCallPriority.HIGH,
+        "cancel_order": AsyncCallPriority.HIGH,
+        "get_account": AsyncCallPriority.LOW,
+        "get_order": AsyncCallPriority.LOW,
+        "get_open_orders": AsyncCallPriority.LOW,
+        "get_my_trades": AsyncCallPriority.LOW,
+        "get_trade_fee": AsyncCallPriority.LOW,
+    }
+    # Binance request weights of client calls by function name, for calls that cost more than 1.
+    API_CALL_WEIGHTS = {
+        "get_account": 5,
+        "get_my_trades": 5,
+    }
+    ORDER_CALLS = frozenset(["order_limit_buy", "order_limit_sell", "order_market_buy", "order_market_sell"])
+    RATE_LIMITS = [
+        RateLimit(10, 1.0, name="requests", default_weight=1),
+        RateLimit(1200, 60.0, name="request_weight"),
+        RateLimit(100000, 86400.0, name="orders", default_weight=0),
+    ]
+    OPEN_ORDERS_WEIGHT = 1
+    ALL_OPEN_ORDERS_WEIGHT = 40
+    RATE_LIMIT_ERROR_STATUS_CODES = (418, 429)
+    RATE_LIMIT_ERROR_PAUSE = 60.0
     SHORT_POLL_INTERVAL = 5.0
     UPDATE_ORDER_STATUS_MIN_INTERVAL = 10.0
     LONG_POLL_INTERVAL = 120.0
@@ -169,8 +205,11 @@ cdef class BinanceMarket(MarketBase):
         self.monkey_patch_binance_time()
         super().__init__()
         self._trading_required = trading_required
+        # The order book snapshot requests share the market's throttler, since they count towards the same rate limits.
+        self._throttler = Throttler(self.RATE_LIMITS)
         self._order_book_tracker = BinanceOrderBookTracker(data_source_type=order_book_tracker_data_source_type,
-                                                           trading_pairs=trading_pairs)
+                                                           trading_pairs=trading_pairs,
+                                                           throttler=self._throttler)
         self._binance_client = BinanceClient(binance_api_key, binance_api_secret)
         self._user_stream_tracker = BinanceUserStreamTracker(
             data_source_type=user_stream_tracker_data_source_type, binance_client=self._binance_client)
@@ -179,6 +218,7 @@ cdef class BinanceMarket(MarketBase):
         self._last_timestamp = 0
         self._in_flight_orders = {}  # Dict[client_order_id:str, BinanceInFlightOrder]
         self._order_not_found_records = {}  # Dict[client_order_id:str, count:int]
+        self._last_trade_ids = {}  # Dict[trading_pair:str, trade_id:int]
         self._tx_tracker = BinanceMarketTransactionTracker(self)
         self._withdraw_rules = {}  # Dict[trading_pair:str, WithdrawRule]
         self._trading_rules = {}  # Dict[trading_pair:str, TradingRule]
@@ -190,9 +230,8 @@ cdef class BinanceMarket(MarketBase):
         self._user_stream_event_listener_task = None
         self._order_tracker_task = None
         self._trading_rules_polling_task = None
-        self._async_scheduler = AsyncCallScheduler(call_interval=0.5)
+        self._async_scheduler = AsyncCallScheduler(call_interval=0.5, max_concurrency=self.API_CALL_CONCURRENCY)
         self._last_poll_timestamp = 0
-        self._throttler = Throttler((10.0, 1.0))
 
     @staticmethod
     def split_trading_pair(trading_pair: str) -> Optional[Tuple[str, str]]:
@@ -280,8 +319,10 @@ cdef class BinanceMarket(MarketBase):
             self,
             coro: Coroutine,
             timeout_seconds: float,
-            app_warning_msg: str = "Binance API call failed. Check API key and network connection.") -> any:
-        return await self._async_scheduler.schedule_async_call(coro, timeout_seconds, app_warning_msg=app_warning_msg)
+            app_warning_msg: str = "Binance API call failed. Check API key and network connection.",
+            priority: int = AsyncCallPriority.NORMAL) -> any:
+        return await self._async_scheduler.schedule_async_call(coro, timeout_seconds, app_warning_msg=app_warning_msg,
+                                                               priority=priority)
 
     async def query_api(
             self,
@@ -289,13 +330,30 @@ cdef class BinanceMarket(MarketBase):
             *args,
             app_warning_msg: str = "Binance API call failed. Check API key and network connection.",
             request_weight: int = 1,
+            priority: Optional[int] = None,
             **kwargs) -> Dict[str, any]:
-        async with self._throttler.weighted_task(request_weight=request_weight):
+        func_name = getattr(func, "__name__", None)
+        if priority is None:
+            priority = self.API_CALL_PRIORITIES.get(func_name, AsyncCallPriority.NORMAL)
+        request_weight = max(request_weight, self.API_CALL_WEIGHTS.get(func_name, 1))
+        limit_weights = {"orders": 1 if func_name in self.ORDER_CALLS else 0}
+        # The throttler starts the waiting calls in priority order too, or the calls with a high priority would be
+        # held back by the rate limits behind the ones with a low priority.
+        async with self._throttler.weighted_task(request_weight=request_weight, limit_weights=limit_weights,
+                                                 priority=priority):
             try:
                 return await self._async_scheduler.call_async(partial(func, *args, **kwargs),
                                                               timeout_seconds=self.API_CALL_TIMEOUT,
-                                                              app_warning_msg=app_warning_msg)
+                                                              app_warning_msg=app_warning_msg,
+                                                              priority=priority)
             except Exception as ex:
+                if getattr(ex, "status_code", None) in self.RATE_LIMIT_ERROR_STATUS_CODES:
+                    # Hold back every request until the ban is lifted, instead of piling up more rate limit errors.
+                    response = getattr(ex, "response", None)
+                    retry_after = response.headers.get("Retry-After") if response is not None else None
+                    pause = float(retry_after) if retry_after is not None else self.RATE_LIMIT_ERROR_PAUSE
+                    self.logger().warning(f"Hit Binance API rate limit. Pausing API requests for {pause} seconds.")
+                    self._throttler.pause(pause)
                 if "Timestamp for this request" in str(ex):
                     self.logger().warning("Got Binance timestamp error. "
                                           "Going to force update Binance server time offset...")
@@ -462,7 +520,53 @@ cdef class BinanceMarket(MarketBase):
                 self.logger().error(f"Error parsing the trading pair rule {rule}. Skipping.", exc_info=True)
         return retval
 
-    async def _update_order_fills_from_trades(self):
+    async def _update_orders(self):
+        cdef:
+            # The minimum poll interval for order status is 10 seconds.
+            int64_t last_tick = <int64_t>(self._last_poll_timestamp / self.UPDATE_ORDER_STATUS_MIN_INTERVAL)
+            int64_t current_tick = <int64_t>(self._current_timestamp / self.UPDATE_ORDER_STATUS_MIN_INTERVAL)
+
+        if current_tick > last_tick and len(self._in_flight_orders) > 0:
+            try:
+                reconciliation = await self._reconcile_open_orders(self._in_flight_orders)
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                self.logger().network("Error fetching open orders. Falling back to querying orders one by one.",
+                                      exc_info=True,
+                                      app_warning_msg="Could not fetch open orders from Binance. "
+                                                      "Check API key and network connection.")
+                reconciliation = OrderReconciliationResult({}, list(self._in_flight_orders.keys()))
+
+            # Only the trading pairs with orders that are no longer open, or that have been partially filled since the
+            # last update, can have new trades. Orders can stop being tracked while the open orders are fetched, e.g. if
+            # a user stream event completes them, and these are skipped.
+            fill_trading_pairs = set()
+            for client_order_id in reconciliation.missing_order_ids:
+                tracked_order = self._in_flight_orders.get(client_order_id)
+                if tracked_order is not None:
+                    fill_trading_pairs.add(tracked_order.trading_pair)
+            for client_order_id, open_order in reconciliation.open_orders.items():
+                tracked_order = self._in_flight_orders.get(client_order_id)
+                if tracked_order is None:
+                    continue
+                if Decimal(open_order["executedQty"]) > tracked_order.executed_amount_base:
+                    fill_trading_pairs.add(tracked_order.trading_pair)
+
+            await self._update_order_fills_from_trades(sorted(fill_trading_pairs))
+            await self._update_order_status(reconciliation)
+
+    async def _query_open_orders(self, trading_pairs: List[str]) -> List[Any]:
+        if len(trading_pairs) * self.OPEN_ORDERS_WEIGHT < self.ALL_OPEN_ORDERS_WEIGHT:
+            results = await safe_gather(*[self.query_api(self._binance_client.get_open_orders, symbol=trading_pair)
+                                          for trading_pair in trading_pairs])
+            return [open_order for open_orders in results for open_order in open_orders]
+        return await self.query_api(self._binance_client.get_open_orders, request_weight=self.ALL_OPEN_ORDERS_WEIGHT)
+
+    def _get_open_order_client_id(self, open_order: Any) -> Optional[str]:
+        return open_order.get("clientOrderId")
+
+    async def _update_order_fills_from_trades(self, object trading_pairs=None):
         cdef:
             # This is intended to be a backup measure to get filled events with trade ID for orders,
             # in case Binance's user stream events are not working.
@@ -477,8 +581,13 @@ cdef class BinanceMarket(MarketBase):
             for o in self._in_flight_orders.values():
                 trading_pairs_to_order_map[o.trading_pair][o.exchange_order_id] = o
 
-            trading_pairs = list(trading_pairs_to_order_map.keys())
-            tasks = [self.query_api(self._binance_client.get_my_trades, symbol=trading_pair)
+            if trading_pairs is None:
+                trading_pairs = list(trading_pairs_to_order_map.keys())
+            trading_pairs = [trading_pair for trading_pair in trading_pairs
+                             if trading_pair in trading_pairs_to_order_map]
+            tasks = [self.query_api(self._binance_client.get_my_trades, symbol=trading_pair,
+                                    **({"fromId": self._last_trade_ids[trading_pair] + 1}
+                                       if trading_pair in self._last_trade_ids else {}))
                      for trading_pair in trading_pairs]
             self.logger().debug("Polling for order fills of %d trading pairs.", len(tasks))
             results = await safe_gather(*tasks, return_exceptions=True)
@@ -490,6 +599,10 @@ cdef class BinanceMarket(MarketBase):
                         app_warning_msg=f"Failed to fetch trade update for {trading_pair}."
                     )
                     continue
+                # Only trades after the last seen trade ID are fetched in the next update, unless an order on the
+                # trading pair doesn't have its exchange order ID yet, and its trades can't be matched.
+                if len(trades) > 0 and None not in order_map:
+                    self._last_trade_ids[trading_pair] = max(trade["id"] for trade in trades)
                 for trade in trades:
                     order_id = str(trade["orderId"])
                     if order_id in order_map:
@@ -516,7 +629,7 @@ cdef class BinanceMarket(MarketBase):
                                                      exchange_trade_id=trade["id"]
                                                  ))
 
-    async def _update_order_status(self):
+    async def _update_order_status(self, object reconciliation=None):
         cdef:
             # This is intended to be a backup measure to close straggler orders, in case Binance's user stream events
             # are not working.
@@ -525,7 +638,16 @@ cdef class BinanceMarket(MarketBase):
             int64_t current_tick = <int64_t>(self._current_timestamp / self.UPDATE_ORDER_STATUS_MIN_INTERVAL)
 
         if current_tick > last_tick and len(self._in_flight_orders) > 0:
-            tracked_orders = list(self._in_flight_orders.values())
+            if reconciliation is None:
+                tracked_orders = list(self._in_flight_orders.values())
+            else:
+                # Orders that are still open only need their state updated. The others are queried one by one.
+                for client_order_id, open_order in reconciliation.open_orders.items():
+                    if client_order_id in self._in_flight_orders:
+                        self._in_flight_orders[client_order_id].last_state = open_order["status"]
+                tracked_orders = [self._in_flight_orders[client_order_id]
+                                  for client_order_id in reconciliation.missing_order_ids
+                                  if client_order_id in self._in_flight_orders]
             tasks = [self.query_api(self._binance_client.get_order,
                                     symbol=o.trading_pair, origClientOrderId=o.client_order_id)
                      for o in tracked_orders]
@@ -768,8 +890,7 @@ cdef class BinanceMarket(MarketBase):
                 await self._poll_notifier.wait()
                 await safe_gather(
                     self._update_balances(),
-                    self._update_order_fills_from_trades(),
-                    self._update_order_status(),
+                    self._update_orders(),
                 )
                 self._last_poll_timestamp = self._current_timestamp
             except asyncio.CancelledError:
@@ -1,4 +1,5 @@
 from hummingbot.core.data_type.order_book cimport OrderBook
 
 cdef class BinanceOrderBook(OrderBook):
-    pass
+    cdef c_apply_diff_message(self, object message)
+    cdef c_apply_snapshot_message(self, object message)
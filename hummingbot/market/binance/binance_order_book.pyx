@@ -134,8 +134,15 @@ cdef class BinanceOrderBook(OrderBook):
             "amount": msg["q"]
         }, timestamp=ts * 1e-3)
 
+    cdef c_apply_diff_message(self, object message):
+        # Binance order book rows are [price, amount], so skip the OrderBookRow conversion.
+        self.c_apply_diff_rows(message.content["bids"], message.content["asks"], message.update_id)
+
+    cdef c_apply_snapshot_message(self, object message):
+        self.c_apply_snapshot_rows(message.content["bids"], message.content["asks"], message.update_id)
+
     @classmethod
     def from_snapshot(cls, msg: OrderBookMessage) -> "OrderBook":
         retval = BinanceOrderBook()
-        retval.apply_snapshot(msg.bids, msg.asks, msg.update_id)
+        retval.apply_snapshot_message(msg)
         return retval
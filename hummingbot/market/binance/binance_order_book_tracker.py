@@ -13,11 +13,13 @@ from typing import (
 
 from hummingbot.logger import HummingbotLogger
 from hummingbot.core.data_type.order_book_tracker import (
+    OrderBookDiffQueueStats,
     OrderBookTracker,
     OrderBookTrackerDataSourceType)
 from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
 from hummingbot.core.data_type.remote_api_order_book_data_source import RemoteAPIOrderBookDataSource
 from hummingbot.core.utils.async_utils import safe_ensure_future
+from hummingbot.core.utils.asyncio_throttle import Throttler
 from hummingbot.market.binance.binance_api_order_book_data_source import BinanceAPIOrderBookDataSource
 from hummingbot.core.data_type.order_book import OrderBook
 from hummingbot.core.data_type.order_book_message import OrderBookMessage, OrderBookMessageType
@@ -34,8 +36,10 @@ class BinanceOrderBookTracker(OrderBookTracker):
 
     def __init__(self,
                  data_source_type: OrderBookTrackerDataSourceType = OrderBookTrackerDataSourceType.EXCHANGE_API,
-                 trading_pairs: Optional[List[str]] = None):
-        super().__init__(data_source_type=data_source_type)
+                 trading_pairs: Optional[List[str]] = None,
+                 coalesce_diffs: bool = False,
+                 throttler: Optional[Throttler] = None):
+        super().__init__(data_source_type=data_source_type, coalesce_diffs=coalesce_diffs)
 
         self._order_book_diff_stream: asyncio.Queue = asyncio.Queue()
         self._order_book_snapshot_stream: asyncio.Queue = asyncio.Queue()
@@ -44,6 +48,7 @@ class BinanceOrderBookTracker(OrderBookTracker):
         self._data_source: Optional[OrderBookTrackerDataSource] = None
         self._saved_message_queues: Dict[str, Deque[OrderBookMessage]] = defaultdict(lambda: deque(maxlen=1000))
         self._trading_pairs: Optional[List[str]] = trading_pairs
+        self._throttler: Optional[Throttler] = throttler
 
     @property
     def data_source(self) -> OrderBookTrackerDataSource:
@@ -51,7 +56,8 @@ class BinanceOrderBookTracker(OrderBookTracker):
             if self._data_source_type is OrderBookTrackerDataSourceType.REMOTE_API:
                 self._data_source = RemoteAPIOrderBookDataSource()
             elif self._data_source_type is OrderBookTrackerDataSourceType.EXCHANGE_API:
-                self._data_source = BinanceAPIOrderBookDataSource(trading_pairs=self._trading_pairs)
+                self._data_source = BinanceAPIOrderBookDataSource(trading_pairs=self._trading_pairs,
+                                                                  throttler=self._throttler)
             else:
                 raise ValueError(f"data_source_type {self._data_source_type} is not supported.")
         return self._data_source
@@ -138,6 +144,7 @@ class BinanceOrderBookTracker(OrderBookTracker):
 
         message_queue: asyncio.Queue = self._tracking_message_queues[trading_pair]
         order_book: OrderBook = self._order_books[trading_pair]
+        stats: OrderBookDiffQueueStats = self._diff_queue_stats.setdefault(trading_pair, OrderBookDiffQueueStats())
         last_message_timestamp: float = time.time()
         diff_messages_accepted: int = 0
 
@@ -152,12 +159,28 @@ class BinanceOrderBookTracker(OrderBookTracker):
                 else:
                     message = await message_queue.get()
 
-                if message.type is OrderBookMessageType.DIFF:
-                    order_book.apply_diffs(message.bids, message.asks, message.update_id)
+                if self._coalesce_diffs:
+                    messages: List[OrderBookMessage] = [message] + list(saved_messages)
+                    saved_messages.clear()
+                    messages.extend(self._drain_message_queue(message_queue))
+                    diff_messages_accepted += self._apply_coalesced_messages(trading_pair,
+                                                                             messages,
+                                                                             past_diffs_window)
+
+                    # Output some statistics periodically.
+                    now: float = time.time()
+                    if int(now / 60.0) > int(last_message_timestamp / 60.0):
+                        self.logger().debug("Processed %d order book diffs for %s. %s",
+                                            diff_messages_accepted, trading_pair, stats)
+                        diff_messages_accepted = 0
+                    last_message_timestamp = now
+                elif message.type is OrderBookMessageType.DIFF:
+                    order_book.apply_diff_message(message)
                     past_diffs_window.append(message)
                     while len(past_diffs_window) > self.PAST_DIFF_WINDOW_SIZE:
                         past_diffs_window.popleft()
                     diff_messages_accepted += 1
+                    stats.record_batch(message_queue.qsize() + len(saved_messages) + 1, 1, message.timestamp)
 
                     # Output some statistics periodically.
                     now: float = time.time()
@@ -20,6 +20,8 @@ from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTr
 from hummingbot.core.data_type.order_book_tracker_entry import OrderBookTrackerEntry
 from hummingbot.core.utils import async_ttl_cache
 from hummingbot.core.utils.async_utils import safe_gather
+from hummingbot.core.utils.asyncio_throttle import Throttler
+from hummingbot.core.data_type.order_book_snapshot_bootstrapper import OrderBookSnapshotBootstrapper
 from hummingbot.logger import HummingbotLogger
 from hummingbot.market.bittrex.bittrex_active_order_tracker import BittrexActiveOrderTracker
 from hummingbot.market.bittrex.bittrex_order_book import BittrexOrderBook
@@ -42,6 +44,7 @@ NaN = float("nan")
 
 class BittrexAPIOrderBookDataSource(OrderBookTrackerDataSource):
     PING_TIMEOUT = 10.0
+    SNAPSHOT_RATE_LIMIT = (4, 1.0)
 
     _bittrexaobds_logger: Optional[HummingbotLogger] = None
 
@@ -54,6 +57,13 @@ class BittrexAPIOrderBookDataSource(OrderBookTrackerDataSource):
     def __init__(self, trading_pairs: Optional[List[str]] = None):
         super().__init__()
         self._trading_pairs: Optional[List[str]] = trading_pairs
+        # Snapshots are queried through the WebSocket connection, which already retries up to MAX_RETRIES times, so
+        # the bootstrapper's client session and retries are not used.
+        self._snapshot_bootstrapper: OrderBookSnapshotBootstrapper = OrderBookSnapshotBootstrapper(
+            Throttler(self.SNAPSHOT_RATE_LIMIT),
+            max_concurrency=4,
+            max_retries=1
+        )
         self._websocket_connection: Optional[Connection] = None
         self._websocket_hub: Optional[Hub] = None
         self._snapshot_msg: Dict[str, any] = {}
@@ -210,44 +220,32 @@ class BittrexAPIOrderBookDataSource(OrderBookTrackerDataSource):
 
         raise IOError
 
-    async def get_tracking_pairs(self) -> Dict[str, OrderBookTrackerEntry]:
-        # Get the current active markets
-        trading_pairs: List[str] = await self.get_trading_pairs()
-        retval: Dict[str, OrderBookTrackerEntry] = {}
-
-        number_of_pairs: int = len(trading_pairs)
-        for index, trading_pair in enumerate(trading_pairs):
-
-            # TODO: Refactor accordingly when V3 WebSocket API is released
-            # get_snapshot() utilizes WebSocket API. Requires market trading pairs in 'Quote-Base' format
-            # Code below converts 'Base-Quote' -> 'Quote-Base'
-            temp_trading_pair = f"{trading_pair.split('-')[1]}-{trading_pair.split('-')[0]}"
+    async def get_tracking_entry(self, client: aiohttp.ClientSession, trading_pair: str) -> OrderBookTrackerEntry:
+        # TODO: Refactor accordingly when V3 WebSocket API is released
+        # get_snapshot() utilizes WebSocket API. Requires market trading pairs in 'Quote-Base' format
+        # Code below converts 'Base-Quote' -> 'Quote-Base'
+        temp_trading_pair = f"{trading_pair.split('-')[1]}-{trading_pair.split('-')[0]}"
+        snapshot: OrderBookMessage = await self.get_snapshot(temp_trading_pair)
 
-            try:
-                snapshot: OrderBookMessage = await self.get_snapshot(temp_trading_pair)
+        order_book: OrderBook = self.order_book_create_function()
+        active_order_tracker: BittrexActiveOrderTracker = BittrexActiveOrderTracker()
 
-                order_book: OrderBook = self.order_book_create_function()
-                active_order_tracker: BittrexActiveOrderTracker = BittrexActiveOrderTracker()
+        bids, asks = active_order_tracker.convert_snapshot_message_to_order_book_row(snapshot)
+        order_book.apply_snapshot(bids, asks, snapshot.update_id)
+        return BittrexOrderBookTrackerEntry(trading_pair, snapshot.timestamp, order_book, active_order_tracker)
 
-                bids, asks = active_order_tracker.convert_snapshot_message_to_order_book_row(snapshot)
-                order_book.apply_snapshot(bids, asks, snapshot.update_id)
-                retval[trading_pair] = BittrexOrderBookTrackerEntry(
-                    trading_pair, snapshot.timestamp, order_book, active_order_tracker
-                )
-                self.logger().info(
-                    f"Initialized order book for {trading_pair}. " f"{index + 1}/{number_of_pairs} completed."
-                )
-                await asyncio.sleep(0.5)
-            except (IOError, OSError):
-                self.logger().network(
-                    f"Max retries met fetching snapshot for {trading_pair}.",
-                    exc_info=True,
-                    app_warning_msg=f"Error getting snapshot for {trading_pair}. Check network connection.",
-                )
-            except Exception:
-                self.logger().error(f"Error initiailizing order book for {trading_pair}. ", exc_info=True)
-                await asyncio.sleep(5.0)
-        return retval
+    async def get_tracking_pairs(self) -> Dict[str, OrderBookTrackerEntry]:
+        # Get the currently active markets
+        trading_pairs: List[str] = await self.get_trading_pairs()
+        return await self._snapshot_bootstrapper.fetch_tracking_entries(
+            trading_pairs,
+            self.get_tracking_entry,
+            priority_trading_pairs=self.priority_trading_pairs,
+            entry_ready_callback=self.tracking_entry_ready_callback
+        )
+
+    async def close(self):
+        await self._snapshot_bootstrapper.close()
 
     async def listen_for_trades(self, ev_loop: asyncio.BaseEventLoop, output: asyncio.Queue):
         # Trade messages are received as Orderbook Deltas and handled by listen_for_order_book_stream()
@@ -20,6 +20,8 @@ from hummingbot.core.data_type.order_book import OrderBook
 from hummingbot.market.coinbase_pro.coinbase_pro_order_book import CoinbaseProOrderBook
 from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
 from hummingbot.core.utils import async_ttl_cache
+from hummingbot.core.utils.asyncio_throttle import Throttler
+from hummingbot.core.data_type.order_book_snapshot_bootstrapper import OrderBookSnapshotBootstrapper
 from hummingbot.logger import HummingbotLogger
 from hummingbot.core.data_type.order_book_tracker_entry import OrderBookTrackerEntry
 from hummingbot.core.data_type.order_book_message import OrderBookMessage
@@ -36,6 +38,7 @@ class CoinbaseProAPIOrderBookDataSource(OrderBookTrackerDataSource):
 
     MESSAGE_TIMEOUT = 30.0
     PING_TIMEOUT = 10.0
+    SNAPSHOT_RATE_LIMIT = (3, 1.0)
 
     _cbpaobds_logger: Optional[HummingbotLogger] = None
 
@@ -48,6 +51,10 @@ class CoinbaseProAPIOrderBookDataSource(OrderBookTrackerDataSource):
     def __init__(self, trading_pairs: Optional[List[str]] = None):
         super().__init__()
         self._trading_pairs: Optional[List[str]] = trading_pairs
+        # Coinbase Pro rate limit for public endpoints is 3 requests per second
+        self._snapshot_bootstrapper: OrderBookSnapshotBootstrapper = OrderBookSnapshotBootstrapper(
+            Throttler(self.SNAPSHOT_RATE_LIMIT)
+        )
 
     @classmethod
     @async_ttl_cache(ttl=60 * 30, maxsize=1)
@@ -148,6 +155,29 @@ class CoinbaseProAPIOrderBookDataSource(OrderBookTrackerDataSource):
             data: Dict[str, Any] = await response.json()
             return data
 
+    async def get_tracking_entry(self, client: aiohttp.ClientSession, trading_pair: str) -> OrderBookTrackerEntry:
+        """
+        Fetches the order book snapshot of a trading pair and builds its order book and active order tracker
+        :returns: The order book tracker entry of the trading pair
+        """
+        snapshot: Dict[str, any] = await self.get_snapshot(client, trading_pair)
+        snapshot_timestamp: float = time.time()
+        snapshot_msg: OrderBookMessage = CoinbaseProOrderBook.snapshot_message_from_exchange(
+            snapshot,
+            snapshot_timestamp,
+            metadata={"trading_pair": trading_pair}
+        )
+        order_book: OrderBook = self.order_book_create_function()
+        active_order_tracker: CoinbaseProActiveOrderTracker = CoinbaseProActiveOrderTracker()
+        bids, asks = active_order_tracker.convert_snapshot_message_to_order_book_row(snapshot_msg)
+        order_book.apply_snapshot(bids, asks, snapshot_msg.update_id)
+        return CoinbaseProOrderBookTrackerEntry(
+            trading_pair,
+            snapshot_timestamp,
+            order_book,
+            active_order_tracker
+        )
+
     async def get_tracking_pairs(self) -> Dict[str, OrderBookTrackerEntry]:
         """
         *required
@@ -156,43 +186,16 @@ class CoinbaseProAPIOrderBookDataSource(OrderBookTrackerDataSource):
         :returns: A dictionary of order book trackers for each trading pair
         """
         # Get the currently active markets
-        async with aiohttp.ClientSession() as client:
-            trading_pairs: List[str] = await self.get_trading_pairs()
-            retval: Dict[str, OrderBookTrackerEntry] = {}
-
-            number_of_pairs: int = len(trading_pairs)
-            for index, trading_pair in enumerate(trading_pairs):
-                try:
-                    snapshot: Dict[str, any] = await self.get_snapshot(client, trading_pair)
-                    snapshot_timestamp: float = time.time()
-                    snapshot_msg: OrderBookMessage = CoinbaseProOrderBook.snapshot_message_from_exchange(
-                        snapshot,
-                        snapshot_timestamp,
-                        metadata={"trading_pair": trading_pair}
-                    )
-                    order_book: OrderBook = self.order_book_create_function()
-                    active_order_tracker: CoinbaseProActiveOrderTracker = CoinbaseProActiveOrderTracker()
-                    bids, asks = active_order_tracker.convert_snapshot_message_to_order_book_row(snapshot_msg)
-                    order_book.apply_snapshot(bids, asks, snapshot_msg.update_id)
+        trading_pairs: List[str] = await self.get_trading_pairs()
+        return await self._snapshot_bootstrapper.fetch_tracking_entries(
+            trading_pairs,
+            self.get_tracking_entry,
+            priority_trading_pairs=self.priority_trading_pairs,
+            entry_ready_callback=self.tracking_entry_ready_callback
+        )
 
-                    retval[trading_pair] = CoinbaseProOrderBookTrackerEntry(
-                        trading_pair,
-                        snapshot_timestamp,
-                        order_book,
-                        active_order_tracker
-                    )
-                    self.logger().info(f"Initialized order book for {trading_pair}. "
-                                       f"{index+1}/{number_of_pairs} completed.")
-                    await asyncio.sleep(0.6)
-                except IOError:
-                    self.logger().network(
-                        f"Error getting snapshot for {trading_pair}.",
-                        exc_info=True,
-                        app_warning_msg=f"Error getting snapshot for {trading_pair}. Check network connection."
-                    )
-                except Exception:
-                    self.logger().error(f"Error initializing order book for {trading_pair}. ", exc_info=True)
-            return retval
+    async def close(self):
+        await self._snapshot_bootstrapper.close()
 
     async def _inner_messages(self,
                               ws: websockets.WebSocketClientProtocol) -> AsyncIterable[str]:
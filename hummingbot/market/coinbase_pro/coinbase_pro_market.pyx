@@ -901,6 +901,49 @@ cdef class CoinbaseProMarket(MarketBase):
         safe_ensure_future(self.execute_cancel(trading_pair, order_id))
         return order_id
 
+    async def execute_batch_cancel(self, trading_pair: str, order_ids: List[str]):
+        """
+        Function that cancels a list of orders of a trading pair. If they're all the active orders of the trading
+        pair, they're cancelled with a single cancel all request for its product. Otherwise they're cancelled one by
+        one, so no other orders are cancelled.
+        """
+        order_id_set = set(order_ids)
+        incomplete_orders = [o for o in self._in_flight_orders.values()
+                             if o.trading_pair == trading_pair and not o.is_done]
+        if len(order_ids) < 2 or any(o.client_order_id not in order_id_set for o in incomplete_orders):
+            await safe_gather(*[self.execute_cancel(trading_pair, order_id) for order_id in order_ids],
+                              return_exceptions=True)
+            return
+
+        try:
+            # Orders being created are included in the cancel all request once they have an exchange order id.
+            async with timeout(self.API_CALL_TIMEOUT):
+                await safe_gather(*[o.get_exchange_order_id() for o in incomplete_orders])
+            path_url = f"/orders?product_id={trading_pair}"
+            cancelled_ids = set(await self._api_request("delete", path_url=path_url))
+            for tracked_order in incomplete_orders:
+                # Orders that were done before the request are updated by the order status polling instead.
+                if tracked_order.exchange_order_id in cancelled_ids:
+                    self.logger().info(f"Successfully cancelled order {tracked_order.client_order_id}.")
+                    self.c_stop_tracking_order(tracked_order.client_order_id)
+                    self.c_trigger_event(self.MARKET_ORDER_CANCELLED_EVENT_TAG,
+                                         OrderCancelledEvent(self._current_timestamp, tracked_order.client_order_id))
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            self.logger().network(
+                f"Failed to cancel orders {order_ids}: ",
+                exc_info=True,
+                app_warning_msg=f"Failed to cancel the orders of {trading_pair} on Coinbase Pro. "
+                                f"Check API key and network connection.{e}"
+            )
+
+    cdef c_batch_cancel(self, str trading_pair, list client_order_ids):
+        """
+        Synchronous wrapper that schedules cancelling a list of orders.
+        """
+        safe_ensure_future(self.execute_batch_cancel(trading_pair, client_order_ids))
+
     async def cancel_all(self, timeout_seconds: float) -> List[CancellationResult]:
         """
         *required
@@ -12,8 +12,7 @@ from typing import (
     Deque,
     Dict,
     List,
-    Optional,
-    Set
+    Optional
 )
 
 from hummingbot.core.event.events import TradeType
@@ -102,32 +101,13 @@ class CoinbaseProOrderBookTracker(OrderBookTracker):
             self._order_book_snapshot_router()
         )
 
-    async def _refresh_tracking_tasks(self):
-        """
-        Starts tracking for any new trading pairs, and stop tracking for any inactive trading pairs.
-        """
-        tracking_trading_pairs: Set[str] = set([key for key in self._tracking_tasks.keys()
-                                                if not self._tracking_tasks[key].done()])
-        available_pairs: Dict[str, CoinbaseProOrderBookTrackerEntry] = await self.data_source.get_tracking_pairs()
-        available_trading_pairs: Set[str] = set(available_pairs.keys())
-        new_trading_pairs: Set[str] = available_trading_pairs - tracking_trading_pairs
-        deleted_trading_pairs: Set[str] = tracking_trading_pairs - available_trading_pairs
-
-        for trading_pair in new_trading_pairs:
-            order_book_tracker_entry: CoinbaseProOrderBookTrackerEntry = available_pairs[trading_pair]
-            self._active_order_trackers[trading_pair] = order_book_tracker_entry.active_order_tracker
-            self._order_books[trading_pair] = order_book_tracker_entry.order_book
-            self._tracking_message_queues[trading_pair] = asyncio.Queue()
-            self._tracking_tasks[trading_pair] = safe_ensure_future(self._track_single_book(trading_pair))
-            self.logger().info("Started order book tracking for %s.", trading_pair)
-
-        for trading_pair in deleted_trading_pairs:
-            self._tracking_tasks[trading_pair].cancel()
-            del self._tracking_tasks[trading_pair]
-            del self._order_books[trading_pair]
-            del self._active_order_trackers[trading_pair]
-            del self._tracking_message_queues[trading_pair]
-            self.logger().info("Stopped order book tracking for %s.", trading_pair)
+    def _start_tracking_entry(self, trading_pair: str, entry: CoinbaseProOrderBookTrackerEntry):
+        self._active_order_trackers[trading_pair] = entry.active_order_tracker
+        super()._start_tracking_entry(trading_pair, entry)
+
+    def _stop_tracking_pair(self, trading_pair: str):
+        super()._stop_tracking_pair(trading_pair)
+        del self._active_order_trackers[trading_pair]
 
     async def _order_book_diff_router(self):
         """
@@ -720,6 +720,9 @@ cdef class DolomiteMarket(MarketBase):
     cdef object c_quantize_order_price(self, str trading_pair, object price):
         return round_d(price, self._trading_rules[trading_pair].price_decimal_places)
 
+    cdef list c_quantize_order_prices(self, str trading_pair, object prices):
+        return [round_d(price, self._trading_rules[trading_pair].price_decimal_places) for price in prices]
+
     cdef object c_quantize_order_amount(self, str trading_pair, object amount, object price = 0.0):
         return round_d(amount, self._trading_rules[trading_pair].amount_decimal_places)
 
@@ -23,6 +23,8 @@ from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTr
 from hummingbot.core.data_type.order_book_tracker_entry import OrderBookTrackerEntry
 from hummingbot.core.utils import async_ttl_cache
 from hummingbot.core.utils.async_utils import safe_gather
+from hummingbot.core.utils.asyncio_throttle import Throttler
+from hummingbot.core.data_type.order_book_snapshot_bootstrapper import OrderBookSnapshotBootstrapper
 from hummingbot.logger import HummingbotLogger
 from hummingbot.market.huobi.huobi_order_book import HuobiOrderBook
 
@@ -36,6 +38,7 @@ class HuobiAPIOrderBookDataSource(OrderBookTrackerDataSource):
 
     MESSAGE_TIMEOUT = 30.0
     PING_TIMEOUT = 10.0
+    SNAPSHOT_RATE_LIMIT = (100, 10.0)
 
     _haobds_logger: Optional[HummingbotLogger] = None
 
@@ -48,6 +51,10 @@ class HuobiAPIOrderBookDataSource(OrderBookTrackerDataSource):
     def __init__(self, trading_pairs: Optional[List[str]] = None):
         super().__init__()
         self._trading_pairs: Optional[List[str]] = trading_pairs
+        # Huobi rate limit is 100 https requests per 10 seconds
+        self._snapshot_bootstrapper: OrderBookSnapshotBootstrapper = OrderBookSnapshotBootstrapper(
+            Throttler(self.SNAPSHOT_RATE_LIMIT)
+        )
 
     @classmethod
     @async_ttl_cache(ttl=60 * 30, maxsize=1)
@@ -122,31 +129,28 @@ class HuobiAPIOrderBookDataSource(OrderBookTrackerDataSource):
             data: Dict[str, Any] = json.loads(api_data)
             return data
 
+    async def get_tracking_entry(self, client: aiohttp.ClientSession, trading_pair: str) -> OrderBookTrackerEntry:
+        snapshot: Dict[str, Any] = await self.get_snapshot(client, trading_pair)
+        snapshot_msg: OrderBookMessage = HuobiOrderBook.snapshot_message_from_exchange(
+            snapshot,
+            metadata={"trading_pair": trading_pair}
+        )
+        order_book: OrderBook = self.order_book_create_function()
+        order_book.apply_snapshot(snapshot_msg.bids, snapshot_msg.asks, snapshot_msg.update_id)
+        return OrderBookTrackerEntry(trading_pair, snapshot_msg.timestamp, order_book)
+
     async def get_tracking_pairs(self) -> Dict[str, OrderBookTrackerEntry]:
         # Get the currently active markets
-        async with aiohttp.ClientSession() as client:
-            trading_pairs: List[str] = await self.get_trading_pairs()
-            retval: Dict[str, OrderBookTrackerEntry] = {}
+        trading_pairs: List[str] = await self.get_trading_pairs()
+        return await self._snapshot_bootstrapper.fetch_tracking_entries(
+            trading_pairs,
+            self.get_tracking_entry,
+            priority_trading_pairs=self.priority_trading_pairs,
+            entry_ready_callback=self.tracking_entry_ready_callback
+        )
 
-            number_of_pairs: int = len(trading_pairs)
-            for index, trading_pair in enumerate(trading_pairs):
-                try:
-                    snapshot: Dict[str, Any] = await self.get_snapshot(client, trading_pair)
-                    snapshot_msg: OrderBookMessage = HuobiOrderBook.snapshot_message_from_exchange(
-                        snapshot,
-                        metadata={"trading_pair": trading_pair}
-                    )
-                    order_book: OrderBook = self.order_book_create_function()
-                    order_book.apply_snapshot(snapshot_msg.bids, snapshot_msg.asks, snapshot_msg.update_id)
-                    retval[trading_pair] = OrderBookTrackerEntry(trading_pair, snapshot_msg.timestamp, order_book)
-                    self.logger().info(f"Initialized order book for {trading_pair}. "
-                                       f"{index + 1}/{number_of_pairs} completed.")
-                    # Huobi rate limit is 100 https requests per 10 seconds
-                    await asyncio.sleep(0.4)
-                except Exception:
-                    self.logger().error(f"Error getting snapshot for {trading_pair}. ", exc_info=True)
-                    await asyncio.sleep(5)
-            return retval
+    async def close(self):
+        await self._snapshot_bootstrapper.close()
 
     async def _inner_messages(self,
                               ws: websockets.WebSocketClientProtocol) -> AsyncIterable[str]:
@@ -100,6 +100,7 @@ cdef class HuobiMarket(MarketBase):
     MARKET_SELL_ORDER_CREATED_EVENT_TAG = MarketEvent.SellOrderCreated.value
     API_CALL_TIMEOUT = 10.0
     UPDATE_ORDERS_INTERVAL = 10.0
+    BATCH_CANCEL_LIMIT = 50
 
     @classmethod
     def logger(cls) -> HummingbotLogger:
@@ -805,6 +806,47 @@ cdef class HuobiMarket(MarketBase):
         safe_ensure_future(self.execute_cancel(trading_pair, order_id))
         return order_id
 
+    async def execute_batch_cancel(self, trading_pair: str, order_ids: List[str]):
+        tracked_orders = []
+        for order_id in order_ids:
+            tracked_order = self._in_flight_orders.get(order_id)
+            if tracked_order is None:
+                # Reports the missing order the same way as a single cancel.
+                await self.execute_cancel(trading_pair, order_id)
+            else:
+                tracked_orders.append(tracked_order)
+
+        for i in range(0, len(tracked_orders), self.BATCH_CANCEL_LIMIT):
+            cancel_order_ids = [o.exchange_order_id for o in tracked_orders[i:i + self.BATCH_CANCEL_LIMIT]]
+            path_url = "order/orders/batchcancel"
+            params = {"order-ids": ujson.dumps(cancel_order_ids)}
+            data = {"order-ids": cancel_order_ids}
+            try:
+                cancel_results = await self._api_request(
+                    "post",
+                    path_url=path_url,
+                    params=params,
+                    data=data,
+                    is_auth_required=True
+                )
+                for cancel_error in cancel_results.get("failed", []):
+                    self.logger().network(
+                        f"Failed to cancel order with exchange order id {cancel_error.get('order-id')}: "
+                        f"{cancel_error.get('err-msg')}",
+                        app_warning_msg=f"Failed to cancel an order on Huobi. Check API key and network connection."
+                    )
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                self.logger().network(
+                    f"Failed to cancel orders: {cancel_order_ids}",
+                    exc_info=True,
+                    app_warning_msg=f"Failed to cancel orders on Huobi. Check API key and network connection."
+                )
+
+    cdef c_batch_cancel(self, str trading_pair, list client_order_ids):
+        safe_ensure_future(self.execute_batch_cancel(trading_pair, client_order_ids))
+
     async def cancel_all(self, timeout_seconds: float) -> List[CancellationResult]:
         open_orders = [o for o in self._in_flight_orders.values() if o.is_open]
         if len(open_orders) == 0:
@@ -139,7 +139,7 @@ class HuobiOrderBookTracker(OrderBookTracker):
                 message: OrderBookMessage = await message_queue.get()
                 if message.type is OrderBookMessageType.DIFF:
                     # Huobi websocket messages contain the entire order book state so they should be treated as snapshots
-                    order_book.apply_snapshot(message.bids, message.asks, message.update_id)
+                    order_book.apply_snapshot_message(message)
                     diff_messages_accepted += 1
 
                     # Output some statistics periodically.
@@ -150,7 +150,7 @@ class HuobiOrderBookTracker(OrderBookTracker):
                         diff_messages_accepted = 0
                     last_message_timestamp = now
                 elif message.type is OrderBookMessageType.SNAPSHOT:
-                    order_book.apply_snapshot(message.bids, message.asks, message.update_id)
+                    order_book.apply_snapshot_message(message)
                     self.logger().debug("Processed order book snapshot for %s.", trading_pair)
             except asyncio.CancelledError:
                 raise
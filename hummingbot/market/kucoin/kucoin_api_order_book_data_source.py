@@ -17,6 +17,8 @@ import websockets
 from websockets.exceptions import ConnectionClosed
 from hummingbot.core.utils import async_ttl_cache
 from hummingbot.core.utils.async_utils import safe_gather
+from hummingbot.core.utils.asyncio_throttle import Throttler
+from hummingbot.core.data_type.order_book_snapshot_bootstrapper import OrderBookSnapshotBootstrapper
 from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
 from hummingbot.core.data_type.order_book_tracker_entry import OrderBookTrackerEntry
 from hummingbot.market.kucoin.kucoin_order_book_tracker_entry import KucoinOrderBookTrackerEntry
@@ -37,6 +39,7 @@ class KucoinAPIOrderBookDataSource(OrderBookTrackerDataSource):
 
     MESSAGE_TIMEOUT = 30.0
     PING_TIMEOUT = 10.0
+    SNAPSHOT_RATE_LIMIT = (100, 10.0)
 
     _kaobds_logger: Optional[HummingbotLogger] = None
 
@@ -49,6 +52,10 @@ class KucoinAPIOrderBookDataSource(OrderBookTrackerDataSource):
     def __init__(self, trading_pairs: Optional[List[str]] = None):
         super().__init__()
         self._trading_pairs: Optional[List[str]] = trading_pairs
+        # Kucoin rate limit is 100 https requests per 10 seconds
+        self._snapshot_bootstrapper: OrderBookSnapshotBootstrapper = OrderBookSnapshotBootstrapper(
+            Throttler(self.SNAPSHOT_RATE_LIMIT)
+        )
         self._order_book_create_function = lambda: OrderBook()
 
     @classmethod
@@ -131,35 +138,32 @@ class KucoinAPIOrderBookDataSource(OrderBookTrackerDataSource):
             data: Dict[str, Any] = await response.json()
             return data
 
+    async def get_tracking_entry(self, client: aiohttp.ClientSession, trading_pair: str) -> OrderBookTrackerEntry:
+        snapshot: Dict[str, Any] = await self.get_snapshot(client, trading_pair)
+        snapshot_timestamp: float = time.time()
+        snapshot_msg: OrderBookMessage = KucoinOrderBook.snapshot_message_from_exchange(
+            snapshot,
+            snapshot_timestamp,
+            metadata={"symbol": trading_pair}
+        )
+        order_book: OrderBook = self.order_book_create_function()
+        active_order_tracker: KucoinActiveOrderTracker = KucoinActiveOrderTracker()
+        bids, asks = active_order_tracker.convert_snapshot_message_to_order_book_row(snapshot_msg)
+        order_book.apply_snapshot(bids, asks, snapshot_msg.update_id)
+        return KucoinOrderBookTrackerEntry(trading_pair, snapshot_timestamp, order_book, active_order_tracker)
+
     async def get_tracking_pairs(self) -> Dict[str, OrderBookTrackerEntry]:
         # Get the currently active markets
-        async with aiohttp.ClientSession() as client:
-            trading_pairs: List[str] = await self.get_trading_pairs()
-            retval: Dict[str, OrderBookTrackerEntry] = {}
+        trading_pairs: List[str] = await self.get_trading_pairs()
+        return await self._snapshot_bootstrapper.fetch_tracking_entries(
+            trading_pairs,
+            self.get_tracking_entry,
+            priority_trading_pairs=self.priority_trading_pairs,
+            entry_ready_callback=self.tracking_entry_ready_callback
+        )
 
-            number_of_pairs: int = len(trading_pairs)
-            for index, trading_pair in enumerate(trading_pairs):
-                try:
-                    snapshot: Dict[str, Any] = await self.get_snapshot(client, trading_pair)
-                    snapshot_timestamp: float = time.time()
-                    snapshot_msg: OrderBookMessage = KucoinOrderBook.snapshot_message_from_exchange(
-                        snapshot,
-                        snapshot_timestamp,
-                        metadata={"symbol": trading_pair}
-                    )
-                    order_book: OrderBook = self.order_book_create_function()
-                    active_order_tracker: KucoinActiveOrderTracker = KucoinActiveOrderTracker()
-                    bids, asks = active_order_tracker.convert_snapshot_message_to_order_book_row(snapshot_msg)
-                    order_book.apply_snapshot(bids, asks, snapshot_msg.update_id)
-                    retval[trading_pair] = KucoinOrderBookTrackerEntry(trading_pair, snapshot_timestamp, order_book, active_order_tracker)
-                    self.logger().info(f"Initialized order book for {trading_pair}. "
-                                       f"{index+1}/{number_of_pairs} completed.")
-                    # Kucoin rate limit is 100 https requests per 10 seconds
-                    await asyncio.sleep(0.4)
-                except Exception:
-                    self.logger().error(f"Error getting snapshot for {trading_pair}. ", exc_info=True)
-                    await asyncio.sleep(5)
-            return retval
+    async def close(self):
+        await self._snapshot_bootstrapper.close()
 
     async def _inner_messages(self,
                               ws: websockets.WebSocketClientProtocol) -> AsyncIterable[str]:
@@ -35,3 +35,4 @@ cdef class KucoinMarket(MarketBase):
                                 object price,
                                 object amount)
     cdef c_stop_tracking_order(self, str order_id)
+    cdef list c_batch_limit_orders(self, str trading_pair, list amounts, list prices, bint is_buy)
@@ -98,6 +98,7 @@ cdef class KucoinMarket(MarketBase):
     MARKET_SELL_ORDER_CREATED_EVENT_TAG = MarketEvent.SellOrderCreated.value
     API_CALL_TIMEOUT = 10.0
     UPDATE_ORDERS_INTERVAL = 10.0
+    BATCH_ORDER_LIMIT = 5
 
     @classmethod
     def logger(cls) -> HummingbotLogger:
@@ -565,6 +566,132 @@ cdef class KucoinMarket(MarketBase):
         )
         return str(exchange_order_id["data"]["orderId"])
 
+    async def place_orders(self,
+                           trading_pair: str,
+                           orders: List[Tuple[str, Decimal, Decimal]],
+                           is_buy: bool) -> List[Dict[str, Any]]:
+        """
+        Places up to BATCH_ORDER_LIMIT limit orders of (client order id, amount, price) with one request, and returns
+        the result of each order.
+        """
+        path_url = "/api/v1/orders/multi"
+        side = "buy" if is_buy else "sell"
+        params = {
+            "symbol": trading_pair,
+            "orderList": [{
+                "clientOid": order_id,
+                "side": side,
+                "type": "limit",
+                "price": str(price),
+                "size": str(amount)
+            } for order_id, amount, price in orders]
+        }
+        results = await self._api_request(
+            "post",
+            path_url=path_url,
+            params=params,
+            data=params,
+            is_auth_required=True,
+            is_partner_required=True
+        )
+        return results["data"]["data"]
+
+    async def execute_batch_limit_orders(self,
+                                         order_ids: List[str],
+                                         trading_pair: str,
+                                         amounts: List[Decimal],
+                                         prices: List[Decimal],
+                                         is_buy: bool):
+        cdef:
+            TradingRule trading_rule = self._trading_rules[trading_pair]
+            object trade_type = TradeType.BUY if is_buy else TradeType.SELL
+            str side = "buy" if is_buy else "sell"
+            list orders = []
+            dict results_by_id
+            object decimal_amount
+            object decimal_price
+
+        for order_id, amount, price in zip(order_ids, amounts, prices):
+            decimal_amount = self.c_quantize_order_amount(trading_pair, amount)
+            decimal_price = self.c_quantize_order_price(trading_pair, price)
+            if decimal_amount < trading_rule.min_order_size:
+                self.logger().warning(f"{side.capitalize()} order amount {decimal_amount} is lower than the minimum "
+                                      f"order size {trading_rule.min_order_size}.")
+                self.c_trigger_event(self.MARKET_ORDER_FAILURE_EVENT_TAG,
+                                     MarketOrderFailureEvent(self._current_timestamp, order_id, OrderType.LIMIT))
+            else:
+                orders.append((order_id, decimal_amount, decimal_price))
+
+        for i in range(0, len(orders), self.BATCH_ORDER_LIMIT):
+            batch = orders[i:i + self.BATCH_ORDER_LIMIT]
+            try:
+                results_by_id = {result.get("clientOid"): result
+                                 for result in await self.place_orders(trading_pair, batch, is_buy)}
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                self.logger().network(
+                    f"Error submitting {side} LIMIT orders to Kucoin for {trading_pair}: {batch}.",
+                    exc_info=True,
+                    app_warning_msg=f"Failed to submit {side} orders to Kucoin. Check API key and network connection."
+                )
+                results_by_id = {}
+
+            for order_id, decimal_amount, decimal_price in batch:
+                result = results_by_id.get(order_id)
+                if result is None or result.get("status") != "success":
+                    if result is not None:
+                        self.logger().network(f"Error submitting {side} LIMIT order {order_id} to Kucoin: "
+                                              f"{result.get('failMsg')}.")
+                    self.c_trigger_event(self.MARKET_ORDER_FAILURE_EVENT_TAG,
+                                         MarketOrderFailureEvent(self._current_timestamp, order_id, OrderType.LIMIT))
+                    continue
+
+                self.c_start_tracking_order(
+                    client_order_id=order_id,
+                    exchange_order_id=str(result["id"]),
+                    trading_pair=trading_pair,
+                    order_type=OrderType.LIMIT,
+                    trade_type=trade_type,
+                    price=decimal_price,
+                    amount=decimal_amount
+                )
+                self.logger().info(f"Created {OrderType.LIMIT} {side} order {order_id} for "
+                                   f"{decimal_amount} {trading_pair}.")
+                self.c_trigger_event(self.MARKET_BUY_ORDER_CREATED_EVENT_TAG if is_buy
+                                     else self.MARKET_SELL_ORDER_CREATED_EVENT_TAG,
+                                     (BuyOrderCreatedEvent if is_buy else SellOrderCreatedEvent)(
+                                         self._current_timestamp,
+                                         OrderType.LIMIT,
+                                         trading_pair,
+                                         float(decimal_amount),
+                                         float(decimal_price),
+                                         order_id
+                                     ))
+
+    cdef list c_batch_limit_orders(self, str trading_pair, list amounts, list prices, bint is_buy):
+        cdef:
+            str side = "buy" if is_buy else "sell"
+            int64_t tracking_nonce
+            list order_ids = []
+        for _ in range(len(amounts)):
+            tracking_nonce = <int64_t> get_tracking_nonce()
+            order_ids.append(f"{side}-{trading_pair}-{tracking_nonce}")
+        safe_ensure_future(self.execute_batch_limit_orders(order_ids, trading_pair, amounts, prices, is_buy))
+        return order_ids
+
+    cdef list c_batch_buy(self, str trading_pair, list amounts, list prices, object order_type=OrderType.LIMIT,
+                          dict kwargs={}):
+        if order_type is not OrderType.LIMIT or len(amounts) != len(prices):
+            return MarketBase.c_batch_buy(self, trading_pair, amounts, prices, order_type, kwargs)
+        return self.c_batch_limit_orders(trading_pair, amounts, prices, True)
+
+    cdef list c_batch_sell(self, str trading_pair, list amounts, list prices, object order_type=OrderType.LIMIT,
+                           dict kwargs={}):
+        if order_type is not OrderType.LIMIT or len(amounts) != len(prices):
+            return MarketBase.c_batch_sell(self, trading_pair, amounts, prices, order_type, kwargs)
+        return self.c_batch_limit_orders(trading_pair, amounts, prices, False)
+
     async def execute_buy(self,
                           order_id: str,
                           trading_pair: str,
@@ -6,7 +6,6 @@ import logging
 import time
 import bisect
 from typing import (
-    Set,
     Deque,
     Dict,
     List,
@@ -66,31 +65,13 @@ class KucoinOrderBookTracker(OrderBookTracker):
     def exchange_name(self) -> str:
         return "kucoin"
 
-    async def _refresh_tracking_tasks(self):
-        """
-        Starts tracking for any new trading pairs, and stop tracking for any inactive trading pairs.
-        """
-        tracking_trading_pair: Set[str] = set([key for key in self._tracking_tasks.keys() if not self._tracking_tasks[key].done()])
-        available_pairs: Dict[str, KucoinOrderBookTrackerEntry] = await self.data_source.get_tracking_pairs()
-        available_trading_pair: Set[str] = set(available_pairs.keys())
-        new_trading_pair: Set[str] = available_trading_pair - tracking_trading_pair
-        deleted_trading_pair: Set[str] = tracking_trading_pair - available_trading_pair
-
-        for trading_pair in new_trading_pair:
-            order_book_tracker_entry: KucoinOrderBookTrackerEntry = available_pairs[trading_pair]
-            self._active_order_trackers[trading_pair] = order_book_tracker_entry.active_order_tracker
-            self._order_books[trading_pair] = order_book_tracker_entry.order_book
-            self._tracking_message_queues[trading_pair] = asyncio.Queue()
-            self._tracking_tasks[trading_pair] = asyncio.ensure_future(self._track_single_book(trading_pair))
-            self.logger().info(f"Started order book tracking for {trading_pair}.")
-
-        for trading_pair in deleted_trading_pair:
-            self._tracking_tasks[trading_pair].cancel()
-            del self._tracking_tasks[trading_pair]
-            del self._order_books[trading_pair]
-            del self._active_order_trackers[trading_pair]
-            del self._tracking_message_queues[trading_pair]
-            self.logger().info(f"Stopped order book tracking for {trading_pair}.")
+    def _start_tracking_entry(self, trading_pair: str, entry: KucoinOrderBookTrackerEntry):
+        self._active_order_trackers[trading_pair] = entry.active_order_tracker
+        super()._start_tracking_entry(trading_pair, entry)
+
+    def _stop_tracking_pair(self, trading_pair: str):
+        super()._stop_tracking_pair(trading_pair)
+        del self._active_order_trackers[trading_pair]
 
     async def start(self):
         await super().start()
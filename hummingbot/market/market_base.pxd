@@ -1,5 +1,6 @@
 from hummingbot.core.event.event_reporter cimport EventReporter
 from hummingbot.core.event.event_logger cimport EventLogger
+from hummingbot.core.data_type.fixed_point cimport FixedPoint
 from hummingbot.core.data_type.order_book cimport OrderBook
 from hummingbot.core.network_iterator cimport NetworkIterator
 from hummingbot.core.data_type.order_book_query_result cimport(
@@ -19,6 +20,9 @@ cdef class MarketBase(NetworkIterator):
     cdef str c_buy(self, str trading_pair, object amount, object order_type=*, object price=*, dict kwargs=*)
     cdef str c_sell(self, str trading_pair, object amount, object order_type=*, object price=*, dict kwargs=*)
     cdef c_cancel(self, str trading_pair, str client_order_id)
+    cdef list c_batch_buy(self, str trading_pair, list amounts, list prices, object order_type=*, dict kwargs=*)
+    cdef list c_batch_sell(self, str trading_pair, list amounts, list prices, object order_type=*, dict kwargs=*)
+    cdef c_batch_cancel(self, str trading_pair, list client_order_ids)
     cdef c_stop_tracking_order(self, str order_id)
     cdef object c_get_balance(self, str currency)
     cdef object c_get_available_balance(self, str currency)
@@ -29,11 +33,27 @@ cdef class MarketBase(NetworkIterator):
     cdef object c_get_order_size_quantum(self, str trading_pair, object order_size)
     cdef object c_quantize_order_price(self, str trading_pair, object price)
     cdef object c_quantize_order_amount(self, str trading_pair, object amount, object price=*)
+    cdef list c_quantize_order_prices(self, str trading_pair, object prices)
+    cdef list c_quantize_order_amounts(self, str trading_pair, object amounts, object prices=*)
     cdef ClientOrderBookQueryResult c_get_quote_volume_for_base_amount(self, str trading_pair, bint is_buy, object base_amount)
     cdef ClientOrderBookQueryResult c_get_volume_for_price(self, str trading_pair, bint is_buy, object price)
     cdef ClientOrderBookQueryResult c_get_quote_volume_for_price(self, str trading_pair, bint is_buy, object price)
     cdef ClientOrderBookQueryResult c_get_vwap_for_volume(self, str trading_pair, bint is_buy, object volume)
     cdef ClientOrderBookQueryResult c_get_price_for_volume(self, str trading_pair, bint is_buy, object volume)
+    cdef list c_get_vwap_for_volumes(self, str trading_pair, bint is_buy, list volumes)
+    cdef list c_get_price_for_volumes(self, str trading_pair, bint is_buy, list volumes)
+    cdef list c_get_depth_profile_results(self, str trading_pair, bint is_buy, list volumes, bint vwap)
+    cdef FixedPoint c_quantize_fixed_point_price(self, str trading_pair, double price)
+    cdef FixedPoint c_quantize_fixed_point_amount(self, str trading_pair, double amount)
+    cdef FixedPoint c_get_fixed_point_price(self, str trading_pair, bint is_buy)
+    cdef ClientOrderBookQueryResult c_get_fixed_point_vwap_for_volume(self,
+                                                                      str trading_pair,
+                                                                      bint is_buy,
+                                                                      FixedPoint volume)
+    cdef ClientOrderBookQueryResult c_get_fixed_point_price_for_volume(self,
+                                                                       str trading_pair,
+                                                                       bint is_buy,
+                                                                       FixedPoint volume)
     cdef object c_get_fee(self,
                           str base_currency,
                           str quote_currency,
@@ -1,8 +1,12 @@
 from decimal import Decimal
+from libc.math cimport isfinite
+import numpy as np
 import pandas as pd
 from typing import (
+    Any,
     Dict,
     List,
+    NamedTuple,
     Tuple,
     Optional,
     Iterator)
@@ -24,6 +28,13 @@ from hummingbot.core.event.event_logger import EventLogger
 from hummingbot.core.data_type.limit_order import LimitOrder
 from hummingbot.core.network_iterator import NetworkIterator
 from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.fixed_point cimport (
+    c_fixed_point_from_double,
+    c_get_quantum_value,
+    c_get_scale_for_quantum
+)
+from hummingbot.core.data_type.fixed_point import FixedPoint
+from hummingbot.core.data_type.order_book_tracker import OrderBookTracker
 
 from .deposit_info import DepositInfo
 
@@ -31,6 +42,15 @@ NaN = float("nan")
 s_decimal_NaN = Decimal("nan")
 s_decimal_0 = Decimal(0)
 
+
+# In-flight orders matched against the exchange's open orders.
+#
+# open_orders: Open order updates from the exchange, by client order ID
+# missing_order_ids: Client order IDs of the in-flight orders that are not open on the exchange. These are filled,
+#                    cancelled or failed, or too recent to be in the open orders, and need to be queried one by one.
+OrderReconciliationResult = NamedTuple("OrderReconciliationResult", [("open_orders", Dict[str, Any]),
+                                                                     ("missing_order_ids", List[str])])
+
 cdef class MarketBase(NetworkIterator):
     MARKET_EVENTS = [
         MarketEvent.ReceivedAsset,
@@ -93,6 +113,10 @@ cdef class MarketBase(NetworkIterator):
     def order_books(self) -> Dict[str, OrderBook]:
         raise NotImplementedError
 
+    @property
+    def order_book_tracker(self) -> Optional[OrderBookTracker]:
+        return self._order_book_tracker
+
     @property
     def ready(self) -> bool:
         raise NotImplementedError
@@ -129,6 +153,37 @@ cdef class MarketBase(NetworkIterator):
     async def cancel_all(self, timeout_seconds: float) -> List[CancellationResult]:
         raise NotImplementedError
 
+    async def _query_open_orders(self, trading_pairs: List[str]) -> List[Any]:
+        """
+        Fetches the open orders on the given trading pairs with bulk requests. Markets that support order
+        reconciliation implement this together with `_get_open_order_client_id`.
+
+        :return: Open orders in the exchange's order update format
+        """
+        raise NotImplementedError
+
+    def _get_open_order_client_id(self, open_order: Any) -> Optional[str]:
+        raise NotImplementedError
+
+    async def _reconcile_open_orders(self, in_flight_orders: Dict[str, Any]) -> OrderReconciliationResult:
+        """
+        Matches the in-flight orders against the exchange's open orders, so the status of all the orders that are
+        still open is known from a few bulk requests, instead of one request per order.
+
+        :param in_flight_orders: In-flight orders by client order ID
+        """
+        trading_pairs = sorted(set(o.trading_pair for o in in_flight_orders.values()))
+        exchange_open_orders = await self._query_open_orders(trading_pairs)
+        open_orders_by_id = {}
+        for open_order in exchange_open_orders:
+            client_order_id = self._get_open_order_client_id(open_order)
+            if client_order_id in in_flight_orders:
+                open_orders_by_id[client_order_id] = open_order
+        missing_order_ids = [client_order_id
+                             for client_order_id in in_flight_orders.keys()
+                             if client_order_id not in open_orders_by_id]
+        return OrderReconciliationResult(open_orders_by_id, missing_order_ids)
+
     cdef str c_buy(self, str trading_pair, object amount, object order_type=OrderType.MARKET,
                    object price=s_decimal_NaN, dict kwargs={}):
         raise NotImplementedError
@@ -140,6 +195,36 @@ cdef class MarketBase(NetworkIterator):
     cdef c_cancel(self, str trading_pair, str client_order_id):
         raise NotImplementedError
 
+    cdef list c_batch_buy(self, str trading_pair, list amounts, list prices, object order_type=OrderType.LIMIT,
+                          dict kwargs={}):
+        """
+        Places a buy order for each of the amounts, at the price of the same index, and returns the client order ids
+        in the same order.
+
+        The default implementation calls c_buy() for each order, so they're submitted concurrently. Markets with a
+        batch order endpoint override it to submit them in fewer requests.
+        """
+        if len(amounts) != len(prices):
+            raise ValueError(f"Batch buy order has {len(amounts)} amounts but {len(prices)} prices.")
+        return [self.c_buy(trading_pair, amounts[i], order_type, prices[i], kwargs) for i in range(len(amounts))]
+
+    cdef list c_batch_sell(self, str trading_pair, list amounts, list prices, object order_type=OrderType.LIMIT,
+                           dict kwargs={}):
+        """
+        Sell side version of c_batch_buy().
+        """
+        if len(amounts) != len(prices):
+            raise ValueError(f"Batch sell order has {len(amounts)} amounts but {len(prices)} prices.")
+        return [self.c_sell(trading_pair, amounts[i], order_type, prices[i], kwargs) for i in range(len(amounts))]
+
+    cdef c_batch_cancel(self, str trading_pair, list client_order_ids):
+        """
+        Cancels the orders of a trading pair. The default implementation calls c_cancel() for each order, markets with
+        a batch cancel endpoint override it.
+        """
+        for client_order_id in client_order_ids:
+            self.c_cancel(trading_pair, client_order_id)
+
     cdef c_stop_tracking_order(self, str order_id):
         raise NotImplementedError
 
@@ -194,6 +279,44 @@ cdef class MarketBase(NetworkIterator):
         order_size_quantum = self.c_get_order_size_quantum(trading_pair, amount)
         return (amount // order_size_quantum) * order_size_quantum
 
+    cdef list c_quantize_order_prices(self, str trading_pair, object prices):
+        """
+        Quantizes a ladder of float64 prices in a single pass. Each price is rounded to a whole number of price quanta
+        as int64 ticks, and only converted to Decimal once the ticks are known.
+
+        :param prices: float64 array of prices
+        :returns: Quantized prices, as a list of Decimals
+        """
+        cdef:
+            object price_array = np.asarray(prices, dtype=np.float64)
+            object is_finite = np.isfinite(price_array)
+            list price_quanta = [self.c_get_order_price_quantum(trading_pair, Decimal(str(price))) if finite else s_decimal_NaN
+                                 for price, finite in zip(price_array, is_finite)]
+            object quantum_array = np.array(price_quanta, dtype=np.float64)
+            object ticks = np.zeros(len(price_array), dtype=np.int64)
+        np.rint(price_array / quantum_array, out=ticks, casting="unsafe", where=is_finite)
+        return [Decimal(int(tick)) * price_quantum if finite else s_decimal_NaN
+                for tick, price_quantum, finite in zip(ticks, price_quanta, is_finite)]
+
+    cdef list c_quantize_order_amounts(self, str trading_pair, object amounts, object prices=None):
+        """
+        Quantizes a ladder of float64 order amounts. Amount quantization carries each market's minimum size and
+        notional checks, so every level goes through c_quantize_order_amount().
+
+        Amounts are rounded to 15 significant digits before they're floored to the size quantum. Otherwise float error
+        can floor away a whole quantum, e.g. 0.7 + 0.1 is 0.7999999999999999 and would be quantized to 0.79.
+
+        :param amounts: float64 array of order amounts
+        :param prices: Optional float64 array of order prices, used by markets with min notional checks
+        :returns: Quantized amounts, as a list of Decimals
+        """
+        cdef:
+            list decimal_amounts = [Decimal(f"{amount:.15g}") for amount in np.asarray(amounts, dtype=np.float64)]
+        if prices is None:
+            return [self.c_quantize_order_amount(trading_pair, amount) for amount in decimal_amounts]
+        return [self.c_quantize_order_amount(trading_pair, amount, Decimal(str(price)))
+                for amount, price in zip(decimal_amounts, np.asarray(prices, dtype=np.float64))]
+
     # ----------------------------------------------------------------------------------------------------------
     # </editor-fold>
 
@@ -273,6 +396,35 @@ cdef class MarketBase(NetworkIterator):
                                           result_price,
                                           result_volume)
 
+    cdef list c_get_vwap_for_volumes(self, str trading_pair, bint is_buy, list volumes):
+        """
+        Batched version of c_get_vwap_for_volume(), for pricing a ladder of orders with one order book query.
+        """
+        return self.c_get_depth_profile_results(trading_pair, is_buy, volumes, True)
+
+    cdef list c_get_price_for_volumes(self, str trading_pair, bint is_buy, list volumes):
+        """
+        Batched version of c_get_price_for_volume(), for pricing a ladder of orders with one order book query.
+        """
+        return self.c_get_depth_profile_results(trading_pair, is_buy, volumes, False)
+
+    cdef list c_get_depth_profile_results(self, str trading_pair, bint is_buy, list volumes, bint vwap):
+        cdef:
+            OrderBook order_book = self.c_get_order_book(trading_pair)
+            object query_volumes = np.array([float(volume) for volume in volumes], dtype="float64")
+            tuple profile = order_book.c_get_depth_profile(is_buy, query_volumes)
+            object result_prices = profile[1] if vwap else profile[0]
+            object result_volumes = profile[2]
+            list retval = []
+        for i in range(len(volumes)):
+            retval.append(ClientOrderBookQueryResult(
+                s_decimal_NaN,
+                self.c_quantize_order_amount(trading_pair, Decimal(query_volumes[i])),
+                self.c_quantize_order_price(trading_pair, Decimal(result_prices[i])),
+                self.c_quantize_order_amount(trading_pair, Decimal(result_volumes[i]))
+            ))
+        return retval
+
     def order_book_bid_entries(self, trading_pair) -> Iterator[ClientOrderBookRow]:
         cdef:
             OrderBook order_book = self.c_get_order_book(trading_pair)
@@ -291,6 +443,88 @@ cdef class MarketBase(NetworkIterator):
     # ----------------------------------------------------------------------------------------------------------
     # </editor-fold>
 
+    # <editor-fold desc="+ Fixed point interface to OrderBook">
+    # ----------------------------------------------------------------------------------------------------------
+    cdef FixedPoint c_quantize_fixed_point_price(self, str trading_pair, double price):
+        """
+        Fixed point version of c_quantize_order_price(). The scale comes from the price quantum of the trading pair.
+
+        :returns: Price rounded to the nearest multiple of the price quantum, or None if the price is not finite
+        """
+        cdef:
+            object price_quantum
+            int scale
+        if not isfinite(price):
+            return None
+        price_quantum = self.c_get_order_price_quantum(trading_pair, Decimal(price))
+        scale = c_get_scale_for_quantum(price_quantum)
+        return c_fixed_point_from_double(price, scale).c_quantize(c_get_quantum_value(price_quantum, scale), False)
+
+    cdef FixedPoint c_quantize_fixed_point_amount(self, str trading_pair, double amount):
+        """
+        Fixed point version of c_quantize_order_amount(). The scale comes from the order size quantum of the trading
+        pair. Only the size quantum is applied, market specific checks like minimum order sizes are not.
+
+        :returns: Amount rounded down to a multiple of the order size quantum, or None if the amount is not finite
+        """
+        cdef:
+            object order_size_quantum
+            int scale
+        if not isfinite(amount):
+            return None
+        order_size_quantum = self.c_get_order_size_quantum(trading_pair, Decimal(amount))
+        scale = c_get_scale_for_quantum(order_size_quantum)
+        return c_fixed_point_from_double(amount, scale).c_quantize(c_get_quantum_value(order_size_quantum, scale), True)
+
+    cdef FixedPoint c_get_fixed_point_price(self, str trading_pair, bint is_buy):
+        """
+        Fixed point version of c_get_price().
+
+        :returns: Top bid/ask price for a specific trading pair, or None if that side of the order book is empty
+        """
+        cdef:
+            OrderBook order_book = self.c_get_order_book(trading_pair)
+            double top_price
+        try:
+            top_price = order_book.c_get_price(is_buy)
+        except EnvironmentError:
+            self.logger().warning(f"{'Ask' if is_buy else 'Buy'} orderbook for {trading_pair} is empty.")
+            return None
+
+        return self.c_quantize_fixed_point_price(trading_pair, top_price)
+
+    cdef ClientOrderBookQueryResult c_get_fixed_point_vwap_for_volume(self,
+                                                                      str trading_pair,
+                                                                      bint is_buy,
+                                                                      FixedPoint volume):
+        """
+        Fixed point version of c_get_vwap_for_volume(). Fields that don't apply to the query are None.
+        """
+        cdef:
+            OrderBook order_book = self.c_get_order_book(trading_pair)
+            OrderBookQueryResult result = order_book.c_get_vwap_for_volume(is_buy, volume.c_to_double())
+        return ClientOrderBookQueryResult(None,
+                                          self.c_quantize_fixed_point_amount(trading_pair, result.query_volume),
+                                          self.c_quantize_fixed_point_price(trading_pair, result.result_price),
+                                          self.c_quantize_fixed_point_amount(trading_pair, result.result_volume))
+
+    cdef ClientOrderBookQueryResult c_get_fixed_point_price_for_volume(self,
+                                                                       str trading_pair,
+                                                                       bint is_buy,
+                                                                       FixedPoint volume):
+        """
+        Fixed point version of c_get_price_for_volume(). Fields that don't apply to the query are None.
+        """
+        cdef:
+            OrderBook order_book = self.c_get_order_book(trading_pair)
+            OrderBookQueryResult result = order_book.c_get_price_for_volume(is_buy, volume.c_to_double())
+        return ClientOrderBookQueryResult(None,
+                                          self.c_quantize_fixed_point_amount(trading_pair, result.query_volume),
+                                          self.c_quantize_fixed_point_price(trading_pair, result.result_price),
+                                          self.c_quantize_fixed_point_amount(trading_pair, result.result_volume))
+    # ----------------------------------------------------------------------------------------------------------
+    # </editor-fold>
+
     # <editor-fold desc="+ Wrapper for cython functions">
     # ----------------------------------------------------------------------------------------------------------
     def get_vwap_for_volume(self, trading_pair: str, is_buy: bool, volume: Decimal):
@@ -299,6 +533,14 @@ cdef class MarketBase(NetworkIterator):
     def get_price_for_volume(self, trading_pair: str, is_buy: bool, volume: Decimal):
         return self.c_get_price_for_volume(trading_pair, is_buy, volume)
 
+    def get_vwap_for_volumes(self, trading_pair: str, is_buy: bool,
+                             volumes: List[Decimal]) -> List[ClientOrderBookQueryResult]:
+        return self.c_get_vwap_for_volumes(trading_pair, is_buy, volumes)
+
+    def get_price_for_volumes(self, trading_pair: str, is_buy: bool,
+                              volumes: List[Decimal]) -> List[ClientOrderBookQueryResult]:
+        return self.c_get_price_for_volumes(trading_pair, is_buy, volumes)
+
     def get_quote_volume_for_base_amount(self, trading_pair: str, is_buy: bool,
                                          base_amount: Decimal) -> ClientOrderBookQueryResult:
         return self.c_get_quote_volume_for_base_amount(trading_pair, is_buy, base_amount)
@@ -315,6 +557,17 @@ cdef class MarketBase(NetworkIterator):
     def get_price(self, trading_pair: str, is_buy: bool) -> Decimal:
         return self.c_get_price(trading_pair, is_buy)
 
+    def get_fixed_point_price(self, trading_pair: str, is_buy: bool) -> Optional[FixedPoint]:
+        return self.c_get_fixed_point_price(trading_pair, is_buy)
+
+    def get_fixed_point_vwap_for_volume(self, trading_pair: str, is_buy: bool,
+                                        volume: FixedPoint) -> ClientOrderBookQueryResult:
+        return self.c_get_fixed_point_vwap_for_volume(trading_pair, is_buy, volume)
+
+    def get_fixed_point_price_for_volume(self, trading_pair: str, is_buy: bool,
+                                         volume: FixedPoint) -> ClientOrderBookQueryResult:
+        return self.c_get_fixed_point_price_for_volume(trading_pair, is_buy, volume)
+
     def buy(self, trading_pair: str, amount: Decimal, order_type=OrderType.MARKET,
             price: Decimal = s_decimal_NaN, **kwargs) -> str:
         return self.c_buy(trading_pair, amount, order_type, price, kwargs)
@@ -326,6 +579,17 @@ cdef class MarketBase(NetworkIterator):
     def cancel(self, trading_pair: str, client_order_id: str):
         return self.c_cancel(trading_pair, client_order_id)
 
+    def batch_buy(self, trading_pair: str, amounts: List[Decimal], prices: List[Decimal],
+                  order_type=OrderType.LIMIT, **kwargs) -> List[str]:
+        return self.c_batch_buy(trading_pair, amounts, prices, order_type, kwargs)
+
+    def batch_sell(self, trading_pair: str, amounts: List[Decimal], prices: List[Decimal],
+                   order_type=OrderType.LIMIT, **kwargs) -> List[str]:
+        return self.c_batch_sell(trading_pair, amounts, prices, order_type, kwargs)
+
+    def batch_cancel(self, trading_pair: str, client_order_ids: List[str]):
+        return self.c_batch_cancel(trading_pair, client_order_ids)
+
     def get_available_balance(self, currency: str) -> Decimal:
         return self.c_get_available_balance(currency)
 
@@ -356,5 +620,20 @@ cdef class MarketBase(NetworkIterator):
     def quantize_order_amount(self, trading_pair: str, amount: Decimal) -> Decimal:
         return self.c_quantize_order_amount(trading_pair, amount)
 
+    def quantize_fixed_point_price(self, trading_pair: str, price: float) -> Optional[FixedPoint]:
+        return self.c_quantize_fixed_point_price(trading_pair, price)
+
+    def quantize_fixed_point_amount(self, trading_pair: str, amount: float) -> Optional[FixedPoint]:
+        return self.c_quantize_fixed_point_amount(trading_pair, amount)
+
+    def quantize_order_prices(self, trading_pair: str, prices: np.ndarray) -> List[Decimal]:
+        return self.c_quantize_order_prices(trading_pair, prices)
+
+    def quantize_order_amounts(self,
+                               trading_pair: str,
+                               amounts: np.ndarray,
+                               prices: Optional[np.ndarray] = None) -> List[Decimal]:
+        return self.c_quantize_order_amounts(trading_pair, amounts, prices)
+
     # ----------------------------------------------------------------------------------------------------------
     # </editor-fold>
@@ -1,6 +1,7 @@
 #!/usr/bin/env python
 
 import asyncio
+import logging
 from sqlalchemy.orm import (
     Session,
     Query
@@ -8,10 +9,13 @@ from sqlalchemy.orm import (
 import time
 import threading
 from typing import (
+    Any,
+    Callable,
     Dict,
     List,
     Optional,
     Tuple,
+    TYPE_CHECKING,
     Union
 )
 
@@ -28,25 +32,68 @@ from hummingbot.core.event.events import (
     TradeFee
 )
 from hummingbot.core.event.event_forwarder import SourceInfoEventForwarder
+from hummingbot.logger import HummingbotLogger
 from hummingbot.market.market_base import MarketBase
 from hummingbot.model.market_state import MarketState
 from hummingbot.model.order import Order
 from hummingbot.model.order_status import OrderStatus
 from hummingbot.model.sql_connection_manager import SQLConnectionManager
 from hummingbot.model.trade_fill import TradeFill
+from hummingbot.model.trade_fill_archive import (
+    TradeFillArchive,
+    TradeFillArchiveRow,
+)
+
+if TYPE_CHECKING:
+    from hummingbot.client.performance_tracker import PerformanceTracker
+
+# Adds the records of one market event to the session. Returns False if the event should not be recorded.
+RecordWriter = Callable[[Session], bool]
 
 
 class MarketsRecorder:
+    """
+    Records the orders, order status changes, trade fills and market states of the given markets to the trade fills
+    database.
+
+    By default, every market event is written and committed right away on the event loop thread. In write-behind mode,
+    market events are queued in memory instead, and a background thread writes them to the database in one transaction
+    per batch. Market states queued for the same market in a batch are coalesced, so only the last one is saved.
+    Reading methods flush the queue first, and `stop()` flushes everything that's left.
+
+    If a trade fill archive is given, committed trade fills are also appended to it. If a performance tracker is given,
+    trade fills are added to it as they're recorded, before they're written.
+    """
+    _mr_logger: Optional[HummingbotLogger] = None
+
     market_event_tag_map: Dict[int, MarketEvent] = {
         event_obj.value: event_obj
         for event_obj in MarketEvent.__members__.values()
     }
 
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._mr_logger is None:
+            cls._mr_logger = logging.getLogger(__name__)
+        return cls._mr_logger
+
     def __init__(self,
                  sql: SQLConnectionManager,
                  markets: List[MarketBase],
                  config_file_path: str,
-                 strategy_name: str):
+                 strategy_name: str,
+                 write_behind: bool = False,
+                 flush_interval: float = 1.0,
+                 max_batch_size: int = 500,
+                 trade_fill_archive: Optional[TradeFillArchive] = None,
+                 performance_tracker: Optional["PerformanceTracker"] = None):
+        """
+        :param write_behind: Queue market events and write them in batches from a background thread
+        :param flush_interval: Max time a queued market event waits before it's written, in write-behind mode
+        :param max_batch_size: Number of queued market events that triggers a flush before the flush interval is up
+        :param trade_fill_archive: Columnar archive to append the recorded trade fills to
+        :param performance_tracker: Performance tracker to add the recorded trade fills to
+        """
         if threading.current_thread() != threading.main_thread():
             raise EnvironmentError("MarketsRecorded can only be initialized from the main thread.")
 
@@ -56,6 +103,20 @@ class MarketsRecorder:
         self._config_file_path: str = config_file_path
         self._strategy_name: str = strategy_name
 
+        self._write_behind: bool = write_behind
+        self._flush_interval: float = flush_interval
+        self._max_batch_size: int = max_batch_size
+        self._pending_writes: List[RecordWriter] = []
+        self._pending_market_states: Dict[str, Tuple[int, Dict[str, Any]]] = {}
+        self._pending_lock: threading.Lock = threading.Lock()
+        self._flush_lock: threading.Lock = threading.Lock()
+        self._flush_event: threading.Event = threading.Event()
+        self._writer_thread: Optional[threading.Thread] = None
+        self._writer_stopping: bool = False
+        self._trade_fill_archive: Optional[TradeFillArchive] = trade_fill_archive
+        self._unarchived_trade_fills: List[TradeFill] = []
+        self._performance_tracker: Optional["PerformanceTracker"] = performance_tracker
+
         self._create_order_forwarder: SourceInfoEventForwarder = SourceInfoEventForwarder(self._did_create_order)
         self._fill_order_forwarder: SourceInfoEventForwarder = SourceInfoEventForwarder(self._did_fill_order)
         self._cancel_order_forwarder: SourceInfoEventForwarder = SourceInfoEventForwarder(self._did_cancel_order)
@@ -94,17 +155,159 @@ class MarketsRecorder:
     def db_timestamp(self) -> int:
         return int(time.time() * 1e3)
 
+    @property
+    def write_behind(self) -> bool:
+        return self._write_behind
+
+    @property
+    def trade_fill_archive(self) -> Optional[TradeFillArchive]:
+        return self._trade_fill_archive
+
+    @property
+    def pending_writes_count(self) -> int:
+        return len(self._pending_writes) + len(self._pending_market_states)
+
     def start(self):
         for market in self._markets:
             for event_pair in self._event_pairs:
                 market.add_listener(event_pair[0], event_pair[1])
 
+        if self._trade_fill_archive is not None and not self._write_behind:
+            self._update_trade_fill_archive()
+
+        if self._write_behind and self._writer_thread is None:
+            self._writer_stopping = False
+            self._writer_thread = threading.Thread(target=self._writer_loop,
+                                                   name="MarketsRecorderWriter",
+                                                   daemon=True)
+            self._writer_thread.start()
+
     def stop(self):
         for market in self._markets:
             for event_pair in self._event_pairs:
                 market.remove_listener(event_pair[0], event_pair[1])
 
+        if self._writer_thread is not None:
+            self._writer_stopping = True
+            self._flush_event.set()
+            self._writer_thread.join()
+            self._writer_thread = None
+        self.flush()
+
+    def flush(self):
+        """
+        Writes all the queued market events to the database in one transaction. Does nothing if write-behind mode is
+        off.
+        """
+        with self._flush_lock:
+            with self._pending_lock:
+                writes: List[RecordWriter] = self._pending_writes
+                market_states: Dict[str, Tuple[int, Dict[str, Any]]] = self._pending_market_states
+                self._pending_writes = []
+                self._pending_market_states = {}
+            if len(writes) == 0 and len(market_states) == 0:
+                return
+
+            try:
+                self._write_batch(writes, market_states)
+            except Exception:
+                # Write the records one by one, so a bad record only loses its own market event.
+                self.logger().error(f"Error writing a batch of {len(writes)} market events. Retrying them one by one.",
+                                    exc_info=True)
+                for write in writes:
+                    try:
+                        self._write_batch([write], {})
+                    except Exception:
+                        self.logger().error("Error writing a market event to the database.", exc_info=True)
+                try:
+                    self._write_batch([], market_states)
+                except Exception:
+                    self.logger().error("Error saving market states to the database.", exc_info=True)
+
+    def _write_batch(self,
+                     writes: List[RecordWriter],
+                     market_states: Dict[str, Tuple[int, Dict[str, Any]]]):
+        self._unarchived_trade_fills = []
+        with self._sql.begin() as session:
+            for write in writes:
+                write(session)
+            for market_name, (timestamp, saved_state) in market_states.items():
+                self._save_market_state_record(session, self._config_file_path, market_name, timestamp, saved_state)
+            archive_rows: List[TradeFillArchiveRow] = self._take_archive_rows(session)
+        self._archive_trade_fills(archive_rows)
+
+    def _take_archive_rows(self, session: Session) -> List[TradeFillArchiveRow]:
+        """
+        Returns the archive rows of the trade fills added in the current transaction. Must be called before the commit,
+        which would expire the trade fill records.
+        """
+        if self._trade_fill_archive is None or len(self._unarchived_trade_fills) == 0:
+            return []
+        # Flushing assigns the trade fill ids.
+        session.flush()
+        retval: List[TradeFillArchiveRow] = [TradeFillArchive.row_from_trade_fill(trade_fill)
+                                             for trade_fill in self._unarchived_trade_fills]
+        self._unarchived_trade_fills = []
+        return retval
+
+    def _archive_trade_fills(self, archive_rows: List[TradeFillArchiveRow]):
+        if len(archive_rows) == 0:
+            return
+        try:
+            self._trade_fill_archive.append(archive_rows)
+        except Exception:
+            # The archive catches up from the database on its next update.
+            self.logger().error("Error appending trade fills to the trade fill archive.", exc_info=True)
+
+    def _update_trade_fill_archive(self):
+        try:
+            self._trade_fill_archive.update(self._sql)
+        except Exception:
+            self.logger().error("Error updating the trade fill archive.", exc_info=True)
+
+    def _writer_loop(self):
+        if self._trade_fill_archive is not None:
+            self._update_trade_fill_archive()
+        while not self._writer_stopping:
+            self._flush_event.wait(self._flush_interval)
+            self._flush_event.clear()
+            try:
+                self.flush()
+            except Exception:
+                self.logger().error("Unexpected error flushing market events.", exc_info=True)
+
+    def _sync_for_read(self):
+        # Reads go through the shared session, which must see the records written by the background writer.
+        if self._write_behind:
+            self.flush()
+            self.session.expire_all()
+
+    def _record(self, market: MarketBase, write: RecordWriter):
+        """
+        Writes the records of a market event along with the market's tracking states, or queues them in write-behind
+        mode.
+        """
+        if self._write_behind:
+            with self._pending_lock:
+                self._pending_writes.append(write)
+                self._pending_market_states[market.display_name] = (self.db_timestamp, market.tracking_states)
+                batch_full: bool = len(self._pending_writes) >= self._max_batch_size
+            if batch_full:
+                self._flush_event.set()
+            return
+
+        session: Session = self.session
+        if write(session):
+            self.save_market_states(self._config_file_path, market, no_commit=True)
+            archive_rows: List[TradeFillArchiveRow] = self._take_archive_rows(session)
+            session.commit()
+            self._archive_trade_fills(archive_rows)
+        else:
+            self._unarchived_trade_fills = []
+            session.rollback()
+
     def get_orders_for_config_and_market(self, config_file_path: str, market: MarketBase) -> List[Order]:
+        self._sync_for_read()
         session: Session = self.session
         query: Query = (session
                         .query(Order)
@@ -114,6 +317,7 @@ class MarketsRecorder:
         return query.all()
 
     def get_trades_for_config(self, config_file_path: str, number_of_rows: Optional[int] = None) -> List[TradeFill]:
+        self._sync_for_read()
         session: Session = self.session
         query: Query = (session
                         .query(TradeFill)
@@ -126,22 +330,29 @@ class MarketsRecorder:
 
     def save_market_states(self, config_file_path: str, market: MarketBase, no_commit: bool = False):
         session: Session = self.session
-        market_states: Optional[MarketState] = self.get_market_states(config_file_path, market)
-        timestamp: int = self.db_timestamp
+        self._save_market_state_record(session, config_file_path, market.display_name, self.db_timestamp,
+                                       market.tracking_states)
+        if not no_commit:
+            session.commit()
 
+    @staticmethod
+    def _save_market_state_record(session: Session,
+                                  config_file_path: str,
+                                  market_name: str,
+                                  timestamp: int,
+                                  saved_state: Dict[str, Any]):
+        market_states: Optional[MarketState] = MarketsRecorder._query_market_states(session, config_file_path,
+                                                                                    market_name)
         if market_states is not None:
-            market_states.saved_state = market.tracking_states
+            market_states.saved_state = saved_state
             market_states.timestamp = timestamp
         else:
             market_states = MarketState(config_file_path=config_file_path,
-                                        market=market.display_name,
+                                        market=market_name,
                                         timestamp=timestamp,
-                                        saved_state=market.tracking_states)
+                                        saved_state=saved_state)
             session.add(market_states)
 
-        if not no_commit:
-            session.commit()
-
     def restore_market_states(self, config_file_path: str, market: MarketBase):
         market_states: Optional[MarketState] = self.get_market_states(config_file_path, market)
 
@@ -149,11 +360,15 @@ class MarketsRecorder:
             market.restore_tracking_states(market_states.saved_state)
 
     def get_market_states(self, config_file_path: str, market: MarketBase) -> Optional[MarketState]:
-        session: Session = self.session
+        self._sync_for_read()
+        return self._query_market_states(self.session, config_file_path, market.display_name)
+
+    @staticmethod
+    def _query_market_states(session: Session, config_file_path: str, market_name: str) -> Optional[MarketState]:
         query: Query = (session
                         .query(MarketState)
                         .filter(MarketState.config_file_path == config_file_path,
-                                MarketState.market == market.display_name))
+                                MarketState.market == market_name))
         market_states: Optional[MarketState] = query.one_or_none()
         return market_states
 
@@ -165,7 +380,6 @@ class MarketsRecorder:
             self._ev_loop.call_soon_threadsafe(self._did_create_order, event_tag, market, evt)
             return
 
-        session: Session = self.session
         base_asset, quote_asset = market.split_trading_pair(evt.trading_pair)
         timestamp: int = self.db_timestamp
         event_type: MarketEvent = self.market_event_tag_map[event_tag]
@@ -185,10 +399,13 @@ class MarketsRecorder:
         order_status: OrderStatus = OrderStatus(order=order_record,
                                                 timestamp=timestamp,
                                                 status=event_type.name)
-        session.add(order_record)
-        session.add(order_status)
-        self.save_market_states(self._config_file_path, market, no_commit=True)
-        session.commit()
+
+        def write(session: Session) -> bool:
+            session.add(order_record)
+            session.add(order_status)
+            return True
+
+        self._record(market, write)
 
     def _did_fill_order(self,
                         event_tag: int,
@@ -198,18 +415,11 @@ class MarketsRecorder:
             self._ev_loop.call_soon_threadsafe(self._did_fill_order, event_tag, market, evt)
             return
 
-        session: Session = self.session
         base_asset, quote_asset = market.split_trading_pair(evt.trading_pair)
         timestamp: int = self.db_timestamp
         event_type: MarketEvent = self.market_event_tag_map[event_tag]
         order_id: str = evt.order_id
 
-        # Try to find the order record, and update it if necessary.
-        order_record: Optional[Order] = session.query(Order).filter(Order.id == order_id).one_or_none()
-        if order_record is not None:
-            order_record.last_status = event_type.name
-            order_record.last_update_timestamp = timestamp
-
         # Order status and trade fill record should be added even if the order record is not found, because it's
         # possible for fill event to come in before the order created event for market orders.
         order_status: OrderStatus = OrderStatus(order_id=order_id,
@@ -229,10 +439,22 @@ class MarketsRecorder:
                                                  amount=float(evt.amount),
                                                  trade_fee=TradeFee.to_json(evt.trade_fee),
                                                  exchange_trade_id=evt.exchange_trade_id)
-        session.add(order_status)
-        session.add(trade_fill_record)
-        self.save_market_states(self._config_file_path, market, no_commit=True)
-        session.commit()
+        if self._performance_tracker is not None:
+            self._performance_tracker.add_trade_fill(trade_fill_record)
+
+        def write(session: Session) -> bool:
+            # Try to find the order record, and update it if necessary.
+            order_record: Optional[Order] = session.query(Order).filter(Order.id == order_id).one_or_none()
+            if order_record is not None:
+                order_record.last_status = event_type.name
+                order_record.last_update_timestamp = timestamp
+            session.add(order_status)
+            session.add(trade_fill_record)
+            if self._trade_fill_archive is not None:
+                self._unarchived_trade_fills.append(trade_fill_record)
+            return True
+
+        self._record(market, write)
 
     def _update_order_status(self,
                              event_tag: int,
@@ -246,23 +468,23 @@ class MarketsRecorder:
             self._ev_loop.call_soon_threadsafe(self._update_order_status, event_tag, market, evt)
             return
 
-        session: Session = self.session
         timestamp: int = self.db_timestamp
         event_type: MarketEvent = self.market_event_tag_map[event_tag]
         order_id: str = evt.order_id
-        order_record: Optional[Order] = session.query(Order).filter(Order.id == order_id).one_or_none()
 
-        if order_record is not None:
+        def write(session: Session) -> bool:
+            order_record: Optional[Order] = session.query(Order).filter(Order.id == order_id).one_or_none()
+            if order_record is None:
+                return False
             order_record.last_status = event_type.name
             order_record.last_update_timestamp = timestamp
             order_status: OrderStatus = OrderStatus(order_id=order_id,
                                                     timestamp=timestamp,
                                                     status=event_type.name)
             session.add(order_status)
-            self.save_market_states(self._config_file_path, market, no_commit=True)
-            session.commit()
-        else:
-            session.rollback()
+            return True
+
+        self._record(market, write)
 
     def _did_cancel_order(self,
                           event_tag: int,
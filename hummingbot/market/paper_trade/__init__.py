@@ -1,5 +1,12 @@
-from typing import List
+from typing import (
+    Dict,
+    Iterable,
+    List,
+    Optional,
+)
 
+from hummingbot.core.data_type.market_data_recorder import RecordedMarketDataMessage
+from hummingbot.core.data_type.replay_order_book_tracker import ReplayOrderBookTracker
 from hummingbot.market.bamboo_relay.bamboo_relay_order_book_tracker import BambooRelayOrderBookTracker
 from hummingbot.market.binance.binance_order_book_tracker import BinanceOrderBookTracker
 from hummingbot.market.coinbase_pro.coinbase_pro_order_book_tracker import CoinbaseProOrderBookTracker
@@ -58,3 +65,28 @@ def create_paper_trade_market(exchange_name: str, trading_pairs: List[str]):
                             MarketConfig.default_config(),
                             MARKET_CLASSES[exchange_name]
                             )
+
+
+def create_replay_paper_trade_market(exchange_name: str,
+                                     trading_pairs: List[str],
+                                     start_time: Optional[float] = None,
+                                     end_time: Optional[float] = None,
+                                     root_path: Optional[str] = None,
+                                     config: Optional[MarketConfig] = None,
+                                     preloaded_messages: Optional[Dict[str,
+                                                                       Iterable[RecordedMarketDataMessage]]] = None):
+    """
+    Creates a paper trade market over the market data recorded from an exchange, for backtesting.
+    """
+    if exchange_name not in MARKET_CLASSES:
+        raise Exception(f"Market {exchange_name.upper()} is not supported with paper trading mode.")
+    order_book_tracker = ReplayOrderBookTracker(exchange_name,
+                                                trading_pairs=trading_pairs,
+                                                start_time=start_time,
+                                                end_time=end_time,
+                                                root_path=root_path,
+                                                preloaded_messages=preloaded_messages)
+    return PaperTradeMarket(order_book_tracker,
+                            config or MarketConfig.default_config(),
+                            MARKET_CLASSES[exchange_name]
+                            )
@@ -0,0 +1,80 @@
+#!/usr/bin/env python
+
+from decimal import Decimal
+from typing import (
+    List,
+    Tuple,
+)
+
+from hummingbot.core.event.events import (
+    OrderType,
+    TradeFee,
+    TradeType,
+)
+from hummingbot.market.market_base import MarketBase
+
+
+class FeeModel:
+    """
+    Trading fees charged by a paper trade market on its fills. Percentage fees are charged in the quote asset, and
+    flat fees in their own asset.
+    """
+    def get_fee(self,
+                base_asset: str,
+                quote_asset: str,
+                order_type: OrderType,
+                order_side: TradeType,
+                amount: Decimal,
+                price: Decimal) -> TradeFee:
+        raise NotImplementedError
+
+
+class ConstantFeeModel(FeeModel):
+    def __init__(self,
+                 maker_fee_percent: Decimal,
+                 taker_fee_percent: Decimal,
+                 flat_fees: List[Tuple[str, Decimal]] = []):
+        """
+        :param maker_fee_percent: Fee of the limit orders, e.g. Decimal("0.001") for 0.1%
+        :param taker_fee_percent: Fee of the market orders
+        :param flat_fees: Fees charged on every fill, as (asset, amount)
+        """
+        self._maker_fee: TradeFee = TradeFee(Decimal(maker_fee_percent), list(flat_fees))
+        self._taker_fee: TradeFee = TradeFee(Decimal(taker_fee_percent), list(flat_fees))
+
+    def get_fee(self,
+                base_asset: str,
+                quote_asset: str,
+                order_type: OrderType,
+                order_side: TradeType,
+                amount: Decimal,
+                price: Decimal) -> TradeFee:
+        return self._maker_fee if order_type is OrderType.LIMIT else self._taker_fee
+
+    def __repr__(self) -> str:
+        return f"ConstantFeeModel({self._maker_fee.percent}, {self._taker_fee.percent})"
+
+
+class ConnectorFeeModel(FeeModel):
+    """
+    Charges the fees of a real exchange connector, as computed by its `get_fee()`, so the fee tiers fetched by the
+    connector and the fee overrides in the global config apply to the simulation too.
+    """
+    def __init__(self, market: MarketBase):
+        self._market: MarketBase = market
+
+    @property
+    def market(self) -> MarketBase:
+        return self._market
+
+    def get_fee(self,
+                base_asset: str,
+                quote_asset: str,
+                order_type: OrderType,
+                order_side: TradeType,
+                amount: Decimal,
+                price: Decimal) -> TradeFee:
+        return self._market.get_fee(base_asset, quote_asset, order_type, order_side, amount, price)
+
+    def __repr__(self) -> str:
+        return f"ConnectorFeeModel({self._market.name})"
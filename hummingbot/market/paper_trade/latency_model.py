@@ -0,0 +1,90 @@
+#!/usr/bin/env python
+
+import pandas as pd
+import random
+from typing import (
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+)
+
+
+class LatencyModel:
+    """
+    Simulated delay, in seconds, between sending a request or message and its arrival at the other end.
+    """
+    def sample(self) -> float:
+        raise NotImplementedError
+
+
+class ConstantLatencyModel(LatencyModel):
+    def __init__(self, latency: float):
+        if latency < 0:
+            raise ValueError(f"Latency must not be negative, got {latency}.")
+        self._latency: float = latency
+
+    @property
+    def latency(self) -> float:
+        return self._latency
+
+    def sample(self) -> float:
+        return self._latency
+
+    def __repr__(self) -> str:
+        return f"ConstantLatencyModel({self._latency})"
+
+
+class EmpiricalLatencyModel(LatencyModel):
+    """
+    Draws latencies from a set of measured ones, e.g. the round trip times recorded from an exchange's API.
+    """
+    def __init__(self, samples: Sequence[float], seed: Optional[int] = None):
+        """
+        :param samples: Measured latencies, in seconds
+        :param seed: Seed of the random draws, for repeatable simulations
+        """
+        self._samples: List[float] = [float(s) for s in samples if s >= 0]
+        if len(self._samples) == 0:
+            raise ValueError("Empirical latency model needs at least one non-negative sample.")
+        self._random: random.Random = random.Random(seed)
+
+    @classmethod
+    def from_csv(cls, path: str, column: str = "latency", seed: Optional[int] = None) -> "EmpiricalLatencyModel":
+        """
+        Reads the measured latencies, in seconds, from a column of a CSV file.
+        """
+        return EmpiricalLatencyModel(pd.read_csv(path)[column].dropna().tolist(), seed=seed)
+
+    @property
+    def samples(self) -> List[float]:
+        return self._samples
+
+    def sample(self) -> float:
+        return self._random.choice(self._samples)
+
+    def __repr__(self) -> str:
+        return f"EmpiricalLatencyModel({len(self._samples)} samples)"
+
+
+class LatencyModels(NamedTuple):
+    """
+    Latencies simulated by a paper trade market, usually measured for the exchange it simulates.
+
+    :param order_submission: Delay until a new order reaches the exchange. Market orders are executed, and limit orders
+                             enter the order book, once it has passed.
+    :param order_cancellation: Delay until a cancellation reaches the exchange. The order can still be filled until then.
+    :param market_data: Delay of the order book data. Only applies to replayed market data.
+    """
+    order_submission: Optional[LatencyModel] = None
+    order_cancellation: Optional[LatencyModel] = None
+    market_data: Optional[LatencyModel] = None
+
+    @classmethod
+    def constant(cls,
+                 order_submission: float = 0.0,
+                 order_cancellation: float = 0.0,
+                 market_data: float = 0.0) -> "LatencyModels":
+        return LatencyModels(ConstantLatencyModel(order_submission),
+                             ConstantLatencyModel(order_cancellation),
+                             ConstantLatencyModel(market_data))
@@ -3,6 +3,10 @@
 from collections import namedtuple
 from decimal import Decimal
 from enum import Enum
+from typing import Optional
+
+from .fee_model import FeeModel
+from .latency_model import LatencyModels
 
 
 class AssetType(Enum):
@@ -13,11 +17,36 @@ class AssetType(Enum):
 class MarketConfig(namedtuple("_MarketConfig", "buy_fees_asset,"
                                                "buy_fees_amount,"
                                                "sell_fees_asset,"
-                                               "sell_fees_amount,")):
+                                               "sell_fees_amount,"
+                                               "queue_position_matching,"
+                                               "latency_models,"
+                                               "fee_model")):
+    """
+    :param queue_position_matching: Fill limit orders only with the traded volume left after the volume queued ahead
+                                    of them at their price level, in parts if needed. Otherwise, limit orders are
+                                    filled in full by any trade or opposite order crossing their price.
+    :param latency_models: Delays of the order submissions, cancellations and market data. Without them, market orders
+                           are executed after a fixed delay, and everything else is instant.
+    :param fee_model: Fees charged on the fills. Without it, trading is free.
+    """
     buy_fees_asset: AssetType
     buy_fees_amount: Decimal
     sell_fees_asset: AssetType
     sell_fees_amount: Decimal
+    queue_position_matching: bool
+    latency_models: Optional[LatencyModels]
+    fee_model: Optional[FeeModel]
+
+    def __new__(cls,
+                buy_fees_asset: AssetType,
+                buy_fees_amount: Decimal,
+                sell_fees_asset: AssetType,
+                sell_fees_amount: Decimal,
+                queue_position_matching: bool = False,
+                latency_models: Optional[LatencyModels] = None,
+                fee_model: Optional[FeeModel] = None):
+        return super().__new__(cls, buy_fees_asset, buy_fees_amount, sell_fees_asset, sell_fees_amount,
+                               queue_position_matching, latency_models, fee_model)
 
     @classmethod
     def default_config(cls) -> "MarketConfig":
@@ -31,17 +31,36 @@ cdef class PaperTradeMarket(MarketBase):
         bint _paper_trade_market_initialized
         dict _trading_pairs
         object _config
-        object _queued_orders
+        list _pending_events
+        long long _pending_event_count
+        dict _pending_limit_orders
+        dict _limit_order_fees_paid
+        double _market_data_timestamp
         dict _quantization_params
         object _order_book_trade_listener
+        dict _order_book_update_listeners
         object _market_order_filled_listener
         LimitOrderExpirationSet _limit_order_expiration_set
         object _order_tracker_task
         object _target_market
 
+    cdef double c_sample_latency(self, object latency_model)
+    cdef double c_get_market_data_timestamp(self, double timestamp)
+    cdef c_queue_event(self, double arrival_timestamp, object queued_event)
+    cdef c_queue_order(self, object queued_order)
+    cdef c_insert_limit_order(self, object queued_order)
+    cdef c_trigger_order_created_event(self, object queued_order)
     cdef c_execute_buy(self, str order_id, str trading_pair, object amount)
     cdef c_execute_sell(self, str order_id, str trading_pair, object amount)
-    cdef c_process_market_orders(self)
+    cdef c_process_pending_events(self)
+    cdef object c_charge_trade_fee(self, str quote_asset, object trade_fee, object quote_volume)
+    cdef object c_get_insufficient_balance(self,
+                                           str base_asset,
+                                           str quote_asset,
+                                           bint is_buy,
+                                           object base_amount,
+                                           object quote_volume,
+                                           object trade_fee)
     cdef c_set_balance(self, str currency, object amount)
     cdef object c_get_fee(self,
                           str base_asset,
@@ -58,21 +77,36 @@ cdef class PaperTradeMarket(MarketBase):
                                bint is_buy,
                                LimitOrders *limit_orders_map_ptr,
                                LimitOrdersIterator *map_it_ptr,
-                               SingleTradingPairLimitOrdersIterator orders_it)
+                               SingleTradingPairLimitOrdersIterator orders_it,
+                               object fill_amount=*)
     cdef c_process_limit_bid_order(self,
                                    LimitOrders *limit_orders_map_ptr,
                                    LimitOrdersIterator *map_it_ptr,
-                                   SingleTradingPairLimitOrdersIterator orders_it)
+                                   SingleTradingPairLimitOrdersIterator orders_it,
+                                   object fill_amount=*)
     cdef c_process_limit_ask_order(self,
                                    LimitOrders *limit_orders_map_ptr,
                                    LimitOrdersIterator *map_it_ptr,
-                                   SingleTradingPairLimitOrdersIterator orders_it)
+                                   SingleTradingPairLimitOrdersIterator orders_it,
+                                   object fill_amount=*)
     cdef c_process_crossed_limit_orders_for_trading_pair(self,
                                                          bint is_buy,
                                                          LimitOrders *limit_orders_map_ptr,
                                                          LimitOrdersIterator *map_it_ptr)
+    cdef c_record_crossed_fill(self, OrderBook order_book, bint is_buy, double price, double amount)
+    cdef object c_get_limit_order_fill_amount(self,
+                                              str trading_pair,
+                                              const CPPLimitOrder *cpp_limit_order_ptr,
+                                              double available_volume)
+    cdef c_update_queue_positions(self, str trading_pair)
     cdef c_process_crossed_limit_orders(self)
     cdef c_match_trade_to_limit_orders(self, object order_book_trade_event)
+    cdef c_match_trade_to_queued_limit_orders(self,
+                                              object order_book_trade_event,
+                                              bint is_maker_buy,
+                                              LimitOrders *limit_orders_map_ptr,
+                                              LimitOrdersIterator *map_it_ptr)
+    cdef c_execute_cancel(self, str trading_pair_str, str client_order_id)
     cdef object c_cancel_order_from_orders_map(self,
                                                LimitOrders *orders_map,
                                                str trading_pair_str,
@@ -1,14 +1,14 @@
-# distutils: sources=['hummingbot/core/cpp/Utils.cpp', 'hummingbot/core/cpp/LimitOrder.cpp', 'hummingbot/core/cpp/OrderExpirationEntry.cpp']
+# distutils: sources=['hummingbot/core/cpp/Utils.cpp', 'hummingbot/core/cpp/LimitOrder.cpp', 'hummingbot/core/cpp/OrderExpirationEntry.cpp', 'hummingbot/core/cpp/OrderBookEntry.cpp']
 
 import asyncio
 from async_timeout import timeout
-from collections import (
-    deque, defaultdict
-)
+from collections import defaultdict
 from cpython cimport PyObject
 from decimal import Decimal
 from functools import partial
+import heapq
 import hummingbot
+from libc.stdint cimport int64_t
 from libcpp cimport bool as cppbool
 from libcpp.vector cimport vector
 import logging
@@ -38,10 +38,17 @@ from hummingbot.core.clock import (
 from hummingbot.core.data_type.cancellation_result import CancellationResult
 from hummingbot.core.data_type.composite_order_book import CompositeOrderBook
 from hummingbot.core.data_type.composite_order_book cimport CompositeOrderBook
+from hummingbot.core.data_type.fixed_point cimport (
+    FixedPoint,
+    c_fixed_point_from_decimal,
+    c_get_scale_for_quantum
+)
 from hummingbot.core.data_type.limit_order cimport c_create_limit_order_from_cpp_limit_order
+from hummingbot.core.data_type.OrderBookEntry cimport OrderBookEntry
 from hummingbot.core.data_type.limit_order import LimitOrder
 from hummingbot.core.data_type.order_book cimport OrderBook
 from hummingbot.core.data_type.order_book_tracker import OrderBookTracker
+from hummingbot.core.data_type.replay_order_book_tracker import ReplayOrderBookTracker
 from hummingbot.core.event.events import (
     MarketEvent,
     OrderType,
@@ -72,6 +79,12 @@ ptm_logger = None
 s_decimal_0 = Decimal(0)
 
 
+cdef object c_get_filled_quantity(const CPPLimitOrder *cpp_limit_order_ptr):
+    if cpp_limit_order_ptr.getFilledQuantity() == NULL:
+        return s_decimal_0
+    return <object> cpp_limit_order_ptr.getFilledQuantity()
+
+
 cdef class QuantizationParams:
     cdef:
         str trading_pair
@@ -104,13 +117,24 @@ cdef class QueuedOrder:
         bint _is_buy
         str _trading_pair
         object _amount
+        object _order_type
+        object _price
 
-    def __init__(self, create_timestamp: float, order_id: str, is_buy: bool, trading_pair: str, amount: Decimal):
+    def __init__(self,
+                 create_timestamp: float,
+                 order_id: str,
+                 is_buy: bool,
+                 trading_pair: str,
+                 amount: Decimal,
+                 order_type: OrderType = OrderType.MARKET,
+                 price: Decimal = s_decimal_0):
         self.create_timestamp = create_timestamp
         self._order_id = order_id
         self._is_buy = is_buy
         self._trading_pair = trading_pair
         self._amount = amount
+        self._order_type = order_type
+        self._price = price
 
     @property
     def timestamp(self) -> double:
@@ -132,9 +156,44 @@ cdef class QueuedOrder:
     def amount(self) -> Decimal:
         return self._amount
 
+    @property
+    def order_type(self) -> OrderType:
+        return self._order_type
+
+    @property
+    def price(self) -> Decimal:
+        return self._price
+
     def __repr__(self) -> str:
         return (f"QueuedOrder({self.create_timestamp}, '{self.order_id}', {self.is_buy}, '{self.trading_pair}', "
-                f"{self.amount})")
+                f"{self.amount}, {self.order_type}, {self.price})")
+
+
+cdef class QueuedCancel:
+    cdef:
+        double create_timestamp
+        str _order_id
+        str _trading_pair
+
+    def __init__(self, create_timestamp: float, order_id: str, trading_pair: str):
+        self.create_timestamp = create_timestamp
+        self._order_id = order_id
+        self._trading_pair = trading_pair
+
+    @property
+    def timestamp(self) -> double:
+        return self.create_timestamp
+
+    @property
+    def order_id(self) -> str:
+        return self._order_id
+
+    @property
+    def trading_pair(self) -> str:
+        return self._trading_pair
+
+    def __repr__(self) -> str:
+        return f"QueuedCancel({self.create_timestamp}, '{self.order_id}', '{self.trading_pair}')"
 
 
 cdef class OrderBookTradeListener(EventListener):
@@ -151,6 +210,19 @@ cdef class OrderBookTradeListener(EventListener):
         except Exception as e:
             self.logger().error("Error call trade listener.", exc_info=True)
 
+cdef class OrderBookUpdateListener(EventListener):
+    cdef:
+        PaperTradeMarket _market
+        str _trading_pair
+
+    def __init__(self, market: PaperTradeMarket, trading_pair: str):
+        super().__init__()
+        self._market = market
+        self._trading_pair = trading_pair
+
+    cdef c_call(self, object update_id):
+        self._market.c_update_queue_positions(self._trading_pair)
+
 cdef class OrderBookMarketOrderFillListener(EventListener):
     cdef:
         MarketBase _market
@@ -169,12 +241,14 @@ cdef class OrderBookMarketOrderFillListener(EventListener):
 
 cdef class PaperTradeMarket(MarketBase):
     TRADE_EXECUTION_DELAY = 5.0
+    MIN_FILL_VOLUME = 1e-7
     ORDER_FILLED_EVENT_TAG = MarketEvent.OrderFilled.value
     SELL_ORDER_COMPLETED_EVENT_TAG = MarketEvent.SellOrderCompleted.value
     BUY_ORDER_COMPLETED_EVENT_TAG = MarketEvent.BuyOrderCompleted.value
     MARKET_ORDER_CANCELLED_EVENT_TAG = MarketEvent.OrderCancelled.value
     MARKET_ORDER_FAILURE_EVENT_TAG = MarketEvent.OrderFailure.value
     ORDER_BOOK_TRADE_EVENT_TAG = OrderBookEvent.TradeEvent.value
+    ORDER_BOOK_UPDATE_EVENT_TAG = OrderBookEvent.UpdateEvent.value
     MARKET_SELL_ORDER_CREATED_EVENT_TAG = MarketEvent.SellOrderCreated.value
     MARKET_BUY_ORDER_CREATED_EVENT_TAG = MarketEvent.BuyOrderCreated.value
 
@@ -186,11 +260,16 @@ cdef class PaperTradeMarket(MarketBase):
         self._paper_trade_market_initialized = False
         self._trading_pairs = {}
         self._config = config
-        self._queued_orders = deque()
+        self._pending_events = []
+        self._pending_event_count = 0
+        self._pending_limit_orders = {}
+        self._limit_order_fees_paid = {}
+        self._market_data_timestamp = 0.0
         self._quantization_params = {}
         self._order_tracker_task = None
         self._order_book_tracker = order_book_tracker
         self._order_book_trade_listener = OrderBookTradeListener(self)
+        self._order_book_update_listeners = {}
         self._target_market = target_market
         self._market_order_filled_listener = OrderBookMarketOrderFillListener(self)
         self.c_add_listener(self.ORDER_FILLED_EVENT_TAG, self._market_order_filled_listener)
@@ -209,6 +288,12 @@ cdef class PaperTradeMarket(MarketBase):
                 self.ORDER_BOOK_TRADE_EVENT_TAG,
                 self._order_book_trade_listener
             )
+            if self._config.queue_position_matching:
+                self._order_book_update_listeners[trading_pair_str] = OrderBookUpdateListener(self, trading_pair_str)
+                (<CompositeOrderBook>order_book).c_add_listener(
+                    self.ORDER_BOOK_UPDATE_EVENT_TAG,
+                    self._order_book_update_listeners[trading_pair_str]
+                )
 
     def split_trading_pair(self, trading_pair: str) -> Tuple[str, str]:
         return self._target_market.split_trading_pair(trading_pair)
@@ -247,7 +332,16 @@ cdef class PaperTradeMarket(MarketBase):
 
     @property
     def queued_orders(self) -> List[QueuedOrder]:
-        return self._queued_orders
+        """
+        Orders submitted but not arrived at the simulated exchange yet, in the order of their arrival.
+        """
+        return [queued_event for _, _, queued_event in sorted(self._pending_events)
+                if isinstance(queued_event, QueuedOrder)]
+
+    @property
+    def queued_cancels(self) -> List[QueuedCancel]:
+        return [queued_event for _, _, queued_event in sorted(self._pending_events)
+                if isinstance(queued_event, QueuedCancel)]
 
     @property
     def limit_orders(self) -> List[LimitOrder]:
@@ -285,10 +379,11 @@ cdef class PaperTradeMarket(MarketBase):
     def on_hold_balances(self) -> Dict[str, Decimal]:
         _on_hold_balances = defaultdict(Decimal)
         for limit_order in self.limit_orders:
+            unfilled_quantity = limit_order.quantity - limit_order.filled_quantity
             if limit_order.is_buy:
-                _on_hold_balances[limit_order.quote_currency] += limit_order.quantity * limit_order.price
+                _on_hold_balances[limit_order.quote_currency] += unfilled_quantity * limit_order.price
             else:
-                _on_hold_balances[limit_order.base_currency] += limit_order.quantity
+                _on_hold_balances[limit_order.base_currency] += unfilled_quantity
         return _on_hold_balances
 
     @property
@@ -302,6 +397,8 @@ cdef class PaperTradeMarket(MarketBase):
 
     cdef c_start(self, Clock clock, double timestamp):
         MarketBase.c_start(self, clock, timestamp)
+        if isinstance(self._order_book_tracker, ReplayOrderBookTracker):
+            self._order_book_tracker.start_replay()
 
     async def start_network(self):
         await self.stop_network()
@@ -326,9 +423,49 @@ cdef class PaperTradeMarket(MarketBase):
 
     cdef c_tick(self, double timestamp):
         MarketBase.c_tick(self, timestamp)
-        self.c_process_market_orders()
+        if isinstance(self._order_book_tracker, ReplayOrderBookTracker):
+            # Recorded trades are matched to the limit orders as they're replayed.
+            self._order_book_tracker.replay_til(self.c_get_market_data_timestamp(timestamp))
+        self.c_process_pending_events()
         self.c_process_crossed_limit_orders()
 
+    cdef double c_sample_latency(self, object latency_model):
+        if latency_model is None:
+            return 0.0
+        return max(0.0, latency_model.sample())
+
+    cdef double c_get_market_data_timestamp(self, double timestamp):
+        """
+        Returns the timestamp of the market data delivered at the given time, which lags behind it by the market data
+        latency. The market data is never delivered out of order.
+        """
+        cdef:
+            object latency_models = self._config.latency_models
+        if latency_models is None or latency_models.market_data is None:
+            return timestamp
+        self._market_data_timestamp = max(self._market_data_timestamp,
+                                          timestamp - self.c_sample_latency(latency_models.market_data))
+        return self._market_data_timestamp
+
+    cdef c_queue_event(self, double arrival_timestamp, object queued_event):
+        # The count breaks ties between events arriving at the same time, in the order they were queued.
+        heapq.heappush(self._pending_events, (arrival_timestamp, self._pending_event_count, queued_event))
+        self._pending_event_count += 1
+
+    cdef c_queue_order(self, object queued_order):
+        cdef:
+            object latency_models = self._config.latency_models
+            double latency
+
+        if latency_models is None:
+            # Without latency models, only market orders are delayed, by a fixed time.
+            latency = self.TRADE_EXECUTION_DELAY if queued_order.order_type is OrderType.MARKET else 0.0
+        else:
+            latency = self.c_sample_latency(latency_models.order_submission)
+        if queued_order.order_type is OrderType.LIMIT:
+            self._pending_limit_orders[queued_order.order_id] = queued_order
+        self.c_queue_event(self._current_timestamp + latency, queued_order)
+
     cdef str c_buy(self,
                    str trading_pair_str,
                    object amount,
@@ -340,49 +477,23 @@ cdef class PaperTradeMarket(MarketBase):
 
         cdef:
             str order_id = self.random_order_id("buy", trading_pair_str)
-            str quote_asset = self._trading_pairs[trading_pair_str].quote_asset
-            string cpp_order_id = order_id.encode("utf8")
-            string cpp_trading_pair_str = trading_pair_str.encode("utf8")
-            string cpp_base_asset = self._trading_pairs[trading_pair_str].base_asset.encode("utf8")
-            string cpp_quote_asset = quote_asset.encode("utf8")
-            LimitOrdersIterator map_it
-            SingleTradingPairLimitOrders *limit_orders_collection_ptr = NULL
-            pair[LimitOrders.iterator, cppbool] insert_result
+            QueuedOrder queued_order
 
         quantized_price = (self.c_quantize_order_price(trading_pair_str, price)
                            if order_type is OrderType.LIMIT
                            else s_decimal_0)
         quantized_amount = self.c_quantize_order_amount(trading_pair_str, amount)
+        queued_order = QueuedOrder(self._current_timestamp, order_id, True, trading_pair_str, quantized_amount,
+                                   order_type, quantized_price)
         if order_type is OrderType.MARKET:
-            self._queued_orders.append(QueuedOrder(self._current_timestamp, order_id, True, trading_pair_str,
-                                                   quantized_amount))
+            self.c_queue_order(queued_order)
         elif order_type is OrderType.LIMIT:
-
-            map_it = self._bid_limit_orders.find(cpp_trading_pair_str)
-
-            if map_it == self._bid_limit_orders.end():
-                insert_result = self._bid_limit_orders.insert(LimitOrdersPair(cpp_trading_pair_str,
-                                                                              SingleTradingPairLimitOrders()))
-                map_it = insert_result.first
-            limit_orders_collection_ptr = address(deref(map_it).second)
-            limit_orders_collection_ptr.insert(CPPLimitOrder(
-                cpp_order_id,
-                cpp_trading_pair_str,
-                True,
-                cpp_base_asset,
-                cpp_quote_asset,
-                <PyObject *> quantized_price,
-                <PyObject *> quantized_amount
-            ))
-        self.c_trigger_event(self.MARKET_BUY_ORDER_CREATED_EVENT_TAG,
-                             BuyOrderCreatedEvent(
-                                 self._current_timestamp,
-                                 order_type,
-                                 trading_pair_str,
-                                 quantized_amount,
-                                 quantized_price,
-                                 order_id
-                             ))
+            if self._config.latency_models is not None:
+                # The order is created once it reaches the exchange.
+                self.c_queue_order(queued_order)
+                return order_id
+            self.c_insert_limit_order(queued_order)
+        self.c_trigger_order_created_event(queued_order)
         return order_id
 
     cdef str c_sell(self,
@@ -396,50 +507,83 @@ cdef class PaperTradeMarket(MarketBase):
             raise ValueError(f"Trading pair '{trading_pair_str}' does not existing in current data set.")
         cdef:
             str order_id = self.random_order_id("sell", trading_pair_str)
-            str base_asset = self._trading_pairs[trading_pair_str].base_asset
-            string cpp_order_id = order_id.encode("utf8")
-            string cpp_trading_pair_str = trading_pair_str.encode("utf8")
-            string cpp_base_asset = base_asset.encode("utf8")
-            string cpp_quote_asset = self._trading_pairs[trading_pair_str].quote_asset.encode("utf8")
-            LimitOrdersIterator map_it
-            SingleTradingPairLimitOrders *limit_orders_collection_ptr = NULL
-            pair[LimitOrders.iterator, cppbool] insert_result
+            QueuedOrder queued_order
 
         quantized_price = (self.c_quantize_order_price(trading_pair_str, price)
                            if order_type is OrderType.LIMIT
                            else s_decimal_0)
         quantized_amount = self.c_quantize_order_amount(trading_pair_str, amount)
+        queued_order = QueuedOrder(self._current_timestamp, order_id, False, trading_pair_str, quantized_amount,
+                                   order_type, quantized_price)
         if order_type is OrderType.MARKET:
-            self._queued_orders.append(QueuedOrder(self._current_timestamp, order_id, False, trading_pair_str,
-                                                   quantized_amount))
+            self.c_queue_order(queued_order)
         elif order_type is OrderType.LIMIT:
-            map_it = self._ask_limit_orders.find(cpp_trading_pair_str)
-
-            if map_it == self._ask_limit_orders.end():
-                insert_result = self._ask_limit_orders.insert(LimitOrdersPair(cpp_trading_pair_str,
-                                                                              SingleTradingPairLimitOrders()))
-                map_it = insert_result.first
-            limit_orders_collection_ptr = address(deref(map_it).second)
-            limit_orders_collection_ptr.insert(CPPLimitOrder(
-                cpp_order_id,
-                cpp_trading_pair_str,
-                False,
-                cpp_base_asset,
-                cpp_quote_asset,
-                <PyObject *> quantized_price,
-                <PyObject *> quantized_amount
-            ))
-        self.c_trigger_event(self.MARKET_SELL_ORDER_CREATED_EVENT_TAG,
-                             SellOrderCreatedEvent(
-                                 self._current_timestamp,
-                                 order_type,
-                                 trading_pair_str,
-                                 quantized_amount,
-                                 quantized_price,
-                                 order_id
-                             ))
+            if self._config.latency_models is not None:
+                # The order is created once it reaches the exchange.
+                self.c_queue_order(queued_order)
+                return order_id
+            self.c_insert_limit_order(queued_order)
+        self.c_trigger_order_created_event(queued_order)
         return order_id
 
+    cdef c_insert_limit_order(self, object queued_order):
+        cdef:
+            str trading_pair_str = queued_order.trading_pair
+            object trading_pair = self._trading_pairs[trading_pair_str]
+            bint is_buy = queued_order.is_buy
+            object price = queued_order.price
+            object amount = queued_order.amount
+            string cpp_trading_pair_str = trading_pair_str.encode("utf8")
+            LimitOrders *limit_orders_map_ptr = (address(self._bid_limit_orders)
+                                                 if is_buy
+                                                 else address(self._ask_limit_orders))
+            LimitOrdersIterator map_it
+            SingleTradingPairLimitOrders *limit_orders_collection_ptr = NULL
+            pair[LimitOrders.iterator, cppbool] insert_result
+            pair[SingleTradingPairLimitOrders.iterator, cppbool] order_insert_result
+
+        map_it = limit_orders_map_ptr.find(cpp_trading_pair_str)
+        if map_it == limit_orders_map_ptr.end():
+            insert_result = limit_orders_map_ptr.insert(LimitOrdersPair(cpp_trading_pair_str,
+                                                                        SingleTradingPairLimitOrders()))
+            map_it = insert_result.first
+        limit_orders_collection_ptr = address(deref(map_it).second)
+        order_insert_result = limit_orders_collection_ptr.insert(CPPLimitOrder(
+            queued_order.order_id.encode("utf8"),
+            cpp_trading_pair_str,
+            is_buy,
+            trading_pair.base_asset.encode("utf8"),
+            trading_pair.quote_asset.encode("utf8"),
+            <PyObject *> price,
+            <PyObject *> amount
+        ))
+        if self._config.queue_position_matching:
+            # The new order queues up behind the volume already resting at its price.
+            deref(order_insert_result.first).setQueueAhead(
+                self.c_get_order_book(trading_pair_str).c_get_level_volume(is_buy, float(price)))
+
+    cdef c_trigger_order_created_event(self, object queued_order):
+        if queued_order.is_buy:
+            self.c_trigger_event(self.MARKET_BUY_ORDER_CREATED_EVENT_TAG,
+                                 BuyOrderCreatedEvent(
+                                     self._current_timestamp,
+                                     queued_order.order_type,
+                                     queued_order.trading_pair,
+                                     queued_order.amount,
+                                     queued_order.price,
+                                     queued_order.order_id
+                                 ))
+        else:
+            self.c_trigger_event(self.MARKET_SELL_ORDER_CREATED_EVENT_TAG,
+                                 SellOrderCreatedEvent(
+                                     self._current_timestamp,
+                                     queued_order.order_type,
+                                     queued_order.trading_pair,
+                                     queued_order.amount,
+                                     queued_order.price,
+                                     queued_order.order_id
+                                 ))
+
     cdef c_execute_buy(self, str order_id, str trading_pair, object amount):
         cdef:
             str quote_asset = self._trading_pairs[trading_pair].quote_asset
@@ -447,31 +591,35 @@ cdef class PaperTradeMarket(MarketBase):
             object quote_balance = self.c_get_balance(quote_asset)
             object base_balance = self.c_get_balance(base_asset)
 
-        config = self._config
         order_book = self.order_books[trading_pair]
         buy_entries = order_book.simulate_buy(amount)
-        # Calculate the quote currency needed, including fees.
-        total_quote_needed = Decimal(sum(row.price * row.amount for row in buy_entries))
+        total_quote_traded = Decimal(sum(row.price * row.amount for row in buy_entries))
+        trade_fee = self.c_get_fee(base_asset, quote_asset, OrderType.MARKET, TradeType.BUY, amount,
+                                   total_quote_traded / amount if amount > s_decimal_0 else s_decimal_NaN)
+        # Calculate the base currency acquired, including fees.
+        total_base_acquired = Decimal(sum(row.amount for row in buy_entries))
 
-        if total_quote_needed > quote_balance:
-            self.logger().warning(f"Insufficient {quote_asset} balance available for buy order. "
-                                  f"{quote_balance} {quote_asset} available vs. "
-                                  f"{total_quote_needed} {quote_asset} required for the order.")
+        # Check the balances needed, including fees.
+        insufficient_balance = self.c_get_insufficient_balance(base_asset, quote_asset, True, total_base_acquired,
+                                                               total_quote_traded, trade_fee)
+        if insufficient_balance is not None:
+            asset, required_amount, balance = insufficient_balance
+            self.logger().warning(f"Insufficient {asset} balance available for buy order. "
+                                  f"{balance} {asset} available vs. "
+                                  f"{required_amount} {asset} required for the order.")
             self.c_trigger_event(
                 self.MARKET_ORDER_FAILURE_EVENT_TAG,
                 MarketOrderFailureEvent(self._current_timestamp, order_id, OrderType.MARKET)
             )
             return
 
-        # Calculate the base currency acquired, including fees.
-        total_base_acquired = Decimal(sum(row.amount for row in buy_entries))
-
-        self.c_set_balance(quote_asset, quote_balance - total_quote_needed)
+        self.c_set_balance(quote_asset, quote_balance - total_quote_traded)
         self.c_set_balance(base_asset, base_balance + total_base_acquired)
+        fee_paid = self.c_charge_trade_fee(quote_asset, trade_fee, total_quote_traded)
 
         order_filled_events = OrderFilledEvent.order_filled_events_from_order_book_rows(
             self._current_timestamp, order_id, trading_pair, TradeType.BUY, OrderType.MARKET,
-            TradeFee(s_decimal_0), buy_entries
+            trade_fee, buy_entries
         )
 
         for order_filled_event in order_filled_events:
@@ -483,10 +631,10 @@ cdef class PaperTradeMarket(MarketBase):
                                    order_id,
                                    base_asset,
                                    quote_asset,
-                                   base_asset if config.buy_fees_asset is AssetType.BASE_CURRENCY else quote_asset,
+                                   quote_asset,
                                    total_base_acquired,
-                                   total_quote_needed,
-                                   s_decimal_0,
+                                   total_quote_traded,
+                                   fee_paid,
                                    OrderType.MARKET))
 
     cdef c_execute_sell(self, str order_id, str trading_pair_str, object amount):
@@ -499,16 +647,6 @@ cdef class PaperTradeMarket(MarketBase):
         base_asset = self._trading_pairs[trading_pair_str].base_asset
         base_asset_amount = self.c_get_balance(base_asset)
 
-        if amount > base_asset_amount:
-            self.logger().warning(f"Insufficient {base_asset} balance available for sell order. "
-                                  f"{base_asset_amount} {base_asset} available vs. "
-                                  f"{amount} {base_asset} required for the order.")
-            self.c_trigger_event(
-                self.MARKET_ORDER_FAILURE_EVENT_TAG,
-                MarketOrderFailureEvent(self._current_timestamp, order_id, OrderType.MARKET)
-            )
-            return
-
         order_book = self.order_books[trading_pair_str]
 
         # Calculate the base currency used, including fees.
@@ -520,15 +658,32 @@ cdef class PaperTradeMarket(MarketBase):
 
         # Calculate the quote currency acquired, including fees.
         acquired_amount = Decimal(sum(row.price * row.amount for row in sell_entries))
+        trade_fee = self.c_get_fee(base_asset, quote_asset, OrderType.MARKET, TradeType.SELL, sold_amount,
+                                   acquired_amount / sold_amount if sold_amount > s_decimal_0 else s_decimal_NaN)
+
+        # Check the balances needed, including fees.
+        insufficient_balance = self.c_get_insufficient_balance(base_asset, quote_asset, False, amount,
+                                                               acquired_amount, trade_fee)
+        if insufficient_balance is not None:
+            asset, required_amount, balance = insufficient_balance
+            self.logger().warning(f"Insufficient {asset} balance available for sell order. "
+                                  f"{balance} {asset} available vs. "
+                                  f"{required_amount} {asset} required for the order.")
+            self.c_trigger_event(
+                self.MARKET_ORDER_FAILURE_EVENT_TAG,
+                MarketOrderFailureEvent(self._current_timestamp, order_id, OrderType.MARKET)
+            )
+            return
 
         self.c_set_balance(quote_asset,
                            quote_asset_amount + acquired_amount)
         self.c_set_balance(base_asset,
                            base_asset_amount - amount)
+        fee_paid = self.c_charge_trade_fee(quote_asset, trade_fee, acquired_amount)
 
         order_filled_events = OrderFilledEvent.order_filled_events_from_order_book_rows(
             self._current_timestamp, order_id, trading_pair_str, TradeType.SELL,
-            OrderType.MARKET, TradeFee(s_decimal_0), sell_entries
+            OrderType.MARKET, trade_fee, sell_entries
         )
 
         for order_filled_event in order_filled_events:
@@ -540,28 +695,81 @@ cdef class PaperTradeMarket(MarketBase):
                                     order_id,
                                     base_asset,
                                     quote_asset,
-                                    base_asset if config.sell_fees_asset is AssetType.BASE_CURRENCY else quote_asset,
+                                    quote_asset,
                                     sold_amount,
                                     acquired_amount,
-                                    fee_amount,
+                                    fee_paid,
                                     OrderType.MARKET))
 
-    cdef c_process_market_orders(self):
+    cdef c_process_pending_events(self):
+        """
+        Carries out the orders and cancellations that have reached the simulated exchange, in the order they arrived.
+        """
         cdef:
-            QueuedOrder front_order = None
-        while len(self._queued_orders) > 0:
-            front_order = self._queued_orders[0]
-            if front_order.create_timestamp <= self._current_timestamp - self.TRADE_EXECUTION_DELAY:
-                self._queued_orders.popleft()
-                try:
-                    if front_order.is_buy:
-                        self.c_execute_buy(front_order.order_id, front_order.trading_pair, front_order.amount)
-                    else:
-                        self.c_execute_sell(front_order.order_id, front_order.trading_pair, front_order.amount)
-                except Exception as e:
-                    self.logger().error("Error executing queued order.", exc_info=True)
-            else:
-                return
+            object queued_event
+            QueuedOrder queued_order
+        while len(self._pending_events) > 0 and self._pending_events[0][0] <= self._current_timestamp:
+            queued_event = heapq.heappop(self._pending_events)[2]
+            try:
+                if isinstance(queued_event, QueuedCancel):
+                    self.c_execute_cancel(queued_event.trading_pair, queued_event.order_id)
+                    continue
+                queued_order = queued_event
+                if queued_order.order_type is OrderType.LIMIT:
+                    # Limit orders cancelled before they arrived are dropped.
+                    if self._pending_limit_orders.pop(queued_order.order_id, None) is not None:
+                        self.c_insert_limit_order(queued_order)
+                        self.c_trigger_order_created_event(queued_order)
+                elif queued_order.is_buy:
+                    self.c_execute_buy(queued_order.order_id, queued_order.trading_pair, queued_order.amount)
+                else:
+                    self.c_execute_sell(queued_order.order_id, queued_order.trading_pair, queued_order.amount)
+            except Exception as e:
+                self.logger().error("Error executing queued order.", exc_info=True)
+
+    cdef object c_charge_trade_fee(self, str quote_asset, object trade_fee, object quote_volume):
+        """
+        Deducts the fee of a trade from the balances, the percentage fee in the quote asset and the flat fees in their
+        own assets.
+
+        :return: The fee charged in the quote asset, which the order completed events report. Flat fees in other assets
+                 are only in the order filled events.
+        """
+        cdef:
+            object fee_paid = quote_volume * trade_fee.percent
+        if fee_paid != s_decimal_0:
+            self.c_set_balance(quote_asset, self.c_get_balance(quote_asset) - fee_paid)
+        for asset, amount in trade_fee.flat_fees:
+            self.c_set_balance(asset, self.c_get_balance(asset) - amount)
+            if asset.upper() == quote_asset.upper():
+                fee_paid += amount
+        return fee_paid
+
+    cdef object c_get_insufficient_balance(self,
+                                           str base_asset,
+                                           str quote_asset,
+                                           bint is_buy,
+                                           object base_amount,
+                                           object quote_volume,
+                                           object trade_fee):
+        """
+        Checks that the balances cover a trade and the fees charged on it. The assets acquired by the trade count
+        towards paying its fees.
+
+        :return: (asset, amount required, balance) of an asset without enough balance, or None if there's enough of all
+                 of them
+        """
+        cdef:
+            dict balance_changes = {
+                base_asset.upper(): base_amount if is_buy else -base_amount,
+                quote_asset.upper(): (-quote_volume if is_buy else quote_volume) - quote_volume * trade_fee.percent
+            }
+        for asset, amount in trade_fee.flat_fees:
+            balance_changes[asset.upper()] = balance_changes.get(asset.upper(), s_decimal_0) - amount
+        for asset, balance_change in balance_changes.items():
+            if balance_change < s_decimal_0 and self.c_get_balance(asset) < -balance_change:
+                return asset, -balance_change, self.c_get_balance(asset)
+        return None
 
     cdef c_delete_limit_order(self,
                               LimitOrders *limit_orders_map_ptr,
@@ -570,6 +778,7 @@ cdef class PaperTradeMarket(MarketBase):
         cdef:
             SingleTradingPairLimitOrders *orders_collection_ptr = address(deref(deref(map_it_ptr)).second)
         try:
+            self._limit_order_fees_paid.pop(deref(orders_it).getClientOrderID().decode("utf8"), None)
             orders_collection_ptr.erase(orders_it)
             if orders_collection_ptr.empty():
                 map_it_ptr[0] = limit_orders_map_ptr.erase(deref(map_it_ptr))
@@ -581,23 +790,35 @@ cdef class PaperTradeMarket(MarketBase):
     cdef c_process_limit_bid_order(self,
                                    LimitOrders *limit_orders_map_ptr,
                                    LimitOrdersIterator *map_it_ptr,
-                                   SingleTradingPairLimitOrdersIterator orders_it):
+                                   SingleTradingPairLimitOrdersIterator orders_it,
+                                   object fill_amount=None):
         cdef:
             const CPPLimitOrder *cpp_limit_order_ptr = address(deref(orders_it))
             str trading_pair = cpp_limit_order_ptr.getTradingPair().decode("utf8")
             str quote_asset = cpp_limit_order_ptr.getQuoteCurrency().decode("utf8")
             str base_asset = cpp_limit_order_ptr.getBaseCurrency().decode("utf8")
             str order_id = cpp_limit_order_ptr.getClientOrderID().decode("utf8")
-            object quote_asset_balance = self.c_get_balance(quote_asset)
-            object quote_asset_traded = <object> cpp_limit_order_ptr.getPrice() * \
-                                        <object> cpp_limit_order_ptr.getQuantity()
-            object base_asset_traded = <object> cpp_limit_order_ptr.getQuantity()
-
-        # Check if there's enough balance to satisfy the order. If not, remove the limit order without doing anything.
-        if quote_asset_balance < quote_asset_traded:
-            self.logger().warning(f"Not enough {quote_asset} balance to fill limit buy order on {trading_pair}. "
-                                  f"{quote_asset_traded:.8g} {quote_asset} needed vs. "
-                                  f"{quote_asset_balance:.8g} {quote_asset} available.")
+            object order_price = <object> cpp_limit_order_ptr.getPrice()
+            object order_quantity = <object> cpp_limit_order_ptr.getQuantity()
+            object filled_quantity = c_get_filled_quantity(cpp_limit_order_ptr)
+            object base_asset_traded = order_quantity - filled_quantity
+            object quote_asset_traded
+
+        if fill_amount is not None and fill_amount < base_asset_traded:
+            base_asset_traded = fill_amount
+        quote_asset_traded = order_price * base_asset_traded
+        trade_fee = self.c_get_fee(base_asset, quote_asset, OrderType.LIMIT, TradeType.BUY, base_asset_traded,
+                                   order_price)
+
+        # Check if there's enough balance to satisfy the order, including fees. If not, remove the limit order without
+        # doing anything.
+        insufficient_balance = self.c_get_insufficient_balance(base_asset, quote_asset, True, base_asset_traded,
+                                                               quote_asset_traded, trade_fee)
+        if insufficient_balance is not None:
+            asset, required_amount, balance = insufficient_balance
+            self.logger().warning(f"Not enough {asset} balance to fill limit buy order on {trading_pair}. "
+                                  f"{required_amount:.8g} {asset} needed vs. "
+                                  f"{balance:.8g} {asset} available.")
 
             self.c_delete_limit_order(limit_orders_map_ptr, map_it_ptr, orders_it)
             return
@@ -605,9 +826,10 @@ cdef class PaperTradeMarket(MarketBase):
         # Adjust the market balances according to the trade done.
         self.c_set_balance(quote_asset, self.c_get_balance(quote_asset) - quote_asset_traded)
         self.c_set_balance(base_asset, self.c_get_balance(base_asset) + base_asset_traded)
+        fee_paid = (self._limit_order_fees_paid.get(order_id, s_decimal_0) +
+                    self.c_charge_trade_fee(quote_asset, trade_fee, quote_asset_traded))
 
-        # Emit the trade and order completed events.
-        config = self._config
+        # Emit the trade event, and the order completed event once the whole order is filled.
         self.c_trigger_event(
             self.ORDER_FILLED_EVENT_TAG,
             OrderFilledEvent(
@@ -616,11 +838,17 @@ cdef class PaperTradeMarket(MarketBase):
                 trading_pair,
                 TradeType.BUY,
                 OrderType.LIMIT,
-                <object> cpp_limit_order_ptr.getPrice(),
-                <object> cpp_limit_order_ptr.getQuantity(),
-                TradeFee(s_decimal_0)
+                order_price,
+                base_asset_traded,
+                trade_fee
             ))
 
+        filled_quantity += base_asset_traded
+        if filled_quantity < order_quantity:
+            cpp_limit_order_ptr.setFilledQuantity(<PyObject *> filled_quantity)
+            self._limit_order_fees_paid[order_id] = fee_paid
+            return
+
         self.c_trigger_event(
             self.BUY_ORDER_COMPLETED_EVENT_TAG,
             BuyOrderCompletedEvent(
@@ -628,10 +856,10 @@ cdef class PaperTradeMarket(MarketBase):
                 order_id,
                 base_asset,
                 quote_asset,
-                base_asset if config.buy_fees_asset is AssetType.BASE_CURRENCY else quote_asset,
-                base_asset_traded,
-                quote_asset_traded,
-                s_decimal_0,
+                quote_asset,
+                order_quantity,
+                order_price * order_quantity,
+                fee_paid,
                 OrderType.LIMIT
             ))
         self.c_delete_limit_order(limit_orders_map_ptr, map_it_ptr, orders_it)
@@ -639,32 +867,45 @@ cdef class PaperTradeMarket(MarketBase):
     cdef c_process_limit_ask_order(self,
                                    LimitOrders *limit_orders_map_ptr,
                                    LimitOrdersIterator *map_it_ptr,
-                                   SingleTradingPairLimitOrdersIterator orders_it):
+                                   SingleTradingPairLimitOrdersIterator orders_it,
+                                   object fill_amount=None):
         cdef:
             const CPPLimitOrder *cpp_limit_order_ptr = address(deref(orders_it))
             str trading_pair_str = cpp_limit_order_ptr.getTradingPair().decode("utf8")
             str quote_asset = cpp_limit_order_ptr.getQuoteCurrency().decode("utf8")
             str base_asset = cpp_limit_order_ptr.getBaseCurrency().decode("utf8")
             str order_id = cpp_limit_order_ptr.getClientOrderID().decode("utf8")
-            object base_asset_balance = self.c_get_balance(base_asset)
-            object quote_asset_traded = <object> cpp_limit_order_ptr.getPrice() * \
-                                        <object> cpp_limit_order_ptr.getQuantity()
-            object base_asset_traded = <object> cpp_limit_order_ptr.getQuantity()
-
-        # Check if there's enough balance to satisfy the order. If not, remove the limit order without doing anything.
-        if base_asset_balance < base_asset_traded:
-            self.logger().warning(f"Not enough {base_asset} balance to fill limit sell order on {trading_pair_str}. "
-                                  f"{base_asset_traded:.8g} {base_asset} needed vs. "
-                                  f"{base_asset_balance:.8g} {base_asset} available.")
+            object order_price = <object> cpp_limit_order_ptr.getPrice()
+            object order_quantity = <object> cpp_limit_order_ptr.getQuantity()
+            object filled_quantity = c_get_filled_quantity(cpp_limit_order_ptr)
+            object base_asset_traded = order_quantity - filled_quantity
+            object quote_asset_traded
+
+        if fill_amount is not None and fill_amount < base_asset_traded:
+            base_asset_traded = fill_amount
+        quote_asset_traded = order_price * base_asset_traded
+        trade_fee = self.c_get_fee(base_asset, quote_asset, OrderType.LIMIT, TradeType.SELL, base_asset_traded,
+                                   order_price)
+
+        # Check if there's enough balance to satisfy the order, including fees. If not, remove the limit order without
+        # doing anything.
+        insufficient_balance = self.c_get_insufficient_balance(base_asset, quote_asset, False, base_asset_traded,
+                                                               quote_asset_traded, trade_fee)
+        if insufficient_balance is not None:
+            asset, required_amount, balance = insufficient_balance
+            self.logger().warning(f"Not enough {asset} balance to fill limit sell order on {trading_pair_str}. "
+                                  f"{required_amount:.8g} {asset} needed vs. "
+                                  f"{balance:.8g} {asset} available.")
             self.c_delete_limit_order(limit_orders_map_ptr, map_it_ptr, orders_it)
             return
 
         # Adjust the market balances according to the trade done.
         self.c_set_balance(quote_asset, self.c_get_balance(quote_asset) + quote_asset_traded)
         self.c_set_balance(base_asset, self.c_get_balance(base_asset) - base_asset_traded)
+        fee_paid = (self._limit_order_fees_paid.get(order_id, s_decimal_0) +
+                    self.c_charge_trade_fee(quote_asset, trade_fee, quote_asset_traded))
 
-        # Emit the trade and order completed events.
-        config = self._config
+        # Emit the trade event, and the order completed event once the whole order is filled.
         self.c_trigger_event(
             self.ORDER_FILLED_EVENT_TAG,
             OrderFilledEvent(
@@ -673,11 +914,17 @@ cdef class PaperTradeMarket(MarketBase):
                 trading_pair_str,
                 TradeType.SELL,
                 OrderType.LIMIT,
-                <object> cpp_limit_order_ptr.getPrice(),
-                <object> cpp_limit_order_ptr.getQuantity(),
-                TradeFee(s_decimal_0)
+                order_price,
+                base_asset_traded,
+                trade_fee
             ))
 
+        filled_quantity += base_asset_traded
+        if filled_quantity < order_quantity:
+            cpp_limit_order_ptr.setFilledQuantity(<PyObject *> filled_quantity)
+            self._limit_order_fees_paid[order_id] = fee_paid
+            return
+
         self.c_trigger_event(
             self.SELL_ORDER_COMPLETED_EVENT_TAG,
             SellOrderCompletedEvent(
@@ -685,10 +932,10 @@ cdef class PaperTradeMarket(MarketBase):
                 order_id,
                 base_asset,
                 quote_asset,
-                base_asset if config.sell_fees_asset is AssetType.BASE_CURRENCY else quote_asset,
-                base_asset_traded,
-                quote_asset_traded,
-                s_decimal_0,
+                quote_asset,
+                order_quantity,
+                order_price * order_quantity,
+                fee_paid,
                 OrderType.LIMIT
             ))
         self.c_delete_limit_order(limit_orders_map_ptr, map_it_ptr, orders_it)
@@ -697,12 +944,16 @@ cdef class PaperTradeMarket(MarketBase):
                                bint is_buy,
                                LimitOrders *limit_orders_map_ptr,
                                LimitOrdersIterator *map_it_ptr,
-                               SingleTradingPairLimitOrdersIterator orders_it):
+                               SingleTradingPairLimitOrdersIterator orders_it,
+                               object fill_amount=None):
+        """
+        Fills a limit order, or part of it if fill_amount is less than its unfilled quantity.
+        """
         try:
             if is_buy:
-                self.c_process_limit_bid_order(limit_orders_map_ptr, map_it_ptr, orders_it)
+                self.c_process_limit_bid_order(limit_orders_map_ptr, map_it_ptr, orders_it, fill_amount)
             else:
-                self.c_process_limit_ask_order(limit_orders_map_ptr, map_it_ptr, orders_it)
+                self.c_process_limit_ask_order(limit_orders_map_ptr, map_it_ptr, orders_it, fill_amount)
         except Exception as e:
             self.logger().error(f"Error processing limit order.", exc_info=True)
 
@@ -726,6 +977,9 @@ cdef class PaperTradeMarket(MarketBase):
             SingleTradingPairLimitOrdersRIterator orders_rit = orders_collection_ptr.rbegin()
             vector[SingleTradingPairLimitOrdersIterator] process_order_its
             const CPPLimitOrder *cpp_limit_order_ptr = NULL
+            OrderBook order_book
+            list fill_amounts = []
+            size_t i
 
         if is_buy:
             while orders_rit != orders_collection_ptr.rend():
@@ -743,8 +997,98 @@ cdef class PaperTradeMarket(MarketBase):
                 process_order_its.push_back(orders_it)
                 inc(orders_it)
 
+        if not self._config.queue_position_matching:
+            for orders_it in process_order_its:
+                self.c_process_limit_order(is_buy, limit_orders_map_ptr, map_it_ptr, orders_it)
+            return
+
+        # The crossed orders would be at the front of their queue. They're filled, in price priority, by the volume on
+        # the opposite side of the order book at their price or better. The volume they fill is recorded in the
+        # composite order book, so it isn't available to fill them again on the next tick.
+        order_book = self.c_get_order_book(trading_pair)
         for orders_it in process_order_its:
-            self.c_process_limit_order(is_buy, limit_orders_map_ptr, map_it_ptr, orders_it)
+            cpp_limit_order_ptr = address(deref(orders_it))
+            cpp_limit_order_ptr.setQueueAhead(0)
+            fill_amount = self.c_get_limit_order_fill_amount(
+                trading_pair,
+                cpp_limit_order_ptr,
+                order_book.c_walk_price(is_buy, cpp_limit_order_ptr.getPriceValue()).base_volume
+            )
+            if fill_amount > s_decimal_0:
+                self.c_record_crossed_fill(order_book, is_buy, cpp_limit_order_ptr.getPriceValue(), float(fill_amount))
+            fill_amounts.append(fill_amount)
+        for i in range(process_order_its.size()):
+            if fill_amounts[i] > s_decimal_0:
+                self.c_process_limit_order(is_buy, limit_orders_map_ptr, map_it_ptr, process_order_its[i],
+                                           fill_amounts[i])
+
+    cdef c_record_crossed_fill(self, OrderBook order_book, bint is_buy, double price, double amount):
+        """
+        Records a crossed limit order fill against the opposite side of a composite order book, level by level from
+        the best price up to the limit price.
+        """
+        cdef:
+            CompositeOrderBook composite_order_book
+            vector[OrderBookEntry] entries
+            double level_amount
+
+        if not isinstance(order_book, CompositeOrderBook):
+            return
+        composite_order_book = <CompositeOrderBook>order_book
+        entries = composite_order_book.c_get_depth_entries(is_buy)
+        for entry in entries:
+            if amount <= 0 or (is_buy and entry.getPrice() > price) or (not is_buy and entry.getPrice() < price):
+                break
+            level_amount = min(amount, entry.getAmount())
+            composite_order_book.c_record_fill(is_buy, entry.getPrice(), level_amount, <int64_t>self._current_timestamp)
+            amount -= level_amount
+
+    cdef object c_get_limit_order_fill_amount(self,
+                                              str trading_pair,
+                                              const CPPLimitOrder *cpp_limit_order_ptr,
+                                              double available_volume):
+        """
+        :returns: Amount of a limit order that can be filled with the available volume, up to its unfilled quantity
+        """
+        cdef:
+            object unfilled_quantity = (<object> cpp_limit_order_ptr.getQuantity() -
+                                        c_get_filled_quantity(cpp_limit_order_ptr))
+        if available_volume <= self.MIN_FILL_VOLUME:
+            return s_decimal_0
+        return min(unfilled_quantity, self.c_quantize_order_amount(trading_pair, Decimal(available_volume)))
+
+    cdef c_update_queue_positions(self, str trading_pair):
+        """
+        Updates the estimated queue positions of the limit orders of a trading pair from the volume resting at their
+        price levels, after an order book update.
+        """
+        cdef:
+            string cpp_trading_pair = trading_pair.encode("utf8")
+            OrderBook order_book = self.c_get_order_book(trading_pair)
+            LimitOrdersIterator map_it
+            SingleTradingPairLimitOrders *orders_collection_ptr
+            SingleTradingPairLimitOrdersIterator orders_it
+            const CPPLimitOrder *cpp_limit_order_ptr
+
+        map_it = self._bid_limit_orders.find(cpp_trading_pair)
+        if map_it != self._bid_limit_orders.end():
+            orders_collection_ptr = address(deref(map_it).second)
+            orders_it = orders_collection_ptr.begin()
+            while orders_it != orders_collection_ptr.end():
+                cpp_limit_order_ptr = address(deref(orders_it))
+                cpp_limit_order_ptr.updateQueueAhead(
+                    order_book.c_get_level_volume(True, cpp_limit_order_ptr.getPriceValue()))
+                inc(orders_it)
+
+        map_it = self._ask_limit_orders.find(cpp_trading_pair)
+        if map_it != self._ask_limit_orders.end():
+            orders_collection_ptr = address(deref(map_it).second)
+            orders_it = orders_collection_ptr.begin()
+            while orders_it != orders_collection_ptr.end():
+                cpp_limit_order_ptr = address(deref(orders_it))
+                cpp_limit_order_ptr.updateQueueAhead(
+                    order_book.c_get_level_volume(False, cpp_limit_order_ptr.getPriceValue()))
+                inc(orders_it)
 
     cdef c_process_crossed_limit_orders(self):
         cdef:
@@ -790,6 +1134,11 @@ cdef class PaperTradeMarket(MarketBase):
             return
 
         orders_collection_ptr = address(deref(map_it).second)
+        if self._config.queue_position_matching:
+            self.c_match_trade_to_queued_limit_orders(order_book_trade_event, is_maker_buy, limit_orders_map_ptr,
+                                                      address(map_it))
+            return
+
         if is_maker_buy:
             orders_rit = orders_collection_ptr.rbegin()
             while orders_rit != orders_collection_ptr.rend():
@@ -811,6 +1160,61 @@ cdef class PaperTradeMarket(MarketBase):
         for orders_it in process_order_its:
             self.c_process_limit_order(is_maker_buy, limit_orders_map_ptr, address(map_it), orders_it)
 
+    cdef c_match_trade_to_queued_limit_orders(self,
+                                              object order_book_trade_event,
+                                              bint is_maker_buy,
+                                              LimitOrders *limit_orders_map_ptr,
+                                              LimitOrdersIterator *map_it_ptr):
+        """
+        Fills the limit orders at or better than a trade's price, in price priority, with the trade's volume. At each
+        order, the traded volume goes to the volume queued ahead of the order first, and then to the order itself.
+
+        :param is_maker_buy: are the limit orders on the bid side?
+        """
+        cdef:
+            str trading_pair = order_book_trade_event.trading_pair
+            double trade_price = order_book_trade_event.price
+            double traded_volume = order_book_trade_event.amount
+            SingleTradingPairLimitOrders *orders_collection_ptr = address(deref(deref(map_it_ptr)).second)
+            SingleTradingPairLimitOrdersIterator orders_it
+            SingleTradingPairLimitOrdersRIterator orders_rit
+            vector[SingleTradingPairLimitOrdersIterator] process_order_its
+            const CPPLimitOrder *cpp_limit_order_ptr = NULL
+            list fill_amounts = []
+            size_t i
+
+        if is_maker_buy:
+            orders_rit = orders_collection_ptr.rbegin()
+            while orders_rit != orders_collection_ptr.rend() and traded_volume > self.MIN_FILL_VOLUME:
+                cpp_limit_order_ptr = address(deref(orders_rit))
+                if cpp_limit_order_ptr.getPriceValue() < trade_price:
+                    break
+                traded_volume = cpp_limit_order_ptr.consumeTradedVolume(traded_volume)
+                fill_amount = self.c_get_limit_order_fill_amount(trading_pair, cpp_limit_order_ptr, traded_volume)
+                if fill_amount > s_decimal_0:
+                    traded_volume -= float(fill_amount)
+                    process_order_its.push_back(getIteratorFromReverseIterator(
+                        <reverse_iterator[SingleTradingPairLimitOrdersIterator]>orders_rit))
+                    fill_amounts.append(fill_amount)
+                inc(orders_rit)
+        else:
+            orders_it = orders_collection_ptr.begin()
+            while orders_it != orders_collection_ptr.end() and traded_volume > self.MIN_FILL_VOLUME:
+                cpp_limit_order_ptr = address(deref(orders_it))
+                if cpp_limit_order_ptr.getPriceValue() > trade_price:
+                    break
+                traded_volume = cpp_limit_order_ptr.consumeTradedVolume(traded_volume)
+                fill_amount = self.c_get_limit_order_fill_amount(trading_pair, cpp_limit_order_ptr, traded_volume)
+                if fill_amount > s_decimal_0:
+                    traded_volume -= float(fill_amount)
+                    process_order_its.push_back(orders_it)
+                    fill_amounts.append(fill_amount)
+                inc(orders_it)
+
+        for i in range(process_order_its.size()):
+            self.c_process_limit_order(is_maker_buy, limit_orders_map_ptr, map_it_ptr, process_order_its[i],
+                                       fill_amounts[i])
+
     # </editor-fold>
 
     cdef object c_get_available_balance(self, str currency):
@@ -823,6 +1227,12 @@ cdef class PaperTradeMarket(MarketBase):
         cdef:
             LimitOrders *limit_orders_map_ptr
             list cancellation_results = []
+        # Orders still on their way to the exchange are cancelled too.
+        for order_id in list(self._pending_limit_orders.keys()):
+            del self._pending_limit_orders[order_id]
+            cancellation_results.append(CancellationResult(order_id, True))
+            self.c_trigger_event(self.MARKET_ORDER_CANCELLED_EVENT_TAG,
+                                 OrderCancelledEvent(self._current_timestamp, order_id))
         limit_orders_map_ptr = address(self._bid_limit_orders)
         for trading_pair_str in self._trading_pairs.keys():
             results = self.c_cancel_order_from_orders_map(limit_orders_map_ptr, trading_pair_str, cancel_all=True)
@@ -877,14 +1287,28 @@ cdef class PaperTradeMarket(MarketBase):
 
     cdef c_cancel(self, str trading_pair_str, str client_order_id):
         cdef:
-            string cpp_trading_pair = trading_pair_str.encode("utf8")
-            string cpp_client_order_id = client_order_id.encode("utf8")
+            object latency_models = self._config.latency_models
+            double latency
+        if latency_models is not None:
+            latency = self.c_sample_latency(latency_models.order_cancellation)
+            if latency > 0:
+                self.c_queue_event(self._current_timestamp + latency,
+                                   QueuedCancel(self._current_timestamp, client_order_id, trading_pair_str))
+                return
+        self.c_execute_cancel(trading_pair_str, client_order_id)
+
+    cdef c_execute_cancel(self, str trading_pair_str, str client_order_id):
+        cdef:
             str trade_type = client_order_id.split("://")[0]
             bint is_maker_buy = trade_type.upper() == "BUY"
             LimitOrders *limit_orders_map_ptr = (address(self._bid_limit_orders)
                                                  if is_maker_buy
                                                  else address(self._ask_limit_orders))
-        self.c_cancel_order_from_orders_map(limit_orders_map_ptr, trading_pair_str, client_order_id)
+        if self._pending_limit_orders.pop(client_order_id, None) is not None:
+            self.c_trigger_event(self.MARKET_ORDER_CANCELLED_EVENT_TAG,
+                                 OrderCancelledEvent(self._current_timestamp, client_order_id))
+            return
+        self.c_cancel_order_from_orders_map(limit_orders_map_ptr, trading_pair_str, False, client_order_id)
 
     cdef object c_get_fee(self,
                           str base_asset,
@@ -893,7 +1317,9 @@ cdef class PaperTradeMarket(MarketBase):
                           object order_side,
                           object amount,
                           object price):
-        return TradeFee(Decimal(0))
+        if self._config.fee_model is None:
+            return TradeFee(s_decimal_0)
+        return self._config.fee_model.get_fee(base_asset, quote_asset, order_type, order_side, amount, price)
 
     cdef OrderBook c_get_order_book(self, str trading_pair):
         if trading_pair not in self._trading_pairs:
@@ -937,6 +1363,40 @@ cdef class PaperTradeMarket(MarketBase):
         price_quantum = self.c_get_order_price_quantum(trading_pair, price)
         return (price // price_quantum) * price_quantum
 
+    cdef list c_quantize_order_prices(self,
+                                      str trading_pair,
+                                      object prices):
+        # Paper trade prices are rounded to significant digits first, so each level goes through c_quantize_order_price()
+        return [self.c_quantize_order_price(trading_pair, Decimal(str(price))) for price in prices]
+
+    cdef FixedPoint c_quantize_fixed_point_price(self,
+                                                 str trading_pair,
+                                                 double price):
+        # Paper trade prices are rounded to significant digits first, so this goes through c_quantize_order_price()
+        cdef:
+            object quantized_price
+        if not math.isfinite(price):
+            return None
+        quantized_price = self.c_quantize_order_price(trading_pair, Decimal(price))
+        return c_fixed_point_from_decimal(
+            quantized_price,
+            c_get_scale_for_quantum(self.c_get_order_price_quantum(trading_pair, quantized_price))
+        )
+
+    cdef FixedPoint c_quantize_fixed_point_amount(self,
+                                                  str trading_pair,
+                                                  double amount):
+        # Paper trade amounts are rounded to significant digits first, so this goes through c_quantize_order_amount()
+        cdef:
+            object quantized_amount
+        if not math.isfinite(amount):
+            return None
+        quantized_amount = self.c_quantize_order_amount(trading_pair, Decimal(amount))
+        return c_fixed_point_from_decimal(
+            quantized_amount,
+            c_get_scale_for_quantum(self.c_get_order_size_quantum(trading_pair, quantized_amount))
+        )
+
     cdef object c_quantize_order_amount(self,
                                         str trading_pair,
                                         object amount,
@@ -0,0 +1,291 @@
+#!/usr/bin/env python
+
+from concurrent.futures import (
+    Future,
+    ProcessPoolExecutor,
+    as_completed,
+)
+from decimal import Decimal
+import itertools
+import logging
+import multiprocessing
+import time
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    List,
+    NamedTuple,
+    Optional,
+    Set,
+    Tuple,
+)
+
+import pandas as pd
+
+from hummingbot.core.data_type.market_data_recorder import MarketDataBuffer
+from hummingbot.core.data_type.replay_order_book_data_source import ReplayOrderBookDataSource
+from hummingbot.core.event.event_logger import EventLogger
+from hummingbot.core.event.events import (
+    MarketEvent,
+    OrderFilledEvent,
+    TradeType,
+)
+from hummingbot.core.time_iterator import TimeIterator
+from hummingbot.logger import HummingbotLogger
+from hummingbot.market.paper_trade import MARKET_CLASSES
+from hummingbot.market.paper_trade.market_config import MarketConfig
+from hummingbot.market.paper_trade.paper_trade_market import PaperTradeMarket
+from hummingbot.market.paper_trade.replay_backtest import ReplayBacktest
+
+s_decimal_0 = Decimal(0)
+
+StrategyFactory = Callable[[List[PaperTradeMarket], Dict[str, Any]], TimeIterator]
+PreloadedMarketData = Dict[Tuple[str, str], MarketDataBuffer]
+
+# Market data loaded by the parent process before the worker processes are forked. The workers replay it from the
+# memory maps they share with the parent, instead of each reading and decompressing the recording again.
+_preloaded_market_data: PreloadedMarketData = {}
+
+
+class SweepMarket(NamedTuple):
+    exchange_name: str
+    trading_pairs: List[str]
+    balances: Dict[str, Decimal]
+    config: Optional[MarketConfig] = None
+
+
+class SweepSpec(NamedTuple):
+    markets: List[SweepMarket]
+    strategy_factory: StrategyFactory
+    start_time: float
+    end_time: float
+    tick_size: float
+    root_path: Optional[str]
+    sample_interval: float
+    valuation_asset: str
+
+
+def _asset_prices(markets: List[PaperTradeMarket], valuation_asset: str) -> Dict[str, Decimal]:
+    """
+    Prices of the assets in the valuation asset, from the mid prices of the trading pairs that quote one in the other.
+    Assets without a mid price, e.g. from an empty order book, are left out.
+    """
+    retval: Dict[str, Decimal] = {valuation_asset: Decimal(1)}
+    for market in markets:
+        for trading_pair in market.order_books.keys():
+            base_asset, quote_asset = market.split_trading_pair(trading_pair)
+            mid_price: Decimal = market.get_mid_price(trading_pair)
+            if mid_price.is_nan():
+                continue
+            if quote_asset == valuation_asset and base_asset not in retval:
+                retval[base_asset] = mid_price
+            elif base_asset == valuation_asset and quote_asset not in retval and mid_price > 0:
+                retval[quote_asset] = Decimal(1) / mid_price
+    return retval
+
+
+def run_sweep_point(spec: SweepSpec, parameters: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Runs one backtest of a parameter sweep, and returns its results row.
+    """
+    backtest: ReplayBacktest = ReplayBacktest(spec.start_time, spec.end_time,
+                                              tick_size=spec.tick_size, root_path=spec.root_path)
+    markets: List[PaperTradeMarket] = []
+    fill_loggers: List[EventLogger] = []
+    for sweep_market in spec.markets:
+        preloaded_messages: Dict[str, MarketDataBuffer] = {
+            trading_pair: _preloaded_market_data[(sweep_market.exchange_name, trading_pair)]
+            for trading_pair in sweep_market.trading_pairs
+            if (sweep_market.exchange_name, trading_pair) in _preloaded_market_data
+        }
+        market: PaperTradeMarket = backtest.add_market(sweep_market.exchange_name,
+                                                       sweep_market.trading_pairs,
+                                                       sweep_market.balances,
+                                                       config=sweep_market.config,
+                                                       preloaded_messages=preloaded_messages)
+        fill_logger: EventLogger = EventLogger()
+        market.add_listener(MarketEvent.OrderFilled, fill_logger)
+        markets.append(market)
+        fill_loggers.append(fill_logger)
+
+    first_market: SweepMarket = spec.markets[0]
+    base_asset, _ = markets[0].split_trading_pair(first_market.trading_pairs[0])
+    inventory_path: List[Tuple[float, float]] = []
+
+    def sample_inventory(timestamp: float):
+        inventory_path.append((timestamp, float(sum(market.get_balance(base_asset) for market in markets))))
+
+    strategy: TimeIterator = spec.strategy_factory(markets, parameters)
+    backtest.run(strategy, interval_callback=sample_inventory, callback_interval=spec.sample_interval)
+
+    prices: Dict[str, Decimal] = _asset_prices(markets, spec.valuation_asset)
+    pnl: Decimal = s_decimal_0
+    start_value: Decimal = s_decimal_0
+    unpriced_assets: Set[str] = set()
+    for sweep_market, market in zip(spec.markets, markets):
+        end_balances: Dict[str, Decimal] = market.get_all_balances()
+        for asset in set(end_balances.keys()) | set(sweep_market.balances.keys()):
+            price: Decimal = prices.get(asset.upper(), Decimal("NaN"))
+            if price.is_nan():
+                # Assets that can't be valued are left out of the PnL, and reported in the results row instead.
+                unpriced_assets.add(asset.upper())
+                continue
+            start_balance: Decimal = Decimal(sweep_market.balances.get(asset, s_decimal_0))
+            pnl += (end_balances.get(asset.upper(), s_decimal_0) - start_balance) * price
+            start_value += start_balance * price
+
+    fills: List[OrderFilledEvent] = [e for fill_logger in fill_loggers for e in fill_logger.event_log]
+    return {
+        **parameters,
+        "pnl": float(pnl),
+        "return_pct": float(pnl / start_value * 100) if start_value > 0 else float("nan"),
+        "fills": len(fills),
+        "buy_fills": len([e for e in fills if e.trade_type is TradeType.BUY]),
+        "sell_fills": len([e for e in fills if e.trade_type is TradeType.SELL]),
+        "traded_volume": float(sum(e.amount * e.price for e in fills)),
+        "end_inventory": inventory_path[-1][1] if len(inventory_path) > 0 else float("nan"),
+        "inventory_path": inventory_path,
+        "run_time": backtest.run_duration,
+        "unpriced_assets": sorted(unpriced_assets),
+        "error": None,
+    }
+
+
+def _run_sweep_point_safe(spec: SweepSpec, parameters: Dict[str, Any]) -> Dict[str, Any]:
+    try:
+        return run_sweep_point(spec, parameters)
+    except Exception as e:
+        logging.getLogger(__name__).error(f"Error running sweep point {parameters}.", exc_info=True)
+        return {**parameters, "error": f"{type(e).__name__}: {e}"}
+
+
+class ParameterSweep:
+    """
+    Backtests a strategy over recorded market data with every set of parameters in a grid, in parallel worker
+    processes, and collects the results of the runs into one data frame.
+
+    Each run gets its own clock, paper trade markets and strategy, created in the worker by `strategy_factory` from
+    the markets and the run's parameters. The factory must be a module level function, so it can be sent to the
+    workers. With `preload_market_data`, the market data is decompressed once by the parent process into shared
+    memory maps before the workers are forked, and each worker decodes the messages from them as it replays them.
+
+    Example:
+        def make_strategy(markets, parameters):
+            market_info = MarketTradingPairTuple(markets[0], "ETHUSDT", "ETH", "USDT")
+            return PureMarketMakingStrategyV2(
+                [market_info],
+                filter_delegate=PassThroughFilterDelegate(),
+                pricing_delegate=ConstantSpreadPricingDelegate(parameters["bid_place_threshold"],
+                                                               parameters["ask_place_threshold"]),
+                sizing_delegate=ConstantSizeSizingDelegate(Decimal(1)))
+
+        sweep = ParameterSweep([SweepMarket("binance", ["ETHUSDT"], {"ETH": Decimal(10), "USDT": Decimal(2000)})],
+                               make_strategy, start_time, end_time)
+        results = sweep.run(ParameterSweep.parameter_grid(bid_place_threshold=[Decimal("0.001"), Decimal("0.002")],
+                                                          ask_place_threshold=[Decimal("0.001"), Decimal("0.002")]))
+    """
+    _ps_logger: Optional[HummingbotLogger] = None
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._ps_logger is None:
+            cls._ps_logger = logging.getLogger(__name__)
+        return cls._ps_logger
+
+    def __init__(self,
+                 markets: List[SweepMarket],
+                 strategy_factory: StrategyFactory,
+                 start_time: float,
+                 end_time: float,
+                 tick_size: float = 1.0,
+                 root_path: Optional[str] = None,
+                 max_workers: Optional[int] = None,
+                 sample_interval: float = 60.0,
+                 valuation_asset: Optional[str] = None,
+                 preload_market_data: bool = True):
+        """
+        :param markets: Paper trade markets to create for every run
+        :param strategy_factory: Creates the strategy of a run from its markets and parameters
+        :param max_workers: Number of worker processes. Defaults to the number of CPUs.
+        :param sample_interval: Interval of the inventory samples, in seconds of simulated time
+        :param valuation_asset: Asset to value the PnL in. Defaults to the quote asset of the first trading pair.
+        :param preload_market_data: Read the market data once in the parent process and share it with the workers.
+                                    Only takes effect where worker processes can be forked.
+        """
+        if len(markets) == 0:
+            raise ValueError("At least one market is required.")
+        self._markets: List[SweepMarket] = markets
+        self._strategy_factory: StrategyFactory = strategy_factory
+        self._start_time: float = start_time
+        self._end_time: float = end_time
+        self._tick_size: float = tick_size
+        self._root_path: Optional[str] = root_path
+        self._max_workers: Optional[int] = max_workers
+        self._sample_interval: float = sample_interval
+        self._valuation_asset: Optional[str] = valuation_asset
+        self._preload_market_data: bool = preload_market_data
+
+    @staticmethod
+    def parameter_grid(**parameter_values: List[Any]) -> List[Dict[str, Any]]:
+        """
+        Returns every combination of the given parameter values.
+        """
+        names: List[str] = list(parameter_values.keys())
+        return [dict(zip(names, values)) for values in itertools.product(*parameter_values.values())]
+
+    def _sweep_spec(self) -> SweepSpec:
+        valuation_asset: Optional[str] = self._valuation_asset
+        if valuation_asset is None:
+            first_market: SweepMarket = self._markets[0]
+            _, valuation_asset = MARKET_CLASSES[first_market.exchange_name].split_trading_pair(
+                first_market.trading_pairs[0])
+        return SweepSpec(self._markets, self._strategy_factory, self._start_time, self._end_time, self._tick_size,
+                         self._root_path, self._sample_interval, valuation_asset)
+
+    def _load_market_data(self) -> PreloadedMarketData:
+        retval: PreloadedMarketData = {}
+        for sweep_market in self._markets:
+            data_source: ReplayOrderBookDataSource = ReplayOrderBookDataSource(sweep_market.exchange_name,
+                                                                               start_time=self._start_time,
+                                                                               end_time=self._end_time,
+                                                                               root_path=self._root_path)
+            for trading_pair in sweep_market.trading_pairs:
+                if (sweep_market.exchange_name, trading_pair) not in retval:
+                    retval[(sweep_market.exchange_name, trading_pair)] = data_source.load_messages(trading_pair)
+        return retval
+
+    def run(self, parameter_sets: List[Dict[str, Any]]) -> pd.DataFrame:
+        """
+        Runs a backtest for every parameter set.
+
+        :returns: One row per parameter set, in the given order, with the parameters, the PnL in the valuation asset,
+                  the fill counts, the traded volume, the base asset inventory path as (timestamp, balance) pairs, the
+                  assets left out of the PnL because they have no price in the valuation asset, and the error of the
+                  runs that failed
+        """
+        global _preloaded_market_data
+        spec: SweepSpec = self._sweep_spec()
+        mp_context = None
+        if self._preload_market_data and "fork" in multiprocessing.get_all_start_methods():
+            mp_context = multiprocessing.get_context("fork")
+            _preloaded_market_data = self._load_market_data()
+
+        start: float = time.perf_counter()
+        results: List[Optional[Dict[str, Any]]] = [None] * len(parameter_sets)
+        try:
+            with ProcessPoolExecutor(max_workers=self._max_workers, mp_context=mp_context) as executor:
+                futures: Dict[Future, int] = {
+                    executor.submit(_run_sweep_point_safe, spec, parameters): index
+                    for index, parameters in enumerate(parameter_sets)
+                }
+                for completed, future in enumerate(as_completed(futures), 1):
+                    results[futures[future]] = future.result()
+                    self.logger().info(f"Parameter sweep: {completed}/{len(parameter_sets)} runs completed.")
+        finally:
+            for market_data_buffer in _preloaded_market_data.values():
+                market_data_buffer.close()
+            _preloaded_market_data = {}
+        self.logger().info(f"Parameter sweep of {len(parameter_sets)} runs finished in "
+                           f"{time.perf_counter() - start:.1f} seconds.")
+        return pd.DataFrame(results)
@@ -0,0 +1,147 @@
+#!/usr/bin/env python
+
+from decimal import Decimal
+import logging
+import time
+from typing import (
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+)
+
+from hummingbot.core.clock import (
+    Clock,
+    ClockMode,
+)
+from hummingbot.core.data_type.market_data_recorder import RecordedMarketDataMessage
+from hummingbot.core.time_iterator import TimeIterator
+from hummingbot.logger import HummingbotLogger
+from hummingbot.market.paper_trade import create_replay_paper_trade_market
+from hummingbot.market.paper_trade.market_config import MarketConfig
+from hummingbot.market.paper_trade.paper_trade_market import PaperTradeMarket
+
+
+class ReplayBacktest:
+    """
+    Runs strategies over recorded market data with a backtest clock.
+
+    Markets created with `add_market()` are paper trade markets whose order books replay the data recorded by
+    `MarketDataRecorder` between the start and end times. Strategies are created over those markets as usual and
+    passed to `run()`, which ticks the clock through the whole time range without waiting for real time.
+
+    Example:
+        backtest = ReplayBacktest(start_time, end_time)
+        market = backtest.add_market("binance", ["ETHUSDT"], {"ETH": Decimal(10), "USDT": Decimal(2000)})
+        strategy = PureMarketMakingStrategyV2([MarketTradingPairTuple(market, "ETHUSDT", "ETH", "USDT")], ...)
+        backtest.run(strategy)
+    """
+    _rb_logger: Optional[HummingbotLogger] = None
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._rb_logger is None:
+            cls._rb_logger = logging.getLogger(__name__)
+        return cls._rb_logger
+
+    def __init__(self,
+                 start_time: float,
+                 end_time: float,
+                 tick_size: float = 1.0,
+                 root_path: Optional[str] = None):
+        """
+        :param start_time: Start of the backtest in UNIX timestamp
+        :param end_time: End of the backtest in UNIX timestamp
+        :param tick_size: Time interval of each clock tick
+        :param root_path: Root directory of the recorded market data. Defaults to the recorder's default.
+        """
+        self._start_time: float = start_time
+        self._end_time: float = end_time
+        self._tick_size: float = tick_size
+        self._root_path: Optional[str] = root_path
+        self._markets: List[PaperTradeMarket] = []
+        self._clock: Optional[Clock] = None
+        self._run_duration: float = 0.0
+
+    @property
+    def markets(self) -> List[PaperTradeMarket]:
+        return self._markets
+
+    @property
+    def clock(self) -> Optional[Clock]:
+        return self._clock
+
+    @property
+    def run_duration(self) -> float:
+        """
+        Wall clock time of the last run, in seconds.
+        """
+        return self._run_duration
+
+    @property
+    def speedup(self) -> float:
+        """
+        Simulated time divided by the wall clock time of the last run.
+        """
+        if self._run_duration <= 0:
+            return 0.0
+        return (self._end_time - self._start_time) / self._run_duration
+
+    def add_market(self,
+                   exchange_name: str,
+                   trading_pairs: List[str],
+                   balances: Optional[Dict[str, Decimal]] = None,
+                   config: Optional[MarketConfig] = None,
+                   preloaded_messages: Optional[Dict[str, Iterable[RecordedMarketDataMessage]]] = None
+                   ) -> PaperTradeMarket:
+        """
+        :param preloaded_messages: Messages of the trading pairs already loaded for the backtest's time range, e.g. by
+                                   `ReplayOrderBookDataSource.load_messages()`
+        """
+        market: PaperTradeMarket = create_replay_paper_trade_market(exchange_name,
+                                                                    trading_pairs,
+                                                                    start_time=self._start_time,
+                                                                    end_time=self._end_time,
+                                                                    root_path=self._root_path,
+                                                                    config=config,
+                                                                    preloaded_messages=preloaded_messages)
+        for asset, balance in (balances or {}).items():
+            market.set_balance(asset, balance)
+        self._markets.append(market)
+        return market
+
+    def run(self,
+            *strategies: TimeIterator,
+            interval_callback: Optional[Callable[[float], None]] = None,
+            callback_interval: float = 60.0) -> Clock:
+        """
+        Runs the strategies from the start time to the end time. The markets are ticked before the strategies, so the
+        strategies see the order books replayed up to the current tick.
+
+        :param interval_callback: Called with the clock's timestamp every `callback_interval` seconds of simulated
+                                  time and at the end, e.g. to sample the balances or report progress
+        """
+        self._clock = Clock(ClockMode.BACKTEST, self._tick_size, self._start_time, self._end_time)
+        for market in self._markets:
+            self._clock.add_iterator(market)
+        for strategy in strategies:
+            self._clock.add_iterator(strategy)
+
+        start: float = time.perf_counter()
+        try:
+            if interval_callback is None:
+                self._clock.backtest_til(self._end_time)
+            else:
+                next_timestamp: float = self._start_time
+                while next_timestamp < self._end_time:
+                    next_timestamp = min(next_timestamp + callback_interval, self._end_time)
+                    self._clock.backtest_til(next_timestamp)
+                    interval_callback(self._clock.current_timestamp)
+        finally:
+            self._run_duration = time.perf_counter() - start
+            for market in self._markets:
+                market.order_book_tracker.stop()
+        self.logger().info(f"Backtested {self._end_time - self._start_time:.0f} seconds of market data in "
+                           f"{self._run_duration:.1f} seconds ({self.speedup:.0f}x real time).")
+        return self._clock
@@ -5,6 +5,7 @@ import logging
 from os.path import join
 from sqlalchemy import (
     create_engine,
+    event,
     MetaData,
 )
 from sqlalchemy.engine.base import Engine
@@ -71,6 +72,7 @@ class SQLConnectionManager:
 
         if connection_type is SQLConnectionType.TRADE_FILLS:
             self._engine: Engine = create_engine(f"sqlite:///{db_path}")
+            event.listen(self._engine, "connect", self._enable_wal_mode)
             self._metadata: MetaData = self.get_declarative_base().metadata
             self._metadata.create_all(self._engine)
 
@@ -80,6 +82,15 @@ class SQLConnectionManager:
         if connection_type is SQLConnectionType.TRADE_FILLS:
             self.check_and_upgrade_trade_fills_db()
 
+    @staticmethod
+    def _enable_wal_mode(dbapi_connection, connection_record):
+        # WAL mode lets readers run alongside a background writer, and makes each commit a single append to the log.
+        # With WAL, synchronous=NORMAL can only lose the last commits on power loss, and never corrupts the database.
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.close()
+
     @property
     def engine(self) -> Engine:
         return self._engine
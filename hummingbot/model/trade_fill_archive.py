@@ -0,0 +1,481 @@
+#!/usr/bin/env python
+
+from datetime import datetime
+import json
+import logging
+import numpy as np
+import os
+from os.path import (
+    exists,
+    getsize,
+    isdir,
+    join,
+)
+import pandas as pd
+import threading
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    List,
+    NamedTuple,
+    Optional,
+    Tuple,
+)
+from urllib.parse import (
+    quote,
+    unquote,
+)
+from sqlalchemy.orm import Query
+
+from hummingbot import data_path
+from hummingbot.logger import HummingbotLogger
+from hummingbot.model.sql_connection_manager import SQLConnectionManager
+from hummingbot.model.trade_fill import TradeFill
+
+
+class TradeFillArchiveRow(NamedTuple):
+    id: int
+    config_file_path: str
+    strategy: str
+    market: str
+    symbol: str
+    base_asset: str
+    quote_asset: str
+    timestamp: int
+    trade_type: str
+    order_type: str
+    price: float
+    amount: float
+    trade_fee: Dict[str, Any]
+
+
+class TradeFillPartition:
+    """
+    Trade fills of one config file and market, stored as one binary file per column.
+
+    Text columns are dictionary encoded, with one list of values for the whole partition. Flat fees are stored in a
+    separate set of columns, with the index of their trade fill in the partition.
+    """
+    FILL_COLUMNS: List[Tuple[str, str]] = [
+        ("id", "<i8"),
+        ("timestamp", "<i8"),
+        ("price", "<f8"),
+        ("amount", "<f8"),
+        ("fee_percent", "<f8"),
+        ("strategy", "<i4"),
+        ("symbol", "<i4"),
+        ("base_asset", "<i4"),
+        ("quote_asset", "<i4"),
+        ("trade_type", "<i4"),
+        ("order_type", "<i4"),
+    ]
+    FLAT_FEE_COLUMNS: List[Tuple[str, str]] = [
+        ("fee_fill_index", "<i8"),
+        ("fee_asset", "<i4"),
+        ("fee_amount", "<f8"),
+    ]
+
+    def __init__(self, path: str, config_file_path: str, market: str):
+        self._path: str = path
+        self._config_file_path: str = config_file_path
+        self._market: str = market
+        os.makedirs(path, exist_ok=True)
+        self._categories: List[str] = []
+        categories_path: str = join(path, "categories.json")
+        if exists(categories_path):
+            with open(categories_path, "r") as fd:
+                self._categories = json.load(fd)
+        self._category_codes: Dict[str, int] = {value: code for code, value in enumerate(self._categories)}
+        self._num_fills: int = self._repair(self.FILL_COLUMNS)
+        self._num_flat_fees: int = self._repair(self.FLAT_FEE_COLUMNS)
+        if self._num_flat_fees > 0:
+            # Flat fees are written before their trade fills, so drop the ones whose trade fills didn't make it.
+            fee_fill_indices: np.ndarray = self.read_flat_fees()["fee_fill_index"]
+            num_flat_fees: int = int(np.searchsorted(fee_fill_indices, self._num_fills))
+            if num_flat_fees < self._num_flat_fees:
+                self._truncate(self.FLAT_FEE_COLUMNS, num_flat_fees)
+                self._num_flat_fees = num_flat_fees
+
+    @property
+    def config_file_path(self) -> str:
+        return self._config_file_path
+
+    @property
+    def market(self) -> str:
+        return self._market
+
+    @property
+    def num_fills(self) -> int:
+        return self._num_fills
+
+    @property
+    def categories(self) -> List[str]:
+        return self._categories
+
+    @property
+    def last_trade_fill_id(self) -> int:
+        return int(self.read_fills()["id"][-1]) if self._num_fills > 0 else 0
+
+    def _column_path(self, column: str) -> str:
+        return join(self._path, f"{column}.bin")
+
+    def _repair(self, columns: List[Tuple[str, str]]) -> int:
+        """
+        Truncates the columns to the length of the shortest one, in case an append was interrupted.
+        """
+        lengths: List[int] = []
+        for column, dtype in columns:
+            column_path: str = self._column_path(column)
+            lengths.append(getsize(column_path) // np.dtype(dtype).itemsize if exists(column_path) else 0)
+        num_rows: int = min(lengths)
+        if max(lengths) > num_rows:
+            self._truncate(columns, num_rows)
+        return num_rows
+
+    def _truncate(self, columns: List[Tuple[str, str]], num_rows: int):
+        for column, dtype in columns:
+            column_path: str = self._column_path(column)
+            if exists(column_path):
+                with open(column_path, "r+b") as fd:
+                    fd.truncate(num_rows * np.dtype(dtype).itemsize)
+
+    def _encode(self, value: str) -> int:
+        code: Optional[int] = self._category_codes.get(value)
+        if code is None:
+            code = len(self._categories)
+            self._categories.append(value)
+            self._category_codes[value] = code
+        return code
+
+    def _save_categories(self):
+        categories_path: str = join(self._path, "categories.json")
+        with open(categories_path + ".tmp", "w") as fd:
+            json.dump(self._categories, fd)
+        os.replace(categories_path + ".tmp", categories_path)
+
+    def _append_columns(self, columns: List[Tuple[str, str]], values: Dict[str, List[Any]]):
+        for column, dtype in columns:
+            with open(self._column_path(column), "ab") as fd:
+                fd.write(np.asarray(values[column], dtype=dtype).tobytes())
+
+    def append(self, rows: List[TradeFillArchiveRow]):
+        num_categories: int = len(self._categories)
+        fills: Dict[str, List[Any]] = {column: [] for column, _ in self.FILL_COLUMNS}
+        flat_fees: Dict[str, List[Any]] = {column: [] for column, _ in self.FLAT_FEE_COLUMNS}
+        for fill_index, row in enumerate(rows, self._num_fills):
+            fills["id"].append(row.id)
+            fills["timestamp"].append(row.timestamp)
+            fills["price"].append(row.price)
+            fills["amount"].append(row.amount)
+            fills["fee_percent"].append(row.trade_fee.get("percent", 0.0))
+            fills["strategy"].append(self._encode(row.strategy))
+            fills["symbol"].append(self._encode(row.symbol))
+            fills["base_asset"].append(self._encode(row.base_asset))
+            fills["quote_asset"].append(self._encode(row.quote_asset))
+            fills["trade_type"].append(self._encode(row.trade_type))
+            fills["order_type"].append(self._encode(row.order_type))
+            for flat_fee in row.trade_fee.get("flat_fees", []):
+                flat_fees["fee_fill_index"].append(fill_index)
+                flat_fees["fee_asset"].append(self._encode(flat_fee["asset"]))
+                flat_fees["fee_amount"].append(flat_fee["amount"])
+
+        # The categories are saved first, so the codes in the columns can always be decoded.
+        if len(self._categories) > num_categories:
+            self._save_categories()
+        self._append_columns(self.FLAT_FEE_COLUMNS, flat_fees)
+        self._append_columns(self.FILL_COLUMNS, fills)
+        self._num_flat_fees += len(flat_fees["fee_fill_index"])
+        self._num_fills += len(rows)
+
+    def _read_columns(self, columns: List[Tuple[str, str]], num_rows: int) -> Dict[str, np.ndarray]:
+        retval: Dict[str, np.ndarray] = {}
+        for column, dtype in columns:
+            if num_rows == 0:
+                retval[column] = np.empty(0, dtype=dtype)
+            else:
+                retval[column] = np.memmap(self._column_path(column), dtype=dtype, mode="r", shape=(num_rows,))
+        return retval
+
+    def read_fills(self) -> Dict[str, np.ndarray]:
+        """
+        Returns read-only memory maps of the fill columns. Text columns hold category codes.
+        """
+        return self._read_columns(self.FILL_COLUMNS, self._num_fills)
+
+    def read_flat_fees(self) -> Dict[str, np.ndarray]:
+        return self._read_columns(self.FLAT_FEE_COLUMNS, self._num_flat_fees)
+
+
+class TradeFillArchive:
+    """
+    Columnar copy of the TradeFill table, partitioned by config file and market, for fast scans and aggregations over
+    large trade histories.
+
+    Trade fills are appended in trade fill id order, either right after the markets recorder commits them, or by
+    `update()`, which copies every trade fill that's not archived yet from the database. Trade fills already archived
+    are skipped, so both can be used together.
+    """
+    _tfa_logger: Optional[HummingbotLogger] = None
+    _tfa_shared_instance: Optional["TradeFillArchive"] = None
+
+    FRAME_COLUMNS: List[str] = ["id", "config_file_path", "strategy", "market", "symbol", "base_asset", "quote_asset",
+                                "timestamp", "trade_type", "order_type", "price", "amount", "fee_percent"]
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._tfa_logger is None:
+            cls._tfa_logger = logging.getLogger(__name__)
+        return cls._tfa_logger
+
+    @classmethod
+    def get_instance(cls) -> "TradeFillArchive":
+        if cls._tfa_shared_instance is None:
+            cls._tfa_shared_instance = TradeFillArchive()
+        return cls._tfa_shared_instance
+
+    def __init__(self, archive_path: Optional[str] = None):
+        if archive_path is None:
+            archive_path = join(data_path(), "trade_fill_archive")
+        self._archive_path: str = archive_path
+        self._lock: threading.RLock = threading.RLock()
+        self._partitions: Dict[Tuple[str, str], TradeFillPartition] = {}
+
+        os.makedirs(archive_path, exist_ok=True)
+        for config_dir in os.listdir(archive_path):
+            if not isdir(join(archive_path, config_dir)):
+                continue
+            for market_dir in os.listdir(join(archive_path, config_dir)):
+                self._get_partition(unquote(config_dir), unquote(market_dir))
+        # Trade fills are archived in id order, so everything up to the largest archived id is in the archive.
+        self._last_trade_fill_id: int = max([partition.last_trade_fill_id for partition in self._partitions.values()],
+                                            default=0)
+
+    @property
+    def archive_path(self) -> str:
+        return self._archive_path
+
+    @property
+    def last_trade_fill_id(self) -> int:
+        return self._last_trade_fill_id
+
+    @property
+    def partitions(self) -> List[Tuple[str, str]]:
+        return list(self._partitions.keys())
+
+    @staticmethod
+    def row_from_trade_fill(trade_fill: TradeFill) -> TradeFillArchiveRow:
+        return TradeFillArchiveRow(trade_fill.id, trade_fill.config_file_path, trade_fill.strategy, trade_fill.market,
+                                   trade_fill.symbol, trade_fill.base_asset, trade_fill.quote_asset,
+                                   trade_fill.timestamp, trade_fill.trade_type, trade_fill.order_type,
+                                   trade_fill.price, trade_fill.amount, trade_fill.trade_fee)
+
+    def _get_partition(self, config_file_path: str, market: str) -> TradeFillPartition:
+        key: Tuple[str, str] = (config_file_path, market)
+        partition: Optional[TradeFillPartition] = self._partitions.get(key)
+        if partition is None:
+            partition_path: str = join(self._archive_path, quote(config_file_path, safe=""), quote(market, safe=""))
+            partition = TradeFillPartition(partition_path, config_file_path, market)
+            self._partitions[key] = partition
+        return partition
+
+    def append(self, rows: Iterable[TradeFillArchiveRow]) -> int:
+        """
+        Appends the given committed trade fills, in id order. Trade fills that are already archived are skipped.
+
+        :returns: Number of trade fills appended
+        """
+        with self._lock:
+            new_rows: List[TradeFillArchiveRow] = sorted((row for row in rows if row.id > self._last_trade_fill_id),
+                                                         key=lambda row: row.id)
+            if len(new_rows) == 0:
+                return 0
+            partition_rows: Dict[Tuple[str, str], List[TradeFillArchiveRow]] = {}
+            for row in new_rows:
+                partition_rows.setdefault((row.config_file_path, row.market), []).append(row)
+            for (config_file_path, market), rows_in_partition in partition_rows.items():
+                self._get_partition(config_file_path, market).append(rows_in_partition)
+            self._last_trade_fill_id = new_rows[-1].id
+            return len(new_rows)
+
+    def update(self, sql: SQLConnectionManager, batch_size: int = 10000) -> int:
+        """
+        Copies the trade fills that are not archived yet from the database. Uses its own session, so it can be called
+        from any thread.
+
+        :returns: Number of trade fills appended
+        """
+        with self._lock, sql.begin() as session:
+            query: Query = (session
+                            .query(*[getattr(TradeFill, field) for field in TradeFillArchiveRow._fields])
+                            .filter(TradeFill.id > self._last_trade_fill_id)
+                            .order_by(TradeFill.id.asc()))
+            total: int = 0
+            batch: List[TradeFillArchiveRow] = []
+            for row in query.yield_per(batch_size):
+                batch.append(TradeFillArchiveRow(*row))
+                if len(batch) >= batch_size:
+                    total += self.append(batch)
+                    batch = []
+            total += self.append(batch)
+            if total > 0:
+                self.logger().debug(f"Archived {total} trade fills.")
+            return total
+
+    def _selected_partitions(self,
+                             config_file_path: Optional[str],
+                             market: Optional[str]) -> List[TradeFillPartition]:
+        return [partition for (partition_config_file_path, partition_market), partition in self._partitions.items()
+                if (config_file_path is None or partition_config_file_path == config_file_path) and
+                (market is None or partition_market == market)]
+
+    @staticmethod
+    def _fill_mask(partition: TradeFillPartition,
+                   fills: Dict[str, np.ndarray],
+                   strategy: Optional[str],
+                   symbol: Optional[str],
+                   start_timestamp: Optional[int],
+                   end_timestamp: Optional[int]) -> Optional[np.ndarray]:
+        mask: np.ndarray = np.ones(partition.num_fills, dtype=bool)
+        for column, value in (("strategy", strategy), ("symbol", symbol)):
+            if value is not None:
+                if value not in partition.categories:
+                    return None
+                mask &= fills[column] == partition.categories.index(value)
+        if start_timestamp is not None:
+            mask &= fills["timestamp"] >= start_timestamp
+        if end_timestamp is not None:
+            mask &= fills["timestamp"] <= end_timestamp
+        return mask
+
+    def read(self,
+             config_file_path: Optional[str] = None,
+             market: Optional[str] = None,
+             strategy: Optional[str] = None,
+             symbol: Optional[str] = None,
+             start_timestamp: Optional[int] = None,
+             end_timestamp: Optional[int] = None,
+             include_flat_fees: bool = False) -> pd.DataFrame:
+        """
+        Returns the matching trade fills in ascending timestamp order, with one column per TradeFill field except the
+        trade fee, which is given as `fee_percent`. With `include_flat_fees`, the `flat_fees` column holds the list of
+        (asset, amount) flat fees of each trade fill.
+        """
+        frames: List[pd.DataFrame] = []
+        with self._lock:
+            for partition in self._selected_partitions(config_file_path, market):
+                fills: Dict[str, np.ndarray] = partition.read_fills()
+                mask: Optional[np.ndarray] = self._fill_mask(partition, fills, strategy, symbol,
+                                                             start_timestamp, end_timestamp)
+                if mask is None or not mask.any():
+                    continue
+                categories: np.ndarray = np.asarray(partition.categories, dtype=object)
+                frame: pd.DataFrame = pd.DataFrame({
+                    "id": fills["id"][mask],
+                    "config_file_path": partition.config_file_path,
+                    "market": partition.market,
+                    "timestamp": fills["timestamp"][mask],
+                    "price": fills["price"][mask],
+                    "amount": fills["amount"][mask],
+                    "fee_percent": fills["fee_percent"][mask],
+                    **{column: categories[fills[column][mask]]
+                       for column in ("strategy", "symbol", "base_asset", "quote_asset", "trade_type", "order_type")}
+                })
+                if include_flat_fees:
+                    flat_fees: Dict[str, np.ndarray] = partition.read_flat_fees()
+                    fee_lists: List[List[Tuple[str, float]]] = [[] for _ in range(partition.num_fills)]
+                    for fill_index, asset_code, amount in zip(flat_fees["fee_fill_index"].tolist(),
+                                                              flat_fees["fee_asset"].tolist(),
+                                                              flat_fees["fee_amount"].tolist()):
+                        fee_lists[fill_index].append((partition.categories[asset_code], amount))
+                    frame["flat_fees"] = [fee_lists[fill_index] for fill_index in np.flatnonzero(mask)]
+                frames.append(frame)
+
+        columns: List[str] = self.FRAME_COLUMNS + (["flat_fees"] if include_flat_fees else [])
+        if len(frames) == 0:
+            return pd.DataFrame(columns=columns)
+        return (pd.concat(frames, ignore_index=True)[columns]
+                .sort_values(["timestamp", "id"], kind="mergesort")
+                .reset_index(drop=True))
+
+    def read_flat_fees(self,
+                       config_file_path: Optional[str] = None,
+                       market: Optional[str] = None,
+                       strategy: Optional[str] = None,
+                       symbol: Optional[str] = None,
+                       start_timestamp: Optional[int] = None,
+                       end_timestamp: Optional[int] = None) -> pd.DataFrame:
+        """
+        Returns the flat fees of the matching trade fills, with the trade fill id, market, symbol, trade type and
+        quote asset of each fee.
+        """
+        frames: List[pd.DataFrame] = []
+        with self._lock:
+            for partition in self._selected_partitions(config_file_path, market):
+                fills: Dict[str, np.ndarray] = partition.read_fills()
+                mask: Optional[np.ndarray] = self._fill_mask(partition, fills, strategy, symbol,
+                                                             start_timestamp, end_timestamp)
+                if mask is None:
+                    continue
+                flat_fees: Dict[str, np.ndarray] = partition.read_flat_fees()
+                fill_indices: np.ndarray = flat_fees["fee_fill_index"]
+                fee_mask: np.ndarray = mask[fill_indices]
+                if not fee_mask.any():
+                    continue
+                fill_indices = fill_indices[fee_mask]
+                categories: np.ndarray = np.asarray(partition.categories, dtype=object)
+                frames.append(pd.DataFrame({
+                    "id": fills["id"][fill_indices],
+                    "market": partition.market,
+                    "symbol": categories[fills["symbol"][fill_indices]],
+                    "trade_type": categories[fills["trade_type"][fill_indices]],
+                    "quote_asset": categories[fills["quote_asset"][fill_indices]],
+                    "asset": categories[flat_fees["fee_asset"][fee_mask]],
+                    "amount": flat_fees["fee_amount"][fee_mask],
+                }))
+        columns: List[str] = ["id", "market", "symbol", "trade_type", "quote_asset", "asset", "amount"]
+        if len(frames) == 0:
+            return pd.DataFrame(columns=columns)
+        return pd.concat(frames, ignore_index=True)[columns]
+
+    def volume_summary(self,
+                       config_file_path: Optional[str] = None,
+                       market: Optional[str] = None,
+                       strategy: Optional[str] = None,
+                       start_timestamp: Optional[int] = None,
+                       end_timestamp: Optional[int] = None) -> pd.DataFrame:
+        """
+        Returns the number of trades, the base and quote volumes, and the percentage fees in quote asset of the matching
+        trade fills, by market, symbol and trade type.
+        """
+        fills: pd.DataFrame = self.read(config_file_path=config_file_path, market=market, strategy=strategy,
+                                        start_timestamp=start_timestamp, end_timestamp=end_timestamp)
+        quote_volume: pd.Series = fills["price"] * fills["amount"]
+        return (fills
+                .assign(quote_volume=quote_volume, percent_fee_quote=quote_volume * fills["fee_percent"])
+                .groupby(["market", "symbol", "trade_type"])
+                .agg(num_trades=("id", "count"),
+                     base_volume=("amount", "sum"),
+                     quote_volume=("quote_volume", "sum"),
+                     percent_fee_quote=("percent_fee_quote", "sum"))
+                .reset_index())
+
+    @staticmethod
+    def to_pandas(fills: pd.DataFrame) -> pd.DataFrame:
+        """
+        Formats trade fills read with `include_flat_fees` like `TradeFill.to_pandas()`.
+        """
+        flat_fee_strs: List[str] = [",".join(f"{amount} {asset}" for asset, amount in flat_fees) or "None"
+                                    for flat_fees in fills["flat_fees"]]
+        return pd.DataFrame({
+            "symbol": fills["symbol"],
+            "price": fills["price"],
+            "amount": fills["amount"],
+            "order_type": fills["order_type"].str.lower(),
+            "side": fills["trade_type"].str.lower(),
+            "market": fills["market"],
+            "timestamp": [datetime.fromtimestamp(int(timestamp / 1e3)).strftime("%Y-%m-%d %H:%M:%S")
+                          for timestamp in fills["timestamp"].tolist()],
+            "fee_percent": fills["fee_percent"],
+            "flat_fee / gas": flat_fee_strs,
+        })
@@ -0,0 +1,47 @@
+#!/usr/bin/env python
+
+from typing import (
+    List,
+    NamedTuple,
+    Optional,
+)
+
+from hummingbot.market.market_base import MarketBase
+
+
+class ArbitragePathLeg(NamedTuple):
+    """
+    One step of an arbitrage path, from one asset to another.
+
+    Trade legs take the best price of an order book, on the market where both assets are. Conversion legs move an
+    asset to another market - as the same asset, or converted with `ExchangeRateConversion` - and have no trading
+    pair.
+    """
+    from_market: MarketBase
+    from_asset: str
+    to_market: MarketBase
+    to_asset: str
+    trading_pair: Optional[str]
+    is_buy: bool
+    price: float
+    rate: float
+
+    @property
+    def is_conversion(self) -> bool:
+        return self.trading_pair is None
+
+
+class ArbitragePath(NamedTuple):
+    """
+    A cycle of legs that ends with more of the starting asset than it began with, at the top of the order books.
+    """
+    legs: List[ArbitragePathLeg]
+    profitability: float
+
+    @property
+    def trade_legs(self) -> List[ArbitragePathLeg]:
+        return [leg for leg in self.legs if not leg.is_conversion]
+
+    @property
+    def markets(self) -> List[MarketBase]:
+        return list({leg.from_market: None for leg in self.trade_legs}.keys())
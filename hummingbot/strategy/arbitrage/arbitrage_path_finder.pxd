@@ -0,0 +1,40 @@
+# distutils: language=c++
+
+from libcpp.vector cimport vector
+
+from hummingbot.core.data_type.order_book cimport OrderBook
+from hummingbot.core.time_iterator cimport TimeIterator
+
+
+cdef class ArbitragePathFinder(TimeIterator):
+    cdef:
+        double _min_profitability
+        list _markets
+        dict _market_order_books
+        dict _node_indices
+        list _nodes
+        dict _order_book_edges
+        list _conversion_edges
+        int _conversion_node_count
+        list _edge_legs
+        vector[int] _edge_sources
+        vector[int] _edge_targets
+        vector[double] _edge_weights
+        vector[double] _edge_prices
+        vector[double] _distances
+        vector[int] _predecessor_edges
+        bint _graph_changed
+        bint _warm_start
+        list _profitable_paths
+        object _order_book_update_listener
+
+    cdef int c_get_node(self, object market, str asset)
+    cdef int c_add_edge(self, int source, int target, object leg)
+    cdef c_set_edge_weight(self, int edge, double price, double rate)
+    cdef c_add_market(self, object market)
+    cdef c_add_order_book(self, object market, str trading_pair, OrderBook order_book)
+    cdef c_update_order_book_edges(self, OrderBook order_book)
+    cdef c_add_conversion_edges(self)
+    cdef c_update_conversion_edges(self)
+    cdef list c_find_profitable_paths(self)
+    cdef object c_make_path(self, vector[int] cycle_edges)
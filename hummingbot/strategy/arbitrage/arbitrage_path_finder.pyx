@@ -0,0 +1,361 @@
+# distutils: language=c++
+
+from decimal import Decimal
+import logging
+from libc.math cimport (
+    exp,
+    INFINITY,
+    isnan,
+    log,
+)
+from libcpp.vector cimport vector
+from typing import List
+
+from hummingbot.core.data_type.order_book cimport OrderBook
+from hummingbot.core.event.event_listener cimport EventListener
+from hummingbot.core.event.events import (
+    OrderBookEvent,
+    OrderType,
+    TradeType,
+)
+from hummingbot.core.time_iterator cimport TimeIterator
+from hummingbot.core.utils.exchange_rate_conversion import ExchangeRateConversion
+from hummingbot.logger import HummingbotLogger
+from hummingbot.market.market_base import MarketBase
+from hummingbot.strategy.arbitrage.arbitrage_path import (
+    ArbitragePath,
+    ArbitragePathLeg,
+)
+
+NaN = float("nan")
+s_decimal_1 = Decimal(1)
+s_decimal_nan = Decimal("nan")
+apf_logger = None
+
+# Relaxations smaller than this are ignored, so that zero weight cycles - e.g. moving an asset between two markets and
+# back - never count as relaxations from rounding errors.
+cdef double RELAXATION_TOLERANCE = 1e-12
+
+
+cdef class OrderBookUpdateListener(EventListener):
+    cdef:
+        ArbitragePathFinder _owner
+
+    def __init__(self, ArbitragePathFinder owner):
+        super().__init__()
+        self._owner = owner
+
+    cdef c_call(self, object arg):
+        self._owner.c_update_order_book_edges(<OrderBook>self._current_event_caller)
+
+
+cdef class ArbitragePathFinder(TimeIterator):
+    """
+    Finds the profitable arbitrage cycles across the order books of all the given markets, including the triangular
+    ones within one market.
+
+    The assets on each market are the nodes of a graph. Each order book adds two edges between its base and quote
+    assets - selling at the best bid, and buying at the best ask - and the same asset on different markets, or assets
+    converted by `ExchangeRateConversion`, are joined by conversion edges. An edge's weight is the negative log of its
+    exchange rate after fees, so a cycle with a negative total weight multiplies the starting amount by more than 1.
+
+    The edge weights are updated as the order books change, and the negative cycles are found by Bellman-Ford on
+    demand, only when an edge has changed since the last search. A search that found none leaves the distances as the
+    starting point of the next one, which then usually converges in a couple of passes.
+
+    The paths only consider the prices at the top of the books, not the available amounts.
+    """
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        global apf_logger
+        if apf_logger is None:
+            apf_logger = logging.getLogger(__name__)
+        return apf_logger
+
+    def __init__(self, markets: List[MarketBase], min_profitability: float = 0.0):
+        """
+        :param markets: the markets to find the arbitrage paths across, with all the order books they track
+        :param min_profitability: the minimum profitability of the paths found, e.g. 0.001 for 0.1%
+        """
+        super().__init__()
+        self._min_profitability = min_profitability
+        self._markets = []
+        self._market_order_books = {}
+        self._node_indices = {}
+        self._nodes = []
+        self._order_book_edges = {}
+        self._conversion_edges = []
+        self._conversion_node_count = 0
+        self._edge_legs = []
+        self._graph_changed = False
+        self._warm_start = False
+        self._profitable_paths = []
+        self._order_book_update_listener = OrderBookUpdateListener(self)
+
+        for market in markets:
+            self.c_add_market(market)
+        self.c_update_conversion_edges()
+
+    @property
+    def markets(self) -> List[MarketBase]:
+        return list(self._markets)
+
+    @property
+    def node_count(self) -> int:
+        return len(self._nodes)
+
+    @property
+    def edge_count(self) -> int:
+        return self._edge_weights.size()
+
+    def add_market(self, market: MarketBase):
+        self.c_add_market(market)
+        self.c_update_conversion_edges()
+
+    def update_conversion_edges(self):
+        self.c_update_conversion_edges()
+
+    def find_profitable_paths(self) -> List[ArbitragePath]:
+        return self.c_find_profitable_paths()
+
+    cdef c_tick(self, double timestamp):
+        TimeIterator.c_tick(self, timestamp)
+        # Order book trackers can start tracking order books after the markets were added.
+        for market in self._markets:
+            if len(market.order_books) != len(self._market_order_books[market]):
+                self.c_add_market(market)
+        self.c_update_conversion_edges()
+
+    cdef int c_get_node(self, object market, str asset):
+        cdef:
+            tuple node = (market, asset.upper())
+        if node not in self._node_indices:
+            self._node_indices[node] = len(self._nodes)
+            self._nodes.append(node)
+        return self._node_indices[node]
+
+    cdef int c_add_edge(self, int source, int target, object leg):
+        self._edge_sources.push_back(source)
+        self._edge_targets.push_back(target)
+        self._edge_weights.push_back(INFINITY)
+        self._edge_prices.push_back(NaN)
+        self._edge_legs.append(leg)
+        return self._edge_weights.size() - 1
+
+    cdef c_set_edge_weight(self, int edge, double price, double rate):
+        cdef:
+            double weight = -log(rate) if rate > 0 else INFINITY
+        if isnan(weight):
+            weight = INFINITY
+        self._edge_prices[edge] = price
+        if weight != self._edge_weights[edge]:
+            self._edge_weights[edge] = weight
+            self._graph_changed = True
+
+    cdef c_add_market(self, object market):
+        cdef:
+            dict market_order_books
+
+        if market not in self._market_order_books:
+            self._markets.append(market)
+            self._market_order_books[market] = {}
+        market_order_books = self._market_order_books[market]
+        for trading_pair, order_book in market.order_books.items():
+            if trading_pair not in market_order_books:
+                market_order_books[trading_pair] = order_book
+                self.c_add_order_book(market, trading_pair, order_book)
+
+    cdef c_add_order_book(self, object market, str trading_pair, OrderBook order_book):
+        cdef:
+            str base_asset
+            str quote_asset
+            int base_node
+            int quote_node
+            int sell_edge
+            int buy_edge
+            double sell_fee
+            double buy_fee
+
+        try:
+            base_asset, quote_asset = market.split_trading_pair(trading_pair)
+        except Exception:
+            self.logger().warning(f"Unable to parse the trading pair {trading_pair} on {market.name}. "
+                                  f"Leaving its order book out of the arbitrage paths.")
+            return
+        base_node = self.c_get_node(market, base_asset)
+        quote_node = self.c_get_node(market, quote_asset)
+        sell_fee = float(market.get_fee(base_asset, quote_asset, OrderType.MARKET, TradeType.SELL,
+                                        s_decimal_1, s_decimal_nan).percent)
+        buy_fee = float(market.get_fee(base_asset, quote_asset, OrderType.MARKET, TradeType.BUY,
+                                       s_decimal_1, s_decimal_nan).percent)
+        sell_edge = self.c_add_edge(base_node, quote_node,
+                                    (market, base_asset, market, quote_asset, trading_pair, False))
+        buy_edge = self.c_add_edge(quote_node, base_node,
+                                   (market, quote_asset, market, base_asset, trading_pair, True))
+        self._order_book_edges.setdefault(order_book, []).append((sell_edge, buy_edge, 1 - sell_fee, 1 - buy_fee))
+        order_book.c_add_listener(OrderBookEvent.UpdateEvent.value, self._order_book_update_listener)
+        self.c_update_order_book_edges(order_book)
+
+    cdef c_update_order_book_edges(self, OrderBook order_book):
+        cdef:
+            double bid_price
+            double ask_price
+        try:
+            bid_price = order_book.c_get_price(False)
+        except EnvironmentError:
+            bid_price = NaN
+        try:
+            ask_price = order_book.c_get_price(True)
+        except EnvironmentError:
+            ask_price = NaN
+        for sell_edge, buy_edge, sell_fee_factor, buy_fee_factor in self._order_book_edges.get(order_book, ()):
+            self.c_set_edge_weight(sell_edge, bid_price, bid_price * sell_fee_factor)
+            self.c_set_edge_weight(buy_edge, ask_price, buy_fee_factor / ask_price)
+
+    cdef c_add_conversion_edges(self):
+        """
+        Joins the same asset on different markets, and the assets that `ExchangeRateConversion` converts between - ETH
+        and WETH, and the assets in its `conversion_required` config - with conversion edges.
+        """
+        cdef:
+            set conversion_required_assets = None
+            set joined_nodes = {(source_node, target_node)
+                                for _, source_node, target_node in self._conversion_edges}
+            int edge
+
+        for source_node, (source_market, source_asset) in enumerate(self._nodes):
+            for target_node, (target_market, target_asset) in enumerate(self._nodes):
+                if source_market is target_market or (source_node, target_node) in joined_nodes:
+                    continue
+                if source_asset != target_asset:
+                    if conversion_required_assets is None:
+                        conversion_required_assets = ExchangeRateConversion.get_instance().conversion_required_assets
+                    if not ({source_asset, target_asset} == {"ETH", "WETH"} or
+                            (source_asset in conversion_required_assets and
+                             target_asset in conversion_required_assets)):
+                        continue
+                edge = self.c_add_edge(source_node, target_node,
+                                       (source_market, source_asset, target_market, target_asset, None, False))
+                self._conversion_edges.append((edge, source_node, target_node))
+                joined_nodes.add((source_node, target_node))
+        self._conversion_node_count = len(self._nodes)
+
+    cdef c_update_conversion_edges(self):
+        """
+        Updates the rates of the conversion edges, after adding the conversion edges of any new nodes.
+        """
+        cdef:
+            object exchange_rate_conversion = None
+            double rate
+
+        if self._conversion_node_count != len(self._nodes):
+            self.c_add_conversion_edges()
+
+        for edge, source_node, target_node in self._conversion_edges:
+            source_asset = self._nodes[source_node][1]
+            target_asset = self._nodes[target_node][1]
+            if source_asset == target_asset:
+                rate = 1.0
+            else:
+                if exchange_rate_conversion is None:
+                    exchange_rate_conversion = ExchangeRateConversion.get_instance()
+                try:
+                    rate = exchange_rate_conversion.convert_token_value(1.0, source_asset, target_asset,
+                                                                        source="config")
+                except ValueError:
+                    rate = NaN
+            self.c_set_edge_weight(edge, rate, rate)
+
+    cdef list c_find_profitable_paths(self):
+        cdef:
+            size_t node_count = len(self._nodes)
+            size_t edge_count = self._edge_weights.size()
+            size_t i
+            size_t edge
+            size_t search_pass
+            int node
+            int cycle_node
+            int predecessor_edge
+            bint relaxed = False
+            double distance
+            vector[int] visited_from
+            vector[int] cycle_edges
+            list profitable_paths = []
+
+        if not self._graph_changed:
+            return self._profitable_paths
+        self._graph_changed = False
+
+        # Every node starts at distance 0 or less, as if reached from a virtual source with 0 weight edges to all nodes.
+        if not self._warm_start:
+            self._distances.assign(node_count, 0)
+        self._distances.resize(node_count, 0)
+        self._predecessor_edges.assign(node_count, -1)
+        with nogil:
+            for i in range(node_count):
+                if self._distances[i] > 0:
+                    self._distances[i] = 0
+            for search_pass in range(node_count):
+                relaxed = False
+                for edge in range(edge_count):
+                    distance = self._distances[self._edge_sources[edge]] + self._edge_weights[edge]
+                    if distance < self._distances[self._edge_targets[edge]] - RELAXATION_TOLERANCE:
+                        self._distances[self._edge_targets[edge]] = distance
+                        self._predecessor_edges[self._edge_targets[edge]] = edge
+                        relaxed = True
+                if not relaxed:
+                    break
+
+        # Without a relaxation in the last pass, there's no negative cycle.
+        self._warm_start = not relaxed
+        if relaxed:
+            # Any cycle of predecessor edges is a negative cycle. Walk back the predecessors from every node, marking
+            # the nodes visited from it, until reaching a node already visited - from the same node means a new cycle.
+            visited_from.assign(node_count, -1)
+            for i in range(node_count):
+                node = i
+                while node >= 0 and visited_from[node] < 0:
+                    visited_from[node] = i
+                    predecessor_edge = self._predecessor_edges[node]
+                    node = self._edge_sources[predecessor_edge] if predecessor_edge >= 0 else -1
+                if node < 0 or visited_from[node] != i:
+                    continue
+                cycle_edges.clear()
+                cycle_node = node
+                while True:
+                    predecessor_edge = self._predecessor_edges[cycle_node]
+                    cycle_edges.push_back(predecessor_edge)
+                    cycle_node = self._edge_sources[predecessor_edge]
+                    if cycle_node == node:
+                        break
+                path = self.c_make_path(cycle_edges)
+                if path.profitability >= self._min_profitability:
+                    profitable_paths.append(path)
+            profitable_paths.sort(key=lambda p: p.profitability, reverse=True)
+
+        self._profitable_paths = profitable_paths
+        return profitable_paths
+
+    cdef object c_make_path(self, vector[int] cycle_edges):
+        """
+        Makes the path of a cycle, given by its edges in reverse order, from the leg that starts at its lowest node.
+        """
+        cdef:
+            size_t i
+            size_t cycle_length = cycle_edges.size()
+            size_t start = 0
+            int edge
+            double weight = 0
+            list legs = []
+
+        for i in range(cycle_length):
+            if self._edge_sources[cycle_edges[i]] < self._edge_sources[cycle_edges[start]]:
+                start = i
+        for i in range(cycle_length):
+            edge = cycle_edges[(start + cycle_length - i) % cycle_length]
+            weight += self._edge_weights[edge]
+            legs.append(ArbitragePathLeg(*self._edge_legs[edge],
+                                         price=self._edge_prices[edge],
+                                         rate=exp(-self._edge_weights[edge])))
+        return ArbitragePath(legs, exp(-weight) - 1)
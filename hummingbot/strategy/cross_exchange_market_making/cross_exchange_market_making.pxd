@@ -33,6 +33,7 @@ cdef class CrossExchangeMarketMakingStrategy(StrategyBase):
         object _exchange_rate_conversion
         OrderIDMarketPairTracker _market_pair_tracker
 
+    cdef c_subscribe_clock_wakeups(self)
     cdef c_process_market_pair(self,
                                object market_pair,
                                list active_ddex_orders)
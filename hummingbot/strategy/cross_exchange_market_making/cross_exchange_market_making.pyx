@@ -15,7 +15,11 @@ from typing import (
     Optional
 )
 from hummingbot.core.clock cimport Clock
-from hummingbot.core.event.events import TradeType
+from hummingbot.core.event.events import (
+    MarketEvent,
+    OrderBookEvent,
+    TradeType
+)
 from hummingbot.core.data_type.limit_order cimport LimitOrder
 from hummingbot.core.data_type.limit_order import LimitOrder
 from hummingbot.core.network_iterator import NetworkStatus
@@ -277,6 +281,7 @@ cdef class CrossExchangeMarketMakingStrategy(StrategyBase):
                     # Markets are ready, ok to proceed.
                     if self.OPTION_LOG_STATUS_REPORT:
                         self.logger().info(f"Markets are ready. Trading started.")
+                    self.c_subscribe_clock_wakeups()
 
             if should_report_warnings:
                 # Check if all markets are still connected or not. If not, log a warning.
@@ -304,6 +309,18 @@ cdef class CrossExchangeMarketMakingStrategy(StrategyBase):
         finally:
             self._last_timestamp = timestamp
 
+    cdef c_subscribe_clock_wakeups(self):
+        """
+        With an event driven clock, tick as soon as a hedging order book changes or a maker order is filled, instead of
+        waiting for the next regular tick.
+        """
+        if self._clock is None or not self._clock.event_driven:
+            return
+        for maker_market in self._maker_markets:
+            self._clock.subscribe_wakeup(self, maker_market, MarketEvent.OrderFilled)
+        for market_pair in self._market_pairs.values():
+            self._clock.subscribe_wakeup(self, market_pair.taker.order_book, OrderBookEvent.UpdateEvent)
+
     cdef c_process_market_pair(self, object market_pair, list active_orders):
         """
         For market pair being managed by this strategy object, do the following:
@@ -1,6 +1,6 @@
 from decimal import Decimal
+import numpy as np
 
-from hummingbot.core.data_type.order_book cimport OrderBook
 from hummingbot.market.market_base cimport MarketBase
 from hummingbot.market.market_base import MarketBase
 from .data_types import PricingProposal
@@ -41,24 +41,14 @@ cdef class ConstantMultipleSpreadPricingDelegate(OrderPricingDelegate):
                                            object asset_mid_price):
         cdef:
             MarketBase maker_market = market_info.market
-            OrderBook maker_order_book = maker_market.c_get_order_book(market_info.trading_pair)
-            str market_name = maker_market.name
-            object mid_price = asset_mid_price
-            list bid_prices = [maker_market.c_quantize_order_price(market_info.trading_pair,
-                                                                   mid_price * (Decimal(1) - self.bid_spread))]
-            list ask_prices = [maker_market.c_quantize_order_price(market_info.trading_pair,
-                                                                   mid_price * (Decimal(1) + self.ask_spread))]
-
-        for _ in range(self.number_of_orders - 1):
-            last_bid_price = bid_prices[-1]
-            current_bid_price = maker_market.c_quantize_order_price(market_info.trading_pair,
-                                                                    last_bid_price * (Decimal(1) - self.order_interval_size))
-            bid_prices.append(current_bid_price)
-
-            last_ask_price = ask_prices[-1]
-            current_ask_price = maker_market.c_quantize_order_price(market_info.trading_pair,
-                                                                    last_ask_price * (Decimal(1) + self.order_interval_size))
-
-            ask_prices.append(current_ask_price)
-
-        return PricingProposal(bid_prices, ask_prices)
+            double mid_price = float(asset_mid_price)
+            object levels = np.arange(self._number_of_orders, dtype=np.float64)
+            # Every level is one order interval further away from the previous one, so the whole ladder is computed
+            # at once and quantized in a single pass.
+            object bid_prices = (mid_price * (1.0 - float(self._bid_spread)) *
+                                 np.power(1.0 - float(self._order_interval_size), levels))
+            object ask_prices = (mid_price * (1.0 + float(self._ask_spread)) *
+                                 np.power(1.0 + float(self._order_interval_size), levels))
+
+        return PricingProposal(maker_market.c_quantize_order_prices(market_info.trading_pair, bid_prices),
+                               maker_market.c_quantize_order_prices(market_info.trading_pair, ask_prices))
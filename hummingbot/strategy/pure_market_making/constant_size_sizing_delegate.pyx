@@ -53,11 +53,13 @@ cdef class ConstantSizeSizingDelegate(OrderSizingDelegate):
             object required_quote_asset_balance
 
         for active_order in active_orders:
+            # Orders being refreshed count towards the balances, but don't stop their replacements from being proposed.
+            is_refreshing = strategy.c_is_refreshing_order(active_order.client_order_id)
             if active_order.is_buy:
-                has_active_bid = True
+                has_active_bid = has_active_bid or not is_refreshing
                 quote_asset_balance += active_order.quantity * active_order.price
             else:
-                has_active_ask = True
+                has_active_ask = has_active_ask or not is_refreshing
                 base_asset_balance += active_order.quantity
 
         if market.name == "binance":
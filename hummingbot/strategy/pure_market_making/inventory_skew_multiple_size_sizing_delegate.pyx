@@ -1,5 +1,6 @@
 from decimal import Decimal
 import logging
+import numpy as np
 from typing import Optional
 
 from hummingbot.market.market_base cimport MarketBase
@@ -75,15 +76,15 @@ cdef class InventorySkewMultipleSizeSizingDelegate(OrderSizingDelegate):
             bint has_active_ask = False
             list buy_orders = []
             list sell_orders = []
-            current_bid_order_size
-            current_ask_order_size
 
         for active_order in active_orders:
+            # Orders being refreshed count towards the balances, but don't stop their replacements from being proposed.
+            is_refreshing = strategy.c_is_refreshing_order(active_order.client_order_id)
             if active_order.is_buy:
-                has_active_bid = True
+                has_active_bid = has_active_bid or not is_refreshing
                 quote_asset_balance += active_order.quantity * active_order.price
             else:
-                has_active_ask = True
+                has_active_ask = has_active_ask or not is_refreshing
                 base_asset_balance += active_order.quantity
 
         if has_active_bid and has_active_ask:
@@ -122,67 +123,57 @@ cdef class InventorySkewMultipleSizeSizingDelegate(OrderSizingDelegate):
             else:
                 current_target_quote_ratio = Decimal(2) - current_target_base_ratio
 
-        for i in range(self.number_of_orders):
-            current_bid_order_size = (self.order_start_size + self.order_step_size * i) * current_target_quote_ratio
-            current_ask_order_size = (self.order_start_size + self.order_step_size * i) * current_target_base_ratio
-            if market.name == "binance":
-                # For binance fees is calculated in base token, so need to adjust for that
+        # The order sizes of all levels are computed at once, and each side is quantized in a single pass.
+        order_sizes = (float(self._order_start_size) +
+                       float(self._order_step_size) * np.arange(self._number_of_orders, dtype=np.float64))
+        buy_prices = np.array(pricing_proposal.buy_order_prices[:self._number_of_orders], dtype=np.float64)
+        sell_prices = np.array(pricing_proposal.sell_order_prices[:self._number_of_orders], dtype=np.float64)
+
+        if market.name == "binance":
+            # For binance fees is calculated in base token, so need to adjust for that
+            quantized_bid_order_sizes = market.c_quantize_order_amounts(trading_pair,
+                                                                        order_sizes * float(current_target_quote_ratio),
+                                                                        buy_prices)
+            buy_fee_percent = s_decimal_0
+        else:
+            quantized_bid_order_sizes = market.c_quantize_order_amounts(trading_pair,
+                                                                        order_sizes * float(current_target_quote_ratio))
+            # For other exchanges, fees is calculated in quote tokens, so need to ensure you have enough for order + fees.
+            # The fee percentage is the same for every level, so it only needs to be looked up once.
+            buy_fee_percent = market.c_get_fee(
+                market_info.base_asset,
+                market_info.quote_asset,
+                OrderType.MARKET,
+                TradeType.BUY,
+                quantized_bid_order_sizes[0],
+                pricing_proposal.buy_order_prices[0]
+            ).percent
+        quantized_ask_order_sizes = market.c_quantize_order_amounts(trading_pair,
+                                                                    order_sizes * float(current_target_base_ratio),
+                                                                    sell_prices)
+
+        # Each level can only use the balance left over by the levels before it.
+        for quantized_bid_order_size, buy_price in zip(quantized_bid_order_sizes, pricing_proposal.buy_order_prices):
+            quote_asset_order_size = quantized_bid_order_size * buy_price * (Decimal(1) + buy_fee_percent)
+            if quote_asset_balance < current_quote_asset_order_size_total + quote_asset_order_size:
+                quote_asset_order_size = quote_asset_balance - current_quote_asset_order_size_total
                 quantized_bid_order_size = market.c_quantize_order_amount(
-                    market_info.trading_pair,
-                    current_bid_order_size,
-                    pricing_proposal.buy_order_prices[i]
+                    trading_pair,
+                    quote_asset_order_size / buy_price * (Decimal(1) - buy_fee_percent),
+                    buy_price
                 )
-                # Check whether you have enough quote tokens
-                quote_asset_order_size = quantized_bid_order_size * pricing_proposal.buy_order_prices[i]
-                if quote_asset_balance < current_quote_asset_order_size_total + quote_asset_order_size:
-                    quote_asset_order_size = quote_asset_balance - current_quote_asset_order_size_total
-                    bid_order_size = quote_asset_order_size / pricing_proposal.buy_order_prices[i]
-                    quantized_bid_order_size = market.c_quantize_order_amount(
-                        market_info.trading_pair,
-                        bid_order_size,
-                        pricing_proposal.buy_order_prices[i]
-                    )
-
-            else:
-                quantized_bid_order_size = market.c_quantize_order_amount(
-                    market_info.trading_pair,
-                    current_bid_order_size
-                )
-                buy_fees = market.c_get_fee(
-                    market_info.base_asset,
-                    market_info.quote_asset,
-                    OrderType.MARKET,
-                    TradeType.BUY,
-                    quantized_bid_order_size,
-                    pricing_proposal.buy_order_prices[i]
-                )
-                # For other exchanges, fees is calculated in quote tokens, so need to ensure you have enough for order + fees
-                quote_asset_order_size = quantized_bid_order_size * pricing_proposal.buy_order_prices[i] * (Decimal(1) + buy_fees.percent)
-                if quote_asset_balance < current_quote_asset_order_size_total + quote_asset_order_size:
-                    quote_asset_order_size = quote_asset_balance - current_quote_asset_order_size_total
-                    bid_order_size = quote_asset_order_size / pricing_proposal.buy_order_prices[i] * (Decimal(1) - buy_fees.percent)
-                    quantized_bid_order_size = market.c_quantize_order_amount(
-                        market_info.trading_pair,
-                        bid_order_size,
-                        pricing_proposal.buy_order_prices[i]
-                    )
             current_quote_asset_order_size_total += quote_asset_order_size
+            if quantized_bid_order_size > s_decimal_0:
+                buy_orders.append(quantized_bid_order_size)
 
-            quantized_ask_order_size = market.c_quantize_order_amount(
-                market_info.trading_pair,
-                current_ask_order_size,
-                pricing_proposal.sell_order_prices[i]
-            )
+        for quantized_ask_order_size, sell_price in zip(quantized_ask_order_sizes, pricing_proposal.sell_order_prices):
             if base_asset_balance < current_base_asset_order_size_total + quantized_ask_order_size:
                 quantized_ask_order_size = market.c_quantize_order_amount(
-                    market_info.trading_pair,
+                    trading_pair,
                     base_asset_balance - current_base_asset_order_size_total,
-                    pricing_proposal.sell_order_prices[i]
+                    sell_price
                 )
-
             current_base_asset_order_size_total += quantized_ask_order_size
-            if quantized_bid_order_size > s_decimal_0:
-                buy_orders.append(quantized_bid_order_size)
             if quantized_ask_order_size > s_decimal_0:
                 sell_orders.append(quantized_ask_order_size)
 
@@ -62,6 +62,14 @@ def is_valid_order_amount(value: str) -> bool:
         return False
 
 
+def is_valid_order_refresh_tolerance_pct(value: str) -> bool:
+    # Any negative value, e.g. -1, turns the tolerance off.
+    try:
+        return Decimal(value) < 0 or is_valid_percent(value)
+    except Exception:
+        return False
+
+
 def external_market_trading_pair_prompt():
     external_market = pure_market_making_config_map.get("external_price_source_exchange").value
     return f'Enter the token trading pair on {external_market} >>> '
@@ -203,6 +211,14 @@ pure_market_making_config_map = {
                   type_str="bool",
                   default=False,
                   validator=is_valid_bool),
+    "order_refresh_tolerance_pct":
+        ConfigVar(key="order_refresh_tolerance_pct",
+                  prompt="Enter the percent change in price and size within which your orders are kept instead of "
+                         "refreshed (Enter 0.01 to indicate 1%, or -1 to always refresh them) >>> ",
+                  type_str="decimal",
+                  default=-1,
+                  migration_default=Decimal(-1),
+                  validator=is_valid_order_refresh_tolerance_pct),
     "external_pricing_source": ConfigVar(key="external_pricing_source",
                                          prompt="Would you like to use an external pricing source for mid-market "
                                                 "price? (Yes/No) >>> ",
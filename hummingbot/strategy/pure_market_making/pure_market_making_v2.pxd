@@ -25,8 +25,10 @@ cdef class PureMarketMakingStrategyV2(StrategyBase):
         double _last_timestamp
         double _filled_order_replenish_wait_time
         object _best_bid_ask_jump_orders_depth
+        object _order_refresh_tolerance_pct
 
         dict _time_to_cancel
+        set _refreshing_order_ids
 
         int64_t _logging_options
 
@@ -49,4 +51,12 @@ cdef class PureMarketMakingStrategyV2(StrategyBase):
                                                                      object market_info,
                                                                      object pricing_proposal,
                                                                      object sizing_proposal)
+    cdef object c_get_prices_with_tx_costs(self,
+                                           object market_info,
+                                           object trade_type,
+                                           list prices,
+                                           list amounts)
     cdef object c_filter_orders_proposal_for_takers(self, object market_info, object orders_proposal)
+    cdef bint c_is_refreshing_order(self, str order_id)
+    cdef object c_reconcile_orders_proposal(self, object market_info, list active_orders, object orders_proposal)
+    cdef tuple c_match_refreshing_orders(self, list refreshing_orders, list order_prices, list order_sizes)
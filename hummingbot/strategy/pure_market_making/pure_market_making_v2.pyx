@@ -1,5 +1,6 @@
 from decimal import Decimal
 import logging
+import numpy as np
 from typing import (
     List,
     Tuple,
@@ -51,6 +52,7 @@ from .asset_price_delegate import AssetPriceDelegate
 
 NaN = float("nan")
 s_decimal_zero = Decimal(0)
+s_decimal_neg_one = Decimal(-1)
 s_logger = None
 
 
@@ -105,7 +107,13 @@ cdef class PureMarketMakingStrategyV2(StrategyBase):
                  limit_order_min_expiration: float = 130.0,
                  status_report_interval: float = 900,
                  asset_price_delegate: AssetPriceDelegate = None,
-                 expiration_seconds: float = NaN):
+                 expiration_seconds: float = NaN,
+                 order_refresh_tolerance_pct: Decimal = s_decimal_neg_one):
+        """
+        :param order_refresh_tolerance_pct: When orders are due to be refreshed, the ones within this percentage of
+            the price and size of a newly proposed order are kept instead of being cancelled and placed again, so they
+            keep their place in the order book queue. Negative values disable it, i.e. all orders are refreshed.
+        """
 
         if len(market_infos) < 1:
             raise ValueError(f"market_infos must not be empty.")
@@ -122,7 +130,10 @@ cdef class PureMarketMakingStrategyV2(StrategyBase):
         self._filled_order_replenish_wait_time = filled_order_replenish_wait_time
         self._add_transaction_costs_to_orders = add_transaction_costs_to_orders
 
+        self._order_refresh_tolerance_pct = order_refresh_tolerance_pct
+
         self._time_to_cancel = {}
+        self._refreshing_order_ids = set()
 
         self._logging_options = logging_options
         self._last_timestamp = 0
@@ -183,6 +194,10 @@ cdef class PureMarketMakingStrategyV2(StrategyBase):
     def sizing_delegate(self) -> OrderSizingDelegate:
         return self._sizing_delegate
 
+    @property
+    def order_refresh_tolerance_pct(self) -> Decimal:
+        return self._order_refresh_tolerance_pct
+
     @property
     def asset_price_delegate(self) -> AssetPriceDelegate:
         return self._asset_price_delegate
@@ -236,6 +251,12 @@ cdef class PureMarketMakingStrategyV2(StrategyBase):
     def cancel_order(self, market_info: MarketTradingPairTuple, order_id: str):
         return self.c_cancel_order(market_info, order_id)
 
+    def reconcile_orders_proposal(self,
+                                  market_info: MarketTradingPairTuple,
+                                  active_orders: List[LimitOrder],
+                                  orders_proposal: OrdersProposal) -> OrdersProposal:
+        return self.c_reconcile_orders_proposal(market_info, active_orders, orders_proposal)
+
     def get_order_price_proposal(self, market_info: MarketTradingPairTuple) -> PricingProposal:
         asset_mid_price = Decimal("0")
         if self._asset_price_delegate is None:
@@ -321,6 +342,10 @@ cdef class PureMarketMakingStrategyV2(StrategyBase):
                                                                                    market_info_to_active_orders.get(market_info, []),
                                                                                    orders_proposal)
                 filtered_proposal = self.c_filter_orders_proposal_for_takers(market_info, filtered_proposal)
+                if self._order_refresh_tolerance_pct >= s_decimal_zero:
+                    filtered_proposal = self.c_reconcile_orders_proposal(market_info,
+                                                                         market_info_to_active_orders.get(market_info, []),
+                                                                         filtered_proposal)
                 self.c_execute_orders_proposal(market_info, filtered_proposal)
         finally:
             self._last_timestamp = timestamp
@@ -355,6 +380,103 @@ cdef class PureMarketMakingStrategyV2(StrategyBase):
                               sell_sizes,
                               orders_proposal.cancel_order_ids)
 
+    cdef bint c_is_refreshing_order(self, str order_id):
+        """
+        Whether the order is being cancelled by the orders proposal being generated, with its replacement proposed by
+        the sizing delegate at the same time.
+        """
+        return order_id in self._refreshing_order_ids
+
+    # Turns the orders to be cancelled into the proposed orders with the fewest cancels and creates, by keeping the
+    # orders to be cancelled that are within the refresh tolerance of a proposed order.
+    cdef object c_reconcile_orders_proposal(self, object market_info, list active_orders, object orders_proposal):
+        cdef:
+            int64_t actions = orders_proposal.actions
+            set cancel_order_ids = set(orders_proposal.cancel_order_ids)
+            list buy_prices = list(orders_proposal.buy_order_prices)
+            list buy_sizes = list(orders_proposal.buy_order_sizes)
+            list sell_prices = list(orders_proposal.sell_order_prices)
+            list sell_sizes = list(orders_proposal.sell_order_sizes)
+            list kept_order_ids = []
+            tuple match_result
+
+        if not (actions & ORDER_PROPOSAL_ACTION_CANCEL_ORDERS and actions & ORDER_PROPOSAL_ACTION_CREATE_ORDERS):
+            return orders_proposal
+
+        if orders_proposal.buy_order_type is OrderType.LIMIT:
+            match_result = self.c_match_refreshing_orders(
+                [o for o in active_orders if o.is_buy and o.client_order_id in cancel_order_ids],
+                buy_prices,
+                buy_sizes
+            )
+            buy_prices, buy_sizes = match_result[0], match_result[1]
+            kept_order_ids.extend(match_result[2])
+        if orders_proposal.sell_order_type is OrderType.LIMIT:
+            match_result = self.c_match_refreshing_orders(
+                [o for o in active_orders if not o.is_buy and o.client_order_id in cancel_order_ids],
+                sell_prices,
+                sell_sizes
+            )
+            sell_prices, sell_sizes = match_result[0], match_result[1]
+            kept_order_ids.extend(match_result[2])
+
+        if len(kept_order_ids) == 0:
+            return orders_proposal
+
+        # The kept orders are refreshed again after another cancel order wait time.
+        for order_id in kept_order_ids:
+            self._time_to_cancel[order_id] = self._current_timestamp + self._cancel_order_wait_time
+        if self._logging_options & self.OPTION_LOG_ADJUST_ORDER:
+            self.log_with_clock(
+                logging.INFO,
+                f"({market_info.trading_pair}) Keeping the orders {kept_order_ids} as they're within the refresh "
+                f"tolerance of the new orders."
+            )
+
+        cancel_order_ids.difference_update(kept_order_ids)
+        if len(cancel_order_ids) == 0:
+            actions &= ~ORDER_PROPOSAL_ACTION_CANCEL_ORDERS
+        if len(buy_sizes) == 0 and len(sell_sizes) == 0:
+            actions &= ~ORDER_PROPOSAL_ACTION_CREATE_ORDERS
+        return OrdersProposal(actions,
+                              orders_proposal.buy_order_type,
+                              buy_prices,
+                              buy_sizes,
+                              orders_proposal.sell_order_type,
+                              sell_prices,
+                              sell_sizes,
+                              [order_id for order_id in orders_proposal.cancel_order_ids
+                               if order_id in cancel_order_ids])
+
+    # Matches each proposed order to the closest priced order to be refreshed within the refresh tolerance of its price
+    # and size. Returns the prices and sizes of the proposed orders without a match, and the ids of the matched orders.
+    cdef tuple c_match_refreshing_orders(self, list refreshing_orders, list order_prices, list order_sizes):
+        cdef:
+            object tolerance = self._order_refresh_tolerance_pct
+            list unmatched_orders = list(refreshing_orders)
+            list remaining_prices = []
+            list remaining_sizes = []
+            list matched_order_ids = []
+            LimitOrder matched_order
+
+        for price, size in zip(order_prices, order_sizes):
+            if size <= s_decimal_zero:
+                continue
+            matched_order = None
+            for refreshing_order in unmatched_orders:
+                if (abs(refreshing_order.price - price) <= price * tolerance and
+                        abs(refreshing_order.quantity - size) <= size * tolerance and
+                        (matched_order is None or
+                         abs(refreshing_order.price - price) < abs(matched_order.price - price))):
+                    matched_order = refreshing_order
+            if matched_order is None:
+                remaining_prices.append(price)
+                remaining_sizes.append(size)
+            else:
+                unmatched_orders.remove(matched_order)
+                matched_order_ids.append(matched_order.client_order_id)
+        return remaining_prices, remaining_sizes, matched_order_ids
+
     # Compare the market price with the top bid and top ask price
     cdef object c_get_penny_jumped_pricing_proposal(self,
                                                     object market_info,
@@ -448,91 +570,98 @@ cdef class PureMarketMakingStrategyV2(StrategyBase):
                 sizing_proposal.sell_order_sizes[0] == s_decimal_zero:
             return do_not_place_order, pricing_proposal
 
-        buy_index = 0
-        for buy_price, buy_amount in zip(pricing_proposal.buy_order_prices,
-                                         sizing_proposal.buy_order_sizes):
-            if buy_amount > s_decimal_zero:
-                fee_object = maker_market.c_get_fee(
-                    market_info.base_asset,
-                    market_info.quote_asset,
-                    OrderType.LIMIT,
-                    TradeType.BUY,
-                    buy_amount,
-                    buy_price
-                )
-                # Total flat fees charged by the exchange
-                total_flat_fees = self.c_sum_flat_fees(market_info.quote_asset,
-                                                       fee_object.flat_fees)
-                # Find the fixed cost per unit size for the total amount
-                # Fees is in Float
-                fixed_cost_per_unit = total_flat_fees / buy_amount
-                # New Price = Price * (1 - maker_fees) - Fixed_fees_per_unit
-                buy_price_with_tx_cost = buy_price * (Decimal(1) - fee_object.percent) - fixed_cost_per_unit
-            else:
-                buy_price_with_tx_cost = buy_price
-
-            buy_price_with_tx_cost = maker_market.c_quantize_order_price(market_info.trading_pair,
-                                                                         buy_price_with_tx_cost)
-
-            # If the buy price with transaction cost is less than or equal to zero
-            # do not place orders
-            if buy_price_with_tx_cost <= s_decimal_zero:
-                if should_report_warnings:
-                    self.logger().warning(f"Buy price with transaction cost is "
-                                          f"less than or equal to zero. Stopping Order placements. ")
-                do_not_place_order = True
-                break
-
-            # If the buy price with the transaction cost is 10% below the buy price due to price adjustment,
-            # Display warning
-            if (buy_price_with_tx_cost / buy_price) < (Decimal(1) - warning_report_threshold):
-                if should_report_warnings:
-                    self.logger().warning(f"Buy price with transaction cost is "
-                                          f"{warning_report_threshold * 100} % below the buy price ")
-
-            buy_prices_with_tx_costs[buy_index] = buy_price_with_tx_cost
-            buy_index += 1
-
-        if do_not_place_order:
+        # Transaction costs are added to every level of a side at once, then quantized in a single pass.
+        # Price levels past the end of the sizing proposal keep their original prices.
+        buy_levels = min(len(pricing_proposal.buy_order_prices), len(sizing_proposal.buy_order_sizes))
+        buy_prices = np.array(pricing_proposal.buy_order_prices[:buy_levels], dtype=np.float64)
+        buy_prices_with_tx_costs_array = self.c_get_prices_with_tx_costs(market_info,
+                                                                         TradeType.BUY,
+                                                                         pricing_proposal.buy_order_prices[:buy_levels],
+                                                                         sizing_proposal.buy_order_sizes[:buy_levels])
+        buy_prices_with_tx_costs = (maker_market.c_quantize_order_prices(market_info.trading_pair,
+                                                                         buy_prices_with_tx_costs_array) +
+                                    pricing_proposal.buy_order_prices[buy_levels:])
+
+        # If the buy price with transaction cost is less than or equal to zero
+        # do not place orders
+        if any(buy_price_with_tx_cost <= s_decimal_zero
+               for buy_price_with_tx_cost in buy_prices_with_tx_costs[:buy_levels]):
+            if should_report_warnings:
+                self.logger().warning(f"Buy price with transaction cost is "
+                                      f"less than or equal to zero. Stopping Order placements. ")
+            do_not_place_order = True
             return do_not_place_order, pricing_proposal
 
-        sell_index = 0
-        for sell_price, sell_amount in zip(pricing_proposal.sell_order_prices,
-                                           sizing_proposal.sell_order_sizes):
-            if sell_amount > s_decimal_zero:
-                fee_object = maker_market.c_get_fee(
-                    market_info.base_asset,
-                    market_info.quote_asset,
-                    OrderType.LIMIT,
-                    TradeType.SELL,
-                    sell_amount,
-                    sell_price
-                )
-                # Total flat fees charged by the exchange
-                total_flat_fees = self.c_sum_flat_fees(market_info.quote_asset,
-                                                       fee_object.flat_fees)
-                # Find the fixed cost per unit size for the total amount
-                # Fees is in Float
-                fixed_cost_per_unit = total_flat_fees / sell_amount
-                # New Price = Price * (1 + maker_fees) + Fixed_fees_per_unit
-                sell_price_with_tx_cost = sell_price * (Decimal(1) + fee_object.percent) + fixed_cost_per_unit
-            else:
-                sell_price_with_tx_cost = sell_price
-
-            sell_price_with_tx_cost = maker_market.c_quantize_order_price(market_info.trading_pair,
-                                                                          Decimal(sell_price_with_tx_cost))
-
-            if (sell_price_with_tx_cost / sell_price) > (Decimal(1) + warning_report_threshold):
-                if should_report_warnings:
-                    self.logger().warning(f"Sell price with transaction cost is "
-                                          f"{warning_report_threshold * 100} % above the sell price")
-
-            sell_prices_with_tx_costs[sell_index] = sell_price_with_tx_cost
-            sell_index += 1
+        # If the buy price with the transaction cost is 10% below the buy price due to price adjustment,
+        # Display warning
+        if np.any(buy_prices_with_tx_costs_array / buy_prices < 1.0 - float(warning_report_threshold)):
+            if should_report_warnings:
+                self.logger().warning(f"Buy price with transaction cost is "
+                                      f"{warning_report_threshold * 100} % below the buy price ")
+
+        sell_levels = min(len(pricing_proposal.sell_order_prices), len(sizing_proposal.sell_order_sizes))
+        sell_prices = np.array(pricing_proposal.sell_order_prices[:sell_levels], dtype=np.float64)
+        sell_prices_with_tx_costs_array = self.c_get_prices_with_tx_costs(market_info,
+                                                                          TradeType.SELL,
+                                                                          pricing_proposal.sell_order_prices[:sell_levels],
+                                                                          sizing_proposal.sell_order_sizes[:sell_levels])
+        sell_prices_with_tx_costs = (maker_market.c_quantize_order_prices(market_info.trading_pair,
+                                                                          sell_prices_with_tx_costs_array) +
+                                     pricing_proposal.sell_order_prices[sell_levels:])
+
+        if np.any(sell_prices_with_tx_costs_array / sell_prices > 1.0 + float(warning_report_threshold)):
+            if should_report_warnings:
+                self.logger().warning(f"Sell price with transaction cost is "
+                                      f"{warning_report_threshold * 100} % above the sell price")
 
         return (do_not_place_order,
                 PricingProposal(buy_prices_with_tx_costs, sell_prices_with_tx_costs))
 
+    cdef object c_get_prices_with_tx_costs(self,
+                                           object market_info,
+                                           object trade_type,
+                                           list prices,
+                                           list amounts):
+        """
+        Adds transaction costs to the prices of all order levels on one side of the book.
+        :param market_info: Pure Market making Pair object
+        :param trade_type: TradeType.BUY or TradeType.SELL
+        :param prices: Order prices of each level
+        :param amounts: Order sizes of each level
+        :return: float64 array of the prices with transaction costs
+        """
+        cdef:
+            MarketBase maker_market = market_info.market
+            object price_array = np.array(prices, dtype=np.float64)
+            object amount_array = np.array(amounts, dtype=np.float64)
+            object has_amount = amount_array > 0
+            double fee_sign = -1.0 if trade_type is TradeType.BUY else 1.0
+            int first_level
+
+        if not has_amount.any():
+            return price_array
+
+        # The fee rate doesn't depend on the order level, so it only needs to be looked up once
+        first_level = int(np.argmax(has_amount))
+        fee_object = maker_market.c_get_fee(
+            market_info.base_asset,
+            market_info.quote_asset,
+            OrderType.LIMIT,
+            trade_type,
+            amounts[first_level],
+            prices[first_level]
+        )
+        # Total flat fees charged by the exchange
+        total_flat_fees = float(self.c_sum_flat_fees(market_info.quote_asset, fee_object.flat_fees))
+        # Find the fixed cost per unit size for the total amount of each level
+        fixed_costs_per_unit = np.divide(total_flat_fees, amount_array,
+                                         out=np.zeros_like(amount_array), where=has_amount)
+        # Buy: New Price = Price * (1 - maker_fees) - Fixed_fees_per_unit
+        # Sell: New Price = Price * (1 + maker_fees) + Fixed_fees_per_unit
+        return np.where(has_amount,
+                        price_array * (1.0 + fee_sign * float(fee_object.percent)) + fee_sign * fixed_costs_per_unit,
+                        price_array)
+
     cdef object c_get_orders_proposal_for_market_info(self, object market_info, list active_orders):
         cdef:
             int actions = 0
@@ -563,23 +692,6 @@ cdef class PureMarketMakingStrategyV2(StrategyBase):
                                                                         pricing_proposal,
                                                                         active_orders)
 
-        sizing_proposal = self._sizing_delegate.c_get_order_size_proposal(self,
-                                                                          market_info,
-                                                                          active_orders,
-                                                                          pricing_proposal)
-        if self._add_transaction_costs_to_orders:
-            no_order_placement, pricing_proposal = self.c_check_and_add_transaction_costs_to_pricing_proposal(
-                market_info,
-                pricing_proposal,
-                sizing_proposal)
-
-        if sizing_proposal.buy_order_sizes[0] > 0 or sizing_proposal.sell_order_sizes[0] > 0:
-            actions |= ORDER_PROPOSAL_ACTION_CREATE_ORDERS
-
-        if no_order_placement:
-            # Order creation bit is set to zero
-            actions = actions & (1 << 1)
-
         if ((market_info.market.name not in self.RADAR_RELAY_TYPE_EXCHANGES) or
                 (market_info.market.display_name == "bamboo_relay" and market_info.market.use_coordinator)):
             for active_order in active_orders:
@@ -598,6 +710,31 @@ cdef class PureMarketMakingStrategyV2(StrategyBase):
             if len(cancel_order_ids) > 0:
                 actions |= ORDER_PROPOSAL_ACTION_CANCEL_ORDERS
 
+        # With a refresh tolerance, the orders to be cancelled are refreshed with new orders in the same proposal, so
+        # the ones that haven't moved can be kept by c_reconcile_orders_proposal().
+        if self._order_refresh_tolerance_pct >= s_decimal_zero:
+            self._refreshing_order_ids = set(cancel_order_ids)
+        try:
+            sizing_proposal = self._sizing_delegate.c_get_order_size_proposal(self,
+                                                                              market_info,
+                                                                              active_orders,
+                                                                              pricing_proposal)
+        finally:
+            self._refreshing_order_ids = set()
+
+        if self._add_transaction_costs_to_orders:
+            no_order_placement, pricing_proposal = self.c_check_and_add_transaction_costs_to_pricing_proposal(
+                market_info,
+                pricing_proposal,
+                sizing_proposal)
+
+        if sizing_proposal.buy_order_sizes[0] > 0 or sizing_proposal.sell_order_sizes[0] > 0:
+            actions |= ORDER_PROPOSAL_ACTION_CREATE_ORDERS
+
+        if no_order_placement:
+            # Order creation bit is set to zero
+            actions = actions & (1 << 1)
+
         return OrdersProposal(actions,
                               OrderType.LIMIT,
                               pricing_proposal.buy_order_prices,
@@ -743,8 +880,7 @@ cdef class PureMarketMakingStrategyV2(StrategyBase):
 
         # Cancel orders.
         if actions & ORDER_PROPOSAL_ACTION_CANCEL_ORDERS:
-            for order_id in orders_proposal.cancel_order_ids:
-                self.c_cancel_order(market_info, order_id)
+            self.c_batch_cancel_orders(market_info, list(orders_proposal.cancel_order_ids))
 
         # Create orders.
         if actions & ORDER_PROPOSAL_ACTION_CREATE_ORDERS:
@@ -760,14 +896,13 @@ cdef class PureMarketMakingStrategyV2(StrategyBase):
                             f"({market_info.trading_pair}) Creating limit bid orders at (Size, Price): {price_quote_str}"
                         )
 
-                    for idx in range(len(orders_proposal.buy_order_sizes)):
-                        bid_order_id = self.c_buy_with_specific_market(
-                            market_info,
-                            orders_proposal.buy_order_sizes[idx],
-                            order_type=OrderType.LIMIT,
-                            price=orders_proposal.buy_order_prices[idx],
-                            expiration_seconds=expiration_seconds
-                        )
+                    for bid_order_id in self.c_batch_buy_with_specific_market(
+                        market_info,
+                        list(orders_proposal.buy_order_sizes),
+                        list(orders_proposal.buy_order_prices),
+                        order_type=OrderType.LIMIT,
+                        expiration_seconds=expiration_seconds
+                    ):
                         self._time_to_cancel[bid_order_id] = self._current_timestamp + self._cancel_order_wait_time
 
                 elif orders_proposal.buy_order_type is OrderType.MARKET:
@@ -785,14 +920,13 @@ cdef class PureMarketMakingStrategyV2(StrategyBase):
                             f"({market_info.trading_pair}) Creating limit ask orders at (Size, Price): {price_quote_str}"
                         )
 
-                    for idx in range(len(orders_proposal.sell_order_sizes)):
-                        ask_order_id = self.c_sell_with_specific_market(
-                            market_info,
-                            orders_proposal.sell_order_sizes[idx],
-                            order_type=OrderType.LIMIT,
-                            price=orders_proposal.sell_order_prices[idx],
-                            expiration_seconds=expiration_seconds
-                        )
+                    for ask_order_id in self.c_batch_sell_with_specific_market(
+                        market_info,
+                        list(orders_proposal.sell_order_sizes),
+                        list(orders_proposal.sell_order_prices),
+                        order_type=OrderType.LIMIT,
+                        expiration_seconds=expiration_seconds
+                    ):
                         self._time_to_cancel[ask_order_id] = self._current_timestamp + self._cancel_order_wait_time
 
                 elif orders_proposal.sell_order_type is OrderType.MARKET:
@@ -1,5 +1,6 @@
 from decimal import Decimal
 import logging
+import numpy as np
 
 from hummingbot.market.market_base cimport MarketBase
 from hummingbot.market.market_base import MarketBase
@@ -63,54 +64,59 @@ cdef class StaggeredMultipleSizeSizingDelegate(OrderSizingDelegate):
             bint has_active_ask = False
 
         for active_order in active_orders:
+            # Orders being refreshed count towards the balances, but don't stop their replacements from being proposed.
+            is_refreshing = strategy.c_is_refreshing_order(active_order.client_order_id)
             if active_order.is_buy:
-                has_active_bid = True
+                has_active_bid = has_active_bid or not is_refreshing
                 quote_asset_balance += active_order.quantity * active_order.price
             else:
-                has_active_ask = True
+                has_active_ask = has_active_ask or not is_refreshing
                 base_asset_balance += active_order.quantity
 
-        for idx in range(self.number_of_orders):
-            current_order_size = Decimal(self.order_start_size + self.order_step_size * idx)
-            buy_fees = market.c_get_fee(market_info.base_asset,
-                                        market_info.quote_asset,
-                                        OrderType.MARKET,
-                                        TradeType.BUY,
-                                        current_order_size,
-                                        pricing_proposal.buy_order_prices[idx])
-
-            if market.name == "binance":
-                # For binance fees is calculated in base token, so need to adjust for that
-                buy_order_size = market.c_quantize_order_amount(market_info.trading_pair,
-                                                                current_order_size,
-                                                                pricing_proposal.buy_order_prices[idx])
-                # Check whether you have enough quote tokens
-                required_quote_asset_balance += (buy_order_size * pricing_proposal.buy_order_prices[idx])
-
-            else:
-                buy_order_size = market.c_quantize_order_amount(market_info.trading_pair, current_order_size)
-                # For other exchanges, fees is calculated in quote tokens, so need to ensure you have enough for order + fees
-                required_quote_asset_balance += (buy_order_size * pricing_proposal.buy_order_prices[idx] * (Decimal(1) + buy_fees.percent))
-
-            sell_order_size = market.c_quantize_order_amount(market_info.trading_pair, current_order_size, pricing_proposal.sell_order_prices[idx])
-            required_base_asset_balance += sell_order_size
-            if self._log_warning_order_size:
-                if buy_order_size == s_decimal_0:
-                    self.logger().network(f"Buy Order size is less than minimum order size for Price: {pricing_proposal.buy_order_prices[idx]} ",
-                                          f"The orders for price of {pricing_proposal.buy_order_prices[idx]} are too small for the market. Check configuration")
-
-                    # After warning once, set warning flag to False
-                    self._log_warning_order_size = False
-
-                if sell_order_size == s_decimal_0:
-                    self.logger().network(f"Sell Order size is less than minimum order size for Price: {pricing_proposal.sell_order_prices[idx]} ",
-                                          f"The orders for price of {pricing_proposal.sell_order_prices[idx]} are too small for the market. Check configuration")
+        # The order sizes of all levels are computed at once, and each side is quantized in a single pass.
+        order_sizes = (float(self._order_start_size) +
+                       float(self._order_step_size) * np.arange(self._number_of_orders, dtype=np.float64))
+        buy_prices = np.array(pricing_proposal.buy_order_prices[:self._number_of_orders], dtype=np.float64)
+        sell_prices = np.array(pricing_proposal.sell_order_prices[:self._number_of_orders], dtype=np.float64)
+        # The fee percentage is the same for every level, so it only needs to be looked up once
+        buy_fees = market.c_get_fee(market_info.base_asset,
+                                    market_info.quote_asset,
+                                    OrderType.MARKET,
+                                    TradeType.BUY,
+                                    self._order_start_size,
+                                    pricing_proposal.buy_order_prices[0])
+
+        if market.name == "binance":
+            # For binance fees is calculated in base token, so need to adjust for that
+            buy_orders = market.c_quantize_order_amounts(market_info.trading_pair, order_sizes, buy_prices)
+            buy_fee_factor = Decimal(1)
+        else:
+            # For other exchanges, fees is calculated in quote tokens, so need to ensure you have enough for order + fees
+            buy_orders = market.c_quantize_order_amounts(market_info.trading_pair, order_sizes)
+            buy_fee_factor = Decimal(1) + buy_fees.percent
+        sell_orders = market.c_quantize_order_amounts(market_info.trading_pair, order_sizes, sell_prices)
+
+        required_quote_asset_balance = buy_fee_factor * sum(
+            [buy_order_size * buy_price
+             for buy_order_size, buy_price in zip(buy_orders, pricing_proposal.buy_order_prices)],
+            s_decimal_0
+        )
+        required_base_asset_balance = sum(sell_orders, s_decimal_0)
 
-                    # After warning once, set warning flag to False
-                    self._log_warning_order_size = False
+        if self._log_warning_order_size:
+            if s_decimal_0 in buy_orders:
+                buy_price = pricing_proposal.buy_order_prices[buy_orders.index(s_decimal_0)]
+                self.logger().network(f"Buy Order size is less than minimum order size for Price: {buy_price} ",
+                                      f"The orders for price of {buy_price} are too small for the market. Check configuration")
+                # After warning once, set warning flag to False
+                self._log_warning_order_size = False
 
-            buy_orders.append(buy_order_size)
-            sell_orders.append(sell_order_size)
+            if s_decimal_0 in sell_orders:
+                sell_price = pricing_proposal.sell_order_prices[sell_orders.index(s_decimal_0)]
+                self.logger().network(f"Sell Order size is less than minimum order size for Price: {sell_price} ",
+                                      f"The orders for price of {sell_price} are too small for the market. Check configuration")
+                # After warning once, set warning flag to False
+                self._log_warning_order_size = False
 
         if self._log_warning_balance:
             if quote_asset_balance < required_quote_asset_balance:
@@ -44,6 +44,7 @@ def start(self):
         best_bid_ask_jump_mode = pure_market_making_config_map.get("best_bid_ask_jump_mode").value
         best_bid_ask_jump_orders_depth = pure_market_making_config_map.get("best_bid_ask_jump_orders_depth").value
         add_transaction_costs_to_orders = pure_market_making_config_map.get("add_transaction_costs").value
+        order_refresh_tolerance_pct = pure_market_making_config_map.get("order_refresh_tolerance_pct").value
         external_pricing_source = pure_market_making_config_map.get("external_pricing_source").value
         external_price_source_type = pure_market_making_config_map.get("external_price_source_type").value
         external_price_source_exchange = pure_market_making_config_map.get("external_price_source_exchange").value
@@ -124,7 +125,8 @@ def start(self):
                                                    add_transaction_costs_to_orders=add_transaction_costs_to_orders,
                                                    logging_options=strategy_logging_options,
                                                    asset_price_delegate=asset_price_delegate,
-                                                   expiration_seconds=expiration_seconds)
+                                                   expiration_seconds=expiration_seconds,
+                                                   order_refresh_tolerance_pct=order_refresh_tolerance_pct)
     except Exception as e:
         self._notify(str(e))
         self.logger().error("Unknown error during initialization.", exc_info=True)
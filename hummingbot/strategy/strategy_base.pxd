@@ -41,7 +41,12 @@ cdef class StrategyBase(TimeIterator):
                                         object order_type = *, object price = *, double expiration_seconds = *)
     cdef str c_sell_with_specific_market(self, object market_trading_pair_tuple, object amount,
                                          object order_type = *, object price = *, double expiration_seconds = *)
+    cdef list c_batch_buy_with_specific_market(self, object market_trading_pair_tuple, list amounts, list prices,
+                                               object order_type = *, double expiration_seconds = *)
+    cdef list c_batch_sell_with_specific_market(self, object market_trading_pair_tuple, list amounts, list prices,
+                                                object order_type = *, double expiration_seconds = *)
     cdef c_cancel_order(self, object market_pair, str order_id)
+    cdef c_batch_cancel_orders(self, object market_pair, list order_ids)
 
     cdef c_start_tracking_limit_order(self, object market_pair, str order_id, bint is_buy, object price,
                                       object quantity)
@@ -446,6 +446,74 @@ cdef class StrategyBase(TimeIterator):
 
         return order_id
 
+    cdef list c_batch_buy_with_specific_market(self, object market_trading_pair_tuple, list amounts, list prices,
+                                               object order_type=OrderType.LIMIT,
+                                               double expiration_seconds=NaN):
+        """
+        Submits the buy orders of amounts and prices together, with the batch order API of the market.
+        """
+        if self._sb_delegate_lock:
+            raise RuntimeError("Delegates are not allowed to execute orders directly.")
+
+        if not all(isinstance(x, Decimal) for x in amounts + prices):
+            raise TypeError("prices and amounts must be Decimal objects.")
+
+        cdef:
+            dict kwargs = {
+                "expiration_ts": self._current_timestamp + max(self._sb_limit_order_min_expiration, expiration_seconds)
+            }
+            MarketBase market = market_trading_pair_tuple.market
+
+        if market not in self._sb_markets:
+            raise ValueError(f"Market object for buy order is not in the whitelisted markets set.")
+
+        cdef:
+            list order_ids = market.c_batch_buy(market_trading_pair_tuple.trading_pair, amounts, prices,
+                                                order_type=order_type, kwargs=kwargs)
+
+        # Start order tracking
+        for order_id, amount, price in zip(order_ids, amounts, prices):
+            if order_type == OrderType.LIMIT:
+                self.c_start_tracking_limit_order(market_trading_pair_tuple, order_id, True, price, amount)
+            elif order_type == OrderType.MARKET:
+                self.c_start_tracking_market_order(market_trading_pair_tuple, order_id, True, amount)
+
+        return order_ids
+
+    cdef list c_batch_sell_with_specific_market(self, object market_trading_pair_tuple, list amounts, list prices,
+                                                object order_type=OrderType.LIMIT,
+                                                double expiration_seconds=NaN):
+        """
+        Submits the sell orders of amounts and prices together, with the batch order API of the market.
+        """
+        if self._sb_delegate_lock:
+            raise RuntimeError("Delegates are not allowed to execute orders directly.")
+
+        if not all(isinstance(x, Decimal) for x in amounts + prices):
+            raise TypeError("prices and amounts must be Decimal objects.")
+
+        cdef:
+            dict kwargs = {
+                "expiration_ts": self._current_timestamp + max(self._sb_limit_order_min_expiration, expiration_seconds)
+            }
+            MarketBase market = market_trading_pair_tuple.market
+
+        if market not in self._sb_markets:
+            raise ValueError(f"Market object for sell order is not in the whitelisted markets set.")
+
+        cdef:
+            list order_ids = market.c_batch_sell(market_trading_pair_tuple.trading_pair, amounts, prices,
+                                                 order_type=order_type, kwargs=kwargs)
+
+        # Start order tracking
+        for order_id, amount, price in zip(order_ids, amounts, prices):
+            if order_type == OrderType.LIMIT:
+                self.c_start_tracking_limit_order(market_trading_pair_tuple, order_id, False, price, amount)
+            elif order_type == OrderType.MARKET:
+                self.c_start_tracking_market_order(market_trading_pair_tuple, order_id, False, amount)
+
+        return order_ids
+
     cdef c_cancel_order(self, object market_trading_pair_tuple, str order_id):
         cdef:
             MarketBase market = market_trading_pair_tuple.market
@@ -456,6 +524,20 @@ cdef class StrategyBase(TimeIterator):
                 f"({market_trading_pair_tuple.trading_pair}) Cancelling the limit order {order_id}."
             )
             market.c_cancel(market_trading_pair_tuple.trading_pair, order_id)
+
+    cdef c_batch_cancel_orders(self, object market_trading_pair_tuple, list order_ids):
+        cdef:
+            MarketBase market = market_trading_pair_tuple.market
+            list cancel_order_ids = [order_id
+                                     for order_id in order_ids
+                                     if self._sb_order_tracker.c_check_and_track_cancel(order_id)]
+
+        if len(cancel_order_ids) > 0:
+            self.log_with_clock(
+                logging.INFO,
+                f"({market_trading_pair_tuple.trading_pair}) Cancelling the limit orders {cancel_order_ids}."
+            )
+            market.c_batch_cancel(market_trading_pair_tuple.trading_pair, cancel_order_ids)
     # ----------------------------------------------------------------------------------------------------------
     # </editor-fold>
 
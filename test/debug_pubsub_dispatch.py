@@ -0,0 +1,59 @@
+#!/usr/bin/env python
+"""
+Microbenchmark of PubSub event dispatch: the number of events triggered per second, for different numbers of
+listeners on the event.
+
+Usage:
+    python test/debug_pubsub_dispatch.py [number of events per measurement]
+"""
+from os.path import join, realpath
+import sys; sys.path.insert(0, realpath(join(__file__, "../../")))
+
+from enum import Enum
+import time
+from typing import List
+
+from hummingbot.core.event.event_listener import EventListener
+from hummingbot.core.pubsub import PubSub
+
+LISTENER_COUNTS: List[int] = [1, 2, 5, 10, 20, 50, 100]
+
+
+class BenchmarkEvent(Enum):
+    Tick = 1
+
+
+class CountingListener(EventListener):
+    def __init__(self):
+        super().__init__()
+        self.count: int = 0
+
+    def __call__(self, arg: any):
+        self.count += 1
+
+
+def measure(listener_count: int, event_count: int) -> float:
+    pubsub: PubSub = PubSub()
+    listeners: List[CountingListener] = [CountingListener() for _ in range(listener_count)]
+    for listener in listeners:
+        pubsub.add_listener(BenchmarkEvent.Tick, listener)
+
+    start: float = time.perf_counter()
+    for i in range(event_count):
+        pubsub.trigger_event(BenchmarkEvent.Tick, i)
+    duration: float = time.perf_counter() - start
+
+    assert all(listener.count == event_count for listener in listeners)
+    return event_count / duration
+
+
+def main():
+    event_count: int = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    print(f"{'listeners':>10} {'events/s':>14} {'dispatches/s':>14}")
+    for listener_count in LISTENER_COUNTS:
+        events_per_second: float = measure(listener_count, max(1000, event_count // listener_count))
+        print(f"{listener_count:>10} {events_per_second:>14,.0f} {events_per_second * listener_count:>14,.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+import shutil
+import tempfile
+from typing import (
+    List,
+    Optional,
+)
+
+from hummingbot.core.data_type.market_data_recorder import MarketDataRecorder
+from hummingbot.core.data_type.order_book_message import (
+    OrderBookMessage,
+    OrderBookMessageType,
+)
+from hummingbot.core.event.events import TradeType
+from hummingbot.market.paper_trade import create_replay_paper_trade_market
+from hummingbot.market.paper_trade.market_config import MarketConfig
+from hummingbot.market.paper_trade.paper_trade_market import PaperTradeMarket
+
+
+def diff_message(trading_pair: str, update_id: int, bids: List[List[float]], asks: List[List[float]],
+                 timestamp: float) -> OrderBookMessage:
+    return OrderBookMessage(OrderBookMessageType.DIFF, {
+        "trading_pair": trading_pair,
+        "update_id": update_id,
+        "bids": bids,
+        "asks": asks
+    }, timestamp=timestamp)
+
+
+def trade_message(trading_pair: str, trade_id: int, price: float, amount: float, trade_type: TradeType,
+                  timestamp: float, update_id: Optional[int] = None) -> OrderBookMessage:
+    return OrderBookMessage(OrderBookMessageType.TRADE, {
+        "trading_pair": trading_pair,
+        "trade_id": trade_id,
+        "update_id": trade_id if update_id is None else update_id,
+        "price": str(price),
+        "amount": str(amount),
+        "trade_type": float(trade_type.value)
+    }, timestamp=timestamp)
+
+
+class ReplayMarketData:
+    """
+    Market data recorded to a temporary directory, for the tests to replay on paper trade markets.
+    """
+    def __init__(self, exchange_name: str = "binance"):
+        self.exchange_name: str = exchange_name
+        self.root_path: str = tempfile.mkdtemp()
+        self.recorder: MarketDataRecorder = MarketDataRecorder(exchange_name, root_path=self.root_path)
+
+    def record_snapshot(self, trading_pair: str, bids: List[List[float]], asks: List[List[float]], timestamp: float,
+                        update_id: int = 10):
+        self.recorder.record_order_book_snapshot(trading_pair, update_id, bids, asks, receive_timestamp=timestamp)
+
+    def record(self, *messages: OrderBookMessage):
+        for message in messages:
+            self.recorder.record(message, receive_timestamp=message.timestamp)
+
+    def stop(self):
+        """
+        Writes out the messages recorded so far, so they can be replayed.
+        """
+        self.recorder.stop()
+
+    def create_market(self,
+                      trading_pairs: List[str],
+                      start_time: float,
+                      end_time: float,
+                      config: Optional[MarketConfig] = None) -> PaperTradeMarket:
+        self.stop()
+        return create_replay_paper_trade_market(self.exchange_name, trading_pairs,
+                                                start_time=start_time,
+                                                end_time=end_time,
+                                                root_path=self.root_path,
+                                                config=config)
+
+    def cleanup(self):
+        self.stop()
+        shutil.rmtree(self.root_path)
@@ -0,0 +1,119 @@
+#!/usr/bin/env python
+from os.path import join, realpath
+import sys; sys.path.insert(0, realpath(join(__file__, "../../../")))
+
+from decimal import Decimal
+import logging; logging.basicConfig(level=logging.ERROR)
+from typing import (
+    Dict,
+    List,
+    Optional,
+)
+import unittest
+
+from hummingbot.core.clock import (
+    Clock,
+    ClockMode,
+)
+from hummingbot.core.data_type.order_book_message import OrderBookMessage
+from hummingbot.market.paper_trade.fee_model import ConstantFeeModel
+from hummingbot.market.paper_trade.market_config import MarketConfig
+from hummingbot.market.paper_trade.paper_trade_market import PaperTradeMarket
+from hummingbot.strategy.arbitrage.arbitrage_path import ArbitragePath
+from hummingbot.strategy.arbitrage.arbitrage_path_finder import ArbitragePathFinder
+from test.integration.replay_market_data import (
+    ReplayMarketData,
+    diff_message,
+)
+
+
+class ArbitragePathFinderUnitTest(unittest.TestCase):
+    start_timestamp: float = 1577836800.0
+    end_timestamp: float = start_timestamp + 60.0
+
+    def setUp(self):
+        self.market_data: List[ReplayMarketData] = []
+        self.markets: List[PaperTradeMarket] = []
+        self.clock: Clock = Clock(ClockMode.BACKTEST, 1.0, self.start_timestamp, self.end_timestamp)
+
+    def tearDown(self):
+        for market in self.markets:
+            market.order_book_tracker.stop()
+        for market_data in self.market_data:
+            market_data.cleanup()
+
+    def start_market(self,
+                     snapshots: Dict[str, List[List[List[float]]]],
+                     diffs: Optional[List[OrderBookMessage]] = None,
+                     config: Optional[MarketConfig] = None) -> PaperTradeMarket:
+        market_data: ReplayMarketData = ReplayMarketData()
+        self.market_data.append(market_data)
+        for trading_pair, (bids, asks) in snapshots.items():
+            market_data.record_snapshot(trading_pair, bids, asks, self.start_timestamp)
+        market_data.record(*(diffs or []))
+
+        market: PaperTradeMarket = market_data.create_market(list(snapshots.keys()),
+                                                             self.start_timestamp,
+                                                             self.end_timestamp,
+                                                             config=config)
+        self.markets.append(market)
+        self.clock.add_iterator(market)
+        return market
+
+    def test_triangular_path(self):
+        market: PaperTradeMarket = self.start_market({
+            "ETHUSDT": [[[199.0, 10.0]], [[201.0, 10.0]]],
+            "BTCUSDT": [[[9990.0, 1.0]], [[10010.0, 1.0]]],
+            "ETHBTC": [[[0.021, 10.0]], [[0.0211, 10.0]]],
+        }, diffs=[
+            diff_message("ETHBTC", 11, [[0.021, 0.0], [0.02, 10.0]], [], self.start_timestamp + 5)
+        ], config=MarketConfig.default_config()._replace(fee_model=ConstantFeeModel(Decimal(0), Decimal("0.001"))))
+        self.clock.backtest_til(self.start_timestamp + 1)
+        self.assertTrue(market.ready)
+
+        path_finder: ArbitragePathFinder = ArbitragePathFinder([market], min_profitability=0.01)
+        self.clock.add_iterator(path_finder)
+        self.assertEqual(3, path_finder.node_count)
+        self.assertEqual(6, path_finder.edge_count)
+
+        paths: List[ArbitragePath] = path_finder.find_profitable_paths()
+        self.assertEqual(1, len(paths))
+        path: ArbitragePath = paths[0]
+        # Buy ETH with USDT, sell ETH for BTC, and sell BTC for USDT.
+        self.assertEqual({("USDT", "ETH", "ETHUSDT", True),
+                          ("ETH", "BTC", "ETHBTC", False),
+                          ("BTC", "USDT", "BTCUSDT", False)},
+                         {(leg.from_asset, leg.to_asset, leg.trading_pair, leg.is_buy) for leg in path.legs})
+        self.assertEqual([market], path.markets)
+        self.assertAlmostEqual(0.021 * 9990 / 201 * 0.999 ** 3 - 1, path.profitability)
+        self.assertIs(paths, path_finder.find_profitable_paths())
+
+        # The ETHBTC bid drops, and the path isn't profitable anymore.
+        self.clock.backtest_til(self.start_timestamp + 6)
+        self.assertEqual([], path_finder.find_profitable_paths())
+
+    def test_cross_market_path(self):
+        market_1: PaperTradeMarket = self.start_market({
+            "ETHUSDT": [[[205.0, 10.0]], [[206.0, 10.0]]],
+        })
+        market_2: PaperTradeMarket = self.start_market({
+            "ETHUSDT": [[[200.0, 10.0]], [[201.0, 10.0]]],
+        })
+        self.clock.backtest_til(self.start_timestamp + 1)
+
+        path_finder: ArbitragePathFinder = ArbitragePathFinder([market_1, market_2])
+        # Each asset is joined with itself on the other market, in both directions.
+        self.assertEqual(4, path_finder.node_count)
+        self.assertEqual(8, path_finder.edge_count)
+
+        paths: List[ArbitragePath] = path_finder.find_profitable_paths()
+        self.assertEqual(1, len(paths))
+        path: ArbitragePath = paths[0]
+        self.assertEqual(4, len(path.legs))
+        self.assertEqual([(market_1, False, 205.0), (market_2, True, 201.0)],
+                         [(leg.from_market, leg.is_buy, leg.price) for leg in path.trade_legs])
+        self.assertAlmostEqual(205.0 / 201.0 - 1, path.profitability)
+
+
+if __name__ == "__main__":
+    unittest.main()
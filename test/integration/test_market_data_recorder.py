@@ -0,0 +1,114 @@
+#!/usr/bin/env python
+from os.path import join, realpath
+import sys; sys.path.insert(0, realpath(join(__file__, "../../../")))
+
+import logging; logging.basicConfig(level=logging.ERROR)
+import shutil
+import tempfile
+from typing import List
+import unittest
+
+from hummingbot.core.data_type.market_data_recorder import (
+    FLAG_ORDER_BOOK_SNAPSHOT,
+    MarketDataBuffer,
+    MarketDataReader,
+    MarketDataRecorder,
+    RecordedMarketDataMessage,
+)
+from hummingbot.core.data_type.order_book_message import OrderBookMessageType
+from hummingbot.core.event.events import TradeType
+from test.integration.replay_market_data import (
+    diff_message,
+    trade_message,
+)
+
+
+class MarketDataRecorderUnitTest(unittest.TestCase):
+    start_timestamp: float = 1577836800.0
+    trading_pair: str = "ETHUSDT"
+
+    @classmethod
+    def setUpClass(cls):
+        # Skipped messages are logged as warnings, which the tests don't need to see.
+        logging.getLogger("hummingbot.core.data_type.market_data_recorder").setLevel(logging.ERROR)
+
+    def setUp(self):
+        self.root_path: str = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.root_path)
+
+    def test_round_trip(self):
+        t: float = self.start_timestamp
+        # Small chunks, so the messages with malformed ids share their chunks with valid messages.
+        recorder: MarketDataRecorder = MarketDataRecorder("binance", root_path=self.root_path, chunk_size=3)
+        recorder.record_order_book_snapshot(self.trading_pair, 10, [[99.0, 1.0]], [[101.0, 2.0]], receive_timestamp=t)
+        for message in [diff_message(self.trading_pair, 11, [[99.5, 3.0]], [], t + 1),
+                        diff_message(self.trading_pair, "not an id", [[99.5, 4.0]], [], t + 2),
+                        trade_message(self.trading_pair, 1, 100.5, 2.0, TradeType.BUY, t + 3),
+                        trade_message(self.trading_pair, None, 99.0, 1.0, TradeType.SELL, t + 4),
+                        diff_message(self.trading_pair, "12", [], [[100.0, 1.0]], t + 5),
+                        trade_message(self.trading_pair, 2, 99.0, 1.0, TradeType.SELL, t + 6)]:
+            recorder.record(message, receive_timestamp=message.timestamp + 0.5)
+        recorder.stop()
+        self.assertEqual(5, recorder.messages_recorded)
+
+        reader: MarketDataReader = MarketDataReader("binance", root_path=self.root_path)
+        self.assertEqual([self.trading_pair], reader.trading_pairs())
+        self.assertEqual((t, t + 6.5), reader.time_range(self.trading_pair))
+        recorded: List[RecordedMarketDataMessage] = list(reader.read(self.trading_pair))
+        self.assertEqual([t, t + 1.5, t + 3.5, t + 5.5, t + 6.5], [r.receive_timestamp for r in recorded])
+        self.assertEqual([FLAG_ORDER_BOOK_SNAPSHOT, 0, 0, 0, 0], [r.flags for r in recorded])
+        self.assertEqual([OrderBookMessageType.SNAPSHOT, OrderBookMessageType.DIFF, OrderBookMessageType.TRADE,
+                          OrderBookMessageType.DIFF, OrderBookMessageType.TRADE],
+                         [r.message.type for r in recorded])
+        self.assertEqual([t, t + 1, t + 3, t + 5, t + 6], [r.message.timestamp for r in recorded])
+
+        snapshot, diff, trade = recorded[0].message, recorded[1].message, recorded[2].message
+        self.assertEqual({"trading_pair": self.trading_pair, "update_id": 10, "bids": [[99.0, 1.0]],
+                          "asks": [[101.0, 2.0]]},
+                         snapshot.content)
+        self.assertEqual([[99.5, 3.0]], diff.content["bids"])
+        self.assertEqual(11, diff.update_id)
+        self.assertEqual(1, trade.trade_id)
+        self.assertEqual("100.5", trade.content["price"])
+        self.assertEqual(float(TradeType.BUY.value), trade.content["trade_type"])
+        # An id given as a numeric string is still recorded.
+        self.assertEqual("12", recorded[3].message.update_id)
+
+        # Reading a time range only returns the messages received within it.
+        self.assertEqual([t + 3.5, t + 5.5],
+                         [r.receive_timestamp for r in reader.read(self.trading_pair, t + 3, t + 6)])
+
+    def test_load(self):
+        t: float = self.start_timestamp
+        recorder: MarketDataRecorder = MarketDataRecorder("binance", root_path=self.root_path, chunk_size=2)
+        recorder.record_order_book_snapshot(self.trading_pair, 10, [[99.0, 1.0]], [[101.0, 2.0]], receive_timestamp=t)
+        for update_id in range(11, 16):
+            recorder.record(diff_message(self.trading_pair, update_id, [[99.0, float(update_id)]], [], t + update_id),
+                            receive_timestamp=t + update_id)
+        recorder.stop()
+
+        reader: MarketDataReader = MarketDataReader("binance", root_path=self.root_path)
+        market_data_buffer: MarketDataBuffer = reader.load(self.trading_pair, t + 11, t + 14)
+        self.assertEqual(4, len(market_data_buffer))
+        self.assertGreater(market_data_buffer.size, 0)
+        # The buffer is read again from the start on every iteration, with the same messages as reading the recording.
+        for _ in range(2):
+            loaded: List[RecordedMarketDataMessage] = list(market_data_buffer)
+            self.assertEqual([(r.receive_timestamp, r.flags, r.message.type, r.message.timestamp, r.message.content)
+                              for r in reader.read(self.trading_pair, t + 11, t + 14)],
+                             [(r.receive_timestamp, r.flags, r.message.type, r.message.timestamp, r.message.content)
+                              for r in loaded])
+        self.assertEqual([11, 12, 13, 14], [r.message.update_id for r in loaded])
+        market_data_buffer.close()
+
+        # Nothing recorded in the time range.
+        empty_buffer: MarketDataBuffer = reader.load(self.trading_pair, t + 100, t + 200)
+        self.assertEqual(0, len(empty_buffer))
+        self.assertEqual([], list(empty_buffer))
+        empty_buffer.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
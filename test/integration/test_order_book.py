@@ -4,8 +4,20 @@ from os.path import join, realpath
 import sys; sys.path.insert(0, realpath(join(__file__, "../../../")))
 
 import logging
+from typing import List
 import unittest
 from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.composite_order_book import CompositeOrderBook
+from hummingbot.core.event.event_logger import EventLogger
+from hummingbot.core.event.events import (
+    OrderBookEvent,
+    OrderBookTradeEvent,
+    OrderBookTradeEventBatch,
+    OrderFilledEvent,
+    OrderType,
+    TradeFee,
+    TradeType,
+)
 import numpy as np
 
 
@@ -53,6 +65,192 @@ class OrderBookUnitTest(unittest.TestCase):
         self.assertEqual(best_bid, [50., 0.01, 6.])
         self.assertEqual(best_ask, 0)
 
+    def test_depth_queries(self):
+        order_book = OrderBook()
+        bids_array = np.array([[1, 1, 1], [2, 2, 1], [3, 3, 1]], dtype=np.float64)
+        asks_array = np.array([[4, 1, 1], [5, 2, 1], [6, 3, 1]], dtype=np.float64)
+        order_book.apply_numpy_snapshot(bids_array, asks_array)
+
+        self.assertEqual(order_book.get_price_for_volume(True, 2).result_price, 5)
+        self.assertEqual(order_book.get_price_for_volume(True, 0).result_price, 4)
+        self.assertEqual(order_book.get_price_for_volume(False, 4).result_price, 2)
+        self.assertTrue(np.isnan(order_book.get_price_for_volume(True, 7).result_price))
+        self.assertEqual(order_book.get_price_for_volume(True, 7).result_volume, 6)
+        self.assertAlmostEqual(order_book.get_vwap_for_volume(True, 2).result_price, 4.5)
+        self.assertAlmostEqual(order_book.get_vwap_for_volume(False, 4).result_price, 2.75)
+        self.assertEqual(order_book.get_price_for_quote_volume(True, 10).result_price, 5)
+        self.assertEqual(order_book.get_quote_volume_for_base_amount(True, 2).result_volume, 9)
+        self.assertEqual(order_book.get_volume_for_price(True, 5.5).result_volume, 3)
+        self.assertEqual(order_book.get_volume_for_price(True, 5.5).result_price, 5)
+        self.assertEqual(order_book.get_quote_volume_for_price(False, 2).result_volume, 13)
+
+        # Update an existing level, remove a level and add a new level.
+        order_book.apply_numpy_diffs(np.array([[3, 0, 2]], dtype=np.float64),
+                                     np.array([[4, 0.5, 2], [5, 0, 2], [5.5, 1, 2]], dtype=np.float64))
+        self.assertEqual(order_book.get_price_for_volume(True, 1).result_price, 5.5)
+        self.assertEqual(order_book.get_price_for_volume(False, 0).result_price, 2)
+        self.assertEqual(order_book.get_volume_for_price(True, 5.9).result_volume, 1.5)
+        self.assertEqual(order_book.get_volume_for_price(True, 5.9).result_price, 5.5)
+
+    def test_depth_queries_match_order_book_rows(self):
+        rng = np.random.RandomState(42)
+        order_book = OrderBook()
+        order_book.apply_numpy_snapshot(np.array([[100 - i, 1, 1] for i in range(1, 50)], dtype=np.float64),
+                                        np.array([[100 + i, 1, 1] for i in range(1, 50)], dtype=np.float64))
+        for update_id in range(2, 200):
+            bid_prices = 100 - rng.randint(1, 60, size=5)
+            ask_prices = 100 + rng.randint(1, 60, size=5)
+            amounts = rng.choice([0, 0.5, 1, 2.5], size=10)
+            order_book.apply_numpy_diffs(
+                np.array([[p, a, update_id] for p, a in zip(bid_prices, amounts[:5])], dtype=np.float64),
+                np.array([[p, a, update_id] for p, a in zip(ask_prices, amounts[5:])], dtype=np.float64))
+            for is_buy, rows in ((True, list(order_book.ask_entries())), (False, list(order_book.bid_entries()))):
+                volume = rng.uniform(0, 30)
+                cumulative_volume = 0
+                expected_price = float("nan")
+                for row in rows:
+                    cumulative_volume += row.amount
+                    if cumulative_volume >= volume:
+                        expected_price = row.price
+                        break
+                result = order_book.get_price_for_volume(is_buy, volume)
+                self.assertTrue(result.result_price == expected_price or
+                                (np.isnan(result.result_price) and np.isnan(expected_price)))
+                self.assertAlmostEqual(result.result_volume, min(cumulative_volume, volume))
+
+                price = 100 + (rng.uniform(0, 60) if is_buy else -rng.uniform(0, 60))
+                within_price = [row for row in rows if (row.price <= price if is_buy else row.price >= price)]
+                result = order_book.get_quote_volume_for_price(is_buy, price)
+                self.assertAlmostEqual(result.result_volume, sum(row.price * row.amount for row in within_price))
+
+    def test_depth_index_insertions(self):
+        order_book = OrderBook()
+        order_book.apply_numpy_snapshot(np.array([[90 + i, 1, 1] for i in range(10)], dtype=np.float64),
+                                        np.array([[101 + i, 1, 1] for i in range(10)], dtype=np.float64))
+        self.assertEqual(order_book.get_price_for_volume(True, 1).result_price, 101)
+        self.assertEqual(order_book.get_price_for_volume(False, 1).result_price, 99)
+        self.assertEqual(order_book.depth_index_rebuild_count, 2)
+
+        # New best prices, new levels between and behind the existing ones, and enough new levels between two
+        # neighbouring ones to shift the levels around them.
+        order_book.apply_numpy_diffs(
+            np.array([[99.5, 2, 2], [95.5, 1, 2], [80, 3, 2]], dtype=np.float64),
+            np.array([[100.5, 2, 2], [105.5, 1, 2], [130, 3, 2]] + [[101 + i / 20, 0.5, 2] for i in range(1, 20)],
+                     dtype=np.float64))
+        for is_buy, rows in ((True, list(order_book.ask_entries())), (False, list(order_book.bid_entries()))):
+            for volume in [0, 1, 2.5, 4, 7.5, 12, 20, 30]:
+                cumulative_volume = 0
+                expected_price = float("nan")
+                for row in rows:
+                    cumulative_volume += row.amount
+                    if cumulative_volume >= volume:
+                        expected_price = row.price
+                        break
+                result = order_book.get_price_for_volume(is_buy, volume)
+                self.assertTrue(result.result_price == expected_price or
+                                (np.isnan(result.result_price) and np.isnan(expected_price)))
+                self.assertAlmostEqual(result.result_volume, min(cumulative_volume, volume))
+            for row in rows:
+                within_price = [r for r in rows if (r.price <= row.price if is_buy else r.price >= row.price)]
+                self.assertAlmostEqual(order_book.get_volume_for_price(is_buy, row.price).result_volume,
+                                       sum(r.amount for r in within_price))
+                self.assertEqual(order_book.get_volume_for_price(is_buy, row.price).result_price, row.price)
+                self.assertAlmostEqual(order_book.get_quote_volume_for_price(is_buy, row.price).result_volume,
+                                       sum(r.price * r.amount for r in within_price))
+        # The new price levels were inserted into the depth indexes, without rebuilding them.
+        self.assertEqual(order_book.depth_index_rebuild_count, 2)
+
+    def test_depth_profile(self):
+        bids_array = np.array([[1, 1, 1], [2, 2, 1], [3, 3, 1]], dtype=np.float64)
+        asks_array = np.array([[4, 1, 1], [5, 2, 1], [6, 3, 1]], dtype=np.float64)
+        volumes = np.array([2, 0, 7, 1, 3.5], dtype=np.float64)
+        for order_book in (OrderBook(), CompositeOrderBook()):
+            order_book.apply_numpy_snapshot(bids_array, asks_array)
+            prices, vwaps, result_volumes = order_book.get_depth_profile(True, volumes)
+            for volume, price, vwap, result_volume in zip(volumes, prices, vwaps, result_volumes):
+                expected_price = order_book.get_price_for_volume(True, volume).result_price
+                expected_vwap = order_book.get_vwap_for_volume(True, volume)
+                self.assertTrue(price == expected_price or (np.isnan(price) and np.isnan(expected_price)))
+                self.assertTrue(np.isclose(vwap, expected_vwap.result_price, equal_nan=True))
+                self.assertAlmostEqual(result_volume, expected_vwap.result_volume)
+            self.assertEqual(prices.tolist()[:2], [5, 4])
+            self.assertAlmostEqual(vwaps[4], 17 / 3.5)
+
+    def test_composite_depth_queries(self):
+        order_book = CompositeOrderBook()
+        order_book.apply_numpy_snapshot(np.array([[1, 1, 1], [2, 2, 1], [3, 3, 1]], dtype=np.float64),
+                                        np.array([[4, 1, 1], [5, 2, 1], [6, 3, 1]], dtype=np.float64))
+        # Buys use up the best ask and part of the next one, and a sell part of the best bid.
+        for trade_type, price, amount in [(TradeType.BUY, 4, 1), (TradeType.BUY, 5, 0.5), (TradeType.SELL, 3, 1)]:
+            order_book.record_filled_order(OrderFilledEvent(1, "", "", trade_type, OrderType.MARKET,
+                                                            price, amount, TradeFee(0)))
+
+        self.assertEqual(5, order_book.get_price(True))
+        self.assertEqual(3, order_book.get_price(False))
+        for is_buy, rows in ((True, list(order_book.ask_entries())), (False, list(order_book.bid_entries()))):
+            self.assertEqual([5, 6] if is_buy else [3, 2, 1], [row.price for row in rows])
+            for volume in [0, 1, 2.5, 4.5, 10]:
+                cumulative_volume = 0
+                expected_price = float("nan")
+                for row in rows:
+                    cumulative_volume += row.amount
+                    if cumulative_volume >= volume:
+                        expected_price = row.price
+                        break
+                result = order_book.get_price_for_volume(is_buy, volume)
+                self.assertTrue(result.result_price == expected_price or
+                                (np.isnan(result.result_price) and np.isnan(expected_price)))
+                self.assertAlmostEqual(result.result_volume, min(cumulative_volume, volume))
+            for price in [1.5, 2.5, 5, 5.5, 7]:
+                within_price = [row for row in rows if (row.price <= price if is_buy else row.price >= price)]
+                self.assertAlmostEqual(sum(row.amount for row in within_price),
+                                       order_book.get_volume_for_price(is_buy, price).result_volume)
+                self.assertAlmostEqual(sum(row.price * row.amount for row in within_price),
+                                       order_book.get_quote_volume_for_price(is_buy, price).result_volume)
+        self.assertEqual(6, order_book.get_price_for_quote_volume(True, 10).result_price)
+
+        # Filled orders that use up the whole book leave no price.
+        order_book.record_filled_order(OrderFilledEvent(2, "", "", TradeType.BUY, OrderType.MARKET, 5, 1.5,
+                                                        TradeFee(0)))
+        order_book.record_filled_order(OrderFilledEvent(2, "", "", TradeType.BUY, OrderType.MARKET, 6, 3,
+                                                        TradeFee(0)))
+        with self.assertRaises(EnvironmentError):
+            order_book.get_price(True)
+        self.assertEqual(0, order_book.get_volume_for_price(True, 10).result_volume)
+
+    def test_apply_rows(self):
+        order_book = OrderBook()
+        order_book.apply_snapshot_rows([["3", "1.5"], ["2", "1"]], [["4", "1", "trash"], [5, 2]], 1)
+        self.assertEqual([tuple(row) for row in order_book.bid_entries()], [(3, 1.5, 1), (2, 1, 1)])
+        self.assertEqual([tuple(row) for row in order_book.ask_entries()], [(4, 1, 1), (5, 2, 1)])
+        order_book.apply_diff_rows([["3", "0"]], [["4.5", "0.25"]], 2)
+        self.assertEqual([tuple(row) for row in order_book.bid_entries()], [(2, 1, 1)])
+        self.assertEqual([tuple(row) for row in order_book.ask_entries()], [(4, 1, 1), (4.5, 0.25, 2), (5, 2, 1)])
+        self.assertEqual(order_book.last_diff_uid, 2)
+
+    def test_trade_event_batch(self):
+        order_book = OrderBook()
+        batch_logger = EventLogger()
+        order_book.add_batch_listener(OrderBookEvent.TradeEvent, batch_logger)
+        trades: List[OrderBookTradeEvent] = [
+            OrderBookTradeEvent("ETHUSDT", 1.0, TradeType.BUY, 100.0, 1.0),
+            OrderBookTradeEvent("ETHUSDT", 1.5, TradeType.SELL, 99.5, 2.0),
+            OrderBookTradeEvent("ETHUSDT", 2.0, TradeType.BUY, 100.5, 0.5)
+        ]
+        for trade in trades:
+            order_book.apply_trade(trade)
+        self.assertEqual(len(batch_logger.event_log), 0)
+
+        order_book.flush_event_batches()
+        self.assertEqual(len(batch_logger.event_log), 1)
+        batch: OrderBookTradeEventBatch = batch_logger.event_log[0]
+        self.assertEqual(batch.trading_pair, "ETHUSDT")
+        self.assertEqual(batch.size, 3)
+        self.assertEqual(batch.price.tolist(), [100.0, 99.5, 100.5])
+        self.assertEqual(batch.type.tolist(), [TradeType.BUY.value, TradeType.SELL.value, TradeType.BUY.value])
+        self.assertEqual(float(np.dot(batch.price, batch.amount)), 100.0 + 199.0 + 50.25)
+        self.assertEqual(batch.to_events(), trades)
+
 
 def main():
     logging.basicConfig(level=logging.INFO)
@@ -0,0 +1,160 @@
+#!/usr/bin/env python
+from os.path import join, realpath
+import sys; sys.path.insert(0, realpath(join(__file__, "../../../")))
+
+import asyncio
+import logging; logging.basicConfig(level=logging.ERROR)
+import time
+from collections import deque
+from typing import (
+    Deque,
+    List,
+)
+import unittest
+
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_message import (
+    OrderBookMessage,
+    OrderBookMessageType,
+)
+from hummingbot.core.data_type.order_book_tracker import (
+    OrderBookDiffQueueStats,
+    OrderBookTracker,
+)
+
+
+def diff_message(update_id: int, bids: List[List[float]], asks: List[List[float]]) -> OrderBookMessage:
+    return OrderBookMessage(OrderBookMessageType.DIFF, {
+        "trading_pair": "ETHUSDT",
+        "update_id": update_id,
+        "bids": bids,
+        "asks": asks
+    }, timestamp=time.time())
+
+
+def snapshot_message(update_id: int, bids: List[List[float]], asks: List[List[float]]) -> OrderBookMessage:
+    return OrderBookMessage(OrderBookMessageType.SNAPSHOT, {
+        "trading_pair": "ETHUSDT",
+        "update_id": update_id,
+        "bids": bids,
+        "asks": asks
+    }, timestamp=time.time())
+
+
+class MockOrderBookTracker(OrderBookTracker):
+    @property
+    def data_source(self):
+        return None
+
+    async def start(self):
+        pass
+
+    async def stop(self):
+        pass
+
+
+class OrderBookTrackerUnitTest(unittest.TestCase):
+    trading_pair: str = "ETHUSDT"
+
+    @classmethod
+    def setUpClass(cls):
+        cls.ev_loop: asyncio.BaseEventLoop = asyncio.get_event_loop()
+
+    def setUp(self):
+        self.tracker: MockOrderBookTracker = MockOrderBookTracker(coalesce_diffs=True)
+        self.order_book: OrderBook = OrderBook()
+        self.order_book.apply_snapshot_message(snapshot_message(10, [[99.0, 1.0]], [[101.0, 1.0]]))
+        self.tracker.order_books[self.trading_pair] = self.order_book
+
+    def test_coalesced_diffs(self):
+        past_diffs_window: Deque[OrderBookMessage] = deque()
+        messages: List[OrderBookMessage] = [
+            diff_message(8, [[99.0, 5.0]], []),
+            diff_message(11, [[99.0, 2.0], [98.0, 1.0]], []),
+            diff_message(12, [[99.0, 3.0]], [[101.0, 0.0], [102.0, 1.5]]),
+            diff_message(13, [[98.0, 0.0]], []),
+        ]
+        self.assertEqual(3, self.tracker._apply_coalesced_messages(self.trading_pair, messages, past_diffs_window))
+
+        # The diff from before the snapshot is skipped, and the later diffs win over the earlier ones.
+        self.assertEqual([(99.0, 3.0)], [(row.price, row.amount) for row in self.order_book.bid_entries()])
+        self.assertEqual([(102.0, 1.5)], [(row.price, row.amount) for row in self.order_book.ask_entries()])
+        self.assertEqual(13, self.order_book.last_diff_uid)
+        # Only the applied diffs are kept for replaying on later snapshots.
+        self.assertEqual([11, 12, 13], [message.update_id for message in past_diffs_window])
+
+        stats: OrderBookDiffQueueStats = self.tracker.diff_queue_stats[self.trading_pair]
+        self.assertEqual(4, stats.queue_depth)
+        self.assertEqual(4, stats.diffs_received)
+        self.assertEqual(1, stats.diff_batches_applied)
+
+    def test_coalesced_diffs_around_snapshot(self):
+        past_diffs_window: Deque[OrderBookMessage] = deque()
+        messages: List[OrderBookMessage] = [
+            diff_message(11, [[99.0, 2.0]], []),
+            snapshot_message(20, [[97.0, 1.0]], [[103.0, 1.0]]),
+            diff_message(15, [[96.0, 1.0]], []),
+            diff_message(21, [[97.0, 4.0]], []),
+        ]
+        self.assertEqual(2, self.tracker._apply_coalesced_messages(self.trading_pair, messages, past_diffs_window))
+        self.assertEqual([(97.0, 4.0)], [(row.price, row.amount) for row in self.order_book.bid_entries()])
+        self.assertEqual([(103.0, 1.0)], [(row.price, row.amount) for row in self.order_book.ask_entries()])
+        self.assertEqual([11, 21], [message.update_id for message in past_diffs_window])
+
+        # The past diffs window keeps the last diffs applied.
+        messages = [diff_message(update_id, [[97.0, float(update_id)]], []) for update_id in range(22, 62)]
+        self.assertEqual(40, self.tracker._apply_coalesced_messages(self.trading_pair, messages, past_diffs_window))
+        self.assertEqual(list(range(62 - OrderBookTracker.PAST_DIFF_WINDOW_SIZE, 62)),
+                         [message.update_id for message in past_diffs_window])
+        self.assertEqual(2, self.tracker.diff_queue_stats[self.trading_pair].diff_batches_applied)
+        self.assertEqual(43, self.tracker.diff_queue_stats[self.trading_pair].diffs_received)
+        self.assertEqual(40, self.tracker.diff_queue_stats[self.trading_pair].max_queue_depth)
+
+    def test_track_single_book(self):
+        message_queue: asyncio.Queue = asyncio.Queue()
+        self.tracker._tracking_message_queues[self.trading_pair] = message_queue
+        for message in [diff_message(11, [[99.0, 2.0]], []),
+                        diff_message(12, [[98.0, 1.0]], []),
+                        diff_message(13, [[99.0, 0.0]], [])]:
+            message_queue.put_nowait(message)
+
+        async def run():
+            tracking_task: asyncio.Task = self.ev_loop.create_task(self.tracker._track_single_book(self.trading_pair))
+            await asyncio.sleep(0.1)
+            tracking_task.cancel()
+            await asyncio.gather(tracking_task, return_exceptions=True)
+
+        self.ev_loop.run_until_complete(run())
+        self.assertEqual([(98.0, 1.0)], [(row.price, row.amount) for row in self.order_book.bid_entries()])
+        # The queued messages are applied as one batch.
+        stats: OrderBookDiffQueueStats = self.tracker.diff_queue_stats[self.trading_pair]
+        self.assertEqual(1, stats.diff_batches_applied)
+        self.assertEqual(3, stats.diffs_received)
+        self.assertEqual([11, 12, 13],
+                         [message.update_id for message in self.tracker._past_diffs_windows[self.trading_pair]])
+
+
+class OrderBookDiffQueueStatsUnitTest(unittest.TestCase):
+    def test_record_batch(self):
+        stats: OrderBookDiffQueueStats = OrderBookDiffQueueStats()
+        stats.record_batch(5, 4, time.time() - 2.0)
+        self.assertEqual(5, stats.queue_depth)
+        self.assertEqual(5, stats.max_queue_depth)
+        self.assertGreaterEqual(stats.lag, 2.0)
+        self.assertLess(stats.lag, 3.0)
+        max_lag: float = stats.max_lag
+
+        # Batches without diffs keep the last lag. Diffs timestamped in the future have no lag.
+        stats.record_batch(2, 0, None)
+        self.assertEqual(max_lag, stats.lag)
+        stats.record_batch(1, 1, time.time() + 10.0)
+        self.assertEqual(0.0, stats.lag)
+        self.assertEqual(max_lag, stats.max_lag)
+        self.assertEqual(1, stats.queue_depth)
+        self.assertEqual(5, stats.max_queue_depth)
+        self.assertEqual(5, stats.diffs_received)
+        self.assertEqual(3, stats.diff_batches_applied)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,72 @@
+#!/usr/bin/env python
+from os.path import join, realpath
+import sys; sys.path.insert(0, realpath(join(__file__, "../../../")))
+
+from decimal import Decimal
+import logging; logging.basicConfig(level=logging.ERROR)
+from typing import List
+import unittest
+
+from hummingbot.core.clock import (
+    Clock,
+    ClockMode,
+)
+from hummingbot.core.event.event_logger import EventLogger
+from hummingbot.core.event.events import (
+    BuyOrderCreatedEvent,
+    MarketEvent,
+    OrderCancelledEvent,
+)
+from hummingbot.market.paper_trade.paper_trade_market import PaperTradeMarket
+from test.integration.replay_market_data import ReplayMarketData
+
+
+class PaperTradeBatchOrdersUnitTest(unittest.TestCase):
+    start_timestamp: float = 1577836800.0
+    end_timestamp: float = start_timestamp + 60.0
+    trading_pair: str = "ETHUSDT"
+
+    def setUp(self):
+        self.market_data: ReplayMarketData = ReplayMarketData()
+        self.market_data.record_snapshot(self.trading_pair,
+                                         [[99.0, 10.0], [98.0, 10.0]],
+                                         [[101.0, 10.0], [102.0, 10.0]],
+                                         self.start_timestamp)
+        self.market: PaperTradeMarket = self.market_data.create_market([self.trading_pair],
+                                                                       self.start_timestamp,
+                                                                       self.end_timestamp)
+        self.market.set_balance("ETH", 10)
+        self.market.set_balance("USDT", 1000)
+        self.market_logger: EventLogger = EventLogger()
+        for event_tag in [MarketEvent.BuyOrderCreated, MarketEvent.OrderCancelled]:
+            self.market.add_listener(event_tag, self.market_logger)
+        self.clock: Clock = Clock(ClockMode.BACKTEST, 1.0, self.start_timestamp, self.end_timestamp)
+        self.clock.add_iterator(self.market)
+        self.clock.backtest_til(self.start_timestamp + 1)
+        self.assertTrue(self.market.ready)
+
+    def tearDown(self):
+        self.market.order_book_tracker.stop()
+        self.market_data.cleanup()
+
+    def test_batch_orders(self):
+        order_ids: List[str] = self.market.batch_buy(self.trading_pair,
+                                                     [Decimal(1), Decimal(2)],
+                                                     [Decimal(98), Decimal(97)])
+        self.assertEqual(2, len(order_ids))
+        self.assertEqual([(order_ids[0], Decimal(98), Decimal(1)), (order_ids[1], Decimal(97), Decimal(2))],
+                         sorted([(o.client_order_id, o.price, o.quantity) for o in self.market.limit_orders],
+                                key=lambda o: order_ids.index(o[0])))
+        self.assertEqual(order_ids, [e.order_id for e in self.market_logger.event_log
+                                     if isinstance(e, BuyOrderCreatedEvent)])
+        with self.assertRaises(ValueError):
+            self.market.batch_sell(self.trading_pair, [Decimal(1)], [Decimal(101), Decimal(102)])
+
+        self.market.batch_cancel(self.trading_pair, order_ids)
+        self.assertEqual(0, len(self.market.limit_orders))
+        self.assertEqual(set(order_ids), set(e.order_id for e in self.market_logger.event_log
+                                             if isinstance(e, OrderCancelledEvent)))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,65 @@
+#!/usr/bin/env python
+from os.path import join, realpath
+import sys; sys.path.insert(0, realpath(join(__file__, "../../../")))
+
+from decimal import Decimal
+import logging; logging.basicConfig(level=logging.ERROR)
+import unittest
+
+from hummingbot.core.clock import (
+    Clock,
+    ClockMode,
+)
+from hummingbot.core.data_type.fixed_point import FixedPoint
+from hummingbot.core.data_type.order_book_query_result import ClientOrderBookQueryResult
+from hummingbot.market.paper_trade.paper_trade_market import PaperTradeMarket
+from test.integration.replay_market_data import ReplayMarketData
+
+
+class PaperTradeFixedPointQueriesUnitTest(unittest.TestCase):
+    start_timestamp: float = 1577836800.0
+    end_timestamp: float = start_timestamp + 60.0
+    trading_pair: str = "ETHUSDT"
+
+    def setUp(self):
+        self.market_data: ReplayMarketData = ReplayMarketData()
+        self.market_data.record_snapshot(self.trading_pair,
+                                         [[99.0, 10.0], [98.0, 10.0]],
+                                         [[101.0, 10.0], [102.0, 10.0]],
+                                         self.start_timestamp)
+        self.market: PaperTradeMarket = self.market_data.create_market([self.trading_pair],
+                                                                       self.start_timestamp,
+                                                                       self.end_timestamp)
+        self.clock: Clock = Clock(ClockMode.BACKTEST, 1.0, self.start_timestamp, self.end_timestamp)
+        self.clock.add_iterator(self.market)
+        self.clock.backtest_til(self.start_timestamp + 1)
+        self.assertTrue(self.market.ready)
+
+    def tearDown(self):
+        self.market.order_book_tracker.stop()
+        self.market_data.cleanup()
+
+    def test_fixed_point_queries(self):
+        self.assertEqual(Decimal(99), self.market.get_fixed_point_price(self.trading_pair, False).to_decimal())
+        self.assertEqual(Decimal(101), self.market.get_fixed_point_price(self.trading_pair, True).to_decimal())
+
+        volume: FixedPoint = FixedPoint.from_decimal(Decimal(15), 0)
+        for is_buy in [True, False]:
+            fixed_point_result: ClientOrderBookQueryResult = self.market.get_fixed_point_vwap_for_volume(
+                self.trading_pair, is_buy, volume
+            )
+            decimal_result: ClientOrderBookQueryResult = self.market.get_vwap_for_volume(
+                self.trading_pair, is_buy, Decimal(15)
+            )
+            self.assertIsNone(fixed_point_result.query_price)
+            self.assertEqual(decimal_result.result_price, fixed_point_result.result_price.to_decimal())
+            self.assertEqual(decimal_result.result_volume, fixed_point_result.result_volume.to_decimal())
+
+        self.assertEqual(Decimal(98),
+                         self.market.get_fixed_point_price_for_volume(self.trading_pair, False, volume)
+                         .result_price.to_decimal())
+        self.assertIsNone(self.market.quantize_fixed_point_price(self.trading_pair, float("nan")))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,222 @@
+#!/usr/bin/env python
+from os.path import join, realpath
+import sys; sys.path.insert(0, realpath(join(__file__, "../../../")))
+
+from decimal import Decimal
+import logging; logging.basicConfig(level=logging.ERROR)
+import os
+from typing import (
+    List,
+    Optional,
+)
+import unittest
+
+from hummingbot.core.clock import (
+    Clock,
+    ClockMode,
+)
+from hummingbot.core.event.event_logger import EventLogger
+from hummingbot.core.event.events import (
+    BuyOrderCompletedEvent,
+    BuyOrderCreatedEvent,
+    MarketEvent,
+    MarketOrderFailureEvent,
+    OrderCancelledEvent,
+    OrderFilledEvent,
+    OrderType,
+    TradeType,
+)
+from hummingbot.market.paper_trade.fee_model import ConstantFeeModel
+from hummingbot.market.paper_trade.latency_model import (
+    EmpiricalLatencyModel,
+    LatencyModels,
+)
+from hummingbot.market.paper_trade.market_config import MarketConfig
+from hummingbot.market.paper_trade.paper_trade_market import PaperTradeMarket
+from test.integration.replay_market_data import (
+    ReplayMarketData,
+    diff_message,
+    trade_message,
+)
+
+
+class PaperTradeLatencyAndFeesUnitTest(unittest.TestCase):
+    start_timestamp: float = 1577836800.0
+    end_timestamp: float = start_timestamp + 60.0
+    trading_pair: str = "ETHUSDT"
+    events: List[MarketEvent] = [
+        MarketEvent.BuyOrderCreated,
+        MarketEvent.BuyOrderCompleted,
+        MarketEvent.OrderFilled,
+        MarketEvent.OrderCancelled,
+        MarketEvent.OrderFailure
+    ]
+
+    @classmethod
+    def setUpClass(cls):
+        # Orders the balances can't cover are logged as warnings, which the tests don't need to see.
+        logging.getLogger("hummingbot.core.network_iterator").setLevel(logging.ERROR)
+
+    def setUp(self):
+        self.market_data: ReplayMarketData = ReplayMarketData()
+        t: float = self.start_timestamp
+        self.market_data.record_snapshot(self.trading_pair,
+                                         [[99.0, 10.0], [98.0, 10.0]],
+                                         [[101.0, 10.0], [102.0, 10.0]],
+                                         t)
+        # A new bid at 100, then a seller hitting the bids down to 98.5.
+        self.market_data.record(
+            diff_message(self.trading_pair, 11, [[100.0, 1.0]], [], t + 5),
+            trade_message(self.trading_pair, 1, 98.5, 5.0, TradeType.SELL, t + 10, update_id=12)
+        )
+        self.market: Optional[PaperTradeMarket] = None
+        self.market_logger: EventLogger = EventLogger()
+
+    def tearDown(self):
+        if self.market is not None:
+            self.market.order_book_tracker.stop()
+        self.market_data.cleanup()
+
+    def start_market(self, config: MarketConfig):
+        self.market = self.market_data.create_market([self.trading_pair],
+                                                     self.start_timestamp,
+                                                     self.end_timestamp,
+                                                     config=config)
+        self.market.set_balance("ETH", 10)
+        self.market.set_balance("USDT", 1000)
+        for event_tag in self.events:
+            self.market.add_listener(event_tag, self.market_logger)
+        self.clock: Clock = Clock(ClockMode.BACKTEST, 1.0, self.start_timestamp, self.end_timestamp)
+        self.clock.add_iterator(self.market)
+        self.clock.backtest_til(self.start_timestamp + 1)
+        self.assertTrue(self.market.ready)
+
+    def logged_events(self, event_type: type) -> List[object]:
+        return [e for e in self.market_logger.event_log if isinstance(e, event_type)]
+
+    def test_limit_order_submission_latency(self):
+        self.start_market(MarketConfig.default_config()._replace(
+            latency_models=LatencyModels.constant(order_submission=2.0)
+        ))
+        order_id: str = self.market.buy(self.trading_pair, Decimal(1), OrderType.LIMIT, Decimal(99))
+        self.assertEqual(0, len(self.market.limit_orders))
+        self.assertEqual([order_id], [o.order_id for o in self.market.queued_orders])
+        self.assertEqual(0, len(self.logged_events(BuyOrderCreatedEvent)))
+
+        self.clock.backtest_til(self.start_timestamp + 2)
+        self.assertEqual(0, len(self.market.limit_orders))
+        self.clock.backtest_til(self.start_timestamp + 3)
+        self.assertEqual([order_id], [o.client_order_id for o in self.market.limit_orders])
+        self.assertEqual(0, len(self.market.queued_orders))
+        created: List[BuyOrderCreatedEvent] = self.logged_events(BuyOrderCreatedEvent)
+        self.assertEqual(1, len(created))
+        self.assertEqual(self.start_timestamp + 3, created[0].timestamp)
+
+    def test_market_order_submission_latency(self):
+        self.start_market(MarketConfig.default_config()._replace(
+            latency_models=LatencyModels.constant(order_submission=0.5)
+        ))
+        self.market.buy(self.trading_pair, Decimal(1), OrderType.MARKET)
+        # Executed on the next tick, instead of after the fixed market order delay.
+        self.clock.backtest_til(self.start_timestamp + 2)
+        completed: List[BuyOrderCompletedEvent] = self.logged_events(BuyOrderCompletedEvent)
+        self.assertEqual(1, len(completed))
+        self.assertEqual(Decimal(101), completed[0].quote_asset_amount)
+        self.assertEqual(Decimal(11), self.market.get_balance("ETH"))
+
+    def test_cancellation_latency(self):
+        self.start_market(MarketConfig.default_config()._replace(
+            latency_models=LatencyModels.constant(order_cancellation=5.0)
+        ))
+        self.clock.backtest_til(self.start_timestamp + 6)
+        order_id: str = self.market.buy(self.trading_pair, Decimal(1), OrderType.LIMIT, Decimal(99))
+        self.market.cancel(self.trading_pair, order_id)
+        self.assertEqual(1, len(self.market.queued_cancels))
+
+        # The seller fills the order before the cancellation arrives.
+        self.clock.backtest_til(self.start_timestamp + 15)
+        self.assertEqual(1, len(self.logged_events(OrderFilledEvent)))
+        self.assertEqual(0, len(self.logged_events(OrderCancelledEvent)))
+        self.assertEqual(0, len(self.market.limit_orders))
+        self.assertEqual(0, len(self.market.queued_cancels))
+
+    def test_cancellation_before_arrival(self):
+        self.start_market(MarketConfig.default_config()._replace(
+            latency_models=LatencyModels.constant(order_submission=3.0, order_cancellation=1.0)
+        ))
+        order_id: str = self.market.buy(self.trading_pair, Decimal(1), OrderType.LIMIT, Decimal(99))
+        self.market.cancel(self.trading_pair, order_id)
+        self.clock.backtest_til(self.start_timestamp + 15)
+        self.assertEqual([order_id], [e.order_id for e in self.logged_events(OrderCancelledEvent)])
+        self.assertEqual(0, len(self.logged_events(BuyOrderCreatedEvent)))
+        self.assertEqual(0, len(self.logged_events(OrderFilledEvent)))
+        self.assertEqual(0, len(self.market.limit_orders))
+
+    def test_cancel_only_the_given_order(self):
+        self.start_market(MarketConfig.default_config())
+        first_order_id: str = self.market.buy(self.trading_pair, Decimal(1), OrderType.LIMIT, Decimal(95))
+        second_order_id: str = self.market.buy(self.trading_pair, Decimal(1), OrderType.LIMIT, Decimal(96))
+        self.market.cancel(self.trading_pair, first_order_id)
+        self.assertEqual([second_order_id], [o.client_order_id for o in self.market.limit_orders])
+        self.assertEqual([first_order_id], [e.order_id for e in self.logged_events(OrderCancelledEvent)])
+
+    def test_market_data_latency(self):
+        self.start_market(MarketConfig.default_config()._replace(
+            latency_models=LatencyModels.constant(market_data=3.0)
+        ))
+        self.clock.backtest_til(self.start_timestamp + 7)
+        self.assertEqual(99.0, self.market.get_price(self.trading_pair, False))
+        self.clock.backtest_til(self.start_timestamp + 8)
+        self.assertEqual(100.0, self.market.get_price(self.trading_pair, False))
+
+    def test_fee_model(self):
+        self.start_market(MarketConfig.default_config()._replace(
+            fee_model=ConstantFeeModel(Decimal("0.001"), Decimal("0.002"))
+        ))
+        self.market.buy(self.trading_pair, Decimal(1), OrderType.MARKET)
+        self.market.buy(self.trading_pair, Decimal(1), OrderType.LIMIT, Decimal(99))
+        self.clock.backtest_til(self.start_timestamp + 15)
+
+        fills: List[OrderFilledEvent] = self.logged_events(OrderFilledEvent)
+        self.assertEqual([(OrderType.MARKET, Decimal("0.002")), (OrderType.LIMIT, Decimal("0.001"))],
+                         [(e.order_type, e.trade_fee.percent) for e in fills])
+        self.assertEqual([("USDT", Decimal(101) * Decimal("0.002")), ("USDT", Decimal(99) * Decimal("0.001"))],
+                         [(e.fee_asset, e.fee_amount) for e in self.logged_events(BuyOrderCompletedEvent)])
+        self.assertEqual(Decimal(12), self.market.get_balance("ETH"))
+        self.assertEqual(Decimal(1000) - Decimal(101) * Decimal("1.002") - Decimal(99) * Decimal("1.001"),
+                         self.market.get_balance("USDT"))
+
+    def test_fee_balance_check(self):
+        self.start_market(MarketConfig.default_config()._replace(
+            fee_model=ConstantFeeModel(Decimal(0), Decimal(0), [("ETH", Decimal("0.01")), ("USDT", Decimal(1))])
+        ))
+        self.market.set_balance("USDT", Decimal("99.5"))
+        # Selling all the ETH leaves none for the flat fee in ETH.
+        order_id: str = self.market.sell(self.trading_pair, Decimal(10), OrderType.MARKET)
+        self.clock.backtest_til(self.start_timestamp + 7)
+        self.assertEqual([order_id], [e.order_id for e in self.logged_events(MarketOrderFailureEvent)])
+
+        # The bid is removed instead of filled by the seller, since the USDT balance can't cover the flat fee too.
+        self.market.buy(self.trading_pair, Decimal(1), OrderType.LIMIT, Decimal(99))
+        self.clock.backtest_til(self.start_timestamp + 15)
+        self.assertEqual(0, len(self.logged_events(OrderFilledEvent)))
+        self.assertEqual(0, len(self.market.limit_orders))
+        self.assertEqual(Decimal(10), self.market.get_balance("ETH"))
+        self.assertEqual(Decimal("99.5"), self.market.get_balance("USDT"))
+
+    def test_empirical_latency_model(self):
+        model: EmpiricalLatencyModel = EmpiricalLatencyModel([0.05, 0.1, 0.25], seed=42)
+        samples: List[float] = [model.sample() for _ in range(100)]
+        self.assertTrue(set(samples) <= {0.05, 0.1, 0.25})
+        same_seed_model: EmpiricalLatencyModel = EmpiricalLatencyModel([0.05, 0.1, 0.25], seed=42)
+        self.assertEqual(samples, [same_seed_model.sample() for _ in range(100)])
+        self.assertEqual(3, len(set(samples)))
+
+        csv_path: str = os.path.join(self.market_data.root_path, "latencies.csv")
+        with open(csv_path, "w") as fd:
+            fd.write("timestamp,latency\n1,0.2\n2,0.3\n")
+        self.assertEqual([0.2, 0.3], EmpiricalLatencyModel.from_csv(csv_path).samples)
+
+
+if __name__ == "__main__":
+    unittest.main()
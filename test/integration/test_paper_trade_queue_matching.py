@@ -0,0 +1,147 @@
+#!/usr/bin/env python
+from os.path import join, realpath
+import sys; sys.path.insert(0, realpath(join(__file__, "../../../")))
+
+from decimal import Decimal
+import logging; logging.basicConfig(level=logging.ERROR)
+from typing import List
+import unittest
+
+from hummingbot.core.clock import (
+    Clock,
+    ClockMode,
+)
+from hummingbot.core.data_type.limit_order import LimitOrder
+from hummingbot.core.event.event_logger import EventLogger
+from hummingbot.core.event.events import (
+    BuyOrderCompletedEvent,
+    MarketEvent,
+    OrderFilledEvent,
+    OrderType,
+    TradeType,
+)
+from hummingbot.market.paper_trade.fee_model import ConstantFeeModel
+from hummingbot.market.paper_trade.market_config import MarketConfig
+from hummingbot.market.paper_trade.paper_trade_market import PaperTradeMarket
+from test.integration.replay_market_data import (
+    ReplayMarketData,
+    diff_message,
+    trade_message,
+)
+
+
+class PaperTradeQueueMatchingUnitTest(unittest.TestCase):
+    start_timestamp: float = 1577836800.0
+    end_timestamp: float = start_timestamp + 60.0
+    trading_pair: str = "ETHUSDT"
+
+    def setUp(self):
+        self.market_data: ReplayMarketData = ReplayMarketData()
+        t: float = self.start_timestamp
+        self.market_data.record_snapshot(self.trading_pair,
+                                         [[99.0, 10.0], [98.0, 10.0]],
+                                         [[101.0, 10.0], [102.0, 10.0]],
+                                         t)
+        self.market_data.record(
+            # Cancellations at 99 move the simulated bid up the queue, and new orders at 99 queue up behind it.
+            diff_message(self.trading_pair, 11, [[99.0, 6.0]], [], t + 10),
+            diff_message(self.trading_pair, 12, [[99.0, 9.0]], [], t + 11),
+            # A seller fills the 6 ahead of the bid, and 2 of the bid.
+            trade_message(self.trading_pair, 1, 99.0, 8.0, TradeType.SELL, t + 20),
+            # A seller sweeps through 99, filling the rest of the bid.
+            trade_message(self.trading_pair, 2, 98.0, 5.0, TradeType.SELL, t + 30)
+        )
+
+        self.start_market(MarketConfig.default_config()._replace(queue_position_matching=True))
+
+    def tearDown(self):
+        self.market.order_book_tracker.stop()
+        self.market_data.cleanup()
+
+    def start_market(self, config: MarketConfig):
+        self.market: PaperTradeMarket = self.market_data.create_market([self.trading_pair],
+                                                                       self.start_timestamp,
+                                                                       self.end_timestamp,
+                                                                       config=config)
+        self.market.set_balance("ETH", 10)
+        self.market.set_balance("USDT", 1000)
+        self.market_logger: EventLogger = EventLogger()
+        for event_tag in [MarketEvent.OrderFilled, MarketEvent.BuyOrderCompleted]:
+            self.market.add_listener(event_tag, self.market_logger)
+        self.clock: Clock = Clock(ClockMode.BACKTEST, 1.0, self.start_timestamp, self.end_timestamp)
+        self.clock.add_iterator(self.market)
+        self.clock.backtest_til(self.start_timestamp + 1)
+        self.assertTrue(self.market.ready)
+
+    def bid(self, order_id: str) -> LimitOrder:
+        return [o for o in self.market.limit_orders if o.client_order_id == order_id][0]
+
+    def test_queue_position_partial_fills(self):
+        order_id: str = self.market.buy(self.trading_pair, Decimal(4), OrderType.LIMIT, Decimal(99))
+        self.assertEqual(10.0, self.bid(order_id).queue_ahead)
+
+        self.clock.backtest_til(self.start_timestamp + 15)
+        self.assertEqual(6.0, self.bid(order_id).queue_ahead)
+
+        self.clock.backtest_til(self.start_timestamp + 25)
+        fills: List[OrderFilledEvent] = [e for e in self.market_logger.event_log if isinstance(e, OrderFilledEvent)]
+        self.assertEqual([Decimal(2)], [e.amount for e in fills])
+        self.assertEqual(Decimal(2), self.bid(order_id).filled_quantity)
+        self.assertEqual(Decimal(12), self.market.get_balance("ETH"))
+        self.assertEqual(Decimal(1000 - 2 * 99), self.market.get_balance("USDT"))
+        self.assertEqual(Decimal(2 * 99), self.market.on_hold_balances["USDT"])
+
+        self.clock.backtest_til(self.start_timestamp + 35)
+        fills = [e for e in self.market_logger.event_log if isinstance(e, OrderFilledEvent)]
+        self.assertEqual([Decimal(2), Decimal(2)], [e.amount for e in fills])
+        completed: List[BuyOrderCompletedEvent] = [e for e in self.market_logger.event_log
+                                                   if isinstance(e, BuyOrderCompletedEvent)]
+        self.assertEqual(1, len(completed))
+        self.assertEqual(Decimal(4), completed[0].base_asset_amount)
+        self.assertEqual(0, len(self.market.limit_orders))
+        self.assertEqual(Decimal(14), self.market.get_balance("ETH"))
+        self.assertEqual(Decimal(1000 - 4 * 99), self.market.get_balance("USDT"))
+
+    def test_fees_of_partial_fills(self):
+        self.market.order_book_tracker.stop()
+        self.start_market(MarketConfig.default_config()._replace(
+            queue_position_matching=True,
+            fee_model=ConstantFeeModel(Decimal("0.001"), Decimal("0.002"), [("USDT", Decimal("0.1"))])
+        ))
+        self.market.buy(self.trading_pair, Decimal(4), OrderType.LIMIT, Decimal(99))
+        self.clock.backtest_til(self.end_timestamp)
+
+        # Each of the two fills is charged the percentage fee on its volume, and the flat fee.
+        fill_fee: Decimal = Decimal(2 * 99) * Decimal("0.001") + Decimal("0.1")
+        completed: List[BuyOrderCompletedEvent] = [e for e in self.market_logger.event_log
+                                                   if isinstance(e, BuyOrderCompletedEvent)]
+        self.assertEqual(1, len(completed))
+        self.assertEqual("USDT", completed[0].fee_asset)
+        self.assertEqual(fill_fee * 2, completed[0].fee_amount)
+        self.assertEqual(Decimal(1000 - 4 * 99) - fill_fee * 2, self.market.get_balance("USDT"))
+
+    def test_orders_at_same_price(self):
+        first_order_id: str = self.market.buy(self.trading_pair, Decimal(1), OrderType.LIMIT, Decimal(98))
+        second_order_id: str = self.market.buy(self.trading_pair, Decimal(1), OrderType.LIMIT, Decimal(98))
+        self.assertEqual({first_order_id, second_order_id}, set(o.client_order_id for o in self.market.limit_orders))
+
+        # Only the sweep reaches 98, and its 5 are taken by the 10 queued ahead of the bids.
+        self.clock.backtest_til(self.end_timestamp)
+        self.assertEqual(2, len(self.market.limit_orders))
+        self.assertEqual(0, len(self.market_logger.event_log))
+
+    def test_crossed_order_larger_than_depth(self):
+        self.market.set_balance("USDT", 5000)
+        order_id: str = self.market.buy(self.trading_pair, Decimal(15), OrderType.LIMIT, Decimal(101))
+
+        # The 10 asked at 101 fill the bid once, rather than again on every tick while the asks are unchanged.
+        self.clock.backtest_til(self.start_timestamp + 10)
+        fills: List[OrderFilledEvent] = [e for e in self.market_logger.event_log if isinstance(e, OrderFilledEvent)]
+        self.assertEqual([Decimal(10)], [e.amount for e in fills])
+        self.assertEqual(Decimal(10), self.bid(order_id).filled_quantity)
+        self.assertEqual(Decimal(20), self.market.get_balance("ETH"))
+        self.assertEqual(Decimal(102), self.market.get_price(self.trading_pair, True))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,122 @@
+#!/usr/bin/env python
+from os.path import join, realpath
+import sys; sys.path.insert(0, realpath(join(__file__, "../../../")))
+
+from decimal import Decimal
+import logging; logging.basicConfig(level=logging.ERROR)
+import math
+import pandas as pd
+from typing import (
+    Any,
+    Dict,
+    List,
+)
+import unittest
+
+from hummingbot.core.event.events import TradeType
+from hummingbot.market.paper_trade.paper_trade_market import PaperTradeMarket
+from hummingbot.market.paper_trade.parameter_sweep import (
+    ParameterSweep,
+    SweepMarket,
+)
+from hummingbot.strategy.market_trading_pair_tuple import MarketTradingPairTuple
+from hummingbot.strategy.pure_market_making import (
+    ConstantSizeSizingDelegate,
+    ConstantSpreadPricingDelegate,
+    PassThroughFilterDelegate,
+)
+from hummingbot.strategy.pure_market_making.pure_market_making_v2 import PureMarketMakingStrategyV2
+from test.integration.replay_market_data import (
+    ReplayMarketData,
+    trade_message,
+)
+
+
+def make_strategy(markets: List[PaperTradeMarket], parameters: Dict[str, Any]) -> PureMarketMakingStrategyV2:
+    return PureMarketMakingStrategyV2(
+        [MarketTradingPairTuple(markets[0], "ETHUSDT", "ETH", "USDT")],
+        filter_delegate=PassThroughFilterDelegate(),
+        pricing_delegate=ConstantSpreadPricingDelegate(parameters["bid_place_threshold"],
+                                                       parameters["ask_place_threshold"]),
+        sizing_delegate=ConstantSizeSizingDelegate(Decimal(1)),
+        cancel_order_wait_time=600,
+        filled_order_replenish_wait_time=600,
+        logging_options=0
+    )
+
+
+class ParameterSweepUnitTest(unittest.TestCase):
+    start_timestamp: float = 1577836800.0
+    end_timestamp: float = start_timestamp + 300.0
+
+    def setUp(self):
+        self.market_data: ReplayMarketData = ReplayMarketData()
+        t: float = self.start_timestamp
+        self.market_data.record_snapshot("ETHUSDT",
+                                         [[99.0, 10.0], [98.0, 10.0]],
+                                         [[101.0, 10.0], [102.0, 10.0]],
+                                         t)
+        # A seller hitting the bids down to 99.4, then a buyer lifting the asks up to 100.3.
+        self.market_data.record(
+            trade_message("ETHUSDT", 1, 99.4, 5.0, TradeType.SELL, t + 60),
+            trade_message("ETHUSDT", 2, 100.3, 5.0, TradeType.BUY, t + 120)
+        )
+        self.market_data.stop()
+
+    def tearDown(self):
+        self.market_data.cleanup()
+
+    def test_parameter_grid(self):
+        grid: List[Dict[str, Any]] = ParameterSweep.parameter_grid(a=[1, 2], b=["x", "y", "z"])
+        self.assertEqual(6, len(grid))
+        self.assertEqual({"a": 1, "b": "x"}, grid[0])
+        self.assertEqual({"a": 2, "b": "z"}, grid[-1])
+
+    def test_sweep(self):
+        sweep: ParameterSweep = ParameterSweep(
+            [SweepMarket("binance", ["ETHUSDT"], {"ETH": Decimal(10), "USDT": Decimal(1000)})],
+            make_strategy,
+            self.start_timestamp,
+            self.end_timestamp,
+            root_path=self.market_data.root_path,
+            max_workers=2
+        )
+        # The bid is at 99.5 or 99.0, and the ask at 100.2 or 101.0, around the mid price of 100.
+        results: pd.DataFrame = sweep.run(ParameterSweep.parameter_grid(
+            bid_place_threshold=[Decimal("0.005"), Decimal("0.01")],
+            ask_place_threshold=[Decimal("0.002"), Decimal("0.01")]
+        ))
+        self.assertEqual(4, len(results))
+        self.assertTrue(results["error"].isna().all())
+        self.assertEqual([2, 1, 1, 0], results["fills"].tolist())
+        self.assertEqual([1, 1, 0, 0], results["buy_fills"].tolist())
+
+        both_filled: Dict[str, Any] = results.iloc[0].to_dict()
+        self.assertEqual(Decimal("0.005"), both_filled["bid_place_threshold"])
+        # Bought at 99.5 and sold at 100.2, with the mid price still at 100.
+        self.assertAlmostEqual(0.7, both_filled["pnl"])
+        self.assertEqual(10.0, both_filled["end_inventory"])
+        self.assertEqual(5, len(both_filled["inventory_path"]))
+        self.assertEqual([11.0, 10.0], [balance for _, balance in both_filled["inventory_path"][0:2]])
+        self.assertTrue(math.isclose(0.0, results.iloc[3]["pnl"], abs_tol=1e-12))
+
+    def test_sweep_with_unpriced_asset(self):
+        # BTC has no trading pair to price it in USDT, so it's left out of the PnL rather than failing the runs.
+        sweep: ParameterSweep = ParameterSweep(
+            [SweepMarket("binance", ["ETHUSDT"], {"ETH": Decimal(10), "USDT": Decimal(1000), "BTC": Decimal(1)})],
+            make_strategy,
+            self.start_timestamp,
+            self.end_timestamp,
+            root_path=self.market_data.root_path,
+            max_workers=1
+        )
+        results: pd.DataFrame = sweep.run([{"bid_place_threshold": Decimal("0.005"),
+                                            "ask_place_threshold": Decimal("0.002")}])
+        self.assertTrue(results["error"].isna().all())
+        self.assertAlmostEqual(0.7, results.iloc[0]["pnl"])
+        self.assertAlmostEqual(0.7 / 2000 * 100, results.iloc[0]["return_pct"])
+        self.assertEqual(["BTC"], results.iloc[0]["unpriced_assets"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,160 @@
+#!/usr/bin/env python
+from os.path import join, realpath
+import sys; sys.path.insert(0, realpath(join(__file__, "../../../")))
+
+from decimal import Decimal
+import logging; logging.basicConfig(level=logging.ERROR)
+import numpy as np
+from typing import List
+import unittest
+
+from hummingbot.core.clock import (
+    Clock,
+    ClockMode,
+)
+from hummingbot.core.data_type.limit_order import LimitOrder
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_row import OrderBookRow
+from hummingbot.market.huobi.huobi_market import HuobiMarket
+from hummingbot.market.paper_trade.paper_trade_market import PaperTradeMarket
+from hummingbot.market.trading_rule import TradingRule
+from hummingbot.strategy.market_trading_pair_tuple import MarketTradingPairTuple
+from hummingbot.strategy.pure_market_making import (
+    ConstantMultipleSpreadPricingDelegate,
+    InventorySkewMultipleSizeSizingDelegate,
+    PassThroughFilterDelegate,
+    StaggeredMultipleSizeSizingDelegate,
+)
+from hummingbot.strategy.pure_market_making.order_sizing_delegate import OrderSizingDelegate
+from hummingbot.strategy.pure_market_making.pure_market_making_v2 import PureMarketMakingStrategyV2
+from test.integration.replay_market_data import ReplayMarketData
+
+
+class PureMarketMakingMultipleLevelsUnitTest(unittest.TestCase):
+    trading_pair: str = "ethusdt"
+
+    def setUp(self):
+        # A market that floors order amounts to its size quantum, without the significant digit rounding of paper trade.
+        self.huobi_market: HuobiMarket = HuobiMarket("", "", trading_pairs=[self.trading_pair], trading_required=False)
+        self.huobi_market.trading_rules[self.trading_pair] = TradingRule(self.trading_pair,
+                                                                         min_order_size=Decimal("0.01"),
+                                                                         min_price_increment=Decimal("0.01"),
+                                                                         min_base_amount_increment=Decimal("0.01"))
+        order_book: OrderBook = OrderBook()
+        order_book.apply_snapshot([OrderBookRow(99.0, 10.0, 1)], [OrderBookRow(101.0, 10.0, 1)], 1)
+        self.huobi_market.order_book_tracker.order_books[self.trading_pair] = order_book
+
+    def test_order_size_ladder_quantization(self):
+        start_size: Decimal = Decimal("0.7")
+        step_size: Decimal = Decimal("0.1")
+        order_sizes: np.ndarray = float(start_size) + float(step_size) * np.arange(6, dtype=np.float64)
+        prices: np.ndarray = np.full(6, 100.0)
+        # The sizes each level used to be quantized to, one Decimal at a time.
+        expected_sizes: List[Decimal] = [self.huobi_market.quantize_order_amount(self.trading_pair,
+                                                                                 start_size + step_size * i)
+                                         for i in range(6)]
+        self.assertEqual([Decimal("0.7"), Decimal("0.8"), Decimal("0.9"), Decimal("1.0"), Decimal("1.1"),
+                          Decimal("1.2")],
+                         expected_sizes)
+        self.assertEqual(expected_sizes, self.huobi_market.quantize_order_amounts(self.trading_pair, order_sizes, prices))
+
+        skew_ratio: Decimal = Decimal("1.3")
+        self.assertEqual([self.huobi_market.quantize_order_amount(self.trading_pair,
+                                                                  (start_size + step_size * i) * skew_ratio)
+                          for i in range(6)],
+                         self.huobi_market.quantize_order_amounts(self.trading_pair,
+                                                                  order_sizes * float(skew_ratio),
+                                                                  prices))
+
+
+class PureMarketMakingMultipleLevelsReplayUnitTest(unittest.TestCase):
+    start_timestamp: float = 1577836800.0
+    end_timestamp: float = start_timestamp + 600.0
+    trading_pair: str = "ETHUSDT"
+
+    def setUp(self):
+        self.market_data: ReplayMarketData = ReplayMarketData()
+        self.market_data.record_snapshot(self.trading_pair,
+                                         [[99.0, 10.0], [98.0, 10.0]],
+                                         [[101.0, 10.0], [102.0, 10.0]],
+                                         self.start_timestamp)
+        self.market: PaperTradeMarket = self.market_data.create_market([self.trading_pair],
+                                                                       self.start_timestamp,
+                                                                       self.end_timestamp)
+        self.market.set_balance("ETH", 100)
+        self.market.set_balance("USDT", 10000)
+        self.clock: Clock = Clock(ClockMode.BACKTEST, 60.0, self.start_timestamp, self.end_timestamp)
+        self.clock.add_iterator(self.market)
+
+    def tearDown(self):
+        self.market.order_book_tracker.stop()
+        self.market_data.cleanup()
+
+    def run_strategy(self, sizing_delegate: OrderSizingDelegate) -> PureMarketMakingStrategyV2:
+        # Five levels each side, 1% apart from the mid price of 100 and from each other.
+        strategy: PureMarketMakingStrategyV2 = PureMarketMakingStrategyV2(
+            [MarketTradingPairTuple(self.market, self.trading_pair, "ETH", "USDT")],
+            filter_delegate=PassThroughFilterDelegate(),
+            pricing_delegate=ConstantMultipleSpreadPricingDelegate(Decimal("0.01"), Decimal("0.01"),
+                                                                   Decimal("0.01"), 5),
+            sizing_delegate=sizing_delegate,
+            cancel_order_wait_time=600,
+            logging_options=0
+        )
+        self.clock.add_iterator(strategy)
+        self.clock.backtest_til(self.start_timestamp + 60)
+        return strategy
+
+    @staticmethod
+    def sorted_orders(orders: List[LimitOrder]) -> List[LimitOrder]:
+        return sorted(orders, key=lambda o: abs(o.price - Decimal(100)))
+
+    def test_batch_quantization(self):
+        self.clock.backtest_til(self.start_timestamp + 60)
+        prices: np.ndarray = 99.123456789 * np.power(0.99, np.arange(4))
+        amounts: np.ndarray = np.array([0.123456789, 1.5, 0.0, 2.25])
+        self.assertEqual([self.market.quantize_order_price(self.trading_pair, Decimal(str(price))) for price in prices],
+                         self.market.quantize_order_prices(self.trading_pair, prices))
+        self.assertEqual([self.market.quantize_order_amount(self.trading_pair, Decimal(str(amount))) for amount in amounts],
+                         self.market.quantize_order_amounts(self.trading_pair, amounts))
+
+    def test_staggered_sizing(self):
+        strategy: PureMarketMakingStrategyV2 = self.run_strategy(
+            StaggeredMultipleSizeSizingDelegate(Decimal(1), Decimal("0.5"), 5)
+        )
+        bids: List[LimitOrder] = self.sorted_orders([o for _, o in strategy.active_bids])
+        asks: List[LimitOrder] = self.sorted_orders([o for _, o in strategy.active_asks])
+        self.assertEqual([Decimal(1) + Decimal("0.5") * i for i in range(5)], [o.quantity for o in bids])
+        self.assertEqual([Decimal(1) + Decimal("0.5") * i for i in range(5)], [o.quantity for o in asks])
+        for i in range(5):
+            self.assertAlmostEqual(Decimal(99) * Decimal("0.99") ** i, bids[i].price, 4)
+            self.assertAlmostEqual(Decimal(101) * Decimal("1.01") ** i, asks[i].price, 4)
+
+    def test_staggered_sizing_without_enough_balance(self):
+        # The five bids need 1 + 1.5 + 2 + 2.5 + 3 at about 97 each, so none of them are placed.
+        self.market.set_balance("USDT", 500)
+        strategy: PureMarketMakingStrategyV2 = self.run_strategy(
+            StaggeredMultipleSizeSizingDelegate(Decimal(1), Decimal("0.5"), 5)
+        )
+        self.assertEqual(0, len(strategy.active_bids))
+        self.assertEqual(5, len(strategy.active_asks))
+
+    def test_inventory_skew_sizing(self):
+        # 100 ETH and 300 USDT is about 97% in base asset, against a target of 50%.
+        self.market.set_balance("USDT", 300)
+        strategy: PureMarketMakingStrategyV2 = self.run_strategy(
+            InventorySkewMultipleSizeSizingDelegate(Decimal(1), Decimal("0.5"), 5, Decimal("0.5"))
+        )
+        bids: List[LimitOrder] = self.sorted_orders([o for _, o in strategy.active_bids])
+        asks: List[LimitOrder] = self.sorted_orders([o for _, o in strategy.active_asks])
+        quote_ratio: Decimal = Decimal(300) / Decimal(10300) / Decimal("0.5")
+        self.assertEqual(5, len(bids))
+        self.assertEqual(5, len(asks))
+        for i in range(5):
+            self.assertAlmostEqual((Decimal(1) + Decimal("0.5") * i) * quote_ratio, bids[i].quantity, 5)
+            self.assertAlmostEqual((Decimal(1) + Decimal("0.5") * i) * (Decimal(2) - quote_ratio), asks[i].quantity, 5)
+        self.assertLessEqual(sum(o.price * o.quantity for o in bids), Decimal(300))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,127 @@
+#!/usr/bin/env python
+from os.path import join, realpath
+import sys; sys.path.insert(0, realpath(join(__file__, "../../../")))
+
+from decimal import Decimal
+import logging; logging.basicConfig(level=logging.ERROR)
+import unittest
+
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.replay_order_book_tracker import ReplayOrderBookTracker
+from hummingbot.core.event.event_logger import EventLogger
+from hummingbot.core.event.events import (
+    BuyOrderCompletedEvent,
+    MarketEvent,
+    OrderBookEvent,
+    TradeType,
+)
+from hummingbot.market.paper_trade.replay_backtest import ReplayBacktest
+from hummingbot.strategy.market_trading_pair_tuple import MarketTradingPairTuple
+from hummingbot.strategy.pure_market_making import (
+    ConstantSizeSizingDelegate,
+    ConstantSpreadPricingDelegate,
+    PassThroughFilterDelegate,
+)
+from hummingbot.strategy.pure_market_making.pure_market_making_v2 import PureMarketMakingStrategyV2
+from test.integration.replay_market_data import (
+    ReplayMarketData,
+    diff_message,
+    trade_message,
+)
+
+
+class ReplayOrderBookTrackerUnitTest(unittest.TestCase):
+    start_timestamp: float = 1577836800.0
+    end_timestamp: float = start_timestamp + 60.0
+    trading_pair: str = "ETHUSDT"
+
+    @classmethod
+    def setUpClass(cls):
+        # Trading pairs without a snapshot to start from are logged as warnings, which the tests don't need to see.
+        logging.getLogger("hummingbot.core.data_type.replay_order_book_data_source").setLevel(logging.ERROR)
+
+    def setUp(self):
+        self.market_data: ReplayMarketData = ReplayMarketData()
+        t: float = self.start_timestamp
+        # Diffs before the first snapshot can't be replayed.
+        self.market_data.record(diff_message(self.trading_pair, 1, [[99.0, 5.0]], [], t))
+        self.market_data.record_snapshot(self.trading_pair,
+                                         [[99.0, 1.0], [98.0, 2.0]],
+                                         [[101.0, 1.0], [102.0, 2.0]],
+                                         t + 1)
+        self.market_data.record(
+            diff_message(self.trading_pair, 11, [[99.5, 3.0]], [], t + 10),
+            diff_message(self.trading_pair, 12, [[99.5, 4.0]], [[101.0, 0.0]], t + 11),
+            trade_message(self.trading_pair, 1, 100.5, 2.0, TradeType.BUY, t + 20),
+            trade_message(self.trading_pair, 2, 99.0, 1.0, TradeType.SELL, t + 30),
+            diff_message(self.trading_pair, 13, [], [[100.0, 1.0]], t + 40)
+        )
+        self.market_data.stop()
+
+    def tearDown(self):
+        self.market_data.cleanup()
+
+    def test_replay_til(self):
+        tracker: ReplayOrderBookTracker = ReplayOrderBookTracker("binance", root_path=self.market_data.root_path)
+        tracker.start_replay()
+        order_book: OrderBook = tracker.order_books[self.trading_pair]
+        trade_logger: EventLogger = EventLogger()
+        order_book.add_listener(OrderBookEvent.TradeEvent, trade_logger)
+        self.assertEqual(10, order_book.snapshot_uid)
+        self.assertEqual(99.0, order_book.get_price(False))
+        self.assertEqual(101.0, order_book.get_price(True))
+
+        tracker.replay_til(self.start_timestamp + 15)
+        self.assertEqual(99.5, order_book.get_price(False))
+        self.assertEqual(4.0, order_book.get_volume_for_price(False, 99.5).result_volume)
+        self.assertEqual(102.0, order_book.get_price(True))
+        self.assertEqual(0, len(trade_logger.event_log))
+
+        tracker.replay_til(self.start_timestamp + 35)
+        self.assertEqual([TradeType.BUY, TradeType.SELL], [e.type for e in trade_logger.event_log])
+        self.assertEqual([100.5, 99.0], [e.price for e in trade_logger.event_log])
+        self.assertFalse(tracker.replay_done)
+
+        tracker.replay_til(self.end_timestamp)
+        self.assertEqual(100.0, order_book.get_price(True))
+        self.assertEqual(5, tracker.messages_replayed)
+        self.assertTrue(tracker.replay_done)
+
+    def test_replay_time_range(self):
+        tracker: ReplayOrderBookTracker = ReplayOrderBookTracker("binance",
+                                                                 start_time=self.start_timestamp + 2,
+                                                                 root_path=self.market_data.root_path)
+        tracker.start_replay()
+        # There's no snapshot after the start time.
+        self.assertEqual(0, len(tracker.order_books))
+        self.assertTrue(tracker.replay_done)
+
+    def test_backtest_limit_order_fill(self):
+        backtest: ReplayBacktest = ReplayBacktest(self.start_timestamp, self.end_timestamp,
+                                                  root_path=self.market_data.root_path)
+        market = backtest.add_market("binance", [self.trading_pair], {"ETH": Decimal(10), "USDT": Decimal(1000)})
+        market_logger: EventLogger = EventLogger()
+        market.add_listener(MarketEvent.BuyOrderCompleted, market_logger)
+        market.add_listener(MarketEvent.SellOrderCompleted, market_logger)
+        # Bid at 99.2 and ask at 100.8 around the snapshot's mid price.
+        strategy: PureMarketMakingStrategyV2 = PureMarketMakingStrategyV2(
+            [MarketTradingPairTuple(market, self.trading_pair, "ETH", "USDT")],
+            filter_delegate=PassThroughFilterDelegate(),
+            pricing_delegate=ConstantSpreadPricingDelegate(Decimal("0.008"), Decimal("0.008")),
+            sizing_delegate=ConstantSizeSizingDelegate(Decimal(1)),
+            cancel_order_wait_time=600,
+            filled_order_replenish_wait_time=600,
+            logging_options=0
+        )
+        backtest.run(strategy)
+
+        # Only the bid is filled, by the recorded sell trade at 99.0.
+        self.assertEqual([BuyOrderCompletedEvent], [type(e) for e in market_logger.event_log])
+        self.assertEqual(Decimal(11), market.get_balance("ETH"))
+        self.assertEqual(Decimal("900.8"), market.get_balance("USDT"))
+        self.assertTrue(market.order_book_tracker.replay_done)
+        self.assertEqual(self.end_timestamp, market.order_book_tracker.replay_timestamp)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,151 @@
+#!/usr/bin/env python
+from os.path import join, realpath
+import sys; sys.path.insert(0, realpath(join(__file__, "../../")))
+
+import asyncio
+import logging; logging.basicConfig(level=logging.ERROR)
+from typing import List
+import unittest
+
+from hummingbot.core.utils.async_call_scheduler import (
+    AsyncCallPriority,
+    AsyncCallScheduler,
+    LatencyHistogram,
+)
+
+
+class AsyncCallSchedulerUnitTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.ev_loop: asyncio.BaseEventLoop = asyncio.get_event_loop()
+        # Failed calls are logged, which the tests don't need to see.
+        logging.getLogger("hummingbot.core.utils.async_call_scheduler").setLevel(logging.CRITICAL)
+
+    def run_async(self, coro):
+        return self.ev_loop.run_until_complete(coro)
+
+    def test_priority(self):
+        call_order: List[str] = []
+
+        async def call(name: str, started: asyncio.Event = None, release: asyncio.Event = None):
+            if started is not None:
+                started.set()
+                await release.wait()
+            call_order.append(name)
+            return name
+
+        async def run():
+            scheduler: AsyncCallScheduler = AsyncCallScheduler(call_interval=0)
+            started: asyncio.Event = asyncio.Event()
+            release: asyncio.Event = asyncio.Event()
+            # Hold up the scheduler, so the other calls are queued before any of them is started.
+            blocking_call: asyncio.Future = asyncio.ensure_future(
+                scheduler.schedule_async_call(call("blocking", started, release), 1.0))
+            await started.wait()
+            calls: List[asyncio.Future] = [
+                asyncio.ensure_future(scheduler.schedule_async_call(call(name), 1.0, priority=priority))
+                for name, priority in [("low", AsyncCallPriority.LOW),
+                                       ("normal 1", AsyncCallPriority.NORMAL),
+                                       ("high 1", AsyncCallPriority.HIGH),
+                                       ("normal 2", AsyncCallPriority.NORMAL),
+                                       ("high 2", AsyncCallPriority.HIGH)]
+            ]
+            await asyncio.sleep(0)
+            release.set()
+            results: List[str] = await asyncio.gather(blocking_call, *calls)
+            scheduler.stop()
+            return scheduler, results
+
+        scheduler, results = self.run_async(run())
+        self.assertEqual(["blocking", "low", "normal 1", "high 1", "normal 2", "high 2"], results)
+        self.assertEqual(["blocking", "high 1", "high 2", "normal 1", "normal 2", "low"], call_order)
+        self.assertEqual(6, scheduler.queue_wait_histogram.num_samples)
+        self.assertEqual(6, scheduler.latency_histogram.num_samples)
+        self.assertEqual(0, scheduler.metrics["queue_size"])
+
+    def test_concurrency(self):
+        running: List[int] = [0]
+        max_running: List[int] = [0]
+
+        async def call():
+            running[0] += 1
+            max_running[0] = max(max_running[0], running[0])
+            await asyncio.sleep(0.05)
+            running[0] -= 1
+
+        async def run(max_concurrency: int):
+            scheduler: AsyncCallScheduler = AsyncCallScheduler(call_interval=0, max_concurrency=max_concurrency)
+            await asyncio.gather(*[scheduler.schedule_async_call(call(), 1.0) for _ in range(8)])
+            scheduler.stop()
+
+        self.run_async(run(1))
+        self.assertEqual(1, max_running[0])
+        max_running[0] = 0
+        self.run_async(run(3))
+        self.assertEqual(3, max_running[0])
+
+        with self.assertRaises(ValueError):
+            AsyncCallScheduler(max_concurrency=0)
+
+    def test_timeout(self):
+        async def slow_call():
+            await asyncio.sleep(1.0)
+            return "slow"
+
+        async def fast_call():
+            return "fast"
+
+        async def run():
+            scheduler: AsyncCallScheduler = AsyncCallScheduler(call_interval=0)
+            # Not assertRaises(), which clears the frames of the traceback. The error is raised in the scheduler's
+            # coroutine, and clearing its frame would close it.
+            timed_out: bool = False
+            try:
+                await scheduler.schedule_async_call(slow_call(), 0.05)
+            except asyncio.TimeoutError:
+                timed_out = True
+            self.assertTrue(timed_out)
+            # The timeout of a call doesn't stop the scheduler from running the next ones.
+            result: str = await scheduler.schedule_async_call(fast_call(), 0.05)
+            scheduler.stop()
+            return scheduler, result
+
+        scheduler, result = self.run_async(run())
+        self.assertEqual("fast", result)
+        self.assertEqual(2, scheduler.latency_histogram.num_samples)
+        self.assertGreaterEqual(scheduler.latency_histogram.max, 0.05)
+        self.assertLess(scheduler.latency_histogram.max, 1.0)
+
+
+class LatencyHistogramUnitTest(unittest.TestCase):
+    def test_latency_histogram(self):
+        histogram: LatencyHistogram = LatencyHistogram((0.1, 0.01, 1.0))
+        self.assertEqual((0.01, 0.1, 1.0), histogram.bucket_bounds)
+        self.assertEqual(0.0, histogram.mean)
+        self.assertEqual(0.0, histogram.percentile(99))
+
+        for seconds in [0.005, 0.01, 0.05, 0.05, 0.5, 2.0]:
+            histogram.add(seconds)
+        self.assertEqual(6, histogram.num_samples)
+        # Samples equal to a bound are counted in its bucket, and the ones above the last bound in the overflow bucket.
+        self.assertEqual([2, 2, 1, 1], histogram.counts)
+        self.assertEqual([(0.01, 2), (0.1, 2), (1.0, 1), (float("inf"), 1)], list(histogram))
+        self.assertAlmostEqual(2.615 / 6, histogram.mean)
+        self.assertEqual(2.0, histogram.max)
+        self.assertEqual(0.01, histogram.percentile(20))
+        self.assertEqual(0.1, histogram.percentile(50))
+        self.assertEqual(1.0, histogram.percentile(80))
+        self.assertEqual(2.0, histogram.percentile(99))
+
+        histogram.reset()
+        self.assertEqual(0, histogram.num_samples)
+        self.assertEqual([0, 0, 0, 0], histogram.counts)
+        self.assertEqual(0.0, histogram.max)
+
+        # The bucket bound is capped at the max sample.
+        histogram.add(0.002)
+        self.assertEqual(0.002, histogram.percentile(50))
+
+
+if __name__ == "__main__":
+    unittest.main()
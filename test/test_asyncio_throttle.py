@@ -0,0 +1,174 @@
+#!/usr/bin/env python
+from os.path import join, realpath
+import sys; sys.path.insert(0, realpath(join(__file__, "../../")))
+
+import asyncio
+import logging; logging.basicConfig(level=logging.ERROR)
+import time
+from typing import (
+    List,
+    Tuple,
+)
+import unittest
+
+from hummingbot.core.utils.async_call_scheduler import AsyncCallPriority
+from hummingbot.core.utils.asyncio_throttle import (
+    RateLimit,
+    RateLimitWindow,
+    Throttler,
+)
+
+
+class RateLimitWindowUnitTest(unittest.TestCase):
+    def test_rate_limit_window(self):
+        window: RateLimitWindow = RateLimitWindow(RateLimit(10, 1.0), period_safety_margin=0.1)
+        window.add(4, 100.0)
+        window.add(5, 100.5)
+        window.add(0, 100.5)
+        self.assertEqual(9, window.used_weight)
+        self.assertEqual(1, window.remaining(100.6))
+
+        self.assertEqual(0.0, window.time_until_capacity(1, 100.6))
+        # Fits once the first request, with the safety margin, has left the window.
+        self.assertAlmostEqual(0.5, window.time_until_capacity(3, 100.6))
+        # Needs both requests to leave the window.
+        self.assertAlmostEqual(1.0, window.time_until_capacity(7, 100.6))
+
+        self.assertEqual(5, window.remaining(101.15))
+        self.assertEqual(10, window.remaining(101.65))
+        self.assertEqual(0, window.used_weight)
+
+
+class ThrottlerUnitTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.ev_loop: asyncio.BaseEventLoop = asyncio.get_event_loop()
+
+    def run_async(self, coro):
+        return self.ev_loop.run_until_complete(coro)
+
+    def test_multiple_rate_limits(self):
+        throttler: Throttler = Throttler([RateLimit(10, 0.2),
+                                          RateLimit(2, 0.2, name="orders", default_weight=0)],
+                                         period_safety_margin=0)
+        self.assertEqual(["default", "orders"], [rate_limit.name for rate_limit in throttler.rate_limits])
+        started: List[Tuple[str, float]] = []
+
+        async def task(name: str, weight: int, orders: int = 0):
+            async with throttler.weighted_task(weight, limit_weights={"orders": orders}):
+                started.append((name, time.monotonic()))
+
+        async def run():
+            await task("request", 3)
+            await task("order 1", 3, 1)
+            self.assertEqual({"default": 4, "orders": 1}, throttler.remaining_budget())
+            self.assertEqual(0, throttler.time_until_capacity(4))
+            self.assertGreater(throttler.time_until_capacity(5), 0.1)
+            self.assertEqual(0, throttler.time_until_capacity(1, {"orders": 1}))
+            self.assertGreater(throttler.time_until_capacity(1, {"orders": 2}), 0.1)
+
+            start_ts: float = time.monotonic()
+            await task("order 2", 1, 1)
+            # The third order waits for the order count limit, while requests without orders go on right away.
+            await asyncio.gather(task("request 2", 1), task("order 3", 1, 1))
+            return start_ts
+
+        start_ts: float = self.run_async(run())
+        self.assertEqual(["request", "order 1", "order 2", "request 2", "order 3"], [name for name, _ in started])
+        timestamps = dict(started)
+        self.assertLess(timestamps["request 2"] - start_ts, 0.1)
+        self.assertGreaterEqual(timestamps["order 3"] - timestamps["order 1"], 0.2)
+
+    def test_fifo_order(self):
+        throttler: Throttler = Throttler((3, 0.2), period_safety_margin=0)
+        started: List[str] = []
+
+        async def task(name: str, weight: int):
+            async with throttler.weighted_task(weight):
+                started.append(name)
+
+        async def run():
+            tasks: List[asyncio.Future] = []
+            for name, weight in [("a", 2), ("b", 2), ("c", 1), ("d", 1)]:
+                tasks.append(asyncio.ensure_future(task(name, weight)))
+                await asyncio.sleep(0.01)
+            await asyncio.gather(*tasks)
+
+        self.run_async(run())
+        # c would fit next to a, but doesn't jump ahead of b, which arrived before it.
+        self.assertEqual(["a", "b", "c", "d"], started)
+        self.assertEqual(3, throttler.metrics.tasks_delayed)
+
+    def test_pause(self):
+        throttler: Throttler = Throttler((10, 1.0))
+        throttler.pause(0.2)
+        self.assertGreater(throttler.paused_until, time.monotonic())
+        self.assertGreater(throttler.time_until_capacity(), 0.1)
+        start_ts: float = time.monotonic()
+        self.run_async(throttler.acquire(1))
+        self.assertGreaterEqual(time.monotonic() - start_ts, 0.19)
+
+    def test_request_heavier_than_rate_limit(self):
+        throttler: Throttler = Throttler([RateLimit(10, 1.0), RateLimit(2, 1.0, name="orders", default_weight=0)])
+        with self.assertRaises(ValueError):
+            self.run_async(throttler.acquire(11))
+        with self.assertRaises(ValueError):
+            self.run_async(throttler.acquire(1, {"orders": 3}))
+        with self.assertRaises(ValueError):
+            throttler.time_until_capacity(11)
+        # Nothing is counted for the rejected requests.
+        self.assertEqual({"default": 10, "orders": 2}, throttler.remaining_budget())
+        with self.assertRaises(ValueError):
+            Throttler([])
+
+    def test_priority(self):
+        throttler: Throttler = Throttler((1, 0.1), period_safety_margin=0)
+        started: List[str] = []
+
+        async def task(name: str, priority: int):
+            async with throttler.weighted_task(1, priority=priority):
+                started.append(name)
+
+        async def run():
+            # The first task uses up the rate limit, so the others wait for it.
+            await task("first", AsyncCallPriority.LOW)
+            tasks: List[asyncio.Future] = []
+            for name, priority in [("low", AsyncCallPriority.LOW),
+                                   ("normal 1", AsyncCallPriority.NORMAL),
+                                   ("high", AsyncCallPriority.HIGH),
+                                   ("normal 2", AsyncCallPriority.NORMAL)]:
+                tasks.append(asyncio.ensure_future(task(name, priority)))
+                await asyncio.sleep(0.01)
+            await asyncio.gather(*tasks)
+
+        self.run_async(run())
+        # The high priority task arrived after the low priority one started waiting, and still goes before it.
+        self.assertEqual(["first", "high", "normal 1", "normal 2", "low"], started)
+        self.assertEqual(5, throttler.metrics.tasks_acquired)
+        self.assertEqual(4, throttler.metrics.tasks_delayed)
+
+    def test_cancelled_waiter(self):
+        throttler: Throttler = Throttler((1, 0.1), period_safety_margin=0)
+        started: List[str] = []
+
+        async def task(name: str, priority: int = AsyncCallPriority.NORMAL):
+            async with throttler.weighted_task(1, priority=priority):
+                started.append(name)
+
+        async def run():
+            await task("first")
+            first_waiter: asyncio.Future = asyncio.ensure_future(task("cancelled first", AsyncCallPriority.HIGH))
+            second_waiter: asyncio.Future = asyncio.ensure_future(task("cancelled second"))
+            last_waiter: asyncio.Future = asyncio.ensure_future(task("last"))
+            await asyncio.sleep(0.01)
+            # Cancelling waiters, at the front of the queue or behind other waiters, lets the rest go on.
+            first_waiter.cancel()
+            second_waiter.cancel()
+            await asyncio.wait_for(last_waiter, 1.0)
+
+        self.run_async(run())
+        self.assertEqual(["first", "last"], started)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,240 @@
+#!/usr/bin/env python
+from os.path import join, realpath
+import sys; sys.path.insert(0, realpath(join(__file__, "../../")))
+
+import asyncio
+import logging; logging.basicConfig(level=logging.ERROR)
+import math
+import time
+from typing import (
+    List,
+    Tuple,
+)
+import unittest
+
+from hummingbot.core.clock import (
+    Clock,
+    ClockMode,
+    TickTimingStats,
+)
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_row import OrderBookRow
+from hummingbot.core.event.events import OrderBookEvent
+from hummingbot.core.py_time_iterator import PyTimeIterator
+
+
+class SlowTickIterator(PyTimeIterator):
+    def __init__(self, tick_duration: float):
+        super().__init__()
+        self.tick_duration: float = tick_duration
+        self.tick_count: int = 0
+
+    def tick(self, timestamp: float):
+        # Busy waits, like a CPU bound strategy tick.
+        end_time: float = time.monotonic() + self.tick_duration
+        while time.monotonic() < end_time:
+            pass
+        self.tick_count += 1
+
+
+class RecordingIterator(PyTimeIterator):
+    def __init__(self, name: str, ticks: List[Tuple[str, float, float]]):
+        super().__init__()
+        self.name: str = name
+        self.ticks: List[Tuple[str, float, float]] = ticks
+
+    def tick(self, timestamp: float):
+        self.ticks.append((self.name, timestamp, time.monotonic()))
+
+
+class ClockUnitTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        # Skipped ticks are logged as warnings, which the tests don't need to see.
+        logging.getLogger("hummingbot.core.clock").setLevel(logging.ERROR)
+
+    @staticmethod
+    def run_clock(clock: Clock, duration: float):
+        ev_loop: asyncio.AbstractEventLoop = asyncio.new_event_loop()
+
+        async def run_clock():
+            with clock:
+                await clock.run_til(time.time() + duration)
+
+        try:
+            ev_loop.run_until_complete(run_clock())
+        finally:
+            ev_loop.close()
+
+    @staticmethod
+    def run_event_driven_clock(clock: Clock, duration: float, trigger_events):
+        ev_loop: asyncio.AbstractEventLoop = asyncio.new_event_loop()
+
+        async def run_clock():
+            with clock:
+                # run_til() only returns on a regular tick, and the regular ticks are far apart. So the clock is
+                # cancelled once the time is up instead.
+                clock_task: asyncio.Task = ev_loop.create_task(clock.run())
+                await asyncio.gather(asyncio.sleep(duration), trigger_events())
+                clock_task.cancel()
+                await asyncio.gather(clock_task, return_exceptions=True)
+
+        try:
+            ev_loop.run_until_complete(run_clock())
+        finally:
+            ev_loop.close()
+
+    def test_tick_timing_stats(self):
+        tick_stats: TickTimingStats = TickTimingStats(1.0)
+        self.assertTrue(math.isnan(tick_stats.percentile(50)))
+        self.assertTrue(math.isnan(tick_stats.mean_duration))
+
+        for duration in [0.00005, 0.0003, 0.0004, 0.002, 3.0]:
+            tick_stats.record(duration)
+        self.assertEqual(5, tick_stats.count)
+        self.assertEqual(1, tick_stats.overrun_count)
+        self.assertAlmostEqual(3.00275 / 5, tick_stats.mean_duration)
+        self.assertEqual(3.0, tick_stats.max_duration)
+        self.assertEqual(3.0, tick_stats.last_duration)
+
+        histogram: List[Tuple[float, int]] = tick_stats.histogram
+        self.assertEqual(len(TickTimingStats.BUCKET_BOUNDS) + 1, len(histogram))
+        self.assertEqual(list(TickTimingStats.BUCKET_BOUNDS) + [float("inf")], [bound for bound, _ in histogram])
+        self.assertEqual({0.0001: 1, 0.0005: 2, 0.0025: 1, float("inf"): 1},
+                         {bound: count for bound, count in histogram if count > 0})
+
+        self.assertEqual(0.0001, tick_stats.percentile(20))
+        self.assertEqual(0.0005, tick_stats.percentile(50))
+        self.assertEqual(0.0025, tick_stats.percentile(80))
+        # The last bucket has no upper bound, so the percentiles within it are the max duration.
+        self.assertEqual(3.0, tick_stats.percentile(99))
+
+        # The bucket bound is capped at the max duration.
+        tick_stats = TickTimingStats(1.0)
+        tick_stats.record(0.003)
+        self.assertEqual(0.003, tick_stats.percentile(50))
+
+    def test_skipped_ticks(self):
+        clock: Clock = Clock(ClockMode.REALTIME, tick_size=0.05)
+        iterator: SlowTickIterator = SlowTickIterator(0.12)
+        clock.add_iterator(iterator)
+        self.run_clock(clock, 1.0)
+
+        tick_stats: TickTimingStats = clock.tick_stats[iterator]
+        self.assertEqual(iterator.tick_count, tick_stats.count)
+        # Every tick takes longer than the tick size on its own, and pushes back the ones after it.
+        self.assertEqual(tick_stats.count, tick_stats.overrun_count)
+        self.assertGreaterEqual(tick_stats.max_duration, 0.12)
+        self.assertGreaterEqual(clock.tick_overrun_count, tick_stats.count - 1)
+        self.assertGreaterEqual(clock.skipped_tick_count, tick_stats.count - 1)
+
+        clock.reset_tick_stats()
+        self.assertEqual({}, clock.tick_stats)
+        self.assertEqual(0, clock.tick_overrun_count)
+        self.assertEqual(0, clock.skipped_tick_count)
+
+    def test_staggered_ticks(self):
+        ticks: List[Tuple[str, float, float]] = []
+        clock: Clock = Clock(ClockMode.REALTIME, tick_size=0.3, stagger_iterators=True)
+        for name in ["a", "b", "c"]:
+            clock.add_iterator(RecordingIterator(name, ticks))
+        self.run_clock(clock, 1.0)
+
+        self.assertGreaterEqual(len(ticks), 6)
+        self.assertEqual(0, len(ticks) % 3)
+        for i in range(0, len(ticks), 3):
+            tick: List[Tuple[str, float, float]] = ticks[i:i + 3]
+            # The iterators run in order, a third of the tick size apart, but all get the same tick timestamp.
+            self.assertEqual(["a", "b", "c"], [name for name, _, _ in tick])
+            self.assertEqual(1, len(set(timestamp for _, timestamp, _ in tick)))
+            for (_, _, a), (_, _, b) in zip(tick, tick[1:]):
+                self.assertGreater(b - a, 0.09)
+        self.assertEqual([0.3] * (len(ticks) // 3 - 1),
+                         [round(b[1] - a[1], 6) for a, b in zip(ticks[::3], ticks[3::3])])
+
+    def test_event_wakeups(self):
+        ticks: List[Tuple[str, float, float]] = []
+        # The regular ticks are an hour apart, so only the events tick the iterators during the test.
+        clock: Clock = Clock(ClockMode.REALTIME, tick_size=3600.0, event_driven=True, min_event_tick_interval=0.5)
+        subscribed_iterator: RecordingIterator = RecordingIterator("subscribed", ticks)
+        idle_iterator: RecordingIterator = RecordingIterator("idle", ticks)
+        clock.add_iterator(subscribed_iterator)
+        clock.add_iterator(idle_iterator)
+        order_book: OrderBook = OrderBook()
+        clock.subscribe_wakeup(subscribed_iterator, order_book, OrderBookEvent.UpdateEvent)
+
+        async def update_order_book():
+            await asyncio.sleep(0.1)
+            for update_id in range(1, 11):
+                order_book.apply_diffs([OrderBookRow(99.0, float(update_id), update_id)], [], update_id)
+                await asyncio.sleep(0.02)
+
+        self.run_event_driven_clock(clock, 1.0, update_order_book)
+
+        # The first update wakes up the iterator right away. The updates within the next 0.5s are debounced into a
+        # single tick, once the interval has passed.
+        self.assertEqual(["subscribed", "subscribed"], [name for name, _, _ in ticks])
+        self.assertGreaterEqual(ticks[1][2] - ticks[0][2], 0.49)
+        self.assertGreater(ticks[1][1], ticks[0][1])
+        self.assertEqual(2, clock.event_tick_count)
+
+    def test_unsubscribed_iterators_are_not_woken(self):
+        ticks: List[Tuple[str, float, float]] = []
+        clock: Clock = Clock(ClockMode.REALTIME, tick_size=3600.0, event_driven=True, min_event_tick_interval=0.1)
+        unsubscribed_iterator: RecordingIterator = RecordingIterator("unsubscribed", ticks)
+        requesting_iterator: RecordingIterator = RecordingIterator("requesting", ticks)
+        clock.add_iterator(unsubscribed_iterator)
+        clock.add_iterator(requesting_iterator)
+        order_book: OrderBook = OrderBook()
+        clock.subscribe_wakeup(unsubscribed_iterator, order_book, OrderBookEvent.UpdateEvent)
+        clock.unsubscribe_wakeups(unsubscribed_iterator)
+        # Tick requests outside of the clock context are ignored.
+        clock.request_tick(requesting_iterator)
+
+        async def update_order_book():
+            await asyncio.sleep(0.1)
+            order_book.apply_diffs([OrderBookRow(99.0, 1.0, 1)], [], 1)
+            await asyncio.sleep(0.1)
+            clock.request_tick(requesting_iterator)
+
+        self.run_event_driven_clock(clock, 0.5, update_order_book)
+
+        self.assertEqual(["requesting"], [name for name, _, _ in ticks])
+        self.assertEqual(1, clock.event_tick_count)
+
+        # Outside of event driven mode, the wakeups aren't subscribed to at all.
+        clock = Clock(ClockMode.REALTIME, tick_size=3600.0)
+        clock.subscribe_wakeup(unsubscribed_iterator, order_book, OrderBookEvent.UpdateEvent)
+        self.assertEqual(0, len(order_book.get_listeners(OrderBookEvent.UpdateEvent)))
+
+    def test_overrunning_ticks_yield_to_event_loop(self):
+        ev_loop: asyncio.AbstractEventLoop = asyncio.new_event_loop()
+        clock: Clock = Clock(ClockMode.REALTIME, tick_size=0.05)
+        iterator: SlowTickIterator = SlowTickIterator(0.08)
+        clock.add_iterator(iterator)
+        heartbeats: list = []
+
+        async def heartbeat():
+            while True:
+                heartbeats.append(time.monotonic())
+                await asyncio.sleep(0.01)
+
+        async def run_clock():
+            with clock:
+                await clock.run_til(time.time() + 1.0)
+
+        try:
+            heartbeat_task: asyncio.Task = ev_loop.create_task(heartbeat())
+            ev_loop.run_until_complete(run_clock())
+            heartbeat_task.cancel()
+            ev_loop.run_until_complete(asyncio.gather(heartbeat_task, return_exceptions=True))
+        finally:
+            ev_loop.close()
+
+        self.assertGreater(clock.tick_overrun_count, 5)
+        # The other coroutine must have run between the overrunning ticks, not just before and after them.
+        self.assertLess(max(b - a for a, b in zip(heartbeats, heartbeats[1:])), 0.5)
+
+
+if __name__ == "__main__":
+    unittest.main()
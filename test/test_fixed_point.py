@@ -0,0 +1,82 @@
+#!/usr/bin/env python
+from os.path import join, realpath
+import sys; sys.path.insert(0, realpath(join(__file__, "../../")))
+
+from decimal import Decimal
+import pickle
+import unittest
+
+from hummingbot.core.data_type.fixed_point import (
+    FixedPoint,
+    get_scale_for_quantum
+)
+
+
+class FixedPointUnitTest(unittest.TestCase):
+    def test_conversions(self):
+        price: FixedPoint = FixedPoint.from_float(98.01, 2)
+        self.assertEqual(9801, price.value)
+        self.assertEqual(2, price.scale)
+        self.assertEqual(Decimal("98.01"), price.to_decimal())
+        self.assertEqual(98.01, float(price))
+        self.assertEqual(FixedPoint(-12346, 4), FixedPoint.from_decimal(Decimal("-1.23455"), 4))
+        self.assertEqual(FixedPoint(12346, 4), FixedPoint.from_decimal(Decimal("1.23455000001"), 4))
+        self.assertEqual(price, pickle.loads(pickle.dumps(price)))
+
+        with self.assertRaises(ValueError):
+            FixedPoint.from_float(float("nan"), 2)
+        with self.assertRaises(ValueError):
+            FixedPoint.from_decimal(Decimal("nan"), 2)
+        with self.assertRaises(ValueError):
+            FixedPoint(1, 19)
+        with self.assertRaises(OverflowError):
+            FixedPoint.from_float(1e12, 8)
+
+    def test_arithmetic(self):
+        a: FixedPoint = FixedPoint.from_decimal(Decimal("1.5"), 1)
+        b: FixedPoint = FixedPoint.from_decimal(Decimal("0.25"), 2)
+        self.assertEqual(Decimal("1.75"), (a + b).to_decimal())
+        self.assertEqual(Decimal("1.25"), (a - b).to_decimal())
+        self.assertEqual(Decimal("0.38"), (a * b).to_decimal())
+        self.assertEqual(Decimal("-1.5"), (-a).to_decimal())
+
+        # Products that don't fit in an int64 before rounding are still exact.
+        big: FixedPoint = FixedPoint.from_decimal(Decimal("123456.12345678"), 8)
+        self.assertEqual(FixedPoint.from_decimal(Decimal("123456.12345678") ** 2, 8), big * big)
+        with self.assertRaises(OverflowError):
+            big * big * big
+
+        # The most negative int64 has no int64 absolute value.
+        int64_min: FixedPoint = FixedPoint(-2 ** 63, 2)
+        self.assertEqual(int64_min, int64_min * FixedPoint(1, 0))
+        self.assertEqual(int64_min, FixedPoint(1, 0) * int64_min)
+        self.assertEqual(FixedPoint(0, 2), int64_min * FixedPoint(0, 1))
+        self.assertEqual(FixedPoint(-2 ** 62, 2), int64_min * FixedPoint(5, 1))
+        with self.assertRaises(OverflowError):
+            int64_min * FixedPoint(-1, 0)
+        with self.assertRaises(OverflowError):
+            int64_min * FixedPoint(2, 0)
+
+    def test_comparisons(self):
+        self.assertEqual(FixedPoint(150, 2), FixedPoint(15, 1))
+        self.assertEqual(hash(FixedPoint(150, 2)), hash(FixedPoint(15, 1)))
+        self.assertLess(FixedPoint(149, 2), FixedPoint(15, 1))
+        self.assertGreater(FixedPoint(-1, 0), FixedPoint(-101, 2))
+        self.assertLess(FixedPoint(-2 ** 63, 0), FixedPoint(1, 18))
+        self.assertEqual(Decimal("0.5"), max(FixedPoint(5, 1), FixedPoint(45, 2)).to_decimal())
+
+    def test_quantize(self):
+        self.assertEqual(2, get_scale_for_quantum(Decimal("0.05")))
+        self.assertEqual(0, get_scale_for_quantum(Decimal("10")))
+        self.assertEqual(10, get_scale_for_quantum(Decimal("1e-56")))
+
+        price: FixedPoint = FixedPoint.from_decimal(Decimal("98.0375"), 4)
+        self.assertEqual(Decimal("98.05"), price.quantize(Decimal("0.05")).to_decimal())
+        self.assertEqual(Decimal("98.00"), price.quantize(Decimal("0.05"), truncate=True).to_decimal())
+        self.assertEqual(Decimal("-98.00"), (-price).quantize(Decimal("0.05"), truncate=True).to_decimal())
+        self.assertEqual(Decimal("98.04"), price.rescale(2).to_decimal())
+        self.assertEqual(Decimal("98.0375"), price.quantize(Decimal("1e-8")).to_decimal())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,150 @@
+#!/usr/bin/env python
+from os.path import join, realpath
+import sys; sys.path.insert(0, realpath(join(__file__, "../../")))
+
+from decimal import Decimal
+import logging; logging.basicConfig(level=logging.ERROR)
+import shutil
+import tempfile
+import time
+from typing import (
+    Any,
+    Dict,
+    List,
+)
+import unittest
+
+from hummingbot.core.event.events import (
+    BuyOrderCompletedEvent,
+    BuyOrderCreatedEvent,
+    MarketEvent,
+    OrderCancelledEvent,
+    OrderFilledEvent,
+    OrderType,
+    SellOrderCreatedEvent,
+    TradeFee,
+    TradeType,
+)
+from hummingbot.market.market_base import MarketBase
+from hummingbot.market.markets_recorder import MarketsRecorder
+from hummingbot.model.market_state import MarketState
+from hummingbot.model.order import Order
+from hummingbot.model.order_status import OrderStatus
+from hummingbot.model.sql_connection_manager import (
+    SQLConnectionManager,
+    SQLConnectionType,
+)
+from hummingbot.model.trade_fill import TradeFill
+
+
+class MockMarket(MarketBase):
+    def __init__(self):
+        super().__init__()
+        self.saved_state: Dict[str, Any] = {}
+
+    @property
+    def tracking_states(self) -> Dict[str, Any]:
+        return dict(self.saved_state)
+
+
+class MarketsRecorderUnitTest(unittest.TestCase):
+    config_file_path: str = "conf_test.yml"
+    trading_pair: str = "ETH-USDT"
+
+    def setUp(self):
+        self.db_dir: str = tempfile.mkdtemp()
+        self.sql: SQLConnectionManager = SQLConnectionManager(SQLConnectionType.TRADE_FILLS,
+                                                              db_path=join(self.db_dir, "trades.sqlite"))
+        self.market: MockMarket = MockMarket()
+
+    def tearDown(self):
+        self.sql.get_shared_session().close()
+        self.sql.engine.dispose()
+        shutil.rmtree(self.db_dir)
+
+    def create_order(self, order_id: str, trade_type: TradeType = TradeType.BUY):
+        if trade_type is TradeType.BUY:
+            self.market.trigger_event(MarketEvent.BuyOrderCreated,
+                                      BuyOrderCreatedEvent(time.time(), OrderType.LIMIT, self.trading_pair,
+                                                           Decimal(1), Decimal(100), order_id))
+        else:
+            self.market.trigger_event(MarketEvent.SellOrderCreated,
+                                      SellOrderCreatedEvent(time.time(), OrderType.LIMIT, self.trading_pair,
+                                                            Decimal(1), Decimal(101), order_id))
+
+    def fill_order(self, order_id: str, amount: Decimal):
+        self.market.trigger_event(MarketEvent.OrderFilled,
+                                  OrderFilledEvent(time.time(), order_id, self.trading_pair, TradeType.BUY,
+                                                   OrderType.LIMIT, Decimal(100), amount, TradeFee(Decimal("0.001"))))
+
+    def saved_order_statuses(self) -> List[Any]:
+        # Read with a new session, to only see what's committed to the database.
+        with self.sql.begin() as session:
+            return [(order_status.order_id, order_status.status)
+                    for order_status in session.query(OrderStatus).order_by(OrderStatus.id)]
+
+    def test_flush_on_stop(self):
+        recorder: MarketsRecorder = MarketsRecorder(self.sql, [self.market], self.config_file_path, "pure_mm",
+                                                    write_behind=True, flush_interval=60.0)
+        recorder.start()
+        self.market.saved_state = {"orders": 1}
+        self.create_order("buy-1")
+        self.fill_order("buy-1", Decimal("0.4"))
+        self.market.saved_state = {"orders": 2}
+        self.create_order("sell-2", TradeType.SELL)
+        self.assertEqual(4, recorder.pending_writes_count)
+        # Nothing is written until the queue is flushed.
+        self.assertEqual([], self.saved_order_statuses())
+
+        recorder.stop()
+        self.assertEqual(0, recorder.pending_writes_count)
+        self.assertEqual([("buy-1", "BuyOrderCreated"), ("buy-1", "OrderFilled"), ("sell-2", "SellOrderCreated")],
+                         self.saved_order_statuses())
+        with self.sql.begin() as session:
+            self.assertEqual(2, session.query(Order).count())
+            trade_fills: List[TradeFill] = session.query(TradeFill).all()
+            self.assertEqual(1, len(trade_fills))
+            self.assertEqual(0.4, trade_fills[0].amount)
+            # The market states queued in the batch are coalesced into the last one.
+            market_state: MarketState = session.query(MarketState).one()
+            self.assertEqual({"orders": 2}, market_state.saved_state)
+
+        # Market events after the recorder is stopped aren't recorded.
+        self.create_order("buy-3")
+        self.assertEqual(0, recorder.pending_writes_count)
+
+    def test_record_order(self):
+        recorder: MarketsRecorder = MarketsRecorder(self.sql, [self.market], self.config_file_path, "pure_mm",
+                                                    write_behind=True, flush_interval=60.0, max_batch_size=4)
+        recorder.start()
+        # The order updates are only written after the orders they update, when they're written in the same batch.
+        self.create_order("buy-1")
+        self.fill_order("buy-1", Decimal("0.5"))
+        self.fill_order("buy-1", Decimal("0.5"))
+        self.market.trigger_event(MarketEvent.BuyOrderCompleted,
+                                  BuyOrderCompletedEvent(time.time(), "buy-1", "ETH", "USDT", "ETH", Decimal(1),
+                                                         Decimal(100), Decimal("0.001"), OrderType.LIMIT))
+        # A full batch is flushed by the background writer right away.
+        deadline: float = time.time() + 5.0
+        while len(self.saved_order_statuses()) < 4 and time.time() < deadline:
+            time.sleep(0.01)
+        self.assertEqual(4, len(self.saved_order_statuses()))
+        self.assertEqual(0, recorder.pending_writes_count)
+
+        self.create_order("sell-2", TradeType.SELL)
+        self.market.trigger_event(MarketEvent.OrderCancelled, OrderCancelledEvent(time.time(), "sell-2"))
+        # Reads flush the queue first.
+        orders: List[Order] = recorder.get_orders_for_config_and_market(self.config_file_path, self.market)
+        self.assertEqual([("buy-1", "BuyOrderCompleted"), ("sell-2", "OrderCancelled")],
+                         [(order.id, order.last_status) for order in orders])
+        recorder.stop()
+
+        self.assertEqual([("buy-1", "BuyOrderCreated"), ("buy-1", "OrderFilled"), ("buy-1", "OrderFilled"),
+                          ("buy-1", "BuyOrderCompleted"), ("sell-2", "SellOrderCreated"),
+                          ("sell-2", "OrderCancelled")],
+                         self.saved_order_statuses())
+        self.assertEqual(2, len(recorder.get_trades_for_config(self.config_file_path)))
+
+
+if __name__ == "__main__":
+    unittest.main()
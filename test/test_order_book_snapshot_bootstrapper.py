@@ -0,0 +1,128 @@
+#!/usr/bin/env python
+from os.path import join, realpath
+import sys; sys.path.insert(0, realpath(join(__file__, "../../")))
+
+import aiohttp
+import asyncio
+import logging; logging.basicConfig(level=logging.ERROR)
+import time
+from typing import (
+    Dict,
+    List,
+)
+import unittest
+from unittest.mock import (
+    MagicMock,
+    patch,
+)
+
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_snapshot_bootstrapper import OrderBookSnapshotBootstrapper
+from hummingbot.core.data_type.order_book_tracker_entry import OrderBookTrackerEntry
+from hummingbot.core.utils.asyncio_throttle import Throttler
+
+
+class OrderBookSnapshotBootstrapperUnitTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.ev_loop: asyncio.BaseEventLoop = asyncio.get_event_loop()
+
+    def run_async(self, coro):
+        return self.ev_loop.run_until_complete(coro)
+
+    def test_concurrency(self):
+        trading_pairs: List[str] = [f"PAIR{i}" for i in range(10)]
+        started: List[str] = []
+        ready: List[str] = []
+        clients: List[aiohttp.ClientSession] = []
+        running: List[int] = [0]
+        max_running: List[int] = [0]
+
+        async def fetch_entry(client: aiohttp.ClientSession, trading_pair: str) -> OrderBookTrackerEntry:
+            started.append(trading_pair)
+            clients.append(client)
+            running[0] += 1
+            max_running[0] = max(max_running[0], running[0])
+            await asyncio.sleep(0.02)
+            running[0] -= 1
+            return OrderBookTrackerEntry(trading_pair, time.time(), OrderBook())
+
+        async def run():
+            bootstrapper: OrderBookSnapshotBootstrapper = OrderBookSnapshotBootstrapper(Throttler((100, 1.0)),
+                                                                                        max_concurrency=3)
+            entries: Dict[str, OrderBookTrackerEntry] = await bootstrapper.fetch_tracking_entries(
+                trading_pairs,
+                fetch_entry,
+                priority_trading_pairs=["PAIR7", "PAIR3"],
+                entry_ready_callback=lambda trading_pair, entry: ready.append(trading_pair)
+            )
+            await bootstrapper.close()
+            return entries
+
+        entries: Dict[str, OrderBookTrackerEntry] = self.run_async(run())
+        self.assertEqual(set(trading_pairs), set(entries.keys()))
+        self.assertEqual(3, max_running[0])
+        # The priority trading pairs are requested first, in the order of the trading pair list.
+        self.assertEqual(["PAIR3", "PAIR7", "PAIR0"], started[:3])
+        self.assertEqual(set(trading_pairs), set(ready))
+        # Every request goes through the one shared client session.
+        self.assertEqual(1, len(set(id(client) for client in clients)))
+
+    def test_rate_limit(self):
+        started: Dict[str, float] = {}
+
+        async def fetch_entry(client: aiohttp.ClientSession, trading_pair: str) -> OrderBookTrackerEntry:
+            started[trading_pair] = time.monotonic()
+            return OrderBookTrackerEntry(trading_pair, time.time(), OrderBook())
+
+        async def run():
+            bootstrapper: OrderBookSnapshotBootstrapper = OrderBookSnapshotBootstrapper(
+                Throttler((4, 0.2), period_safety_margin=0), request_weight=2, max_concurrency=4)
+            start_ts: float = time.monotonic()
+            await bootstrapper.fetch_tracking_entries(["A", "B", "C", "D"], fetch_entry)
+            await bootstrapper.close()
+            return start_ts
+
+        start_ts: float = self.run_async(run())
+        # Two requests fit in the rate limit at a time, even with more requests allowed in flight.
+        self.assertEqual(["A", "B", "C", "D"], sorted(started.keys(), key=lambda trading_pair: started[trading_pair]))
+        self.assertLess(started["B"] - start_ts, 0.1)
+        self.assertGreaterEqual(started["C"] - start_ts, 0.19)
+        self.assertGreaterEqual(started["D"] - start_ts, 0.19)
+
+    def test_retry(self):
+        attempts: Dict[str, int] = {"A": 0, "B": 0, "C": 0}
+
+        async def fetch_entry(client: aiohttp.ClientSession, trading_pair: str) -> OrderBookTrackerEntry:
+            attempts[trading_pair] += 1
+            # B fails on the first attempt, and C on every attempt.
+            if trading_pair == "C" or (trading_pair == "B" and attempts[trading_pair] == 1):
+                raise IOError(f"Error fetching {trading_pair}.")
+            return OrderBookTrackerEntry(trading_pair, time.time(), OrderBook())
+
+        async def run():
+            bootstrapper: OrderBookSnapshotBootstrapper = OrderBookSnapshotBootstrapper(
+                Throttler((100, 1.0)), max_concurrency=2, max_retries=3, retry_interval=0.01)
+            entries: Dict[str, OrderBookTrackerEntry] = await bootstrapper.fetch_tracking_entries(["A", "B", "C"],
+                                                                                                  fetch_entry)
+            await bootstrapper.close()
+            return entries
+
+        # The failed attempts are logged as network errors, with warnings for the app.
+        logger: MagicMock = MagicMock()
+        with patch.object(OrderBookSnapshotBootstrapper, "logger", return_value=logger):
+            entries: Dict[str, OrderBookTrackerEntry] = self.run_async(run())
+        self.assertEqual(["A", "B"], sorted(entries.keys()))
+        self.assertEqual({"A": 1, "B": 2, "C": 3}, attempts)
+        self.assertEqual(4, logger.network.call_count)
+
+    def test_no_trading_pairs(self):
+        async def fetch_entry(client: aiohttp.ClientSession, trading_pair: str) -> OrderBookTrackerEntry:
+            raise AssertionError("No snapshot should be fetched.")
+
+        bootstrapper: OrderBookSnapshotBootstrapper = OrderBookSnapshotBootstrapper(Throttler((100, 1.0)))
+        self.assertEqual({}, self.run_async(bootstrapper.fetch_tracking_entries([], fetch_entry)))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,84 @@
+#!/usr/bin/env python
+from os.path import join, realpath
+import sys; sys.path.insert(0, realpath(join(__file__, "../../")))
+
+import asyncio
+import logging; logging.basicConfig(level=logging.ERROR)
+from typing import (
+    Any,
+    Dict,
+    List,
+    NamedTuple,
+    Optional,
+)
+import unittest
+
+from hummingbot.market.market_base import (
+    MarketBase,
+    OrderReconciliationResult,
+)
+
+
+class MockInFlightOrder(NamedTuple):
+    client_order_id: str
+    trading_pair: str
+
+
+class MockMarket(MarketBase):
+    def __init__(self, exchange_open_orders: List[Dict[str, Any]]):
+        super().__init__()
+        self.exchange_open_orders: List[Dict[str, Any]] = exchange_open_orders
+        self.queried_trading_pairs: List[List[str]] = []
+
+    async def _query_open_orders(self, trading_pairs: List[str]) -> List[Any]:
+        self.queried_trading_pairs.append(trading_pairs)
+        return [open_order for open_order in self.exchange_open_orders if open_order["symbol"] in trading_pairs]
+
+    def _get_open_order_client_id(self, open_order: Any) -> Optional[str]:
+        return open_order.get("clientOrderId")
+
+
+class OrderReconciliationUnitTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.ev_loop: asyncio.BaseEventLoop = asyncio.get_event_loop()
+
+    def test_reconcile_open_orders(self):
+        market: MockMarket = MockMarket([
+            {"symbol": "ETHUSDT", "clientOrderId": "buy-1", "status": "NEW"},
+            {"symbol": "BTCUSDT", "clientOrderId": "sell-2", "status": "PARTIALLY_FILLED"},
+            # Placed outside of the bot, or by an earlier run, and not tracked.
+            {"symbol": "ETHUSDT", "clientOrderId": "web-order", "status": "NEW"},
+            {"symbol": "ETHUSDT", "status": "NEW"},
+        ])
+        in_flight_orders: Dict[str, MockInFlightOrder] = {
+            "buy-1": MockInFlightOrder("buy-1", "ETHUSDT"),
+            # Filled, cancelled or failed on the exchange, and so missing from its open orders.
+            "buy-3": MockInFlightOrder("buy-3", "ETHUSDT"),
+            "sell-2": MockInFlightOrder("sell-2", "BTCUSDT"),
+        }
+        result: OrderReconciliationResult = self.ev_loop.run_until_complete(
+            market._reconcile_open_orders(in_flight_orders))
+
+        # The open orders of every trading pair with in-flight orders are queried at once.
+        self.assertEqual([["BTCUSDT", "ETHUSDT"]], market.queried_trading_pairs)
+        # The untracked exchange orders are left out.
+        self.assertEqual({"buy-1", "sell-2"}, set(result.open_orders.keys()))
+        self.assertEqual("PARTIALLY_FILLED", result.open_orders["sell-2"]["status"])
+        self.assertEqual(["buy-3"], result.missing_order_ids)
+
+    def test_no_open_orders(self):
+        market: MockMarket = MockMarket([])
+        in_flight_orders: Dict[str, MockInFlightOrder] = {
+            "buy-1": MockInFlightOrder("buy-1", "ETHUSDT"),
+            "sell-2": MockInFlightOrder("sell-2", "ETHUSDT"),
+        }
+        result: OrderReconciliationResult = self.ev_loop.run_until_complete(
+            market._reconcile_open_orders(in_flight_orders))
+        self.assertEqual([["ETHUSDT"]], market.queried_trading_pairs)
+        self.assertEqual({}, result.open_orders)
+        self.assertEqual(["buy-1", "sell-2"], result.missing_order_ids)
+
+
+if __name__ == "__main__":
+    unittest.main()
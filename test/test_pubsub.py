@@ -0,0 +1,136 @@
+#!/usr/bin/env python
+from os.path import join, realpath
+import sys; sys.path.insert(0, realpath(join(__file__, "../../")))
+
+import asyncio
+from enum import Enum
+import gc
+from typing import (
+    Callable,
+    List,
+)
+import unittest
+
+from hummingbot.core.event.event_listener import EventListener
+from hummingbot.core.pubsub import PubSub
+
+
+class PubSubTestEvent(Enum):
+    EventA = 1
+    EventB = 2
+
+
+class CallbackListener(EventListener):
+    def __init__(self, callback: Callable[[any], None]):
+        super().__init__()
+        self._callback: Callable[[any], None] = callback
+
+    def __call__(self, arg: any):
+        self._callback(arg)
+
+
+class PubSubUnitTest(unittest.TestCase):
+    def setUp(self):
+        self.pubsub: PubSub = PubSub()
+        self.received: List[any] = []
+
+    def test_trigger_event(self):
+        listener: CallbackListener = CallbackListener(self.received.append)
+        self.pubsub.add_listener(PubSubTestEvent.EventA, listener)
+        self.pubsub.add_listener(PubSubTestEvent.EventA, listener)
+        self.pubsub.trigger_event(PubSubTestEvent.EventA, 1)
+        self.pubsub.trigger_event(PubSubTestEvent.EventB, 2)
+        self.assertEqual([1], self.received)
+        self.assertEqual([listener], self.pubsub.get_listeners(PubSubTestEvent.EventA))
+
+        self.pubsub.remove_listener(PubSubTestEvent.EventA, listener)
+        self.pubsub.trigger_event(PubSubTestEvent.EventA, 3)
+        self.assertEqual([1], self.received)
+        self.assertEqual([], self.pubsub.get_listeners(PubSubTestEvent.EventA))
+
+    def test_listeners_changed_during_event(self):
+        second_listener: CallbackListener = CallbackListener(lambda arg: self.received.append(("second", arg)))
+        added_listener: CallbackListener = CallbackListener(lambda arg: self.received.append(("added", arg)))
+
+        def first_callback(arg: any):
+            self.received.append(("first", arg))
+            self.pubsub.remove_listener(PubSubTestEvent.EventA, second_listener)
+            self.pubsub.add_listener(PubSubTestEvent.EventA, added_listener)
+
+        first_listener: CallbackListener = CallbackListener(first_callback)
+        self.pubsub.add_listener(PubSubTestEvent.EventA, first_listener)
+        self.pubsub.add_listener(PubSubTestEvent.EventA, second_listener)
+
+        # The changes to the listeners take effect from the next event.
+        self.pubsub.trigger_event(PubSubTestEvent.EventA, 1)
+        self.assertEqual([("first", 1), ("second", 1)], self.received)
+        self.received.clear()
+        self.pubsub.trigger_event(PubSubTestEvent.EventA, 2)
+        self.assertEqual([("first", 2), ("added", 2)], self.received)
+
+    def test_dead_listeners_removed(self):
+        listener: CallbackListener = CallbackListener(self.received.append)
+        self.pubsub.add_listener(PubSubTestEvent.EventA, listener)
+        self.pubsub.add_listener(PubSubTestEvent.EventB, listener)
+        del listener
+        gc.collect()
+        self.assertEqual([], self.pubsub.get_listeners(PubSubTestEvent.EventA))
+        self.assertEqual([], self.pubsub.get_listeners(PubSubTestEvent.EventB))
+        self.pubsub.trigger_event(PubSubTestEvent.EventA, 1)
+        self.assertEqual([], self.received)
+
+    def test_batch_listener(self):
+        batches: List[List[int]] = []
+        batch_listener: CallbackListener = CallbackListener(batches.append)
+        listener: CallbackListener = CallbackListener(self.received.append)
+        self.pubsub.add_batch_listener(PubSubTestEvent.EventA, batch_listener)
+        self.pubsub.add_listener(PubSubTestEvent.EventA, listener)
+        for i in range(3):
+            self.pubsub.trigger_event(PubSubTestEvent.EventA, i)
+        self.pubsub.trigger_event(PubSubTestEvent.EventB, 3)
+        self.assertEqual([0, 1, 2], self.received)
+        self.assertEqual([], batches)
+
+        self.pubsub.flush_event_batches()
+        self.assertEqual([[0, 1, 2]], batches)
+        self.pubsub.flush_event_batches()
+        self.assertEqual([[0, 1, 2]], batches)
+
+        self.pubsub.remove_batch_listener(PubSubTestEvent.EventA, batch_listener)
+        self.pubsub.trigger_event(PubSubTestEvent.EventA, 4)
+        self.pubsub.flush_event_batches()
+        self.assertEqual([[0, 1, 2]], batches)
+        self.assertEqual([0, 1, 2, 4], self.received)
+
+    def test_batches_flushed_on_next_loop_iteration(self):
+        batches: List[List[int]] = []
+        batch_listener: CallbackListener = CallbackListener(batches.append)
+        self.pubsub.add_batch_listener(PubSubTestEvent.EventA, batch_listener)
+
+        async def trigger_events():
+            for i in range(3):
+                self.pubsub.trigger_event(PubSubTestEvent.EventA, i)
+            self.assertEqual([], batches)
+            await asyncio.sleep(0)
+            self.assertEqual([[0, 1, 2]], batches)
+            self.pubsub.trigger_event(PubSubTestEvent.EventA, 3)
+            await asyncio.sleep(0)
+            self.assertEqual([[0, 1, 2], [3]], batches)
+
+        ev_loop: asyncio.AbstractEventLoop = asyncio.new_event_loop()
+        try:
+            ev_loop.run_until_complete(trigger_events())
+        finally:
+            ev_loop.close()
+
+    def test_listener_outlives_pubsub(self):
+        listener: CallbackListener = CallbackListener(self.received.append)
+        self.pubsub.add_listener(PubSubTestEvent.EventA, listener)
+        self.pubsub = None
+        gc.collect()
+        del listener
+        gc.collect()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -51,6 +51,11 @@ from hummingbot.strategy.pure_market_making import (
     DataFeedAssetPriceDelegate,
     APIAssetPriceDelegate
 )
+from hummingbot.strategy.pure_market_making.data_types import (
+    ORDER_PROPOSAL_ACTION_CANCEL_ORDERS,
+    ORDER_PROPOSAL_ACTION_CREATE_ORDERS,
+    OrdersProposal,
+)
 from hummingbot.data_feed.data_feed_base import DataFeedBase
 from hummingbot.core.utils.exchange_rate_conversion import ExchangeRateConversion
 from hummingbot.core.network_base import NetworkStatus
@@ -736,6 +741,46 @@ class PureMarketMakingV2UnitTest(unittest.TestCase):
         self.assertEqual(0, len(self.strategy.active_bids))
         self.assertEqual(0, len(self.strategy.active_asks))
 
+    def test_order_refresh_tolerance(self):
+        logging_options: int = (PureMarketMakingStrategyV2.OPTION_LOG_ALL &
+                                (~PureMarketMakingStrategyV2.OPTION_LOG_NULL_ORDER_SIZE))
+        strategy: PureMarketMakingStrategyV2 = PureMarketMakingStrategyV2(
+            [self.market_info],
+            filter_delegate=self.filter_delegate,
+            pricing_delegate=self.multiple_order_strategy_pricing_delegate,
+            sizing_delegate=self.equal_strategy_sizing_delegate,
+            cancel_order_wait_time=45,
+            logging_options=logging_options,
+            order_refresh_tolerance_pct=Decimal("0.01")
+        )
+        self.clock.remove_iterator(self.strategy)
+        self.clock.add_iterator(strategy)
+        self.clock.backtest_til(self.start_timestamp + self.clock_tick_size)
+        order_ids: List[str] = [o.client_order_id for _, o in strategy.active_maker_orders]
+        self.assertEqual(10, len(order_ids))
+
+        # The orders are due to be refreshed, but the mid price hasn't moved, so they're all kept.
+        self.clock.backtest_til(self.start_timestamp + 2 * self.clock_tick_size + 1)
+        self.assertEqual(sorted(order_ids), sorted(o.client_order_id for _, o in strategy.active_maker_orders))
+        self.assertEqual(0, len(strategy.in_flight_cancels))
+
+        # Only the last bid is out of the tolerance of the proposed orders, so it's the only one replaced.
+        bids: List[LimitOrder] = sorted([o for _, o in strategy.active_bids], key=lambda o: o.price, reverse=True)
+        asks: List[LimitOrder] = sorted([o for _, o in strategy.active_asks], key=lambda o: o.price)
+        orders_proposal: OrdersProposal = OrdersProposal(
+            ORDER_PROPOSAL_ACTION_CREATE_ORDERS | ORDER_PROPOSAL_ACTION_CANCEL_ORDERS,
+            OrderType.LIMIT, [o.price for o in bids[:4]] + [Decimal("90")], [Decimal("1")] * 5,
+            OrderType.LIMIT, [o.price * Decimal("1.005") for o in asks], [Decimal("1.005")] * 5,
+            [o.client_order_id for o in bids + asks]
+        )
+        reconciled_proposal: OrdersProposal = strategy.reconcile_orders_proposal(self.market_info,
+                                                                                 bids + asks,
+                                                                                 orders_proposal)
+        self.assertEqual([Decimal("90")], reconciled_proposal.buy_order_prices)
+        self.assertEqual([Decimal("1")], reconciled_proposal.buy_order_sizes)
+        self.assertEqual([], reconciled_proposal.sell_order_prices)
+        self.assertEqual([bids[4].client_order_id], reconciled_proposal.cancel_order_ids)
+
     def test_multiple_orders_staggered_sizes(self):
         self.clock.remove_iterator(self.strategy)
         self.clock.add_iterator(self.multi_order_staggered_strategy)
@@ -0,0 +1,167 @@
+#!/usr/bin/env python
+from os.path import join, realpath
+import sys; sys.path.insert(0, realpath(join(__file__, "../../")))
+
+import logging; logging.basicConfig(level=logging.ERROR)
+import os
+import pandas as pd
+import shutil
+import tempfile
+from typing import (
+    Any,
+    Dict,
+    List,
+)
+import unittest
+
+from hummingbot.model.sql_connection_manager import (
+    SQLConnectionManager,
+    SQLConnectionType,
+)
+from hummingbot.model.trade_fill import TradeFill
+from hummingbot.model.trade_fill_archive import (
+    TradeFillArchive,
+    TradeFillArchiveRow,
+    TradeFillPartition,
+)
+
+START_TIMESTAMP: int = 1577836800000
+
+
+def archive_row(trade_fill_id: int,
+                market: str = "binance",
+                symbol: str = "ETHUSDT",
+                config_file_path: str = "conf_a.yml",
+                trade_type: str = "BUY",
+                price: float = 100.0,
+                amount: float = 1.0,
+                flat_fees: List[Dict[str, Any]] = None) -> TradeFillArchiveRow:
+    base_asset, quote_asset = symbol[:3], symbol[3:]
+    return TradeFillArchiveRow(trade_fill_id, config_file_path, "pure_market_making", market, symbol, base_asset,
+                               quote_asset, START_TIMESTAMP + trade_fill_id * 1000, trade_type, "LIMIT", price,
+                               amount, {"percent": 0.001, "flat_fees": flat_fees or []})
+
+
+class TradeFillArchiveUnitTest(unittest.TestCase):
+    def setUp(self):
+        self.archive_path: str = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.archive_path)
+
+    def test_append_and_read(self):
+        archive: TradeFillArchive = TradeFillArchive(self.archive_path)
+        self.assertEqual(3, archive.append([archive_row(2, market="huobi", symbol="BTCUSDT"),
+                                            archive_row(1),
+                                            archive_row(3, config_file_path="conf_b.yml", trade_type="SELL")]))
+        # Trade fills that are already archived are skipped.
+        self.assertEqual(2, archive.append([archive_row(3), archive_row(4, price=101.0), archive_row(5, amount=2.0)]))
+        self.assertEqual(0, archive.append([archive_row(1), archive_row(5)]))
+        self.assertEqual(5, archive.last_trade_fill_id)
+        self.assertEqual({("conf_a.yml", "binance"), ("conf_a.yml", "huobi"), ("conf_b.yml", "binance")},
+                         set(archive.partitions))
+
+        # Reading across the partitions returns the trade fills in timestamp order.
+        fills: pd.DataFrame = archive.read()
+        self.assertEqual(TradeFillArchive.FRAME_COLUMNS, list(fills.columns))
+        self.assertEqual([1, 2, 3, 4, 5], fills["id"].tolist())
+        self.assertEqual(["binance", "huobi", "binance", "binance", "binance"], fills["market"].tolist())
+        self.assertEqual(["BUY", "BUY", "SELL", "BUY", "BUY"], fills["trade_type"].tolist())
+        self.assertEqual([100.0, 100.0, 100.0, 101.0, 100.0], fills["price"].tolist())
+
+        self.assertEqual([1, 3, 4, 5], archive.read(market="binance")["id"].tolist())
+        self.assertEqual([3], archive.read(config_file_path="conf_b.yml")["id"].tolist())
+        self.assertEqual([2], archive.read(symbol="BTCUSDT")["id"].tolist())
+        self.assertEqual([2, 3, 4], archive.read(start_timestamp=START_TIMESTAMP + 2000,
+                                                 end_timestamp=START_TIMESTAMP + 4000)["id"].tolist())
+        self.assertEqual(0, len(archive.read(symbol="XRPUSDT")))
+
+        summary: pd.DataFrame = archive.volume_summary(market="binance")
+        buys: pd.Series = summary[summary["trade_type"] == "BUY"].iloc[0]
+        self.assertEqual(3, buys["num_trades"])
+        self.assertAlmostEqual(4.0, buys["base_volume"])
+        self.assertAlmostEqual(401.0, buys["quote_volume"])
+        self.assertAlmostEqual(0.401, buys["percent_fee_quote"])
+
+    def test_flat_fees(self):
+        archive: TradeFillArchive = TradeFillArchive(self.archive_path)
+        archive.append([archive_row(1, flat_fees=[{"asset": "BNB", "amount": 0.01}]),
+                        archive_row(2),
+                        archive_row(3, flat_fees=[{"asset": "BNB", "amount": 0.02}, {"asset": "ETH", "amount": 0.5}])])
+        fills: pd.DataFrame = archive.read(include_flat_fees=True)
+        self.assertEqual([[("BNB", 0.01)], [], [("BNB", 0.02), ("ETH", 0.5)]], fills["flat_fees"].tolist())
+        self.assertEqual([[("BNB", 0.02), ("ETH", 0.5)]],
+                         archive.read(start_timestamp=START_TIMESTAMP + 3000, include_flat_fees=True)["flat_fees"]
+                         .tolist())
+
+        flat_fees: pd.DataFrame = archive.read_flat_fees()
+        self.assertEqual([1, 3, 3], flat_fees["id"].tolist())
+        self.assertEqual(["BNB", "BNB", "ETH"], flat_fees["asset"].tolist())
+        self.assertEqual([0.01, 0.02, 0.5], flat_fees["amount"].tolist())
+        self.assertEqual(["USDT", "USDT", "USDT"], flat_fees["quote_asset"].tolist())
+
+    def test_reopen(self):
+        archive: TradeFillArchive = TradeFillArchive(self.archive_path)
+        archive.append([archive_row(1), archive_row(2, market="huobi")])
+        # An append to an existing archive continues after its last trade fill.
+        archive = TradeFillArchive(self.archive_path)
+        self.assertEqual(2, archive.last_trade_fill_id)
+        self.assertEqual(1, archive.append([archive_row(2), archive_row(3)]))
+        self.assertEqual([1, 2, 3], archive.read()["id"].tolist())
+
+        # An interrupted append leaves some columns longer than the others, and the partial rows are dropped.
+        partition_path: str = join(self.archive_path, "conf_a.yml", "binance")
+        with open(join(partition_path, "id.bin"), "ab") as fd:
+            fd.write(b"\x04\x00\x00\x00\x00\x00\x00\x00")
+        with open(join(partition_path, "fee_fill_index.bin"), "ab") as fd:
+            fd.write(b"\x02\x00\x00\x00\x00\x00\x00\x00")
+        partition: TradeFillPartition = TradeFillPartition(partition_path, "conf_a.yml", "binance")
+        self.assertEqual(2, partition.num_fills)
+        self.assertEqual(0, len(partition.read_flat_fees()["fee_fill_index"]))
+        self.assertEqual(2 * 8, os.path.getsize(join(partition_path, "id.bin")))
+        archive = TradeFillArchive(self.archive_path)
+        self.assertEqual(3, archive.last_trade_fill_id)
+        self.assertEqual([1, 2, 3], archive.read()["id"].tolist())
+
+
+class TradeFillArchiveExportUnitTest(unittest.TestCase):
+    def setUp(self):
+        self.archive_path: str = tempfile.mkdtemp()
+        self.sql: SQLConnectionManager = SQLConnectionManager(SQLConnectionType.TRADE_FILLS,
+                                                              db_path=join(self.archive_path, "trades.sqlite"))
+
+    def tearDown(self):
+        self.sql.get_shared_session().close()
+        self.sql.engine.dispose()
+        shutil.rmtree(self.archive_path)
+
+    def add_trade_fills(self, rows: List[TradeFillArchiveRow]):
+        with self.sql.begin() as session:
+            for row in rows:
+                session.add(TradeFill(**row._asdict(), order_id=f"order-{row.id}", exchange_trade_id=str(row.id)))
+
+    def test_update_and_export(self):
+        self.add_trade_fills([archive_row(1), archive_row(2, market="huobi", symbol="BTCUSDT"), archive_row(3)])
+        archive: TradeFillArchive = TradeFillArchive(join(self.archive_path, "archive"))
+        self.assertEqual(3, archive.update(self.sql, batch_size=2))
+        self.assertEqual(0, archive.update(self.sql))
+        self.add_trade_fills([archive_row(4, trade_type="SELL", flat_fees=[{"asset": "BNB", "amount": 0.01}])])
+        self.assertEqual(1, archive.update(self.sql))
+        self.assertEqual([1, 2, 3, 4], archive.read()["id"].tolist())
+
+        # The export formats the archived trade fills like the trade fill records.
+        exported: pd.DataFrame = TradeFillArchive.to_pandas(archive.read(end_timestamp=START_TIMESTAMP + 3000,
+                                                                         include_flat_fees=True))
+        with self.sql.begin() as session:
+            trade_fills: List[TradeFill] = session.query(TradeFill).filter(TradeFill.id <= 3).order_by(TradeFill.id)
+            expected: pd.DataFrame = TradeFill.to_pandas(trade_fills.all())
+        pd.testing.assert_frame_equal(expected, exported)
+
+        exported = TradeFillArchive.to_pandas(archive.read(start_timestamp=START_TIMESTAMP + 4000,
+                                                           include_flat_fees=True))
+        self.assertEqual(["sell"], exported["side"].tolist())
+        self.assertEqual(["0.01 BNB"], exported["flat_fee / gas"].tolist())
+
+
+if __name__ == "__main__":
+    unittest.main()
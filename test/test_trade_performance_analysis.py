@@ -1,9 +1,11 @@
 import asyncio
+import tempfile
 import time
 from decimal import Decimal
 from typing import List, Dict
 import unittest
 from hummingbot.client.performance_analysis import PerformanceAnalysis
+from hummingbot.client.performance_tracker import PerformanceTracker
 from hummingbot.core.event.events import TradeFee, OrderType
 from hummingbot.core.utils.exchange_rate_conversion import ExchangeRateConversion
 from hummingbot.core.utils.async_utils import (
@@ -11,10 +13,12 @@ from hummingbot.core.utils.async_utils import (
     safe_gather,
 )
 
+from hummingbot.core.network_base import NetworkStatus
 from hummingbot.data_feed.data_feed_base import DataFeedBase
 from hummingbot.market.market_base import MarketBase
 from hummingbot.model.sql_connection_manager import SQLConnectionManager, SQLConnectionType
 from hummingbot.model.trade_fill import TradeFill
+from hummingbot.model.trade_fill_archive import TradeFillArchive
 from hummingbot.strategy.market_trading_pair_tuple import MarketTradingPairTuple
 
 
@@ -49,11 +53,15 @@ class MockDataFeed1(DataFeedBase):
         return self.mock_price_dict.get(trading_pair.upper())
 
     async def start_network(self):
-        pass
+        # The prices are known right away, so the exchange rate conversion doesn't wait for the data feed to time out.
+        self._ready_event.set()
 
     async def stop_network(self):
         pass
 
+    async def check_network(self) -> NetworkStatus:
+        return NetworkStatus.CONNECTED
+
 
 class MockMarket1(MarketBase):
     def __init__(self):
@@ -254,6 +262,41 @@ class TestTradePerformanceAnalysis(unittest.TestCase):
         }
         self.assertDictEqual(expected_stats, market_trading_pair_stats[self.trading_pair_tuple_1])
 
+    def test_calculate_asset_delta_from_archive(self):
+        test_trades = [
+            ("BUY", 1, 100),
+            ("SELL", 0.9, 110),
+            ("BUY", 0.1, 100),
+            ("SELL", 1, 120)
+        ]
+        start_time = int(time.time() * 1e3) - 100000
+        self.save_trade_fill_records(test_trades,
+                                     self.trading_pair_tuple_1,
+                                     OrderType.MARKET.name,
+                                     start_time,
+                                     self.strategy_1
+                                     )
+        self.trade_fill_sql.get_shared_session().commit()
+
+        performance_analysis = PerformanceAnalysis(sql=self.trade_fill_sql)
+        raw_queried_trades = self.get_trades_from_session(start_time)
+        expected_stats = performance_analysis.calculate_asset_delta_from_trades(
+            self.strategy_1, [self.trading_pair_tuple_1], raw_queried_trades
+        )[self.trading_pair_tuple_1]
+
+        with tempfile.TemporaryDirectory() as archive_path:
+            trade_fill_archive = TradeFillArchive(archive_path)
+            self.assertEqual(len(test_trades), trade_fill_archive.update(self.trade_fill_sql))
+            self.assertEqual(0, trade_fill_archive.update(self.trade_fill_sql))
+            stats = performance_analysis.calculate_asset_delta_from_archive(
+                self.strategy_1, [self.trading_pair_tuple_1], trade_fill_archive, start_time
+            )[self.trading_pair_tuple_1]
+
+        self.assertEqual(expected_stats["starting_quote_rate"], stats["starting_quote_rate"])
+        for asset in ("WETH", "DAI"):
+            for key in ("spent", "acquired"):
+                self.assertAlmostEqual(float(expected_stats["asset"][asset][key]), float(stats["asset"][asset][key]))
+
     def test_calculate_trade_performance(self):
         test_trades = [
             ("BUY", 100, 2),
@@ -389,3 +432,65 @@ class TestTradePerformanceAnalysis(unittest.TestCase):
         self.assertDictEqual(expected_trade_performance_stats, trade_performance_stats)
         self.assertDictEqual(expected_markettrading_pair_stats_1, market_trading_pair_stats[self.trading_pair_tuple_1])
         self.assertDictEqual(expected_markettrading_pair_stats_2, market_trading_pair_stats[self.trading_pair_tuple_2])
+
+    def test_performance_tracker(self):
+        test_trades_1 = [
+            ("BUY", 100, 1),
+            ("SELL", 100, 0.9),
+            ("BUY", 110, 1),
+            ("SELL", 115, 1)
+        ]
+        test_trades_2 = [
+            ("BUY", 100, 2),
+            ("SELL", 110, 0.9),
+            ("BUY", 105, 0.5),
+            ("SELL", 120, 1)
+        ]
+        start_time = int(time.time() * 1e3) - 100000
+        performance_tracker = PerformanceTracker()
+        for test_trades, trading_pair_tuple in [(test_trades_1, self.trading_pair_tuple_1),
+                                                (test_trades_2, self.trading_pair_tuple_2)]:
+            for trade in self.create_trade_fill_records(test_trades, trading_pair_tuple, OrderType.MARKET.name,
+                                                        start_time, self.strategy_1):
+                trade_fill: TradeFill = TradeFill(**trade)
+                self.trade_fill_sql.get_shared_session().add(trade_fill)
+                performance_tracker.add_trade_fill(trade_fill)
+        # Trade fills of other strategies aren't counted.
+        for trade in self.create_trade_fill_records(test_trades_1, self.trading_pair_tuple_1, OrderType.MARKET.name,
+                                                    start_time, "strategy_2"):
+            performance_tracker.add_trade_fill(TradeFill(**trade))
+        self.assertEqual(12, performance_tracker.trade_fill_count)
+
+        performance_analysis = PerformanceAnalysis(sql=self.trade_fill_sql)
+        m_name_1 = self.trading_pair_tuple_1.market.name
+        m_name_2 = self.trading_pair_tuple_2.market.name
+        starting_balances = {"DAI": {m_name_1: Decimal("1000")}, "WETH": {m_name_1: Decimal("5")},
+                             "USDC": {m_name_2: Decimal("500")}, "ETH": {m_name_2: Decimal("1")}}
+        market_trading_pair_tuples = [self.trading_pair_tuple_1, self.trading_pair_tuple_2]
+        expected_trade_performance_stats, expected_market_trading_pair_stats = \
+            performance_analysis.calculate_trade_performance(self.strategy_1,
+                                                             market_trading_pair_tuples,
+                                                             self.get_trades_from_session(start_time),
+                                                             starting_balances)
+        trade_performance_stats, market_trading_pair_stats = \
+            performance_tracker.calculate_trade_performance(self.strategy_1,
+                                                            market_trading_pair_tuples,
+                                                            starting_balances)
+
+        self.assertDictEqual(expected_trade_performance_stats, trade_performance_stats)
+        for market_trading_pair_tuple in market_trading_pair_tuples:
+            trading_pair_stats = dict(market_trading_pair_stats[market_trading_pair_tuple])
+            self.assertEqual(4, trading_pair_stats.pop("trade_count"))
+            self.assertEqual({market_trading_pair_tuple.base_asset, market_trading_pair_tuple.quote_asset},
+                             set(trading_pair_stats.pop("fees").keys()))
+            self.assertDictEqual(expected_market_trading_pair_stats[market_trading_pair_tuple], trading_pair_stats)
+        # 1% of the acquired asset of each trade, for the trades of the first market trading pair.
+        self.assertAlmostEqual(0.02, float(market_trading_pair_stats[self.trading_pair_tuple_1]["fees"]["WETH"]))
+        self.assertAlmostEqual(2.05, float(market_trading_pair_stats[self.trading_pair_tuple_1]["fees"]["DAI"]))
+
+        # A snapshot isn't changed by later trade fills.
+        for trade in self.create_trade_fill_records([("BUY", 100, 1)], self.trading_pair_tuple_1,
+                                                    OrderType.MARKET.name, start_time + 10, self.strategy_1):
+            performance_tracker.add_trade_fill(TradeFill(**trade))
+        self.assertEqual(Decimal('1.900000000000000022204460492'),
+                         market_trading_pair_stats[self.trading_pair_tuple_1]["asset"]["WETH"]["spent"])